@@ -1,7 +1,7 @@
 """
 Ridebot agent using LangChain.
 
-To switch providers, swap the `llm` definition below:
+To switch providers, swap the client built in `_build_llm` below:
 
   TritonAI (current):
     from langchain_openai import ChatOpenAI
@@ -22,13 +22,13 @@ import os
 import sys
 from datetime import datetime, timedelta
 from difflib import SequenceMatcher
+from functools import cache
 from pathlib import Path
 
 import httpx
 from dotenv import load_dotenv
 from langchain_core.messages import HumanMessage, SystemMessage, ToolMessage
 from langchain_core.tools import tool
-from langchain_openai import ChatOpenAI
 from pydantic import SecretStr
 
 logger = logging.getLogger(__name__)
@@ -44,11 +44,17 @@ from bot.utils.time_helpers import is_in_ride_day_window  # noqa: E402
 
 # --- LLM -------------------------------------------------------------------
 
-llm = ChatOpenAI(
-    model="api-gpt-oss-120b",
-    base_url="https://tritonai-api.ucsd.edu/v1",
-    api_key=SecretStr(os.environ["TRITON_API_KEY"]),
-)
+
+def _build_llm():
+    """Build the chat client. Imported lazily: langchain_openai is slow to import."""
+    from langchain_openai import ChatOpenAI
+
+    return ChatOpenAI(
+        model="api-gpt-oss-120b",
+        base_url="https://tritonai-api.ucsd.edu/v1",
+        api_key=SecretStr(os.environ["TRITON_API_KEY"]),
+    )
+
 
 BACKEND_URL = "http://localhost:8000"
 _INTERNAL_SECRET = os.environ.get("INTERNAL_API_SECRET", "")
@@ -58,6 +64,7 @@ SYSTEM_PROMPT = """You are a ride coordinator assistant for a UCSD college fello
 You help plan pickup routes for drivers and list who needs rides.
 
 When a user asks you to make a route, prefer make_route_with_riders over make_route.
+When a user asks for the fastest or best pickup order, call make_route with optimize_order=true.
 Omit the day argument unless the user explicitly specifies a day — the tool auto-detects friday or sunday from the current time window.
 When a user asks who needs a ride on Sunday, call the list_pickups_sunday tool.
 When a user asks who needs a ride on Friday, call the list_pickups_friday tool.
@@ -95,20 +102,28 @@ housing area, showing each person's name and pickup location."""
 
 
 @tool
-def make_route(locations: str, leave_time: str) -> str:
+def make_route(locations: str, leave_time: str, optimize_order: bool = False) -> str:
     """
     Build a pickup route with staggered departure times for each stop.
 
     Args:
         locations: Space-separated pickup location tokens in pickup order (e.g. 'revelle muir eighth').
         leave_time: Departure time from the final stop (e.g. '5:30pm').
+        optimize_order: Reorder the stops for the shortest total drive instead of the given order.
 
     Returns:
-        Formatted string with pickup times and Google Maps links.
+        Formatted string with pickup times and Google Maps links, plus the minutes
+        saved when the order was optimized.
     """
-    logger.info(f"Tool: make_route locations={locations!r} leave_time={leave_time!r}")
+    logger.info(
+        f"Tool: make_route locations={locations!r} leave_time={leave_time!r} "
+        f"optimize_order={optimize_order}"
+    )
     routing = PickupLocationsService.get_routing_context_sync()
-    return RouteService.make_route(routing, locations, leave_time)
+    if not optimize_order:
+        return RouteService.make_route(routing, locations, leave_time)
+    plan = RouteService.plan_route(routing, locations.split(), leave_time, optimize_order=True)
+    return f"{plan.route}\n(Optimized pickup order saves {plan.minutes_saved} min.)"
 
 
 @tool
@@ -241,11 +256,7 @@ def _build_route_stops(locations_str: str, leave_time_str: str) -> list[dict]:
     """Return structured route stops: [{time, location, maps_url}] in pickup order."""
     curr_leave_time = parse_time(leave_time_str)
     routing = PickupLocationsService.get_routing_context_sync()
-    locations_list: list[str] = []
-    for token in locations_str.split():
-        match = routing.fuzzy_match(token)
-        if match:
-            locations_list.append(match)
+    locations_list = [match for match in routing.fuzzy_match_many(locations_str.split()) if match]
 
     stops: list[dict] = []
     reversed_locs = list(reversed(locations_list))
@@ -483,7 +494,12 @@ TOOL_MAP = {t.name: t for t in TOOLS}
 # Tools that return raw output directly without LLM reformatting
 RAW_OUTPUT_TOOLS = {"make_route"}
 
-llm_with_tools = llm.bind_tools(TOOLS)
+
+@cache
+def _get_llm_with_tools():
+    """Return the tool-bound client, created on the first agent turn."""
+    return _build_llm().bind_tools(TOOLS)
+
 
 # --- Agent loop ------------------------------------------------------------
 
@@ -493,7 +509,7 @@ def run_agent(user_message: str, history: list) -> tuple[str, list]:
     history.append(HumanMessage(content=user_message))
 
     while True:
-        response = llm_with_tools.invoke([SystemMessage(content=SYSTEM_PROMPT), *history])
+        response = _get_llm_with_tools().invoke([SystemMessage(content=SYSTEM_PROMPT), *history])
         history.append(response)
 
         if not response.tool_calls:
@@ -0,0 +1,30 @@
+"""Add composite index for the paginated reaction log.
+
+Revision ID: b3c4d5e6f7a8
+Revises: a9b8c7d6e5f4
+Create Date: 2026-10-19
+
+"""
+
+from collections.abc import Sequence
+
+from alembic import op
+
+revision: str = "b3c4d5e6f7a8"
+down_revision: str | None = "a9b8c7d6e5f4"
+branch_labels: str | Sequence[str] | None = None
+depends_on: str | Sequence[str] | None = None
+
+
+def upgrade() -> None:
+    """Index ride_reaction_events on (ride_type, ride_date, occurred_at)."""
+    op.create_index(
+        "ix_ride_reaction_events_type_date_occurred",
+        "ride_reaction_events",
+        ["ride_type", "ride_date", "occurred_at"],
+    )
+
+
+def downgrade() -> None:
+    """Drop the reaction log index."""
+    op.drop_index("ix_ride_reaction_events_type_date_occurred", table_name="ride_reaction_events")
@@ -20,9 +20,10 @@ from slowapi import _rate_limit_exceeded_handler
 from slowapi.errors import RateLimitExceeded
 from slowapi.middleware import SlowAPIMiddleware
 
-from api.auth import cloudflare_access_middleware
+from api.auth import cloudflare_access_middleware, warm_cloudflare_keys
 from api.auth_session import session_cookie_middleware
-from api.constants import CORS_LOCALHOST_5173, CORS_LOCALHOST_5174
+from api.bot_proxy import BotProxyResponse, bot_proxy_response_handler, close_bot_proxy
+from api.constants import CORS_LOCALHOST_5173, CORS_LOCALHOST_5174, DEPLOYMENT_MODE
 from api.middleware.access_logger import AccessLogMiddleware
 from api.rate_limit import limiter
 from api.routes.admin_users import router as admin_users_router
@@ -48,7 +49,9 @@ from api.routes.ride_coordinators import router as ride_coordinators_router
 from api.routes.route_builder import router as route_builder_router
 from api.routes.user_preferences import router as user_preferences_router
 from api.routes.usernames import router as usernames_router
-from bot.api import bot_lifespan
+from bot.api import api_worker_lifespan, bot_lifespan
+from bot.core.enums import DeploymentMode
+from bot.services.auth_session_cache import auth_session_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO)
@@ -85,14 +88,22 @@ async def lifespan(app: FastAPI):
             sys.exit(1)
         else:
             logger.info("Auth provider: Cloudflare Access.")
+            warm_cloudflare_keys()
     else:
         logger.info("Running in LOCAL mode: Authentication is bypassed.")
 
-    # Start Discord bot
-    async with bot_lifespan():
-        yield
+    if DEPLOYMENT_MODE == DeploymentMode.SPLIT:
+        # The bot runs alone in main.py; bot-bound routes are forwarded to it
+        async with api_worker_lifespan():
+            yield
+        await close_bot_proxy()
+    else:
+        # Start Discord bot
+        async with bot_lifespan():
+            yield
 
-    # Shutdown (cleanup handled by bot_lifespan context manager)
+    # Shutdown (bot cleanup handled by bot_lifespan context manager)
+    await auth_session_cache.stop()
     logger.info("Application shutdown complete")
 
 
@@ -120,6 +131,9 @@ app.state.limiter = limiter
 app.add_exception_handler(RateLimitExceeded, cast(Any, _rate_limit_exceeded_handler))
 app.add_middleware(SlowAPIMiddleware)
 
+# Split deployments: bot-bound routes answer with the bot process's response
+app.add_exception_handler(BotProxyResponse, bot_proxy_response_handler)
+
 # Add authentication middleware based on AUTH_PROVIDER.
 # Must be registered BEFORE CORS so that CORS (added last) becomes the
 # outermost layer and attaches Access-Control-Allow-Origin to every response,
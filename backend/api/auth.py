@@ -5,18 +5,25 @@ This module handles JWT verification for Cloudflare Access
 and role-based access control dependencies.
 """
 
+import asyncio
+import hashlib
 import logging
 import os
 import time
+from collections import OrderedDict
 from collections.abc import Callable
 
 import httpx
 from fastapi import HTTPException, Request, Response
-from jose import jwt
+from jose import JWTError, jwk, jwt
+from jose.backends.base import Key
 
 from api.constants import (
     CF_KEYS_CACHE_TTL_SECONDS,
     CF_KEYS_HTTP_TIMEOUT,
+    CF_KEYS_MIN_REFRESH_INTERVAL_SECONDS,
+    CF_KEYS_REFRESH_AHEAD_SECONDS,
+    CF_TOKEN_CACHE_MAXSIZE,
     INTERNAL_API_SECRET,
     INTERNAL_SECRET_HEADER,
 )
@@ -31,40 +38,110 @@ CLOUDFLARE_TEAM_DOMAIN = os.getenv("CLOUDFLARE_TEAM_DOMAIN")
 CLOUDFLARE_AUD = os.getenv("CLOUDFLARE_AUD")
 APP_ENV = os.getenv("APP_ENV", "local")
 
-# Cache for Cloudflare public keys — refreshed every hour
-_cloudflare_keys = None
+# Cloudflare public keys, parsed once per fetch and indexed by kid. Refreshed in
+# the background ahead of CF_KEYS_CACHE_TTL_SECONDS; the last good set keeps
+# being served if a refresh fails.
+_cloudflare_keys: dict[str, Key] = {}
 _cloudflare_keys_fetched_at: float = 0.0
+_cloudflare_keys_attempted_at: float = 0.0
+_cloudflare_keys_refresh: asyncio.Task | None = None
+
+# sha256(token) -> (exp, user info). A browser resends the same Access JWT on
+# every request until it expires, so each token is verified once.
+_verified_tokens: OrderedDict[str, tuple[float, dict]] = OrderedDict()
+
+
+async def _download_jwks() -> list[dict]:
+    """Fetch the raw JWKS from the Cloudflare team domain."""
+    url = f"https://{CLOUDFLARE_TEAM_DOMAIN}/cdn-cgi/access/certs"
+    async with httpx.AsyncClient(timeout=CF_KEYS_HTTP_TIMEOUT) as client:
+        resp = await client.get(url)
+        resp.raise_for_status()
+        return resp.json()["keys"]
+
+
+async def _refresh_cloudflare_keys() -> None:
+    """Replace the key index with a fresh JWKS; keep the old keys on failure."""
+    global _cloudflare_keys, _cloudflare_keys_fetched_at, _cloudflare_keys_attempted_at
+    _cloudflare_keys_attempted_at = time.time()
+    if not CLOUDFLARE_TEAM_DOMAIN:
+        logger.warning("CLOUDFLARE_TEAM_DOMAIN environment variable is not set")
+        return
+    try:
+        raw_keys = await _download_jwks()
+        keys = {k["kid"]: jwk.construct(k, algorithm="RS256") for k in raw_keys}
+    except Exception:
+        logger.exception(
+            f"Failed to fetch Cloudflare keys; still serving {len(_cloudflare_keys)} cached keys"
+        )
+        return
+    _cloudflare_keys = keys
+    _cloudflare_keys_fetched_at = time.time()
+    logger.info("Successfully fetched Cloudflare public keys")
+
+
+def _start_key_refresh() -> asyncio.Task:
+    """Start a key refresh unless one is already running, and return it."""
+    global _cloudflare_keys_refresh
+    if _cloudflare_keys_refresh is None or _cloudflare_keys_refresh.done():
+        _cloudflare_keys_refresh = asyncio.create_task(
+            _refresh_cloudflare_keys(), name="cloudflare-jwks-refresh"
+        )
+    return _cloudflare_keys_refresh
+
+
+def warm_cloudflare_keys() -> None:
+    """Fetch the keys in the background at startup so the first request doesn't wait."""
+    _start_key_refresh()
 
 
-async def get_cloudflare_keys():
+async def get_cloudflare_keys(*, force: bool = False) -> dict[str, Key]:
     """
-    Fetch and cache public keys from Cloudflare. Refreshes every hour.
+    Return Cloudflare's public keys indexed by kid.
+
+    Requests only wait on the network when there are no keys yet or when
+    *force* is set (an unknown kid after key rotation), and even then at most
+    once per CF_KEYS_MIN_REFRESH_INTERVAL_SECONDS. Otherwise keys nearing
+    their TTL are refreshed in the background while the current ones are served.
+
+    Args:
+        force: Refresh now (subject to the minimum interval) and wait for it.
 
     Returns:
-        List of public keys or empty list if fetch fails.
+        Mapping of kid to parsed public key; empty if none could be fetched.
     """
-    global _cloudflare_keys, _cloudflare_keys_fetched_at
-    if (
-        _cloudflare_keys is None
-        or time.time() - _cloudflare_keys_fetched_at > CF_KEYS_CACHE_TTL_SECONDS
+    now = time.time()
+    can_fetch = now - _cloudflare_keys_attempted_at >= CF_KEYS_MIN_REFRESH_INTERVAL_SECONDS
+    if not _cloudflare_keys or force:
+        refresh = _cloudflare_keys_refresh
+        if can_fetch or (refresh is not None and not refresh.done()):
+            await asyncio.shield(_start_key_refresh())
+    elif (
+        now - _cloudflare_keys_fetched_at
+        > CF_KEYS_CACHE_TTL_SECONDS - CF_KEYS_REFRESH_AHEAD_SECONDS
+        and can_fetch
     ):
-        if not CLOUDFLARE_TEAM_DOMAIN:
-            logger.warning("CLOUDFLARE_TEAM_DOMAIN environment variable is not set")
-            return []
-        url = f"https://{CLOUDFLARE_TEAM_DOMAIN}/cdn-cgi/access/certs"
-        try:
-            async with httpx.AsyncClient(timeout=CF_KEYS_HTTP_TIMEOUT) as client:
-                resp = await client.get(url)
-                resp.raise_for_status()
-                _cloudflare_keys = resp.json()["keys"]
-                _cloudflare_keys_fetched_at = time.time()
-                logger.info("Successfully fetched Cloudflare public keys")
-        except Exception:
-            logger.exception(f"Failed to fetch Cloudflare keys from {url}")
-            return []
+        _start_key_refresh()
     return _cloudflare_keys
 
 
+async def _get_signing_key(kid: str | None) -> Key | None:
+    """Look up the key for *kid*, refreshing once if it is unknown (key rotation)."""
+    if kid is None:
+        return None
+    key = (await get_cloudflare_keys()).get(kid)
+    if key is None:
+        key = (await get_cloudflare_keys(force=True)).get(kid)
+    return key
+
+
+def _cache_verified_token(token_hash: str, exp: float, user_info: dict) -> None:
+    _verified_tokens[token_hash] = (exp, user_info)
+    _verified_tokens.move_to_end(token_hash)
+    while len(_verified_tokens) > CF_TOKEN_CACHE_MAXSIZE:
+        _verified_tokens.popitem(last=False)
+
+
 async def verify_cloudflare_token(request: Request):
     """
     Verifies the Cloudflare Access JWT and extracts user information.
@@ -94,11 +171,20 @@ async def verify_cloudflare_token(request: Request):
         logger.warning(f"Missing Cf-Access-Jwt-Assertion header for path: {request.url.path}")
         return None
 
-    keys = await get_cloudflare_keys()
+    token_hash = hashlib.sha256(token.encode()).hexdigest()
+    cached = _verified_tokens.get(token_hash)
+    if cached is not None:
+        exp, user_info = cached
+        if exp > time.time():
+            _verified_tokens.move_to_end(token_hash)
+            return dict(user_info)
+        del _verified_tokens[token_hash]
 
     try:
         header = jwt.get_unverified_header(token)
-        key = next(k for k in keys if k["kid"] == header["kid"])
+        key = await _get_signing_key(header.get("kid"))
+        if key is None:
+            raise JWTError(f"No Cloudflare public key for kid {header.get('kid')!r}")
 
         payload = jwt.decode(
             token,
@@ -109,11 +195,14 @@ async def verify_cloudflare_token(request: Request):
         )
 
         # Extract user information from JWT payload
-        return {
+        user_info = {
             "email": payload.get("email"),
             "sub": payload.get("sub"),
             "name": payload.get("name"),
         }
+        if "exp" in payload:
+            _cache_verified_token(token_hash, float(payload["exp"]), user_info)
+        return dict(user_info)
     except Exception as e:
         # Debug logging for troubleshooting 'Invalid audience' or 'Invalid issuer'
         try:
@@ -186,6 +275,9 @@ def require_role(minimum_role: AccountRoles) -> Callable:
 
     Role hierarchy: admin (3) > ride_coordinator (2) > viewer (1).
 
+    The resolved role is stored on ``request.state`` so a route that chains
+    several role dependencies looks the role up once per request.
+
     Args:
         minimum_role: The minimum AccountRoles value required.
 
@@ -199,8 +291,12 @@ def require_role(minimum_role: AccountRoles) -> Callable:
         if not email:
             raise HTTPException(status_code=401, detail="Unauthorized")
 
-        has_role = await UserAccountsService.has_minimum_role(email, minimum_role)
-        if not has_role:
+        resolved = getattr(request.state, "account_role", None)
+        if resolved is None or resolved[0] != email:
+            resolved = (email, await UserAccountsService.get_role(email))
+            request.state.account_role = resolved
+
+        if not UserAccountsService.role_meets(resolved[1], minimum_role):
             raise HTTPException(status_code=403, detail="Forbidden")
         return email
 
@@ -19,9 +19,10 @@ from api.constants import (
     INTERNAL_SECRET_HEADER,
     SESSION_COOKIE_NAME,
 )
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal
 from bot.core.logger import generate_txn_id, txn_id_var, user_email_var
 from bot.services.auth_service import AuthService
+from bot.services.auth_session_cache import CachedSession, auth_session_cache
 
 logger = logging.getLogger(__name__)
 
@@ -85,24 +86,31 @@ async def session_cookie_middleware(request: Request, call_next) -> Response:
     if not session_id_plain:
         return Response("Unauthorized", status_code=401)
 
-    try:
-        async with AsyncSessionLocal() as db_session:
-            auth_session = await AuthService.get_session(db_session, session_id_plain)
-            if not auth_session:
-                return Response("Unauthorized", status_code=401)
-
-            # CSRF check for state-changing requests.
-            if request.method not in SAFE_METHODS:
-                csrf_header = request.headers.get(CSRF_HEADER)
-                if not AuthService.verify_csrf(auth_session.csrf_token, csrf_header):
-                    logger.warning(f"CSRF check failed for {request.method} {path}")
-                    return Response("Forbidden", status_code=403)
-
-            # Slide expiry (throttled inside touch_session).
-            await AuthService.touch_session(db_session, session_id_plain, auth_session)
-    except Exception:
-        logger.exception("DB error during session validation")
-        return Response("Unauthorized", status_code=401)
+    # Most requests arrive in bursts from one page load; only the first of a
+    # burst reads auth_sessions, the rest are served from the cache.
+    session_id_hash = AuthService.session_hash(session_id_plain)
+    auth_session = auth_session_cache.get(session_id_hash)
+    if auth_session is None:
+        try:
+            async with AsyncReadSessionLocal() as db_session:
+                db_row = await AuthService.get_session(db_session, session_id_plain)
+        except Exception:
+            logger.exception("DB error during session validation")
+            return Response("Unauthorized", status_code=401)
+        if not db_row:
+            return Response("Unauthorized", status_code=401)
+        auth_session = CachedSession.from_model(db_row)
+        auth_session_cache.put(session_id_hash, auth_session)
+
+    # CSRF check for state-changing requests.
+    if request.method not in SAFE_METHODS:
+        csrf_header = request.headers.get(CSRF_HEADER)
+        if not AuthService.verify_csrf(auth_session.csrf_token, csrf_header):
+            logger.warning(f"CSRF check failed for {request.method} {path}")
+            return Response("Forbidden", status_code=403)
+
+    # Slide expiry (throttled, written in periodic batches by the cache).
+    auth_session_cache.touch(session_id_hash, auth_session)
 
     email = auth_session.email
     request.state.user = {"email": email}
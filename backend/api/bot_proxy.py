@@ -0,0 +1,178 @@
+"""
+Bot Proxy
+
+Local RPC channel for split deployments (``DEPLOYMENT_MODE=split``).
+
+The Discord bot runs alone in ``main.py`` and serves this same FastAPI app on a
+Unix socket. API workers run without a bot: read paths are answered from the
+shared cache and database (per-process caches follow edits made elsewhere
+through ``SharedVersion``), and routes that need the live bot (``require_bot``
+routes, Discord message fetches, role changes, live rescheduling) are handed to
+the bot process unchanged. The forwarded request carries the caller's cookies
+and auth headers, so the bot process authenticates it exactly as the worker did.
+"""
+
+import logging
+
+import httpx
+import uvicorn
+from fastapi import HTTPException, Request, Response
+from starlette.types import ASGIApp
+
+from api.constants import (
+    BOT_RPC_HEALTH_TIMEOUT_SECONDS,
+    BOT_RPC_SOCKET,
+    BOT_RPC_TIMEOUT_SECONDS,
+    BOT_STARTING_RETRY_AFTER_SECONDS,
+    DEPLOYMENT_MODE,
+)
+from api.disconnect import cancel_on_disconnect
+from bot.core.enums import DeploymentMode
+
+logger = logging.getLogger(__name__)
+
+# Connection-level headers that must not be copied across the hop
+_HOP_BY_HOP = frozenset(
+    {
+        "connection",
+        "content-length",
+        "host",
+        "keep-alive",
+        "proxy-authenticate",
+        "proxy-authorization",
+        "te",
+        "trailer",
+        "transfer-encoding",
+        "upgrade",
+    }
+)
+# httpx has already decoded the body, so the upstream encoding no longer applies
+_DROP_RESPONSE_HEADERS = _HOP_BY_HOP | {"content-encoding"}
+
+_client: httpx.AsyncClient | None = None
+_is_bot_process = False
+
+
+class BotProxyResponse(Exception):  # noqa: N818 - control flow, not an error
+    """Raised by a route dependency to answer with the bot process's response."""
+
+    def __init__(self, response: Response) -> None:
+        """
+        Wrap the response returned by the bot process.
+
+        Args:
+            response: The response to send back to the client unchanged
+        """
+        super().__init__(response.status_code)
+        self.response = response
+
+
+def is_api_worker() -> bool:
+    """Return True when this process is an API worker without its own bot."""
+    return DEPLOYMENT_MODE == DeploymentMode.SPLIT and not _is_bot_process
+
+
+def _get_client() -> httpx.AsyncClient:
+    global _client
+    if _client is None:
+        _client = httpx.AsyncClient(
+            transport=httpx.AsyncHTTPTransport(uds=BOT_RPC_SOCKET),
+            base_url="http://bot",
+            timeout=BOT_RPC_TIMEOUT_SECONDS,
+        )
+    return _client
+
+
+async def forward_to_bot(request: Request) -> Response:
+    """
+    Replay *request* against the bot process and return its response.
+
+    Args:
+        request: The incoming request (its body may already have been read)
+
+    Returns:
+        The bot process's response, status and headers included
+
+    Raises:
+        HTTPException: 503 if the bot process is unreachable, 504 if it times out,
+            499 if the client disconnects first (the forwarded call is cancelled)
+    """
+    headers = [(k, v) for k, v in request.headers.items() if k not in _HOP_BY_HOP]
+    if "x-forwarded-for" not in request.headers and request.client:
+        headers.append(("x-forwarded-for", request.client.host))
+
+    body = await request.body()
+    try:
+        # Abandoning the call closes its socket, so the bot side sees the disconnect too
+        upstream = await cancel_on_disconnect(
+            request,
+            _get_client().request(
+                request.method,
+                request.url.path,
+                params=tuple(request.query_params.multi_items()),
+                content=body,
+                headers=headers,
+            ),
+        )
+    except httpx.TimeoutException:
+        logger.warning(f"Bot process timed out on {request.method} {request.url.path}")
+        raise HTTPException(status_code=504, detail="Bot process did not respond in time") from None
+    except httpx.TransportError as e:
+        logger.warning(f"Bot process unreachable at {BOT_RPC_SOCKET}: {e!r}")
+        raise HTTPException(
+            status_code=503,
+            detail="Bot process unavailable",
+            headers={"Retry-After": str(BOT_STARTING_RETRY_AFTER_SECONDS)},
+        ) from None
+
+    response = Response(content=upstream.content, status_code=upstream.status_code)
+    for key, value in upstream.headers.multi_items():
+        if key not in _DROP_RESPONSE_HEADERS:
+            response.headers.append(key, value)
+    return response
+
+
+async def fetch_bot_health() -> dict | None:
+    """Return the bot process's ``/health`` payload, or None if it cannot be reached."""
+    try:
+        response = await _get_client().get("/health", timeout=BOT_RPC_HEALTH_TIMEOUT_SECONDS)
+        return response.json()
+    except (httpx.HTTPError, ValueError):
+        return None
+
+
+async def bot_proxy_response_handler(request: Request, exc: Exception) -> Response:
+    """Exception handler that sends a forwarded response back as-is."""
+    assert isinstance(exc, BotProxyResponse)
+    return exc.response
+
+
+async def close_bot_proxy() -> None:
+    """Close the connection pool to the bot process."""
+    global _client
+    if _client is not None:
+        await _client.aclose()
+        _client = None
+
+
+def bot_rpc_server(app: ASGIApp, socket_path: str = BOT_RPC_SOCKET) -> uvicorn.Server:
+    """
+    Build the server that exposes *app* to API workers on a Unix socket.
+
+    Called from the bot process. Marks this process as the bot so requests it
+    receives are handled locally instead of being forwarded again. The app's
+    lifespan is not run: the bot process has already started everything itself.
+
+    Args:
+        app: The FastAPI application to serve
+        socket_path: Filesystem path of the Unix socket
+
+    Returns:
+        A uvicorn server; run it with ``await server.serve()`` and stop it by
+        setting ``server.should_exit``
+    """
+    global _is_bot_process
+    _is_bot_process = True
+    config = uvicorn.Config(app, uds=socket_path, lifespan="off", log_config=None, access_log=False)
+    logger.info(f"🔌 Serving bot-bound API requests on {socket_path}")
+    return uvicorn.Server(config)
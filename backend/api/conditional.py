@@ -0,0 +1,99 @@
+"""
+Conditional GET support for snapshot-backed read endpoints.
+
+Endpoints whose data comes from a versioned snapshot serialize the payload once
+per version, keep the bytes, and derive a strong ETag from them. Requests that
+send a matching ``If-None-Match`` get a bodyless 304, so dashboard polling costs
+a version check and a header compare.
+"""
+
+import hashlib
+import json
+from collections.abc import Callable
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request, Response
+from fastapi.encoders import jsonable_encoder
+
+# Authenticated data: browsers may keep it but must revalidate on every use
+CACHE_CONTROL = "private, no-cache"
+
+
+@dataclass(frozen=True)
+class RenderedBody:
+    """A serialized JSON payload and its strong ETag."""
+
+    body: bytes
+    etag: str
+
+
+def render_json(payload: Any) -> RenderedBody:
+    """
+    Serialize *payload* the way ``JSONResponse`` would and tag it with a content hash.
+
+    Args:
+        payload: Anything ``jsonable_encoder`` accepts (dicts, Pydantic models, ...)
+
+    Returns:
+        The encoded body and a quoted strong ETag
+    """
+    body = json.dumps(
+        jsonable_encoder(payload), ensure_ascii=False, allow_nan=False, separators=(",", ":")
+    ).encode("utf-8")
+    return RenderedBody(body=body, etag=f'"{hashlib.sha256(body).hexdigest()[:32]}"')
+
+
+def _etag_matches(if_none_match: str, etag: str) -> bool:
+    """Weak comparison, as RFC 9110 prescribes for If-None-Match."""
+    if if_none_match.strip() == "*":
+        return True
+    return any(tag.strip().removeprefix("W/") == etag for tag in if_none_match.split(","))
+
+
+def conditional_json(request: Request, rendered: RenderedBody) -> Response:
+    """
+    Answer with 304 if the client already holds *rendered*, otherwise with the body.
+
+    Args:
+        request: The incoming request
+        rendered: The current serialized payload
+
+    Returns:
+        A 304 with no body, or a 200 JSON response carrying the ETag
+    """
+    headers = {"ETag": rendered.etag, "Cache-Control": CACHE_CONTROL}
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match and _etag_matches(if_none_match, rendered.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=rendered.body, media_type="application/json", headers=headers)
+
+
+class RenderCache:
+    """
+    Serialized body of one endpoint, rebuilt only when its snapshot version moves.
+
+    The version is compared on every request, so pass something cheap to compare:
+    a snapshot counter or a ``Stamped`` token, never the payload itself.
+    """
+
+    def __init__(self) -> None:
+        """Start empty; the first request renders."""
+        self._version: Any = None
+        self._rendered: RenderedBody | None = None
+
+    def get(self, version: Any, build: Callable[[], Any]) -> RenderedBody:
+        """
+        Return the rendered body for *version*, calling *build* only on a change.
+
+        Args:
+            version: The current version of the backing snapshot
+            build: Returns the payload to serialize for that version
+
+        Returns:
+            The serialized body and its ETag
+        """
+        if self._rendered is None or self._version != version:
+            self._rendered = render_json(build())
+            self._version = version
+        return self._rendered
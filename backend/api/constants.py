@@ -6,12 +6,29 @@ Centralized configuration constants for the API layer.
 
 import os
 
+from dotenv import load_dotenv
+
+load_dotenv()
+
 ADMIN_EMAILS = {e.strip() for e in os.getenv("ADMIN_EMAILS", "").split(",") if e.strip()}
 
 # Server
 API_HOST = "0.0.0.0"
 API_PORT = 8000
 
+# Bot readiness: Retry-After sent with 503s while the Discord gateway is connecting
+BOT_STARTING_RETRY_AFTER_SECONDS = 5
+
+# Deployment: "combined" runs the bot inside the API process; "split" runs it alone
+# (main.py) and API workers forward bot-bound requests to it over a Unix socket
+DEPLOYMENT_MODE = os.getenv("DEPLOYMENT_MODE", "combined").lower()
+BOT_RPC_SOCKET = os.getenv("BOT_RPC_SOCKET", "/tmp/ride-bot.sock")
+BOT_RPC_TIMEOUT_SECONDS = 120.0  # group-rides waits on the LLM
+BOT_RPC_HEALTH_TIMEOUT_SECONDS = 2.0
+
+# How often long-running routes check whether their client has gone away
+DISCONNECT_POLL_INTERVAL_SECONDS = 0.5
+
 # CORS
 CORS_LOCALHOST_5173 = "http://localhost:5173"
 CORS_LOCALHOST_5174 = "http://localhost:5174"
@@ -19,6 +36,12 @@ CORS_LOCALHOST_5174 = "http://localhost:5174"
 # Cloudflare auth
 CF_KEYS_CACHE_TTL_SECONDS = 3600.0
 CF_KEYS_HTTP_TIMEOUT = 10.0
+# Start a background refresh this long before the cached keys reach their TTL
+CF_KEYS_REFRESH_AHEAD_SECONDS = 300.0
+# Minimum gap between JWKS fetch attempts (failed refreshes, unknown kid)
+CF_KEYS_MIN_REFRESH_INTERVAL_SECONDS = 60.0
+# Verified Access JWTs cached until their exp
+CF_TOKEN_CACHE_MAXSIZE = 1024
 
 # Rate limits
 DEFAULT_RATE_LIMIT = "120/minute"
@@ -54,6 +77,10 @@ ACCESS_LOG_BACKUP_COUNT = 10
 # SSE
 SSE_HEARTBEAT_INTERVAL = 30  # seconds
 
+# Reaction log pagination (events per page)
+REACTION_LOG_PAGE_SIZE = 500
+REACTION_LOG_MAX_PAGE_SIZE = 2000
+
 # Ask rides defaults
 ASK_RIDES_DEFAULT_COUNT = 6
 ASK_RIDES_DEFAULT_OFFSET = 0
@@ -1,23 +1,48 @@
 """Shared FastAPI dependencies for common validation and parameter parsing."""
 
 from discord.ext.commands import Bot
-from fastapi import HTTPException
+from fastapi import HTTPException, Request
 
-from bot.core.bot_instance import get_bot
-from bot.core.enums import JobName
+from api.bot_proxy import BotProxyResponse, forward_to_bot, is_api_worker
+from api.constants import BOT_STARTING_RETRY_AFTER_SECONDS
+from bot.core.bot_instance import get_bot, get_bot_status
+from bot.core.enums import BotStatus, JobName
 
 VALID_RIDE_TYPES = frozenset({JobName.FRIDAY, JobName.SUNDAY, "message_id"})
 VALID_RIDE_TYPES_NO_MSG = frozenset({JobName.FRIDAY, JobName.SUNDAY})
 
 
 def require_bot() -> Bot:
-    """Dependency that returns the bot instance or raises 503."""
+    """
+    Dependency that returns the bot instance or raises 503.
+
+    The API starts serving before the Discord gateway is ready, so while the
+    bot is still logging in this returns 503 with a ``Retry-After`` hint.
+    """
     bot = get_bot()
     if not bot:
+        if get_bot_status() == BotStatus.STARTING:
+            raise HTTPException(
+                status_code=503,
+                detail="Bot is starting, try again shortly",
+                headers={"Retry-After": str(BOT_STARTING_RETRY_AFTER_SECONDS)},
+            )
         raise HTTPException(status_code=503, detail="Bot not initialized")
     return bot
 
 
+async def run_on_bot_process(request: Request) -> None:
+    """
+    Dependency for routes that must run next to the Discord bot.
+
+    In a split deployment an API worker has no bot, so the request is forwarded
+    to the bot process and its response is returned as-is. Everywhere else this
+    does nothing and the route runs locally.
+    """
+    if is_api_worker():
+        raise BotProxyResponse(await forward_to_bot(request))
+
+
 def require_ready_bot() -> Bot:
     """Dependency that returns the bot instance only if it is ready."""
     bot = get_bot()
@@ -0,0 +1,47 @@
+"""
+Client-disconnect handling for slow routes.
+
+Starlette keeps running a handler after its client disconnects, so slow work
+(an LLM call, or the same call forwarded to the bot process) would otherwise
+run to completion for nobody.
+"""
+
+import asyncio
+import logging
+from collections.abc import Awaitable
+
+from fastapi import HTTPException, Request
+
+from api.constants import DISCONNECT_POLL_INTERVAL_SECONDS
+
+logger = logging.getLogger(__name__)
+
+
+async def cancel_on_disconnect[T](request: Request, awaitable: Awaitable[T]) -> T:
+    """
+    Await *awaitable*, cancelling it if the client goes away first.
+
+    The request body must already have been read: the disconnect check takes
+    messages from the same ASGI channel.
+
+    Args:
+        request: The incoming request to watch.
+        awaitable: The work to run on the client's behalf.
+
+    Returns:
+        The awaitable's result.
+
+    Raises:
+        HTTPException: 499 if the client disconnected and the work was cancelled.
+    """
+    task = asyncio.ensure_future(awaitable)
+    try:
+        while True:
+            done, _ = await asyncio.wait({task}, timeout=DISCONNECT_POLL_INTERVAL_SECONDS)
+            if done:
+                return task.result()
+            if await request.is_disconnected():
+                logger.info(f"Client disconnected, cancelling {request.method} {request.url.path}")
+                raise HTTPException(status_code=499, detail="Client closed request")
+    finally:
+        task.cancel()
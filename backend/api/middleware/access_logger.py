@@ -3,6 +3,11 @@ Access Logging Middleware
 
 This middleware logs all HTTP requests to a separate access log file with
 structured information including timing, status codes, and user context.
+
+It is plain ASGI rather than ``BaseHTTPMiddleware``: the response is passed
+through untouched (streaming and SSE responses included) and only the status
+line is observed. The file handler runs behind a queue listener so disk writes
+and rotation never block the event loop.
 """
 
 import logging
@@ -10,11 +15,11 @@ import time
 from logging.handlers import RotatingFileHandler
 from pathlib import Path
 
-from fastapi import Request
-from starlette.middleware.base import BaseHTTPMiddleware
+from starlette.requests import Request
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 
 from api.constants import ACCESS_LOG_BACKUP_COUNT, ACCESS_LOG_MAX_BYTES
-from bot.core.logger import txn_id_var
+from bot.core.logger import queue_handler_for, txn_id_var
 
 # Configure access logger
 access_logger = logging.getLogger("api.access")
@@ -37,10 +42,10 @@ access_file_handler = RotatingFileHandler(
 # Access log format: Apache Combined Log Format style
 access_formatter = logging.Formatter("%(asctime)s - %(message)s", datefmt="%Y-%m-%d %H:%M:%S")
 access_file_handler.setFormatter(access_formatter)
-access_logger.addHandler(access_file_handler)
+access_logger.addHandler(queue_handler_for(access_file_handler))
 
 
-class AccessLogMiddleware(BaseHTTPMiddleware):
+class AccessLogMiddleware:
     """
     Middleware to log HTTP access in a structured format.
 
@@ -48,36 +53,59 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
     - Client IP
     - HTTP method and path
     - Status code
-    - Response time
+    - Response time (until the response body has been sent)
     - User agent
     - Authenticated user (if available)
     """
 
-    async def dispatch(self, request: Request, call_next):
+    def __init__(self, app: ASGIApp) -> None:
         """
-        Process request and log access information.
+        Wrap the next ASGI application.
 
         Args:
-            request: The incoming HTTP request
-            call_next: The next middleware or route handler
+            app: The next middleware or router in the stack
+        """
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        """
+        Process the request and log access information once it has been answered.
 
-        Returns:
-            The HTTP response
+        Args:
+            scope: The ASGI connection scope
+            receive: The ASGI receive channel
+            send: The ASGI send channel
         """
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
         # Start timing
-        start_time = time.time()
+        start_time = time.perf_counter()
+        status_code = 500  # if the app raises before sending a response
+
+        async def send_wrapper(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_wrapper)
+        finally:
+            self._log(Request(scope), status_code, (time.perf_counter() - start_time) * 1000)
+
+    @staticmethod
+    def _log(request: Request, status_code: int, duration_ms: float) -> None:
+        # Skip logging for successful health checks
+        if request.url.path == "/health" and status_code == 200:
+            return
 
         # Get client IP (handle proxies)
         client_ip = request.client.host if request.client else "unknown"
         if "x-forwarded-for" in request.headers:
             client_ip = request.headers["x-forwarded-for"].split(",")[0].strip()
 
-        # Process request
-        response = await call_next(request)
-
-        # Calculate duration
-        duration_ms = (time.time() - start_time) * 1000
-
         # Get user info from request state (set by auth middleware)
         user_info = getattr(request.state, "user", None)
         user_email = user_info.get("email", "-") if user_info else "-"
@@ -93,21 +121,15 @@ class AccessLogMiddleware(BaseHTTPMiddleware):
             f"{client_ip} - {user_email} - "
             f"[txn:{txn_id}] "
             f'"{request.method} {request.url.path}" '
-            f"{response.status_code} - "
+            f"{status_code} - "
             f"{duration_ms:.2f}ms - "
             f'"{user_agent}"'
         )
 
-        # Skip logging for successful health checks
-        if request.url.path == "/health" and response.status_code == 200:
-            return response
-
         # Use different log levels based on status code
-        if response.status_code >= 500:
+        if status_code >= 500:
             access_logger.error(log_message)
-        elif response.status_code >= 400:
+        elif status_code >= 400:
             access_logger.warning(log_message)
         else:
             access_logger.info(log_message)
-
-        return response
@@ -1,18 +1,17 @@
 """Ask Rides API Routes."""
 
-import asyncio
-import json
 import logging
 from datetime import date, timedelta
 from typing import Literal
 
-from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi import APIRouter, Depends, Header, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field, field_validator, model_validator
 
 from api.auth import require_admin, require_ride_coordinator
+from api.conditional import RenderCache, conditional_json
 from api.constants import ASK_RIDES_DEFAULT_COUNT, ASK_RIDES_DEFAULT_OFFSET, SSE_HEARTBEAT_INTERVAL
-from api.dependencies import require_bot, require_ready_bot
+from api.dependencies import require_bot, require_ready_bot, run_on_bot_process
 from bot.core import messages_broadcaster
 from bot.core.enums import (
     AskRidesMessage,
@@ -48,6 +47,9 @@ logger = logging.getLogger(__name__)
 
 router = APIRouter(prefix="/api/ask-rides", tags=["ask-rides"])
 
+_templates_body = RenderCache()
+_schedule_body = RenderCache()
+
 
 class PauseRequest(BaseModel):
     """Request body for setting a pause."""
@@ -72,7 +74,7 @@ class SendNowRequest(BaseModel):
 
 @router.post(
     "/send-now",
-    dependencies=[Depends(require_ride_coordinator)],
+    dependencies=[Depends(require_ride_coordinator), Depends(run_on_bot_process)],
     summary="Manually Trigger Ask Rides",
     description="Manually trigger ask rides messages immediately for the requested scope.",
 )
@@ -99,6 +101,7 @@ async def send_now(request: SendNowRequest | None = None):
 
 @router.get(
     "/status",
+    dependencies=[Depends(run_on_bot_process)],
     summary="Get Ask Rides Status",
     description="Get the status of all automated ask rides jobs.",
 )
@@ -387,6 +390,7 @@ async def set_late_reaction_windows(payload: LateReactionWindowsPayload) -> dict
 
 @router.get(
     "/reactions/{message_type}",
+    dependencies=[Depends(run_on_bot_process)],
     summary="Get Reaction Breakdown",
     description="Get a detailed breakdown of user reactions on the target ask rides message.",
 )
@@ -489,9 +493,15 @@ def _serialize_template(message_type: AskRidesMessageType, template) -> dict:
     description="Get the effective (customized or default) title/body/color for all four "
     "ask-rides message types.",
 )
-async def get_message_templates() -> dict:
-    """Return all four effective templates plus allowed colors/placeholders."""
-    effective = await AskRidesMessagesService.get_effective_templates()
+async def get_message_templates(request: Request) -> Response:
+    """Return all four effective templates plus allowed colors/placeholders (ETag-aware)."""
+    effective = await AskRidesMessagesService.get_effective_templates_stamped()
+    return conditional_json(
+        request, _templates_body.get(effective.token, lambda: _templates_payload(effective.value))
+    )
+
+
+def _templates_payload(effective: dict) -> dict:
     return {
         "templates": {
             message_type.value: _serialize_template(message_type, template)
@@ -578,25 +588,16 @@ async def reset_message_template(message_type: str) -> dict:
     summary="Stream Ask Rides Message Template Updates",
     description="SSE stream of live ask-rides message template edits.",
 )
-async def message_templates_stream() -> StreamingResponse:
-    """SSE stream — emits a `templates_updated` event whenever a template is saved or reset."""
-
-    async def event_generator():
-        q = messages_broadcaster.subscribe()
-        try:
-            while True:
-                try:
-                    event = await asyncio.wait_for(q.get(), timeout=SSE_HEARTBEAT_INTERVAL)
-                    yield f"data: {json.dumps(event)}\n\n"
-                except TimeoutError:
-                    yield ": heartbeat\n\n"
-        except asyncio.CancelledError:
-            logger.debug("message_templates_stream: client disconnected")
-        finally:
-            messages_broadcaster.unsubscribe(q)
+async def message_templates_stream(
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
+    """
+    SSE stream — emits a `templates_updated` event whenever a template is saved or reset.
 
+    Clients reconnecting with `Last-Event-ID` are first replayed the events they missed.
+    """
     return StreamingResponse(
-        event_generator(),
+        messages_broadcaster.stream(SSE_HEARTBEAT_INTERVAL, last_event_id=last_event_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
@@ -628,9 +629,15 @@ def _serialize_schedule(schedule: EffectiveSchedule, slot: AskRidesScheduleSlot)
     description="Get the effective (customized or default) day/time for both ask-rides "
     "schedule slots.",
 )
-async def get_schedule() -> dict:
-    """Return both slots' effective schedules plus allowed days and the time window."""
-    effective = await AskRidesScheduleService.get_effective_schedules()
+async def get_schedule(request: Request) -> Response:
+    """Return both slots' effective schedules plus allowed days and the time window (ETag-aware)."""
+    effective = await AskRidesScheduleService.get_effective_schedules_stamped()
+    return conditional_json(
+        request, _schedule_body.get(effective.token, lambda: _schedule_payload(effective.value))
+    )
+
+
+def _schedule_payload(effective: dict) -> dict:
     return {
         "schedules": {
             slot.value: _serialize_schedule(schedule, slot) for slot, schedule in effective.items()
@@ -654,7 +661,7 @@ class UpdateScheduleRequest(BaseModel):
 
 @router.put(
     "/schedule/{slot}",
-    dependencies=[Depends(require_ride_coordinator)],
+    dependencies=[Depends(require_ride_coordinator), Depends(run_on_bot_process)],
     summary="Update Ask Rides Send Schedule",
     description="Save a customized day/time for one ask-rides schedule slot.",
 )
@@ -688,7 +695,7 @@ async def update_schedule(slot: str, body: UpdateScheduleRequest, request: Reque
 
 @router.delete(
     "/schedule/{slot}",
-    dependencies=[Depends(require_ride_coordinator)],
+    dependencies=[Depends(require_ride_coordinator), Depends(run_on_bot_process)],
     summary="Reset Ask Rides Send Schedule",
     description="Reset a customized ask-rides schedule slot back to its default.",
 )
@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
 from api.auth import require_ride_coordinator
+from api.dependencies import run_on_bot_process
 from bot.core.bot_instance import get_bot
 from bot.services.ride_coordinator_service import RideCoordinatorService, UserLookupStatus
 
@@ -49,7 +50,7 @@ async def get_coordinator() -> dict:
 
 @router.put(
     "/coordinator",
-    dependencies=[Depends(require_ride_coordinator)],
+    dependencies=[Depends(require_ride_coordinator), Depends(run_on_bot_process)],
     summary="Set Main Rides Coordinator",
     description="Sets the main rides coordinator user ID, with best-effort Discord verification.",
 )
@@ -2,10 +2,10 @@
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from api.dependencies import require_bot, validate_ride_type
+from api.dependencies import require_bot, run_on_bot_process, validate_ride_type
 from bot.core.enums import AskRidesMessage, JobName
 from bot.services.locations_service import LocationsService
 from bot.services.ride_coverage_service import RideCoverageService
@@ -57,6 +57,7 @@ class DriverReactionResponse(BaseModel):
 
 @router.get(
     "/{ride_type}",
+    dependencies=[Depends(run_on_bot_process)],
     response_model=PickupCoverageResponse,
     summary="Get Pickup Coverage",
     description="Check ride assignment coverage for users who requested a ride.",
@@ -87,6 +88,7 @@ async def get_pickup_coverage(ride_type: str):
 
 @router.post(
     "/sync",
+    dependencies=[Depends(run_on_bot_process)],
     response_model=SyncCoverageResponse,
     summary="Sync Ride Coverage",
     description="Force sync ride coverage by scanning recent messages for assignments.",
@@ -10,6 +10,7 @@ from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel
 
 from api.auth import require_admin
+from api.dependencies import run_on_bot_process
 from bot.core.enums import CacheNamespace
 from bot.services.feature_flags_service import FeatureFlagsService
 from bot.utils.cache import invalidate_namespace
@@ -46,7 +47,12 @@ async def list_feature_flags():
         raise HTTPException(status_code=500, detail=f"Failed to fetch feature flags: {e!s}") from e
 
 
-@router.put("/api/feature-flags/{feature_name}", dependencies=[Depends(require_admin)])
+# The bot process keeps its own flag cache, so in a split deployment the toggle
+# runs there for scheduled jobs to see it straight away.
+@router.put(
+    "/api/feature-flags/{feature_name}",
+    dependencies=[Depends(require_admin), Depends(run_on_bot_process)],
+)
 async def toggle_feature_flag(feature_name: str, update: FeatureFlagUpdate):
     """
     Toggle a feature flag on or off.
@@ -3,13 +3,19 @@
 import logging
 from typing import cast
 
-from fastapi import APIRouter, HTTPException, Request
+from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel, Field
 
 from api.constants import GROUP_RIDES_DEFAULT_CAPACITY, GROUP_RIDES_RATE_LIMIT
-from api.dependencies import parse_int_param, require_bot, validate_ride_type
+from api.dependencies import (
+    parse_int_param,
+    require_bot,
+    run_on_bot_process,
+    validate_ride_type,
+)
+from api.disconnect import cancel_on_disconnect
 from api.rate_limit import limiter
-from bot.core.enums import ChannelIds, JobName
+from bot.core.enums import ChannelIds, GroupingSolver, JobName
 from bot.services.group_rides_service import GroupRidesService
 
 logger = logging.getLogger(__name__)
@@ -32,6 +38,20 @@ class GroupRidesRequest(BaseModel):
         default=str(int(ChannelIds.REFERENCES__RIDES_ANNOUNCEMENTS)),
         description="Default to rides announcements channel",
     )
+    solver: GroupingSolver = Field(
+        default=GroupingSolver.LLM,
+        description="'llm' asks Gemini (falls back to 'local' on failure); "
+        "'local' uses the built-in route solver",
+    )
+    optimize_order: bool = Field(
+        default=False,
+        description="Reorder each driver's stops for the shortest drive and report the "
+        "minutes saved in the summary",
+    )
+    regenerate: bool = Field(
+        default=False,
+        description="Ask the LLM again even if an identical grouping is cached",
+    )
 
 
 class GroupRidesResponse(BaseModel):
@@ -49,6 +69,7 @@ class GroupRidesResponse(BaseModel):
 
 @router.post(
     "",
+    dependencies=[Depends(run_on_bot_process)],
     response_model=GroupRidesResponse,
     summary="Group Rides",
     description="Automatically group people from pickup locations into cars based on driver capacity.",
@@ -82,11 +103,17 @@ async def group_rides(request: Request, body: GroupRidesRequest):
     try:
         # Create service and call the API method
         service = GroupRidesService(bot)
-        result = await service.group_rides_api(
-            message_id=message_id_int,
-            day=body.ride_type if body.ride_type in [JobName.FRIDAY, JobName.SUNDAY] else None,
-            driver_capacity=body.driver_capacity,
-            channel_id=channel_id_int,
+        result = await cancel_on_disconnect(
+            request,
+            service.group_rides_api(
+                message_id=message_id_int,
+                day=body.ride_type if body.ride_type in [JobName.FRIDAY, JobName.SUNDAY] else None,
+                driver_capacity=body.driver_capacity,
+                channel_id=channel_id_int,
+                solver=body.solver,
+                optimize_order=body.optimize_order,
+                regenerate=body.regenerate,
+            ),
         )
 
         return GroupRidesResponse(
@@ -95,6 +122,8 @@ async def group_rides(request: Request, body: GroupRidesRequest):
             groupings=cast(list[str] | None, result.get("groupings")),
         )
 
+    except HTTPException:
+        raise
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
     except Exception as e:
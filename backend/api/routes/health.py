@@ -10,9 +10,11 @@ import os
 from fastapi import APIRouter
 from sqlalchemy import text
 
-from bot.core.bot_instance import get_bot
-from bot.core.database import AsyncSessionLocal
-from bot.core.lifecycle import get_failed_extensions
+from api.bot_proxy import fetch_bot_health, is_api_worker
+from bot.core.bot_instance import get_bot_status
+from bot.core.database import AsyncReadSessionLocal
+from bot.core.enums import BotStatus
+from bot.core.lifecycle import get_failed_extensions, get_startup_timings
 
 logger = logging.getLogger(__name__)
 
@@ -24,30 +26,49 @@ async def health_check():
     """
     Health check endpoint that verifies bot and database connectivity.
 
+    The API serves before the Discord gateway is ready, so bot readiness is
+    reported on its own: ``bot`` is ``"starting"`` while logging in and
+    ``status`` is ``"starting"`` (not ``"degraded"``) until it connects. In a
+    split deployment an API worker reports the bot process's view of the bot.
+
     Returns:
         Status dictionary with overall health and component statuses.
     """
-    bot = get_bot()
-    failed_extensions = get_failed_extensions()
-    bot_ok = bot is not None and bot.is_ready() and len(failed_extensions) == 0
+    if is_api_worker():
+        remote = await fetch_bot_health() or {}
+        bot_status = remote.get("bot", BotStatus.UNAVAILABLE)
+        failed_extensions = set(remote.get("failed_extensions", []))
+    else:
+        bot_status = get_bot_status()
+        failed_extensions = get_failed_extensions()
+    bot_ok = bot_status == BotStatus.CONNECTED and len(failed_extensions) == 0
 
     db_ok = False
     try:
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             await session.execute(text("SELECT 1"))
         db_ok = True
     except Exception:
         logger.exception("Health check: database unreachable")
 
-    overall = "ok" if (bot_ok and db_ok) else "degraded"
+    if bot_ok and db_ok:
+        overall = "ok"
+    elif bot_status == BotStatus.STARTING and db_ok and not failed_extensions:
+        overall = "starting"
+    else:
+        overall = "degraded"
 
     result: dict = {
         "status": overall,
-        "bot": "connected" if (bot is not None and bot.is_ready()) else "unavailable",
+        "bot": bot_status,
+        "bot_ready": bot_status == BotStatus.CONNECTED,
         "database": "connected" if db_ok else "unavailable",
     }
     if failed_extensions:
         result["failed_extensions"] = sorted(failed_extensions)
+    startup_timings = get_startup_timings()
+    if startup_timings:
+        result["startup_ms"] = startup_timings
     return result
 
 
@@ -3,10 +3,15 @@
 import logging
 
 import discord
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, Depends, HTTPException
 from pydantic import BaseModel, Field
 
-from api.dependencies import parse_int_param, require_bot, validate_ride_type
+from api.dependencies import (
+    parse_int_param,
+    require_bot,
+    run_on_bot_process,
+    validate_ride_type,
+)
 from bot.core.enums import AskRidesMessage, ChannelIds, JobName
 from bot.services.locations_service import LocationsService
 from bot.utils.custom_exceptions import NoMatchingMessageFoundError
@@ -43,6 +48,7 @@ class ListPickupsResponse(BaseModel):
 
 @router.post(
     "",
+    dependencies=[Depends(run_on_bot_process)],
     response_model=ListPickupsResponse,
     summary="List Pickups",
     description="Extracts and categorizes pickup locations from user reactions on a requested Discord message.",
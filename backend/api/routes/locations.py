@@ -6,8 +6,9 @@ Provides API access to location/pickup listing functionality.
 
 import logging
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 
+from api.dependencies import run_on_bot_process
 from bot.core.bot_instance import get_bot
 from bot.core.enums import ChannelIds
 from bot.services.locations_service import LocationsService
@@ -17,7 +18,7 @@ logger = logging.getLogger(__name__)
 router = APIRouter()
 
 
-@router.get("/api/locations/pickups-by-message")
+@router.get("/api/locations/pickups-by-message", dependencies=[Depends(run_on_bot_process)])
 async def get_pickups_by_message(
     message_id: str = Query(..., description="The Discord message ID"),
     channel_id: str = Query(
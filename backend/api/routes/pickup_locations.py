@@ -9,10 +9,11 @@ coordinator role.
 import logging
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from pydantic import BaseModel, Field, StringConstraints
 
 from api.auth import require_ride_coordinator
+from api.conditional import RenderCache, conditional_json
 from bot.services.pickup_locations_service import PickupLocationsService
 
 logger = logging.getLogger(__name__)
@@ -23,6 +24,8 @@ router = APIRouter(
     tags=["pickup-locations"],
 )
 
+_payload_body = RenderCache()
+
 TrimmedName = Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
 Latitude = Annotated[float, Field(ge=-90, le=90)]
 Longitude = Annotated[float, Field(ge=-180, le=180)]
@@ -116,9 +119,15 @@ class PickupAdjustmentResponse(BaseModel):
 
 
 @router.get("", response_model=PickupLocationsPayload, summary="Get Pickup Locations Payload")
-async def get_pickup_locations():
-    """Return all locations (incl. inactive), edges, mappings, and settings."""
-    return await PickupLocationsService.get_all()
+async def get_pickup_locations(request: Request) -> Response:
+    """Return all locations (incl. inactive), edges, mappings, and settings (ETag-aware)."""
+    payload = await PickupLocationsService.get_all_stamped()
+    return conditional_json(
+        request,
+        _payload_body.get(
+            payload.token, lambda: PickupLocationsPayload.model_validate(payload.value)
+        ),
+    )
 
 
 @router.post("", response_model=LocationOut, status_code=201, summary="Create Pickup Location")
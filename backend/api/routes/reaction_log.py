@@ -1,16 +1,18 @@
 """
 Reaction Log API Endpoint
 
-GET /api/reaction-log — returns ride reaction events grouped by message.
+GET /api/reaction-log — returns ride reaction events grouped by message, one page at a time.
+GET /api/reaction-log/emojis — returns the distinct emojis in the log.
 """
 
 import datetime
 import logging
 
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Query
 from pydantic import BaseModel
 
 from api.auth import require_ride_coordinator
+from api.constants import REACTION_LOG_MAX_PAGE_SIZE, REACTION_LOG_PAGE_SIZE
 from bot.services.ride_reaction_log_service import RideReactionLogService
 
 logger = logging.getLogger(__name__)
@@ -43,6 +45,13 @@ class ReactionLogResponse(BaseModel):
     """Response model for the reaction log endpoint."""
 
     rides: list[RideGroup]
+    next_cursor: str | None = None
+
+
+class ReactionLogEmojisResponse(BaseModel):
+    """Response model for the reaction log emoji list."""
+
+    emojis: list[str]
 
 
 def _format_label(ride_type: str | None, ride_date: datetime.date | None) -> str:
@@ -73,47 +82,52 @@ async def get_reaction_log(
     date_from: datetime.date | None = None,
     date_to: datetime.date | None = None,
     emoji: str | None = None,
+    cursor: str | None = None,
+    limit: int = Query(REACTION_LOG_PAGE_SIZE, ge=1, le=REACTION_LOG_MAX_PAGE_SIZE),
 ):
     """
-    Return ride reaction events grouped by message, newest rides first.
+    Return one page of ride reaction events grouped by message, newest rides first.
 
     Query params (all optional):
         ride_type: friday | sunday | sunday_class | wednesday
         date_from: ISO date — include events on or after this ride_date
         date_to: ISO date — include events on or before this ride_date
         emoji: filter to a specific emoji string
+        cursor: next_cursor from the previous page
+        limit: maximum number of events in the page
+
+    A ride whose events span two pages appears at the end of one and the start
+    of the next; clients merge groups by message_id.
     """
     try:
-        sorted_groups = await RideReactionLogService.get_grouped_events(
+        page = await RideReactionLogService.get_grouped_events(
+            limit=limit,
             ride_type=ride_type,
             date_from=date_from,
             date_to=date_to,
             emoji=emoji,
+            cursor=cursor,
         )
-
-        rides = [
-            RideGroup(
-                message_id=mid,
-                ride_type=data["ride_type"],
-                ride_date=data["ride_date"],
-                label=_format_label(data["ride_type"], data["ride_date"]),
-                events=[
-                    ReactionEventOut(
-                        id=event.id,
-                        discord_username=event.discord_username,
-                        display_name=event.display_name,
-                        emoji=event.emoji,
-                        action=event.action,
-                        occurred_at=event.occurred_at,
-                    )
-                    for event in data["events"]
-                ],
-            )
-            for mid, data in sorted_groups
-        ]
-
-        return ReactionLogResponse(rides=rides)
-
+    except ValueError:
+        raise HTTPException(status_code=400, detail="Invalid cursor") from None
     except Exception:
         logger.exception("Failed to fetch reaction log")
         raise HTTPException(status_code=500, detail="Failed to fetch reaction log") from None
+
+    for group in page.groups:
+        group["label"] = _format_label(group["ride_type"], group["ride_date"])
+    return {"rides": page.groups, "next_cursor": page.next_cursor}
+
+
+@router.get(
+    "/api/reaction-log/emojis",
+    response_model=ReactionLogEmojisResponse,
+    dependencies=[Depends(require_ride_coordinator)],
+)
+async def get_reaction_log_emojis():
+    """Return every emoji that appears in the reaction log, for filter dropdowns."""
+    try:
+        return {"emojis": await RideReactionLogService.get_emojis()}
+    except Exception:
+        logger.exception("Failed to fetch reaction log emojis")
+        raise HTTPException(status_code=500, detail="Failed to fetch reaction log emojis") from None
@@ -4,11 +4,9 @@ Reaction Log Stream Endpoint
 GET /api/reaction-log/stream — SSE stream of live ride reaction events.
 """
 
-import asyncio
-import json
 import logging
 
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Header
 from fastapi.responses import StreamingResponse
 
 from api.auth import require_ride_coordinator
@@ -26,30 +24,19 @@ _HEARTBEAT_INTERVAL = SSE_HEARTBEAT_INTERVAL
     "/api/reaction-log/stream",
     dependencies=[Depends(require_ride_coordinator)],
 )
-async def reaction_log_stream() -> StreamingResponse:
+async def reaction_log_stream(
+    last_event_id: str | None = Header(None),
+) -> StreamingResponse:
     """
     SSE stream of live ride reaction events.
 
-    Yields a JSON data frame for each new event and a heartbeat comment
-    every 30 seconds to keep the connection alive through proxies.
+    Yields a JSON data frame (with an event id) for each new event and a
+    heartbeat comment every 30 seconds to keep the connection alive through
+    proxies. Clients reconnecting with `Last-Event-ID` are first replayed the
+    events they missed.
     """
-
-    async def event_generator():
-        q = reaction_broadcaster.subscribe()
-        try:
-            while True:
-                try:
-                    event = await asyncio.wait_for(q.get(), timeout=_HEARTBEAT_INTERVAL)
-                    yield f"data: {json.dumps(event)}\n\n"
-                except TimeoutError:
-                    yield ": heartbeat\n\n"
-        except asyncio.CancelledError:
-            logger.debug("reaction_log_stream: client disconnected")
-        finally:
-            reaction_broadcaster.unsubscribe(q)
-
     return StreamingResponse(
-        event_generator(),
+        reaction_broadcaster.stream(_HEARTBEAT_INTERVAL, last_event_id=last_event_id),
         media_type="text/event-stream",
         headers={
             "Cache-Control": "no-cache",
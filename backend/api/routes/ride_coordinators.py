@@ -6,6 +6,7 @@ from fastapi import APIRouter, Depends, HTTPException, Request
 from pydantic import BaseModel
 
 from api.auth import require_ride_coordinator
+from api.dependencies import run_on_bot_process
 from bot.core.bot_instance import get_bot
 from bot.core.enums import RoleIds
 from bot.services.role_management_service import RoleManagementService
@@ -13,7 +14,11 @@ from bot.utils.constants import GUILD_ID
 
 logger = logging.getLogger(__name__)
 
-router = APIRouter(prefix="/api/ride-coordinators", tags=["ride-coordinators"])
+router = APIRouter(
+    prefix="/api/ride-coordinators",
+    tags=["ride-coordinators"],
+    dependencies=[Depends(run_on_bot_process)],
+)
 
 
 def _get_guild():
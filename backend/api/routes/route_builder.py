@@ -10,16 +10,19 @@ Provides API access to route building functionality:
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 from pydantic import BaseModel, Field
 
-from bot.services.pickup_locations_service import PickupLocationsService
+from api.conditional import RenderCache, conditional_json
+from bot.services.pickup_locations_service import PickupLocationsService, RoutingContext
 from bot.services.route_service import RouteService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_map_locations_body = RenderCache()
+
 
 class MapLocation(BaseModel):
     """An active pickup location with coordinates and a Google Maps URL."""
@@ -42,9 +45,15 @@ class MapLocationsResponse(BaseModel):
     summary="List Map Locations",
     description="Active pickup locations with coordinates and Google Maps URLs.",
 )
-async def get_map_locations():
-    """Return active pickup locations for map display (any authenticated user)."""
+async def get_map_locations(request: Request) -> Response:
+    """Return active pickup locations for map display (any authenticated user, ETag-aware)."""
     routing = await PickupLocationsService.get_routing_context()
+    return conditional_json(
+        request, _map_locations_body.get(routing.version, lambda: _map_locations(routing))
+    )
+
+
+def _map_locations(routing: RoutingContext) -> MapLocationsResponse:
     return MapLocationsResponse(
         locations=[
             MapLocation(
@@ -66,6 +75,11 @@ class MakeRouteRequest(BaseModel):
         description="List of pickup location names to include in the route"
     )
     leave_time: str = Field(description="Desired departure time from campus (e.g. '1:30 PM')")
+    optimize_order: bool = Field(
+        default=False,
+        description="Reorder the stops to minimize total drive time instead of keeping "
+        "the given order",
+    )
 
 
 class MakeRouteResponse(BaseModel):
@@ -75,6 +89,12 @@ class MakeRouteResponse(BaseModel):
     route: str | None = Field(
         default=None, description="The formatted Google Maps route URL or text"
     )
+    order: list[str] | None = Field(
+        default=None, description="Resolved pickup location names in the order they are visited"
+    )
+    minutes_saved: int | None = Field(
+        default=None, description="Drive minutes saved by reordering (when optimize_order is set)"
+    )
     error: str | None = Field(default=None, description="Error message if the request failed")
 
 
@@ -111,10 +131,17 @@ async def make_route(request: MakeRouteRequest):
 
     try:
         routing = await PickupLocationsService.get_routing_context()
-        route = RouteService.make_route_from_names(routing, request.locations, request.leave_time)
-
-        logger.info(f"✅ Successfully generated route: {route}")
-        return MakeRouteResponse(success=True, route=route)
+        plan = RouteService.plan_route(
+            routing, request.locations, request.leave_time, request.optimize_order
+        )
+
+        logger.info(f"✅ Successfully generated route: {plan.route}")
+        return MakeRouteResponse(
+            success=True,
+            route=plan.route,
+            order=plan.order,
+            minutes_saved=plan.minutes_saved if request.optimize_order else None,
+        )
 
     except ValueError as e:
         raise HTTPException(status_code=400, detail=str(e)) from e
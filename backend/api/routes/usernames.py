@@ -6,21 +6,29 @@ GET /api/usernames — returns Discord username + display name pairs for @mentio
 
 import logging
 
-from fastapi import APIRouter, HTTPException
+from fastapi import APIRouter, HTTPException, Request, Response
 
+from api.conditional import RenderCache, conditional_json
 from bot.services.locations_service import LocationsService
 
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
+_usernames_body = RenderCache()
+
 
 @router.get("/api/usernames")
-async def get_usernames():
-    """Return Discord username + name pairs for @mention autocomplete."""
+async def get_usernames(request: Request) -> Response:
+    """Return Discord username + name pairs for @mention autocomplete (ETag-aware)."""
     try:
-        pairs = await LocationsService.get_all_discord_usernames()
-        return {"users": [{"username": u, "name": n} for u, n in pairs]}
+        pairs = await LocationsService.get_all_discord_usernames_stamped()
     except Exception:
         logger.exception("Failed to fetch usernames")
         raise HTTPException(status_code=500, detail="Failed to fetch usernames") from None
+    return conditional_json(
+        request,
+        _usernames_body.get(
+            pairs.token, lambda: {"users": [{"username": u, "name": n} for u, n in pairs.value]}
+        ),
+    )
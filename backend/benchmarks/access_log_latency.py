@@ -0,0 +1,141 @@
+"""
+Request latency with the access-logging middleware off, in its old form, and as pure ASGI.
+
+Drives a small FastAPI app in-process through ``httpx.ASGITransport`` with a
+few concurrent clients. Scenarios:
+
+- "off": no access logging at all.
+- "legacy": the previous ``BaseHTTPMiddleware`` writing through a
+  ``RotatingFileHandler`` on the event loop.
+- "asgi": ``AccessLogMiddleware`` with its queue-backed file handler.
+
+Both logging scenarios write to a temporary file with a small ``maxBytes`` so
+rotation happens during the run.
+
+Usage:
+    uv run python -m benchmarks.access_log_latency [--requests 5000] [--concurrency 16]
+"""
+
+import argparse
+import asyncio
+import logging
+import statistics
+import tempfile
+import time
+from logging.handlers import RotatingFileHandler
+from pathlib import Path
+
+import httpx
+from fastapi import FastAPI
+from starlette.middleware.base import BaseHTTPMiddleware
+
+from api.middleware import access_logger as access_log_module
+from api.middleware.access_logger import AccessLogMiddleware, access_formatter
+from bot.core.logger import queue_handler_for
+
+ROTATE_BYTES = 256 * 1024
+
+
+def _app(middleware: type | None) -> FastAPI:
+    app = FastAPI()
+    if middleware is not None:
+        app.add_middleware(middleware)
+
+    @app.get("/api/ping")
+    async def ping():
+        return {"ok": True}
+
+    return app
+
+
+def _legacy_middleware(bench_logger: logging.Logger) -> type:
+    class LegacyAccessLogMiddleware(BaseHTTPMiddleware):
+        async def dispatch(self, request, call_next):
+            start_time = time.time()
+            response = await call_next(request)
+            duration_ms = (time.time() - start_time) * 1000
+            bench_logger.info(
+                f'- - "{request.method} {request.url.path}" '
+                f"{response.status_code} - {duration_ms:.2f}ms"
+            )
+            return response
+
+    return LegacyAccessLogMiddleware
+
+
+async def _drive(app: FastAPI, requests: int, concurrency: int) -> dict:
+    latencies: list[float] = []
+    remaining = requests
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+
+        async def worker() -> None:
+            nonlocal remaining
+            while remaining > 0:
+                remaining -= 1
+                start = time.perf_counter()
+                await client.get("/api/ping")
+                latencies.append(time.perf_counter() - start)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(worker() for _ in range(concurrency)))
+        elapsed = time.perf_counter() - started
+
+    latencies.sort()
+    return {
+        "req/s": len(latencies) / elapsed,
+        "p50 ms": statistics.median(latencies) * 1000,
+        "p95 ms": latencies[int(len(latencies) * 0.95)] * 1000,
+        "p99 ms": latencies[int(len(latencies) * 0.99)] * 1000,
+    }
+
+
+def _file_handler(path: Path) -> RotatingFileHandler:
+    handler = RotatingFileHandler(path, maxBytes=ROTATE_BYTES, backupCount=2, encoding="utf-8")
+    handler.setFormatter(access_formatter)
+    return handler
+
+
+async def main() -> None:
+    """Run the three scenarios and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark access-logging middleware latency.")
+    parser.add_argument("--requests", type=int, default=5000)
+    parser.add_argument("--concurrency", type=int, default=16)
+    args = parser.parse_args()
+    # httpx logs every request at INFO; keep the console out of the measurement.
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+
+    rows = []
+    with tempfile.TemporaryDirectory() as tmp:
+        rows.append(
+            {"scenario": "off", **await _drive(_app(None), args.requests, args.concurrency)}
+        )
+
+        legacy_logger = logging.getLogger("benchmarks.access.legacy")
+        legacy_logger.setLevel(logging.INFO)
+        legacy_logger.propagate = False
+        legacy_logger.addHandler(_file_handler(Path(tmp) / "legacy.log"))
+        app = _app(_legacy_middleware(legacy_logger))
+        rows.append({"scenario": "legacy", **await _drive(app, args.requests, args.concurrency)})
+
+        # Point the real middleware's logger at a temp file instead of logs/access.log.
+        access_logger = access_log_module.access_logger
+        saved_handlers = access_logger.handlers[:]
+        access_logger.handlers = [queue_handler_for(_file_handler(Path(tmp) / "asgi.log"))]
+        try:
+            app = _app(AccessLogMiddleware)
+            rows.append({"scenario": "asgi", **await _drive(app, args.requests, args.concurrency)})
+        finally:
+            access_logger.handlers = saved_handlers
+
+    columns = ["scenario", "req/s", "p50 ms", "p95 ms", "p99 ms"]
+    print(" | ".join(f"{c:>10}" for c in columns))
+    for row in rows:
+        cells = [
+            f"{row[c]:>10.2f}" if isinstance(row[c], float) else f"{row[c]!s:>10}" for c in columns
+        ]
+        print(" | ".join(cells))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,117 @@
+"""
+Ride-grouping prompt size with the full routing graph versus the compact matrix.
+
+For each saved request in ``fixtures/grouping_requests.json`` the grouping
+prompt is built twice over the seeded routing graph:
+
+- "graph": the ``repr`` of the whole adjacency dict, START/END edges included,
+  as the prompt used to carry it.
+- "compact": ``llm_input_matrix``, i.e. only the requested locations (and
+  any the prompt's rules route through) with short ids and pairwise
+  shortest times.
+
+Offline, tokens are estimated at four characters per token. With ``--live``
+(needs ``GOOGLE_API_KEY``) tokens are counted by Gemini and each prompt is
+sent ``--repeats`` times to measure the median response latency.
+
+Usage:
+    uv run python -m benchmarks.grouping_prompt [--live] [--repeats 3]
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import statistics
+import time
+from pathlib import Path
+
+from bot.core.enums import CampusLivingLocations
+from bot.core.schemas import Identity, Passenger
+from bot.services.llm_service import LLMService
+from bot.services.ride_grouping import (
+    PassengersByLocation,
+    llm_input_drivers,
+    llm_input_matrix,
+    llm_input_pickups,
+)
+from tests.unit.routing_fixtures import make_seed_context
+
+FIXTURES = Path(__file__).parent / "fixtures" / "grouping_requests.json"
+CHARS_PER_TOKEN = 4
+
+
+def _passengers(pickups: dict[str, list[str]]) -> PassengersByLocation:
+    return {
+        location: [
+            Passenger(
+                identity=Identity(name=name, username=None),
+                living_location=CampusLivingLocations.SIXTH,
+                pickup_location=location,
+            )
+            for name in names
+        ]
+        for location, names in pickups.items()
+    }
+
+
+async def _latency(service: LLMService, prompt: str, repeats: int) -> float:
+    samples = []
+    for _ in range(repeats):
+        start = time.perf_counter()
+        await service.llm.ainvoke(prompt)
+        samples.append(time.perf_counter() - start)
+    return statistics.median(samples) * 1000
+
+
+async def main() -> None:
+    """Build both prompts for every fixture and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark ride-grouping prompt encodings.")
+    parser.add_argument("--live", action="store_true", help="Count tokens and time calls on Gemini")
+    parser.add_argument("--repeats", type=int, default=3)
+    args = parser.parse_args()
+    # _build_prompt logs the whole prompt; keep the console out of the measurement.
+    logging.getLogger("bot.services.llm_service").setLevel(logging.WARNING)
+
+    routing = make_seed_context()
+    service = LLMService()
+    rows = []
+    for request in json.loads(FIXTURES.read_text()):
+        passengers = _passengers(request["pickups"])
+        pickups = llm_input_pickups(passengers)
+        drivers = llm_input_drivers(request["drivers"])
+        for encoding, matrix in (
+            ("graph", repr(routing.graph)),
+            ("compact", llm_input_matrix(passengers, routing)),
+        ):
+            prompt = service._build_prompt(pickups, drivers, matrix, False, None)
+            row = {
+                "request": request["name"],
+                "encoding": encoding,
+                "matrix chars": len(matrix),
+                "chars": len(prompt),
+                "tokens": (
+                    service.llm.get_num_tokens(prompt)
+                    if args.live
+                    else len(prompt) // CHARS_PER_TOKEN
+                ),
+            }
+            if args.live:
+                row["p50 ms"] = await _latency(service, prompt, args.repeats)
+            rows.append(row)
+
+    columns = ["request", "encoding", "matrix chars", "chars", "tokens"] + (
+        ["p50 ms"] if args.live else []
+    )
+    print(" | ".join(f"{c:>18}" for c in columns))
+    for row in rows:
+        cells = [
+            f"{row[c]:>18.2f}" if isinstance(row[c], float) else f"{row[c]!s:>18}" for c in columns
+        ]
+        print(" | ".join(cells))
+    if not args.live:
+        print(f"(tokens estimated at {CHARS_PER_TOKEN} characters each; use --live to count)")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
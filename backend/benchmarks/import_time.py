@@ -0,0 +1,78 @@
+"""
+Cold-start import time of the two entry points.
+
+Runs each entry point's imports (``ENTRY_POINTS`` in
+``tests/unit/test_import_time.py``) in a fresh interpreter with
+``-X importtime`` and sums the cumulative time of the top-level imports. The
+unit test only checks that the LLM stack stays out of ``sys.modules``; this
+measures how long the cold import takes.
+
+Reported per entry point:
+
+- median s / max s: total import time over ``--repeats`` fresh interpreters.
+- slowest: the top-level import with the largest cumulative time in the
+  median run.
+
+Usage:
+    uv run python -m benchmarks.import_time [--repeats 5] [--budget 3.0]
+
+With ``--budget`` the run exits non-zero if any median exceeds it.
+"""
+
+import argparse
+import os
+import statistics
+import subprocess
+import sys
+
+from tests.unit.test_import_time import BACKEND_DIR, ENTRY_POINTS
+
+
+def _importtime(code: str) -> tuple[float, str]:
+    """Run *code* in a fresh interpreter; return (total seconds, slowest top-level import)."""
+    env = os.environ | {"TOKEN": os.environ.get("TOKEN", "test-token")}
+    proc = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", code],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    top_level: list[tuple[int, str]] = []
+    for line in proc.stderr.splitlines():
+        if not line.startswith("import time:"):
+            continue
+        _, cumulative, name = line.split("|")
+        if not cumulative.strip().isdigit():
+            continue  # header row
+        # Nested imports are indented further; top-level rows add up to the total.
+        if not name.startswith("  "):
+            top_level.append((int(cumulative), name.strip()))
+    slowest_us, slowest = max(top_level)
+    return sum(us for us, _ in top_level) / 1e6, f"{slowest} ({slowest_us / 1e6:.2f}s)"
+
+
+def main() -> None:
+    """Time every entry point's cold import and print a table."""
+    parser = argparse.ArgumentParser(description="Benchmark cold-start import time.")
+    parser.add_argument("--repeats", type=int, default=5)
+    parser.add_argument("--budget", type=float, default=None, help="fail above this many seconds")
+    args = parser.parse_args()
+
+    print(f"{'entry point':>12} | {'median s':>8} | {'max s':>8} | slowest")
+    over_budget = []
+    for name, code in sorted(ENTRY_POINTS.items()):
+        runs = sorted(_importtime(code) for _ in range(args.repeats))
+        median = statistics.median(total for total, _ in runs)
+        slowest = runs[len(runs) // 2][1]
+        print(f"{name:>12} | {median:>8.2f} | {runs[-1][0]:>8.2f} | {slowest}")
+        if args.budget is not None and median > args.budget:
+            over_budget.append(name)
+
+    if over_budget:
+        sys.exit(f"Over the {args.budget}s budget: {', '.join(over_budget)}")
+
+
+if __name__ == "__main__":
+    main()
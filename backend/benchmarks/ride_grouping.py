@@ -0,0 +1,203 @@
+"""
+Ride-grouping latency and quality over synthetic workloads.
+
+Generates reproducible rider/driver scenarios over the seeded pickup
+locations (``tests.unit.routing_fixtures``), from 5 to 500 riders under
+several driver capacity mixes, and runs the grouping pipeline on each:
+``_split_on_off_campus``, a solver, then ``create_output``.
+
+Solvers:
+
+- "local": ``solve_ride_groups``, the built-in route solver.
+- "stub": a stand-in for the LLM that fills cars in location order. It makes
+  no network call, so it measures the pipeline around the LLM and gives a
+  quality floor to compare against.
+
+A new solver only needs an entry in ``SOLVERS`` to be checked against the
+same scenarios.
+
+Reported per scenario and solver:
+
+- wall ms: the whole pipeline, median over ``--repeats`` runs.
+- drive min: drive minutes summed over drivers, START to END.
+- max late: the largest extra time any rider spends on the road compared
+  with driving straight from their pickup to END.
+- seats used: riders divided by the seats of the drivers used.
+
+Usage:
+    uv run python -m benchmarks.ride_grouping [--max-riders 500] [--repeats 3]
+"""
+
+import argparse
+import itertools
+import logging
+import math
+import random
+import statistics
+import time
+from collections.abc import Callable
+from datetime import time as clock_time
+
+from bot.services.group_rides_service import GroupRidesService
+from bot.services.pickup_locations_service import START_NODE, RoutingContext
+from bot.services.ride_grouping import LocationsPeopleType, PassengersByLocation, create_output
+from bot.services.ride_solver import RideGroups, solve_ride_groups
+from bot.services.route_service import RouteService
+from tests.unit.routing_fixtures import SEED_LIVING_TO_PICKUP, make_seed_context
+
+RIDER_COUNTS = (5, 10, 25, 50, 100, 250, 500)
+# Seats per driver, repeated until every rider fits with the given slack
+CAPACITY_MIXES = {
+    "fours": ((4,), 1.25),
+    "mixed": ((5, 4, 3, 2), 1.25),
+    "tight": ((4, 3), 1.0),
+}
+OFF_CAMPUS_SHARE = 0.1
+OFF_CAMPUS_LOCATIONS = ("Costa Verde", "Regents Court")
+END_LEAVE_TIME = clock_time(hour=19, minute=10)
+SEED = 7
+
+Solver = Callable[[PassengersByLocation, list[int], RoutingContext], RideGroups]
+
+
+def _stub_solver(
+    passengers_by_location: PassengersByLocation,
+    driver_capacities: list[int],
+    routing: RoutingContext,
+) -> RideGroups:
+    groups: RideGroups = {}
+    seats = iter(enumerate(driver_capacities))
+    driver, free = next(seats)
+    for location in sorted(passengers_by_location):
+        for passenger in passengers_by_location[location]:
+            while free == 0:
+                driver, free = next(seats)
+            groups.setdefault(f"Driver{driver}", []).append(
+                {"name": passenger.identity.name, "location": location}
+            )
+            free -= 1
+    return groups
+
+
+SOLVERS: dict[str, Solver] = {"local": solve_ride_groups, "stub": _stub_solver}
+
+
+def _riders(count: int) -> LocationsPeopleType:
+    """Riders spread over living locations, the same for every run of *count*."""
+    rng = random.Random(SEED * 1000 + count)
+    locations_people: LocationsPeopleType = {}
+    for i in range(count):
+        if rng.random() < OFF_CAMPUS_SHARE:
+            where = rng.choice(OFF_CAMPUS_LOCATIONS)
+        else:
+            where = rng.choice(list(SEED_LIVING_TO_PICKUP))
+        locations_people.setdefault(where, []).append((f"Rider{i}", f"rider{i}"))
+    return locations_people
+
+
+def _drivers(locations_people: LocationsPeopleType, mix: str) -> list[int]:
+    """Driver capacities for one mix, enough to seat every on-campus rider."""
+    pattern, slack = CAPACITY_MIXES[mix]
+    on_campus = sum(
+        len(people) for loc, people in locations_people.items() if loc in SEED_LIVING_TO_PICKUP
+    )
+    capacities: list[int] = []
+    for seats in itertools.cycle(pattern):
+        if sum(capacities) >= math.ceil(on_campus * slack):
+            break
+        capacities.append(seats)
+    return capacities
+
+
+def _quality(
+    groups: RideGroups, capacities: list[int], routing: RoutingContext
+) -> tuple[float, float, float]:
+    """Total drive minutes, max extra minutes for one rider, and share of used seats filled."""
+    total = 0.0
+    worst = 0.0
+    for stops in groups.values():
+        route = list(dict.fromkeys(stop["location"] for stop in stops))
+        total += routing.lookup_time(START_NODE, route[0]) + RouteService.drive_minutes(
+            routing, route
+        )
+        for k, location in enumerate(route):
+            extra = RouteService.drive_minutes(routing, route[k:]) - RouteService.drive_minutes(
+                routing, [location]
+            )
+            worst = max(worst, float(extra))
+    used = sum(capacities[int(driver.removeprefix("Driver"))] for driver in groups)
+    riders = sum(len(stops) for stops in groups.values())
+    return total, worst, riders / used if used else 0.0
+
+
+def _run(
+    service: GroupRidesService,
+    solver: Solver,
+    locations_people: LocationsPeopleType,
+    capacities: list[int],
+    routing: RoutingContext,
+) -> RideGroups:
+    passengers_by_location, off_campus = service._split_on_off_campus(locations_people, routing)
+    groups = solver(passengers_by_location, capacities, routing)
+    create_output(groups, passengers_by_location, END_LEAVE_TIME, off_campus, routing)
+    return groups
+
+
+def main() -> None:
+    """Run every scenario through every solver and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark ride grouping on synthetic riders.")
+    parser.add_argument("--max-riders", type=int, default=max(RIDER_COUNTS))
+    parser.add_argument("--repeats", type=int, default=3)
+    parser.add_argument("--solvers", nargs="+", choices=sorted(SOLVERS), default=sorted(SOLVERS))
+    args = parser.parse_args()
+    # create_output warns about nothing useful here and the solver logs at DEBUG.
+    logging.disable(logging.WARNING)
+
+    routing = make_seed_context()
+    service = GroupRidesService(bot=None)
+
+    rows = []
+    for riders in (n for n in RIDER_COUNTS if n <= args.max_riders):
+        locations_people = _riders(riders)
+        for mix in CAPACITY_MIXES:
+            capacities = _drivers(locations_people, mix)
+            for name in args.solvers:
+                samples = []
+                for _ in range(args.repeats):
+                    start = time.perf_counter()
+                    groups = _run(service, SOLVERS[name], locations_people, capacities, routing)
+                    samples.append(time.perf_counter() - start)
+                drive, late, seats = _quality(groups, capacities, routing)
+                rows.append(
+                    {
+                        "riders": riders,
+                        "mix": mix,
+                        "solver": name,
+                        "drivers": f"{len(groups)}/{len(capacities)}",
+                        "wall ms": statistics.median(samples) * 1000,
+                        "drive min": drive,
+                        "max late": late,
+                        "seats used": seats,
+                    }
+                )
+
+    columns = [
+        "riders",
+        "mix",
+        "solver",
+        "drivers",
+        "wall ms",
+        "drive min",
+        "max late",
+        "seats used",
+    ]
+    print(" | ".join(f"{c:>10}" for c in columns))
+    for row in rows:
+        cells = [
+            f"{row[c]:>10.2f}" if isinstance(row[c], float) else f"{row[c]!s:>10}" for c in columns
+        ]
+        print(" | ".join(cells))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,154 @@
+"""
+Concurrent read/write throughput with and without the SQLite performance profile.
+
+Simulates the production mix: a few tasks inserting ``ride_reaction_events``
+rows one commit at a time (reaction bursts) while dashboard readers run the
+reaction-log query. "baseline" is the old setup (one default engine, journal
+mode DELETE, no pragmas); "profile" is ``create_engines`` with WAL, pragmas and
+the reader/writer pool split.
+
+Usage:
+    uv run python -m benchmarks.sqlite_profile [--seconds 5] [--readers 8] [--writers 2]
+"""
+
+import argparse
+import asyncio
+import datetime
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker
+
+from bot.core.base import Base
+from bot.core.database import SqliteProfile, create_engines
+from bot.core.models import RideReactionEvent
+
+SEED_ROWS = 5000
+
+
+def _event(i: int) -> RideReactionEvent:
+    return RideReactionEvent(
+        message_id=str(1000 + i % 40),
+        discord_username=f"user{i % 300}",
+        display_name=f"User {i % 300}",
+        emoji="🍔",
+        action="add" if i % 3 else "remove",
+        occurred_at=datetime.datetime.now(datetime.UTC),
+        ride_date=datetime.date(2026, 1, 1) + datetime.timedelta(days=i % 120),
+        ride_type="friday" if i % 2 else "sunday",
+    )
+
+
+async def _seed(engine: AsyncEngine) -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+    async with factory() as session:
+        session.add_all(_event(i) for i in range(SEED_ROWS))
+        await session.commit()
+
+
+async def _run(
+    writer: AsyncEngine, reader: AsyncEngine, seconds: float, readers: int, writers: int
+) -> dict:
+    write_factory = async_sessionmaker(writer, expire_on_commit=False, class_=AsyncSession)
+    read_factory = async_sessionmaker(reader, expire_on_commit=False, class_=AsyncSession)
+    deadline = time.perf_counter() + seconds
+    read_latencies: list[float] = []
+    writes = 0
+    errors = 0
+
+    async def write_loop(offset: int) -> None:
+        nonlocal writes, errors
+        i = offset
+        while time.perf_counter() < deadline:
+            try:
+                async with write_factory() as session:
+                    session.add(_event(i))
+                    await session.commit()
+                writes += 1
+            except Exception:
+                errors += 1
+            i += writers
+
+    async def read_loop() -> None:
+        nonlocal errors
+        while time.perf_counter() < deadline:
+            start = time.perf_counter()
+            try:
+                async with read_factory() as session:
+                    stmt = (
+                        select(RideReactionEvent)
+                        .where(RideReactionEvent.ride_type == "friday")
+                        .order_by(RideReactionEvent.occurred_at.desc())
+                        .limit(200)
+                    )
+                    (await session.execute(stmt)).scalars().all()
+                read_latencies.append(time.perf_counter() - start)
+            except Exception:
+                errors += 1
+
+    await asyncio.gather(
+        *(write_loop(SEED_ROWS + n) for n in range(writers)),
+        *(read_loop() for _ in range(readers)),
+    )
+    read_latencies.sort()
+    return {
+        "reads/s": len(read_latencies) / seconds,
+        "writes/s": writes / seconds,
+        "read p50 ms": statistics.median(read_latencies) * 1000 if read_latencies else 0.0,
+        "read p95 ms": (
+            read_latencies[int(len(read_latencies) * 0.95)] * 1000 if read_latencies else 0.0
+        ),
+        "errors": errors,
+    }
+
+
+async def _scenario(
+    name: str, profile: SqliteProfile, seconds: float, readers: int, writers: int
+) -> dict:
+    with tempfile.TemporaryDirectory() as tmp:
+        url = f"sqlite+aiosqlite:///{Path(tmp) / 'bench.db'}"
+        writer, reader = create_engines(url, profile)
+        try:
+            await _seed(writer)
+            result = await _run(writer, reader, seconds, readers, writers)
+        finally:
+            await writer.dispose()
+            await reader.dispose()
+    return {"scenario": name, **result}
+
+
+async def main() -> None:
+    """Run the baseline and profile scenarios and print a comparison table."""
+    parser = argparse.ArgumentParser(description="Benchmark the SQLite performance profile.")
+    parser.add_argument("--seconds", type=float, default=5.0)
+    parser.add_argument("--readers", type=int, default=8)
+    parser.add_argument("--writers", type=int, default=2)
+    args = parser.parse_args()
+
+    rows = [
+        await _scenario(
+            "baseline",
+            SqliteProfile(enabled=False),
+            args.seconds,
+            args.readers,
+            args.writers,
+        ),
+        await _scenario("profile", SqliteProfile(), args.seconds, args.readers, args.writers),
+    ]
+
+    columns = ["scenario", "reads/s", "writes/s", "read p50 ms", "read p95 ms", "errors"]
+    print(" | ".join(f"{c:>12}" for c in columns))
+    for row in rows:
+        cells = [
+            f"{row[c]:>12.1f}" if isinstance(row[c], float) else f"{row[c]!s:>12}" for c in columns
+        ]
+        print(" | ".join(cells))
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
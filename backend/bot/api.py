@@ -14,9 +14,18 @@ from contextlib import asynccontextmanager
 
 from dotenv import load_dotenv
 
-from bot.core.bot_instance import set_bot_instance
+from bot.core import broadcaster
+from bot.core.bot_instance import set_bot_instance, set_bot_task
 from bot.core.error_reporter import send_error_to_discord
-from bot.core.lifecycle import attach_event_handlers, build_bot, load_extensions, startup
+from bot.core.lifecycle import (
+    attach_event_handlers,
+    build_bot,
+    connect_redis_backends,
+    load_extensions,
+    shutdown,
+    startup,
+)
+from bot.services.feature_flags_service import FeatureFlagsService
 
 logger = logging.getLogger(__name__)
 
@@ -26,6 +35,30 @@ if not TOKEN and os.getenv("DISABLE_DISCORD_BOT", "").lower() != "true":
     logger.error("CRITICAL: TOKEN is not set")
     sys.exit(1)
 
+# "background" (default): serve the API as soon as the database is ready and let
+# the Discord gateway connect behind it. "blocking": wait for the bot to be ready
+# before the API starts accepting requests (the previous behaviour).
+BOT_STARTUP_MODE = os.getenv("BOT_STARTUP_MODE", "background").lower()
+
+
+def _log_bot_exit(task: asyncio.Task) -> None:
+    """Surface a bot task that dies on its own (bad token, gateway failure)."""
+    if task.cancelled():
+        return
+    exc = task.exception()
+    if exc is not None:
+        logger.error("Discord bot stopped unexpectedly", exc_info=exc)
+
+
+async def _wait_until_ready(bot, bot_task: asyncio.Task) -> None:
+    """Poll until *bot* is ready, giving up if its task has already finished."""
+    while not bot.is_ready():
+        if bot_task.done():
+            logger.error("Discord bot exited before becoming ready")
+            return
+        await asyncio.sleep(0.1)
+    logger.info("🤖 Discord bot is ready and connected!")
+
 
 @asynccontextmanager
 async def bot_lifespan():
@@ -35,6 +68,11 @@ async def bot_lifespan():
     Handles bot initialization, startup, and shutdown.
     Sets the global bot instance for API access.
 
+    Database startup and cog loading always finish before this yields. With
+    ``BOT_STARTUP_MODE=background`` it then yields straight away while the bot
+    logs in, so DB-only routes and ``/health`` serve immediately and routes that
+    depend on ``require_bot`` answer 503 until the gateway is ready.
+
     Usage:
         async with bot_lifespan():
             # Bot is running
@@ -62,16 +100,22 @@ async def bot_lifespan():
 
     assert TOKEN is not None  # guarded by sys.exit(1) above when DISABLE_DISCORD_BOT is false
     bot_task = asyncio.create_task(bot.start(TOKEN))
+    bot_task.add_done_callback(_log_bot_exit)
+    set_bot_task(bot_task)
+    ready_task: asyncio.Task | None = None
 
     try:
-        while not bot.is_ready():
-            await asyncio.sleep(0.1)
-
-        logger.info("🤖 Discord bot is ready and connected!")
+        if BOT_STARTUP_MODE == "blocking":
+            await _wait_until_ready(bot, bot_task)
+        else:
+            logger.info("🌐 Serving API while the Discord bot connects in the background")
+            ready_task = asyncio.create_task(_wait_until_ready(bot, bot_task))
         yield bot
 
     finally:
         logger.info("🛑 Shutting down Discord bot...")
+        if ready_task is not None:
+            ready_task.cancel()
         try:
             await asyncio.wait_for(bot.close(), timeout=10.0)
         except TimeoutError:
@@ -79,5 +123,26 @@ async def bot_lifespan():
         bot_task.cancel()
         with contextlib.suppress(asyncio.CancelledError, Exception):
             await bot_task
+        await shutdown()
         set_bot_instance(None)
         logger.info("✅ Discord bot shutdown complete")
+
+
+@asynccontextmanager
+async def api_worker_lifespan():
+    """
+    Async context manager for an API worker in a split deployment.
+
+    The bot runs in its own process (``main.py``), which owns the database
+    setup, seeds and scheduled jobs. A worker only joins the shared Redis cache
+    and SSE event bus and keeps its feature flag cache in step with the other
+    processes; requests that need the live bot are forwarded to it.
+    """
+    logger.info("🌐 DEPLOYMENT_MODE=split — serving the API without the Discord bot")
+    await connect_redis_backends()
+    flags_task = asyncio.create_task(FeatureFlagsService.watch_cache())
+    try:
+        yield
+    finally:
+        flags_task.cancel()
+        await broadcaster.get_backend().close()
@@ -8,8 +8,7 @@ from dataclasses import dataclass, field
 import discord
 from discord.ext import commands
 
-from agent.ridebot_agent import run_agent
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal
 from bot.core.enums import ChannelIds, FeatureFlagNames, RoleIds
 from bot.repositories.feature_flags_repository import FeatureFlagsRepository
 from bot.utils.cache_backends import get_backend
@@ -30,6 +29,18 @@ _ALLOWED_CHANNEL_IDS: frozenset[int] = frozenset(
 )
 
 
+def _run_agent(prompt: str, history: list) -> tuple[str, list]:
+    """
+    Run one agent turn (blocking; call via ``asyncio.to_thread``).
+
+    The agent module pulls in langchain, so it is imported on the first turn
+    instead of when the cog loads at bot startup.
+    """
+    from agent.ridebot_agent import run_agent
+
+    return run_agent(prompt, history)
+
+
 @dataclass
 class _ThreadBuffer:
     """Pending messages and debounce task for a single thread."""
@@ -62,7 +73,7 @@ class Agent(commands.Cog):
         return any(r.id == int(RoleIds.RIDE_COORDINATOR) for r in member.roles)
 
     async def _is_feature_enabled(self) -> bool:
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             return (
                 await FeatureFlagsRepository.get_feature_flag_status(
                     session, FeatureFlagNames.AGENT
@@ -115,7 +126,7 @@ class Agent(commands.Cog):
 
         async with thread.typing():
             try:
-                reply, updated_history = await asyncio.to_thread(run_agent, combined, history)
+                reply, updated_history = await asyncio.to_thread(_run_agent, combined, history)
             except Exception:
                 logger.exception("Agent: error during run_agent in thread reply")
                 await thread.send("Sorry, something went wrong. Please try again.")
@@ -209,7 +220,7 @@ class Agent(commands.Cog):
 
         async with thread.typing():
             try:
-                reply, history = await asyncio.to_thread(run_agent, prompt, [])
+                reply, history = await asyncio.to_thread(_run_agent, prompt, [])
             except Exception:
                 logger.exception("Agent: error during run_agent in new thread")
                 await thread.send("Sorry, something went wrong. Please try again.")
@@ -4,7 +4,7 @@ import discord
 from discord import app_commands
 from discord.ext import commands
 
-from bot.core.enums import FeatureFlagNames, JobName
+from bot.core.enums import FeatureFlagNames, GroupingSolver, JobName
 from bot.core.logger import log_cmd
 from bot.services.group_rides_service import GroupRidesService
 from bot.utils.channel_whitelist import LOCATIONS_CHANNELS_WHITELIST, cmd_is_allowed
@@ -27,6 +27,9 @@ class GroupRides(commands.Cog):
     @feature_flag_enabled(FeatureFlagNames.BOT)
     @discord.app_commands.describe(
         driver_capacity="Optional area to list driver capacities, default 5 drivers with capacity=4 each",
+        solver="llm (default) asks Gemini; local uses the built-in route solver",
+        optimize_order="Reorder each driver's stops for the shortest drive",
+        regenerate="Ask the LLM again instead of reusing an identical earlier grouping",
     )
     @log_cmd
     async def group_rides_friday(
@@ -35,6 +38,9 @@ class GroupRides(commands.Cog):
         driver_capacity: str = GROUP_RIDES_DEFAULT_CAPACITY,
         custom_prompt: str | None = None,
         legacy_prompt: bool = False,
+        solver: GroupingSolver = GroupingSolver.LLM,
+        optimize_order: bool = False,
+        regenerate: bool = False,
     ):
         """
         Groups riders with drivers for Friday fellowship.
@@ -44,6 +50,9 @@ class GroupRides(commands.Cog):
             driver_capacity: A string representing driver capacities (e.g., "44444").
             custom_prompt: A custom prompt to use for the LLM.
             legacy_prompt: Whether to use the legacy prompt.
+            solver: Which engine groups the riders.
+            optimize_order: Whether to reorder each driver's stops for the shortest drive.
+            regenerate: Whether to skip the cached grouping and ask the LLM again.
         """
         if not await cmd_is_allowed(
             interaction, interaction.channel_id, LOCATIONS_CHANNELS_WHITELIST
@@ -55,6 +64,9 @@ class GroupRides(commands.Cog):
             day=JobName.FRIDAY,
             legacy_prompt=legacy_prompt,
             custom_prompt=custom_prompt,
+            solver=solver,
+            optimize_order=optimize_order,
+            regenerate=regenerate,
         )
 
     @app_commands.command(
@@ -64,6 +76,9 @@ class GroupRides(commands.Cog):
     @feature_flag_enabled(FeatureFlagNames.BOT)
     @discord.app_commands.describe(
         driver_capacity="Optional area to list driver capacities, default 5 drivers with capacity=4 each",
+        solver="llm (default) asks Gemini; local uses the built-in route solver",
+        optimize_order="Reorder each driver's stops for the shortest drive",
+        regenerate="Ask the LLM again instead of reusing an identical earlier grouping",
     )
     @log_cmd
     async def group_rides_sunday(
@@ -72,6 +87,9 @@ class GroupRides(commands.Cog):
         driver_capacity: str = GROUP_RIDES_DEFAULT_CAPACITY,
         custom_prompt: str | None = None,
         legacy_prompt: bool = False,
+        solver: GroupingSolver = GroupingSolver.LLM,
+        optimize_order: bool = False,
+        regenerate: bool = False,
     ):
         """
         Groups riders with drivers for Sunday service.
@@ -80,6 +98,9 @@ class GroupRides(commands.Cog):
             interaction: The Discord interaction.
             driver_capacity: A string representing driver capacities (e.g., "44444").
             legacy_prompt: Whether to use the legacy prompt.
+            solver: Which engine groups the riders.
+            optimize_order: Whether to reorder each driver's stops for the shortest drive.
+            regenerate: Whether to skip the cached grouping and ask the LLM again.
         """
         if not await cmd_is_allowed(
             interaction, interaction.channel_id, LOCATIONS_CHANNELS_WHITELIST
@@ -91,6 +112,9 @@ class GroupRides(commands.Cog):
             day=JobName.SUNDAY,
             legacy_prompt=legacy_prompt,
             custom_prompt=custom_prompt,
+            solver=solver,
+            optimize_order=optimize_order,
+            regenerate=regenerate,
         )
 
     @app_commands.command(
@@ -101,6 +125,9 @@ class GroupRides(commands.Cog):
     @discord.app_commands.describe(
         message_id="The message ID to fetch pickups from",
         driver_capacity="Optional area to list driver capacities, default 5 drivers with capacity=4 each",
+        solver="llm (default) asks Gemini; local uses the built-in route solver",
+        optimize_order="Reorder each driver's stops for the shortest drive",
+        regenerate="Ask the LLM again instead of reusing an identical earlier grouping",
     )
     @log_cmd
     async def group_rides_message_id(
@@ -109,6 +136,9 @@ class GroupRides(commands.Cog):
         message_id: str,
         driver_capacity: str = GROUP_RIDES_DEFAULT_CAPACITY,
         legacy_prompt: bool = False,
+        solver: GroupingSolver = GroupingSolver.LLM,
+        optimize_order: bool = False,
+        regenerate: bool = False,
     ):
         """
         Groups riders with drivers based on a specific message ID.
@@ -118,6 +148,9 @@ class GroupRides(commands.Cog):
             message_id: The ID of the message to fetch pickups from.
             driver_capacity: A string representing driver capacities (e.g., "44444").
             legacy_prompt: Whether to use the legacy prompt.
+            solver: Which engine groups the riders.
+            optimize_order: Whether to reorder each driver's stops for the shortest drive.
+            regenerate: Whether to skip the cached grouping and ask the LLM again.
         """
         if not await cmd_is_allowed(
             interaction, interaction.channel_id, LOCATIONS_CHANNELS_WHITELIST
@@ -133,7 +166,13 @@ class GroupRides(commands.Cog):
             return
 
         await self.service.group_rides(
-            interaction, driver_capacity, message_id=message_id_int, legacy_prompt=legacy_prompt
+            interaction,
+            driver_capacity,
+            message_id=message_id_int,
+            legacy_prompt=legacy_prompt,
+            solver=solver,
+            optimize_order=optimize_order,
+            regenerate=regenerate,
         )
 
     @app_commands.command(
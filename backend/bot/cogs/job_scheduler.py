@@ -14,9 +14,11 @@ from bot.jobs.ask_rides import (
     run_ask_rides_wed,
     run_periodic_cache_warming,
 )
+from bot.jobs.sweep_auth_sessions import sweep_expired_auth_sessions
 from bot.jobs.sync_rides_locations import sync_rides_locations
 from bot.services.ask_rides_schedule_service import AskRidesScheduleService, EffectiveSchedule
 from bot.utils.ask_rides_schedule_defaults import DEFAULT_SCHEDULE
+from bot.utils.constants import AUTH_SESSION_SWEEP_HOUR, AUTH_SESSION_SWEEP_MINUTE
 from bot.utils.time_helpers import LA_TZ
 
 logger = logging.getLogger(__name__)
@@ -110,6 +112,12 @@ class JobScheduler(commands.Cog):
             id="sync_rides_locations",
         )
 
+        self.scheduler.add_job(
+            sweep_expired_auth_sessions,
+            CronTrigger(hour=AUTH_SESSION_SWEEP_HOUR, minute=AUTH_SESSION_SWEEP_MINUTE),
+            id="sweep_expired_auth_sessions",
+        )
+
         # self.scheduler.add_job(
         #     delete_past_pickups,
         #     CronTrigger(day_of_week="mon", hour=3, minute=0),
@@ -1,10 +1,14 @@
+import asyncio
 import logging
 
 from discord.ext.commands import Bot
 
+from bot.core.enums import BotStatus
+
 logger = logging.getLogger(__name__)
 
 _bot_instance: Bot | None = None
+_bot_task: asyncio.Task | None = None
 
 
 def get_bot() -> Bot | None:
@@ -12,7 +16,33 @@ def get_bot() -> Bot | None:
     return _bot_instance if _bot_instance and _bot_instance.is_ready() else None
 
 
+def get_bot_status() -> BotStatus:
+    """
+    Return the bot's readiness for health reporting.
+
+    ``CONNECTED`` once the gateway is ready, ``STARTING`` while the bot has
+    been created but is still logging in, and ``UNAVAILABLE`` otherwise,
+    including once the task running the bot has exited (``Client.start`` does
+    not close the client when login or the gateway connection fails).
+    """
+    if _bot_instance is None:
+        return BotStatus.UNAVAILABLE
+    if _bot_instance.is_ready():
+        return BotStatus.CONNECTED
+    if _bot_instance.is_closed() or (_bot_task is not None and _bot_task.done()):
+        return BotStatus.UNAVAILABLE
+    return BotStatus.STARTING
+
+
 def set_bot_instance(bot: Bot | None) -> None:
     """Set the global bot instance (called by the lifecycle manager)."""
-    global _bot_instance
+    global _bot_instance, _bot_task
     _bot_instance = bot
+    if bot is None:
+        _bot_task = None
+
+
+def set_bot_task(task: asyncio.Task | None) -> None:
+    """Record the task running ``bot.start`` so a failed login reports unavailable."""
+    global _bot_task
+    _bot_task = task
@@ -0,0 +1,403 @@
+"""
+Pub/sub behind the SSE endpoints.
+
+Each published event is serialized once and handed to a ``BroadcastBackend``,
+which assigns it an id, keeps recent events for ``Last-Event-ID`` replay, and
+delivers it to every process with a listening ``Broadcaster``. Each process
+then encodes the SSE frame once and fans it out to its own subscribers'
+bounded buffers, so one slow or stalled client can neither hold up
+``publish`` nor grow memory without limit.
+
+``InMemoryBroadcastBackend`` (the default) only reaches subscribers in the
+publishing process. ``RedisBroadcastBackend`` carries events over a Redis
+stream, so the bot can publish while any number of API workers serve the
+streams; ``lifecycle.startup`` switches to it whenever Redis is reachable.
+"""
+
+import asyncio
+import contextlib
+import json
+import logging
+import secrets
+from collections import deque
+from collections.abc import AsyncIterator, Callable
+from typing import Protocol, cast
+
+from bot.core.enums import SubscriberOverflowPolicy
+from bot.utils.constants import (
+    SSE_BUS_BLOCK_MS,
+    SSE_BUS_RETRY_SECONDS,
+    SSE_REPLAY_BUFFER_SIZE,
+    SSE_SUBSCRIBER_BUFFER_SIZE,
+)
+
+logger = logging.getLogger(__name__)
+
+HEARTBEAT_FRAME = ": heartbeat\n\n"
+# Sent instead of a replay when the client's Last-Event-ID can't be honoured
+# (too old, or from before a restart); clients treat it like any other change.
+RESYNC_FRAME = 'data: {"type": "resync"}\n\n'
+
+# Called with (event_id, serialized event) for every event on a channel.
+type Deliver = Callable[[str, str], None]
+# A Redis stream entry as returned with decode_responses=True: (id, fields).
+type _StreamEntry = tuple[str, dict[str, str]]
+
+
+class BroadcastBackend(Protocol):
+    """Protocol that all broadcast backends must implement."""
+
+    async def publish(self, channel: str, data: str) -> None:
+        """
+        Deliver a serialized event to every listener of *channel*, in any process.
+
+        Args:
+            channel: Broadcaster name.
+            data: The JSON-encoded event.
+        """
+        ...
+
+    async def replay(self, channel: str, last_event_id: str) -> list[tuple[str, str]] | None:
+        """
+        Return the events published on *channel* after *last_event_id*.
+
+        Returns:
+            (event_id, data) pairs, oldest first, or None if *last_event_id* is
+            unknown (malformed, expired, or from before a restart).
+        """
+        ...
+
+    def listen(self, channel: str, deliver: Deliver) -> None:
+        """Register *deliver* for events on *channel*. Idempotent; must run on the event loop."""
+        ...
+
+    async def close(self) -> None:
+        """Stop listening and release connections."""
+        ...
+
+
+# ---------------------------------------------------------------------------
+# In-memory backend (default)
+# ---------------------------------------------------------------------------
+
+
+class InMemoryBroadcastBackend:
+    """Single-process backend: ids are "<epoch>-<seq>" and recent events live in a ring buffer."""
+
+    def __init__(self, replay_buffer_size: int = SSE_REPLAY_BUFFER_SIZE) -> None:
+        self._replay_buffer_size = replay_buffer_size
+        # The epoch changes per process so ids from before a restart are
+        # recognised as unknown rather than replayed.
+        self._epoch = secrets.token_hex(4)
+        self._seq: dict[str, int] = {}
+        self._recent: dict[str, deque[tuple[int, str, str]]] = {}
+        self._listeners: dict[str, list[Deliver]] = {}
+
+    async def publish(self, channel: str, data: str) -> None:
+        """Assign the next id, remember the event, and deliver it synchronously."""
+        seq = self._seq.get(channel, 0) + 1
+        self._seq[channel] = seq
+        event_id = f"{self._epoch}-{seq}"
+        recent = self._recent.setdefault(channel, deque(maxlen=self._replay_buffer_size))
+        recent.append((seq, event_id, data))
+        for deliver in self._listeners.get(channel, []):
+            deliver(event_id, data)
+
+    async def replay(self, channel: str, last_event_id: str) -> list[tuple[str, str]] | None:
+        """Return events after *last_event_id* from the ring buffer, or None if unknown."""
+        epoch, _, seq = last_event_id.partition("-")
+        latest = self._seq.get(channel, 0)
+        if epoch != self._epoch or not seq.isdigit() or int(seq) > latest:
+            return None
+        last_seq = int(seq)
+        if last_seq == latest:
+            return []
+        recent = self._recent.get(channel, deque())
+        if not recent or recent[0][0] > last_seq + 1:
+            return None
+        return [(event_id, data) for s, event_id, data in recent if s > last_seq]
+
+    def listen(self, channel: str, deliver: Deliver) -> None:
+        """Register *deliver* for *channel*."""
+        listeners = self._listeners.setdefault(channel, [])
+        if deliver not in listeners:
+            listeners.append(deliver)
+
+    async def close(self) -> None:
+        """Nothing to release."""
+
+
+# ---------------------------------------------------------------------------
+# Redis backend (multi-process)
+# ---------------------------------------------------------------------------
+
+
+class RedisBroadcastBackend:
+    """
+    Redis-stream backend: ids are stream entry ids and the stream itself is the replay buffer.
+
+    Each process runs one reader task per channel it listens on (started with
+    the first local subscriber) that blocks on XREAD and delivers new entries.
+    """
+
+    _KEY_PREFIX = "sse"
+
+    def __init__(
+        self,
+        url: str = "redis://localhost:6379",
+        replay_buffer_size: int = SSE_REPLAY_BUFFER_SIZE,
+    ) -> None:
+        import redis.asyncio as aioredis
+
+        self._redis = aioredis.from_url(url, decode_responses=True)
+        self._replay_buffer_size = replay_buffer_size
+        self._listeners: dict[str, list[Deliver]] = {}
+        self._readers: dict[str, asyncio.Task] = {}
+        logger.info(f"RedisBroadcastBackend initialised (url={url})")
+
+    def _key(self, channel: str) -> str:
+        return f"{self._KEY_PREFIX}:{channel}"
+
+    async def publish(self, channel: str, data: str) -> None:
+        """Append the event to the channel's stream, trimmed to roughly the replay size."""
+        await self._redis.xadd(
+            self._key(channel),
+            {"data": data},
+            maxlen=self._replay_buffer_size,
+            approximate=True,
+        )
+
+    async def replay(self, channel: str, last_event_id: str) -> list[tuple[str, str]] | None:
+        """Return stream entries after *last_event_id*, or None if it is no longer in the stream."""
+        from redis.exceptions import ResponseError
+
+        key = self._key(channel)
+        try:
+            # Only replay from an id we still hold; otherwise there may be a gap.
+            if not await self._redis.xrange(key, min=last_event_id, max=last_event_id, count=1):
+                return None
+            entries = cast(
+                list[_StreamEntry],
+                await self._redis.xrange(key, min=f"({last_event_id}", max="+"),
+            )
+        except ResponseError:  # malformed id
+            return None
+        return [(event_id, fields["data"]) for event_id, fields in entries]
+
+    def listen(self, channel: str, deliver: Deliver) -> None:
+        """Register *deliver* and make sure this process is reading *channel*."""
+        listeners = self._listeners.setdefault(channel, [])
+        if deliver not in listeners:
+            listeners.append(deliver)
+        loop = asyncio.get_running_loop()
+        task = self._readers.get(channel)
+        if task is None or task.done() or task.get_loop() is not loop:
+            self._readers[channel] = loop.create_task(
+                self._read(channel), name=f"sse-bus-reader:{channel}"
+            )
+
+    async def _read(self, channel: str) -> None:
+        key = self._key(channel)
+        last_id = "$"  # only events published from now on
+        while True:
+            try:
+                response = cast(
+                    list[tuple[str, list[_StreamEntry]]] | None,
+                    await self._redis.xread({key: last_id}, block=SSE_BUS_BLOCK_MS),
+                )
+            except asyncio.CancelledError:
+                raise
+            except Exception:
+                logger.exception("SSE bus: failed to read %s, retrying", key)
+                await asyncio.sleep(SSE_BUS_RETRY_SECONDS)
+                continue
+            for _stream, entries in response or []:
+                for event_id, fields in entries:
+                    last_id = event_id
+                    for deliver in self._listeners.get(channel, []):
+                        deliver(event_id, fields["data"])
+
+    async def close(self) -> None:
+        """Cancel the reader tasks and close the connection pool."""
+        readers, self._readers = self._readers, {}
+        for task in readers.values():
+            task.cancel()
+        for task in readers.values():
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self._redis.aclose()
+
+
+# ---------------------------------------------------------------------------
+# Module-level backend
+# ---------------------------------------------------------------------------
+
+_backend: BroadcastBackend = InMemoryBroadcastBackend()
+
+
+def get_backend() -> BroadcastBackend:
+    """Return the active broadcast backend."""
+    return _backend
+
+
+def set_backend(backend: BroadcastBackend) -> None:
+    """Swap the broadcast backend.  Call once at startup, before any client subscribes."""
+    global _backend
+    _backend = backend
+    logger.info(f"Broadcast backend set to {type(backend).__name__}")
+
+
+# ---------------------------------------------------------------------------
+# Local fan-out
+# ---------------------------------------------------------------------------
+
+
+class Subscriber:
+    """One client's bounded buffer of encoded SSE frames."""
+
+    def __init__(self, maxsize: int, overflow: SubscriberOverflowPolicy) -> None:
+        # (event_id, frame); event_id is None for frames that carry no id
+        self._frames: deque[tuple[str | None, str]] = deque()
+        self._maxsize = maxsize
+        self._overflow = overflow
+        self._ready = asyncio.Event()
+        self.closed = False
+        self.dropped = 0
+
+    def __len__(self) -> int:
+        """Number of frames waiting to be sent."""
+        return len(self._frames)
+
+    def offer(self, frame: str, event_id: str | None = None) -> None:
+        """Queue a frame without blocking, applying the overflow policy when full."""
+        if self.closed:
+            return
+        if len(self._frames) >= self._maxsize:
+            if self._overflow is SubscriberOverflowPolicy.DISCONNECT:
+                self.close()
+                return
+            self._frames.popleft()
+            self.dropped += 1
+        self._frames.append((event_id, frame))
+        self._ready.set()
+
+    def prepend(self, frames: list[tuple[str | None, str]]) -> None:
+        """Put replayed frames ahead of live ones, dropping live duplicates."""
+        replayed = {event_id for event_id, _ in frames if event_id is not None}
+        live = [item for item in self._frames if item[0] not in replayed]
+        self._frames = deque([*frames, *live][-self._maxsize :])
+        if self._frames:
+            self._ready.set()
+
+    def close(self) -> None:
+        """Stop accepting frames; the stream ends once the buffer is drained."""
+        self.closed = True
+        self._ready.set()
+
+    async def next_frame(self, timeout: float) -> str | None:
+        """
+        Wait for the next frame.
+
+        Returns:
+            The frame, or None if *timeout* passed with nothing to send.
+
+        Raises:
+            EOFError: If the subscriber was closed and its buffer is empty.
+        """
+        if not self._frames and not self.closed:
+            self._ready.clear()
+            try:
+                await asyncio.wait_for(self._ready.wait(), timeout=timeout)
+            except TimeoutError:
+                return None
+        if self._frames:
+            return self._frames.popleft()[1]
+        raise EOFError
+
+
+def _frame(event_id: str, data: str) -> str:
+    return f"id: {event_id}\ndata: {data}\n\n"
+
+
+class Broadcaster:
+    """Fan-out of JSON events to this process's SSE subscribers, with Last-Event-ID replay."""
+
+    def __init__(
+        self,
+        name: str,
+        *,
+        subscriber_buffer_size: int = SSE_SUBSCRIBER_BUFFER_SIZE,
+        overflow: SubscriberOverflowPolicy = SubscriberOverflowPolicy.DROP_OLDEST,
+    ) -> None:
+        self.name = name
+        self._subscriber_buffer_size = subscriber_buffer_size
+        self._overflow = overflow
+        self._subscribers: set[Subscriber] = set()
+
+    def __len__(self) -> int:
+        """Number of connected subscribers in this process."""
+        return len(self._subscribers)
+
+    def subscribe(self) -> Subscriber:
+        """Register a subscriber for events published from now on."""
+        get_backend().listen(self.name, self._deliver)
+        subscriber = Subscriber(self._subscriber_buffer_size, self._overflow)
+        self._subscribers.add(subscriber)
+        logger.debug("%s: subscriber added (total=%d)", self.name, len(self._subscribers))
+        return subscriber
+
+    async def resume(self, subscriber: Subscriber, last_event_id: str) -> None:
+        """Queue, ahead of any live frames, what the client missed since *last_event_id*."""
+        events = await get_backend().replay(self.name, last_event_id)
+        if events is None:
+            subscriber.prepend([(None, RESYNC_FRAME)])
+        else:
+            subscriber.prepend([(event_id, _frame(event_id, data)) for event_id, data in events])
+
+    def unsubscribe(self, subscriber: Subscriber) -> None:
+        """Remove a subscriber."""
+        self._subscribers.discard(subscriber)
+        logger.debug("%s: subscriber removed (total=%d)", self.name, len(self._subscribers))
+
+    async def publish(self, event: dict) -> None:
+        """Serialize *event* once and hand it to the backend. Failures are logged, never raised."""
+        try:
+            await get_backend().publish(self.name, json.dumps(event))
+        except Exception:
+            logger.exception("%s: failed to publish event", self.name)
+
+    def _deliver(self, event_id: str, data: str) -> None:
+        if not self._subscribers:
+            return
+        frame = _frame(event_id, data)
+        logger.debug("%s: publishing to %d subscribers", self.name, len(self._subscribers))
+        for subscriber in list(self._subscribers):
+            subscriber.offer(frame, event_id)
+            if subscriber.closed:
+                logger.warning("%s: dropping subscriber that fell behind", self.name)
+                self.unsubscribe(subscriber)
+
+    async def stream(
+        self, heartbeat_interval: float, last_event_id: str | None = None
+    ) -> AsyncIterator[str]:
+        """
+        Yield SSE frames for one client until it disconnects or falls behind.
+
+        A heartbeat comment is sent whenever nothing was published for
+        *heartbeat_interval* seconds, to keep proxies from closing the connection.
+        """
+        # Subscribe before replaying so nothing published in between is lost.
+        subscriber = self.subscribe()
+        try:
+            if last_event_id:
+                await self.resume(subscriber, last_event_id)
+            while True:
+                try:
+                    frame = await subscriber.next_frame(heartbeat_interval)
+                except EOFError:
+                    return
+                yield HEARTBEAT_FRAME if frame is None else frame
+        except asyncio.CancelledError:
+            logger.debug("%s: client disconnected", self.name)
+        finally:
+            self.unsubscribe(subscriber)
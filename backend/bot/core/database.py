@@ -8,25 +8,164 @@ import logging
 import os
 import re
 import sys
-
-from sqlalchemy import select
-from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
+from dataclasses import dataclass
+from typing import Any
+
+from sqlalchemy import event, select, update
+from sqlalchemy.dialects.sqlite import insert as sqlite_insert
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import (
+    AsyncEngine,
+    AsyncSession,
+    async_sessionmaker,
+    create_async_engine,
+)
 
 from bot.core.base import Base
 from bot.core.enums import AccountRoles, FeatureFlagNames, JobName
 from bot.core.models import FeatureFlags, MessageSchedulePause, UserAccount
+from bot.utils.constants import (
+    SQLITE_BUSY_TIMEOUT_MS,
+    SQLITE_CACHE_SIZE_KIB,
+    SQLITE_MMAP_SIZE_BYTES,
+    SQLITE_POOL_TIMEOUT_SECONDS,
+    SQLITE_READ_POOL_SIZE,
+    SQLITE_WRITE_POOL_OVERFLOW,
+)
 
 logger = logging.getLogger(__name__)
 
 DATABASE_URL = os.getenv("DATABASE_URL", "sqlite+aiosqlite:///./db/bot.db")
 
-engine = create_async_engine(
-    DATABASE_URL,
-    echo=False,
-    pool_pre_ping=True,
-    pool_recycle=3600,
-)
+
+@dataclass(frozen=True)
+class SqliteProfile:
+    """
+    Connection-level SQLite tuning applied to every pooled connection on connect.
+
+    WAL lets readers run concurrently with the single writer, ``busy_timeout``
+    makes lock contention wait instead of failing with ``database is locked``,
+    and ``synchronous=NORMAL`` drops the per-commit fsync of the WAL (still
+    crash-safe, a power loss can only roll back the last few commits).
+    """
+
+    enabled: bool = True
+    journal_mode: str = "WAL"
+    synchronous: str = "NORMAL"
+    busy_timeout_ms: int = SQLITE_BUSY_TIMEOUT_MS
+    mmap_size: int = SQLITE_MMAP_SIZE_BYTES
+    cache_size_kib: int = SQLITE_CACHE_SIZE_KIB
+    read_pool_size: int = SQLITE_READ_POOL_SIZE
+    write_pool_overflow: int = SQLITE_WRITE_POOL_OVERFLOW
+
+    @classmethod
+    def from_env(cls) -> "SqliteProfile":
+        """Build a profile from ``SQLITE_*`` environment overrides."""
+        return cls(
+            enabled=os.getenv("SQLITE_PERFORMANCE_PROFILE", "true").lower() != "false",
+            journal_mode=os.getenv("SQLITE_JOURNAL_MODE", cls.journal_mode),
+            synchronous=os.getenv("SQLITE_SYNCHRONOUS", cls.synchronous),
+            busy_timeout_ms=int(os.getenv("SQLITE_BUSY_TIMEOUT_MS", cls.busy_timeout_ms)),
+            mmap_size=int(os.getenv("SQLITE_MMAP_SIZE", cls.mmap_size)),
+            cache_size_kib=int(os.getenv("SQLITE_CACHE_SIZE_KIB", cls.cache_size_kib)),
+            read_pool_size=int(os.getenv("SQLITE_READ_POOL_SIZE", cls.read_pool_size)),
+            write_pool_overflow=int(
+                os.getenv("SQLITE_WRITE_POOL_OVERFLOW", cls.write_pool_overflow)
+            ),
+        )
+
+    def pragmas(self, *, read_only: bool = False) -> list[str]:
+        """Return the PRAGMA statements to run on a freshly opened connection."""
+        statements = [
+            f"PRAGMA journal_mode={self.journal_mode}",
+            f"PRAGMA synchronous={self.synchronous}",
+            f"PRAGMA busy_timeout={self.busy_timeout_ms}",
+            f"PRAGMA mmap_size={self.mmap_size}",
+            # Negative cache_size is in KiB rather than pages.
+            f"PRAGMA cache_size=-{self.cache_size_kib}",
+            "PRAGMA temp_store=MEMORY",
+        ]
+        if read_only:
+            statements.append("PRAGMA query_only=ON")
+        return statements
+
+
+SQLITE_PROFILE = SqliteProfile.from_env()
+
+
+def _is_file_sqlite(url: str) -> bool:
+    """Whether *url* points at an on-disk SQLite database (not ``:memory:``)."""
+    parsed = make_url(url)
+    return parsed.get_backend_name() == "sqlite" and parsed.database not in (None, "", ":memory:")
+
+
+def _apply_profile(target: AsyncEngine, profile: SqliteProfile, *, read_only: bool) -> None:
+    """Register a connect hook that runs the profile's PRAGMAs on *target*'s connections."""
+    statements = profile.pragmas(read_only=read_only)
+
+    @event.listens_for(target.sync_engine, "connect")
+    def _on_connect(dbapi_connection: Any, _connection_record: Any) -> None:
+        cursor = dbapi_connection.cursor()
+        try:
+            for statement in statements:
+                cursor.execute(statement)
+        finally:
+            cursor.close()
+
+
+def create_engines(
+    url: str, profile: SqliteProfile = SQLITE_PROFILE
+) -> tuple[AsyncEngine, AsyncEngine]:
+    """
+    Create the (writer, reader) engine pair for *url*.
+
+    For an on-disk SQLite database with the profile enabled, the writer keeps
+    a single pooled connection (SQLite only ever admits one writer, so more
+    steady connections would just spin on the write lock) and the reader is a
+    small ``query_only`` pool that WAL lets run alongside it. Otherwise both
+    names refer to one default engine.
+
+    The writer may open ``write_pool_overflow`` extra connections, so a
+    writer session opened while another is held (a long mutation, or a
+    helper that opens its own session) gets a connection at once instead of
+    waiting out the pool timeout. Writes still take turns on SQLite's lock:
+    a session that writes while an outer session on the same task holds an
+    open write transaction fails after ``busy_timeout``, so never nest two
+    writing sessions.
+    """
+    if not (profile.enabled and _is_file_sqlite(url)):
+        default = create_async_engine(url, echo=False, pool_pre_ping=True, pool_recycle=3600)
+        return default, default
+
+    # No pool_pre_ping: a local file connection cannot go stale, and the extra
+    # SELECT 1 per checkout is a measurable share of a single-row commit.
+    writer = create_async_engine(
+        url,
+        echo=False,
+        pool_recycle=3600,
+        pool_size=1,
+        max_overflow=profile.write_pool_overflow,
+        pool_timeout=SQLITE_POOL_TIMEOUT_SECONDS,
+    )
+    reader = create_async_engine(
+        url,
+        echo=False,
+        pool_recycle=3600,
+        pool_size=profile.read_pool_size,
+        max_overflow=0,
+        pool_timeout=SQLITE_POOL_TIMEOUT_SECONDS,
+    )
+    _apply_profile(writer, profile, read_only=False)
+    _apply_profile(reader, profile, read_only=True)
+    return writer, reader
+
+
+engine, read_engine = create_engines(DATABASE_URL)
 AsyncSessionLocal = async_sessionmaker(engine, expire_on_commit=False, class_=AsyncSession)
+# Read-only sessions (query_only) for paths that never write: dashboard reads,
+# auth lookups, feature-flag checks and the health probe. They use the reader
+# pool so they never queue behind the single writer connection.
+AsyncReadSessionLocal = async_sessionmaker(read_engine, expire_on_commit=False, class_=AsyncSession)
 
 APP_ENV = os.getenv("APP_ENV", "local")
 
@@ -43,21 +182,28 @@ async def seed_feature_flags(session: AsyncSession):
     """
     Ensures that all feature flags defined in the enum exist in the database.
 
-    If a flag doesn't exist, it's created with a default 'disabled' state.
+    Missing flags are found with one bulk existence check and created in one
+    ``INSERT ... ON CONFLICT DO NOTHING`` with a default 'disabled' state.
 
     Args:
         session: The database session to use for querying and adding flags.
     """
-    for flag_name in FeatureFlagNames:
-        result = await session.execute(
-            select(FeatureFlags).where(FeatureFlags.feature == flag_name.value)
+    names = [flag_name.value for flag_name in FeatureFlagNames]
+    result = await session.execute(
+        select(FeatureFlags.feature).where(FeatureFlags.feature.in_(names))
+    )
+    existing = set(result.scalars().all())
+    missing = [name for name in names if name not in existing]
+
+    if missing:
+        # `enabled` defaults to False
+        await session.execute(
+            sqlite_insert(FeatureFlags)
+            .values([{"feature": name} for name in missing])
+            .on_conflict_do_nothing(index_elements=[FeatureFlags.feature])
         )
-        existing_flag = result.scalars().first()
-
-        if not existing_flag:
-            new_flag = FeatureFlags(feature=flag_name.value)  # `enabled` defaults to False
-            session.add(new_flag)
-            logger.info(f"🚩 Created feature flag '{flag_name.value}' (disabled by default).")
+        for name in missing:
+            logger.info(f"🚩 Created feature flag '{name}' (disabled by default).")
 
     await session.commit()
 
@@ -66,25 +212,62 @@ async def seed_message_schedule_pauses(session: AsyncSession):
     """
     Ensures that all message schedule pause rows exist in the database.
 
-    If a row doesn't exist for a job, it's created with a default un-paused state.
+    Missing rows are found with one bulk existence check and created in one
+    ``INSERT ... ON CONFLICT DO NOTHING`` with a default un-paused state.
 
     Args:
         session: The database session to use for querying and adding rows.
     """
-    for job_name in JobName:
-        result = await session.execute(
-            select(MessageSchedulePause).where(MessageSchedulePause.job_name == job_name)
+    result = await session.execute(
+        select(MessageSchedulePause.job_name).where(
+            MessageSchedulePause.job_name.in_(list(JobName))
         )
-        existing = result.scalars().first()
-
-        if not existing:
-            new_pause = MessageSchedulePause(job_name=job_name, is_paused=False)
-            session.add(new_pause)
+    )
+    existing = set(result.scalars().all())
+    missing = [job_name for job_name in JobName if job_name not in existing]
+
+    if missing:
+        await session.execute(
+            sqlite_insert(MessageSchedulePause)
+            .values([{"job_name": job_name, "is_paused": False} for job_name in missing])
+            .on_conflict_do_nothing(index_elements=[MessageSchedulePause.job_name])
+        )
+        for job_name in missing:
             logger.info(f"⏸️ Created message schedule pause for '{job_name}' (active by default).")
 
     await session.commit()
 
 
+async def _seed_accounts_with_role(
+    session: AsyncSession, emails: set[str], role: AccountRoles
+) -> tuple[list[str], list[str]]:
+    """
+    Ensure every email has an account with exactly *role*, in three statements.
+
+    Returns:
+        (created, updated) email lists, for logging by the caller.
+    """
+    result = await session.execute(
+        select(UserAccount.email, UserAccount.role).where(UserAccount.email.in_(emails))
+    )
+    existing: dict[str, AccountRoles] = dict(result.all())
+    created = sorted(emails - existing.keys())
+    updated = sorted(email for email, current in existing.items() if current != role)
+
+    if updated:
+        await session.execute(
+            update(UserAccount).where(UserAccount.email.in_(updated)).values(role=role)
+        )
+    if created:
+        await session.execute(
+            sqlite_insert(UserAccount)
+            .values([{"email": email, "role": role} for email in created])
+            .on_conflict_do_nothing(index_elements=[UserAccount.email])
+        )
+    await session.commit()
+    return created, updated
+
+
 async def seed_admin_accounts(session: AsyncSession):
     """
     Seeds admin accounts from the ADMIN_EMAILS environment variable.
@@ -104,19 +287,15 @@ async def seed_admin_accounts(session: AsyncSession):
         if not EMAIL_RE.match(email):
             logger.error(f"Invalid email in ADMIN_EMAILS: {email!r} — fix the env var and restart")
             sys.exit(1)
-        result = await session.execute(select(UserAccount).where(UserAccount.email == email))
-        existing = result.scalars().first()
-
-        if existing:
-            if existing.role != AccountRoles.ADMIN:
-                existing.role = AccountRoles.ADMIN
-                logger.info(f"👤 Updated '{email}' to admin role.")
-        else:
-            account = UserAccount(email=email, role=AccountRoles.ADMIN)
-            session.add(account)
-            logger.info(f"👤 Seeded admin account for '{email}'.")
 
-    await session.commit()
+    if not admin_emails:
+        return
+
+    created, updated = await _seed_accounts_with_role(session, admin_emails, AccountRoles.ADMIN)
+    for email in updated:
+        logger.info(f"👤 Updated '{email}' to admin role.")
+    for email in created:
+        logger.info(f"👤 Seeded admin account for '{email}'.")
 
 
 async def seed_bypass_account(session: AsyncSession) -> None:
@@ -125,16 +304,10 @@ async def seed_bypass_account(session: AsyncSession) -> None:
         return
 
     email = os.getenv("BYPASS_EMAIL", "bypass-emergency@local")
-    result = await session.execute(select(UserAccount).where(UserAccount.email == email))
-    existing = result.scalars().first()
-
-    if existing:
-        if existing.role != AccountRoles.RIDE_COORDINATOR:
-            existing.role = AccountRoles.RIDE_COORDINATOR
-            logger.info(f"👤 Updated bypass account '{email}' to ride_coordinator role.")
-    else:
-        account = UserAccount(email=email, role=AccountRoles.RIDE_COORDINATOR)
-        session.add(account)
+    created, updated = await _seed_accounts_with_role(
+        session, {email}, AccountRoles.RIDE_COORDINATOR
+    )
+    if updated:
+        logger.info(f"👤 Updated bypass account '{email}' to ride_coordinator role.")
+    if created:
         logger.info(f"👤 Seeded bypass account '{email}' with ride_coordinator role.")
-
-    await session.commit()
@@ -139,9 +139,44 @@ class CacheNamespace(StrEnum):
     ASK_RIDES_REACTIONS = "ask_rides_reactions"
     ASK_DRIVERS_REACTIONS = "ask_drivers_reactions"
     ASK_RIDES_STATUS = "ask_rides_status"
+    ACCOUNT_ROLES = "account_roles"
+    ASK_RIDES_TEMPLATES = "ask_rides_templates"
+    ASK_RIDES_SCHEDULES = "ask_rides_schedules"
+    DISCORD_USERNAMES = "discord_usernames"
+    RIDE_GROUPINGS = "ride_groupings"
+    SHARED_VERSIONS = "shared_versions"
     DEFAULT = "default"
 
 
+class SubscriberOverflowPolicy(StrEnum):
+    """What an SSE broadcaster does when a subscriber's buffer is full."""
+
+    DROP_OLDEST = "drop_oldest"
+    DISCONNECT = "disconnect"
+
+
+class DeploymentMode(StrEnum):
+    """How the Discord bot and the API are laid out across processes."""
+
+    COMBINED = "combined"
+    SPLIT = "split"
+
+
+class BotStatus(StrEnum):
+    """Readiness of the Discord bot as reported by health checks."""
+
+    STARTING = "starting"
+    CONNECTED = "connected"
+    UNAVAILABLE = "unavailable"
+
+
+class GroupingSolver(StrEnum):
+    """Which engine assigns riders to drivers in ride grouping."""
+
+    LLM = "llm"
+    LOCAL = "local"
+
+
 class AskRidesMessage(StrEnum):
     """Messages for asking for rides."""
 
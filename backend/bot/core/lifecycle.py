@@ -1,8 +1,10 @@
 """Shared bot lifecycle: construction, startup, extension loading, and event handlers."""
 
+import asyncio
 import logging
 import os
 import sys
+import time
 import traceback
 from collections.abc import Awaitable, Callable
 from pathlib import Path
@@ -14,6 +16,7 @@ from discord.ext import commands
 from discord.ext.commands import Bot
 from sqlalchemy import or_, update
 
+from bot.core import broadcaster
 from bot.core.database import (
     AsyncSessionLocal,
     init_db,
@@ -24,13 +27,15 @@ from bot.core.database import (
 )
 from bot.core.models import FeatureFlags
 from bot.repositories.feature_flags_repository import FeatureFlagsRepository
-from bot.utils.constants import REDIS_CONNECTION_TIMEOUT
+from bot.services.ride_reaction_event_writer import reaction_event_writer
+from bot.utils.constants import REDIS_CONNECTION_TIMEOUT, STARTUP_TIME_BUDGET_SECONDS
 
 logger = logging.getLogger(__name__)
 
 APP_ENV: str = os.getenv("APP_ENV", "local")
 
 _failed_extensions: set[str] = set()
+_startup_timings: dict[str, float] = {}
 
 
 def get_failed_extensions() -> set[str]:
@@ -52,33 +57,90 @@ def build_bot() -> Bot:
 
 
 async def startup() -> None:
-    """Initialize cache backend, database, seeds, feature flag cache, and local-env flags."""
-    if APP_ENV != "local":
-        import asyncio
+    """
+    Initialize cache backend, database, seeds, feature flag cache, and local-env flags.
+
+    The Redis probe runs alongside the database work, and the seeders that touch
+    different tables run concurrently once the schema exists. Each phase is
+    timed; see ``get_startup_timings``.
+    """
+    _startup_timings.clear()
+    started = time.perf_counter()
+
+    async def seed_accounts() -> None:
+        # Same table: the bypass account must be applied after ADMIN_EMAILS.
+        async with AsyncSessionLocal() as session:
+            await _timed("seed_admin_accounts", seed_admin_accounts(session))
+        async with AsyncSessionLocal() as session:
+            await _timed("seed_bypass_account", seed_bypass_account(session))
+
+    async def seed_flags() -> None:
+        async with AsyncSessionLocal() as session:
+            await _timed("seed_feature_flags", seed_feature_flags(session))
+        # Disable local-env flags before the cache is built so it never holds
+        # stale "enabled" values for jobs that must not run locally.
+        await _timed("disable_local_flags", _disable_features_for_local_env())
+        async with AsyncSessionLocal() as session:
+            await _timed("feature_flag_cache", FeatureFlagsRepository.initialize_cache(session))
+
+    async def seed_pauses() -> None:
+        async with AsyncSessionLocal() as session:
+            await _timed("seed_message_schedule_pauses", seed_message_schedule_pauses(session))
+
+    async def database() -> None:
+        await _timed("init_db", init_db())
+        await asyncio.gather(seed_flags(), seed_pauses(), seed_accounts())
+
+    await asyncio.gather(_timed("redis", connect_redis_backends()), database())
+
+    total = time.perf_counter() - started
+    _startup_timings["total"] = round(total * 1000, 1)
+    breakdown = ", ".join(f"{phase}={ms}ms" for phase, ms in _startup_timings.items())
+    logger.info(f"⏱️ Startup finished in {total:.2f}s ({breakdown})")
+    if total > STARTUP_TIME_BUDGET_SECONDS:
+        logger.warning(f"Startup took {total:.2f}s, over the {STARTUP_TIME_BUDGET_SECONDS}s budget")
+
+
+def get_startup_timings() -> dict[str, float]:
+    """Return the duration in milliseconds of each phase of the last ``startup()``."""
+    return dict(_startup_timings)
+
+
+async def _timed[T](phase: str, awaitable: Awaitable[T]) -> T:
+    """Await *awaitable* and record its wall time under *phase*."""
+    started = time.perf_counter()
+    try:
+        return await awaitable
+    finally:
+        _startup_timings[phase] = round((time.perf_counter() - started) * 1000, 1)
+
+
+async def connect_redis_backends() -> None:
+    """
+    Switch the cache and the SSE event bus to Redis outside local env.
+
+    Falls back to the in-memory backends (single process only) if Redis is unreachable.
+    """
+    if APP_ENV == "local":
+        return
 
-        redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
-        from bot.utils.cache_backends import RedisBackend, set_backend
+    redis_url = os.getenv("REDIS_URL", "redis://localhost:6379")
+    from bot.utils.cache_backends import RedisBackend, set_backend
 
-        backend = RedisBackend(redis_url)
-        try:
-            await asyncio.wait_for(backend._redis.ping(), timeout=REDIS_CONNECTION_TIMEOUT)  # ty: ignore[invalid-argument-type]
-            logger.info("Redis connection established")
-            set_backend(backend)
-        except Exception:
-            logger.warning("Redis unavailable at startup, falling back to in-memory cache")
+    backend = RedisBackend(redis_url)
+    try:
+        await asyncio.wait_for(backend._redis.ping(), timeout=REDIS_CONNECTION_TIMEOUT)  # ty: ignore[invalid-argument-type]
+        logger.info("Redis connection established")
+        set_backend(backend)
+        broadcaster.set_backend(broadcaster.RedisBroadcastBackend(redis_url))
+    except Exception:
+        logger.warning("Redis unavailable at startup, falling back to in-memory cache and events")
 
-    await init_db()
-    async with AsyncSessionLocal() as session:
-        await seed_feature_flags(session)
-    async with AsyncSessionLocal() as session:
-        await seed_message_schedule_pauses(session)
-    async with AsyncSessionLocal() as session:
-        await seed_admin_accounts(session)
-    async with AsyncSessionLocal() as session:
-        await seed_bypass_account(session)
-    async with AsyncSessionLocal() as session:
-        await FeatureFlagsRepository.initialize_cache(session)
-    await _disable_features_for_local_env()
+
+async def shutdown() -> None:
+    """Flush background writers and close the SSE event bus before the process exits."""
+    await reaction_event_writer.stop()
+    await broadcaster.get_backend().close()
 
 
 async def _disable_features_for_local_env() -> None:
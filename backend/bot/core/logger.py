@@ -4,14 +4,19 @@ Logger configuration.
 This module sets up the logging configuration for the application, including
 console handlers, file handlers with rotation, formatters, and log levels for
 external libraries.
+
+File handlers sit behind a QueueHandler/QueueListener pair so writes and
+rotation happen on a background thread instead of the event loop.
 """
 
+import atexit
 import contextvars
 import functools
 import logging
 import os
+import queue
 import uuid
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
 from pathlib import Path
 from typing import Any
 
@@ -63,6 +68,27 @@ class TransactionIdFilter(logging.Filter):
         return True
 
 
+def queue_handler_for(*handlers: logging.Handler) -> QueueHandler:
+    """
+    Return a QueueHandler feeding *handlers* from a background listener thread.
+
+    Records are formatted into plain messages on the calling thread, so filters
+    that read context variables must be attached to the returned QueueHandler,
+    not to *handlers*. The listener is stopped (and the queue drained) at exit.
+
+    Args:
+        handlers: The blocking handlers (files, rotation) to move off-thread.
+
+    Returns:
+        The handler to attach to the logger.
+    """
+    log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+    listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+    listener.start()
+    atexit.register(listener.stop)
+    return QueueHandler(log_queue)
+
+
 # ------------------------------
 # Root logger setup (your code)
 # ------------------------------
@@ -117,9 +143,12 @@ file_handler = RotatingFileHandler(
 )
 file_handler.setLevel(logging.DEBUG)
 file_handler.setFormatter(formatter)
-file_handler.addFilter(UserEmailFilter())
-file_handler.addFilter(TransactionIdFilter())
-logger.addHandler(file_handler)
+
+file_queue_handler = queue_handler_for(file_handler)
+file_queue_handler.setLevel(logging.DEBUG)
+file_queue_handler.addFilter(UserEmailFilter())
+file_queue_handler.addFilter(TransactionIdFilter())
+logger.addHandler(file_queue_handler)
 
 
 # ------------------------------
@@ -0,0 +1,22 @@
+"""
+Prometheus metrics for background work.
+
+Registered on the default registry, so they are served by the ``/metrics``
+endpoint the API already exposes.
+"""
+
+from prometheus_client import Counter, Gauge, Histogram
+
+AUTH_SESSIONS_SWEPT = Counter(
+    "auth_sessions_swept",
+    "Expired auth sessions deleted by the scheduled sweep.",
+)
+AUTH_SESSIONS_LAST_SWEEP_ROWS = Gauge(
+    "auth_sessions_last_sweep_rows",
+    "Expired auth sessions deleted by the most recent sweep.",
+)
+AUTH_SESSION_SWEEP_DURATION = Histogram(
+    "auth_session_sweep_duration_seconds",
+    "Wall time of the scheduled expired-session sweep.",
+    buckets=(0.01, 0.05, 0.1, 0.5, 1.0, 5.0, 15.0, 60.0),
+)
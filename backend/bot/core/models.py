@@ -8,7 +8,7 @@ from __future__ import annotations
 
 from datetime import date, datetime
 
-from sqlalchemy import CheckConstraint, ForeignKey, UniqueConstraint, func
+from sqlalchemy import CheckConstraint, ForeignKey, Index, UniqueConstraint, func
 from sqlalchemy import Enum as SQLEnum
 from sqlalchemy.orm import Mapped, mapped_column
 
@@ -254,6 +254,15 @@ class RideReactionEvent(Base):
     """Model representing a single reaction or unreaction on an ask-rides announcement message."""
 
     __tablename__ = "ride_reaction_events"
+    __table_args__ = (
+        # Reaction log: filter by ride type, page newest ride dates first.
+        Index(
+            "ix_ride_reaction_events_type_date_occurred",
+            "ride_type",
+            "ride_date",
+            "occurred_at",
+        ),
+    )
 
     id: Mapped[int] = mapped_column(primary_key=True, autoincrement=True)
     message_id: Mapped[str] = mapped_column(index=True)
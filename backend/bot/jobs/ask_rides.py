@@ -12,7 +12,7 @@ from typing import Literal
 import discord
 from discord.ext.commands import Bot
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import (
     AskRidesMessageType,
     AskRidesScheduleSlot,
@@ -665,7 +665,7 @@ async def get_ask_rides_status(bot: Bot) -> dict:
         JobName.SUNDAY_CLASS: fri_sun_send_day,
     }
 
-    async with AsyncSessionLocal() as session:
+    async with AsyncReadSessionLocal() as session:
         wednesday_enabled = await FeatureFlagsRepository.get_feature_flag_status(
             session, FeatureFlagNames.ASK_WEDNESDAY_RIDES_JOB
         )
@@ -0,0 +1,23 @@
+"""Job for deleting expired auth sessions."""
+
+import logging
+
+from bot.core.logger import log_job
+from bot.core.metrics import (
+    AUTH_SESSION_SWEEP_DURATION,
+    AUTH_SESSIONS_LAST_SWEEP_ROWS,
+    AUTH_SESSIONS_SWEPT,
+)
+from bot.services.auth_service import AuthService
+
+logger = logging.getLogger(__name__)
+
+
+@log_job
+async def sweep_expired_auth_sessions():
+    """Delete expired auth sessions in batches and record how many and how long."""
+    with AUTH_SESSION_SWEEP_DURATION.time():
+        deleted = await AuthService.sweep_expired_sessions()
+    AUTH_SESSIONS_SWEPT.inc(deleted)
+    AUTH_SESSIONS_LAST_SWEEP_ROWS.set(deleted)
+    logger.info("Swept %d expired auth sessions", deleted)
@@ -6,8 +6,9 @@ Data access layer for server-side session management.
 
 import logging
 from datetime import UTC, datetime
+from typing import cast
 
-from sqlalchemy import delete, select, update
+from sqlalchemy import Table, bindparam, delete, select, update
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.core.models import AuthSession
@@ -61,6 +62,38 @@ class AuthSessionsRepository:
         )
         await session.commit()
 
+    @staticmethod
+    async def update_activity_many(
+        session: AsyncSession, touches: dict[str, tuple[datetime, datetime]]
+    ) -> None:
+        """
+        Slide the expiry of several sessions in one executemany UPDATE.
+
+        Args:
+            session: The database session.
+            touches: session_id_hash -> (last_activity_at, expires_at).
+        """
+        if not touches:
+            return
+        table = cast(Table, AuthSession.__table__)
+        await session.execute(
+            update(table)
+            .where(table.c.session_id_hash == bindparam("b_session_id_hash"))
+            .values(
+                last_activity_at=bindparam("b_last_activity_at"),
+                expires_at=bindparam("b_expires_at"),
+            ),
+            [
+                {
+                    "b_session_id_hash": session_id_hash,
+                    "b_last_activity_at": last_activity_at,
+                    "b_expires_at": expires_at,
+                }
+                for session_id_hash, (last_activity_at, expires_at) in touches.items()
+            ],
+        )
+        await session.commit()
+
     @staticmethod
     async def delete_by_hash(session: AsyncSession, session_id_hash: str) -> None:
         """Delete a session by its hashed token (used on logout and expiry)."""
@@ -77,10 +110,31 @@ class AuthSessionsRepository:
         return result.rowcount or 0
 
     @staticmethod
-    async def delete_expired(session: AsyncSession) -> int:
-        """Delete all expired sessions and return the number of rows removed."""
-        result = await session.execute(
-            delete(AuthSession).where(AuthSession.expires_at < datetime.now(UTC))
-        )
+    async def delete_expired(
+        session: AsyncSession, limit: int | None = None, now: datetime | None = None
+    ) -> int:
+        """
+        Delete expired sessions and return the number of rows removed.
+
+        Args:
+            session: The database session.
+            limit: Delete at most this many rows (oldest expiry first), so a large
+                backlog can be cleared in short write transactions.
+            now: Cut-off time; defaults to the current UTC time.
+        """
+        cutoff = now or datetime.now(UTC)
+        stmt = delete(AuthSession)
+        if limit is None:
+            stmt = stmt.where(AuthSession.expires_at < cutoff)
+        else:
+            # Range scan on ix_auth_sessions_expires_at, already in expiry order.
+            oldest = (
+                select(AuthSession.id)
+                .where(AuthSession.expires_at < cutoff)
+                .order_by(AuthSession.expires_at)
+                .limit(limit)
+            )
+            stmt = stmt.where(AuthSession.id.in_(oldest))
+        result = await session.execute(stmt)
         await session.commit()
         return result.rowcount or 0
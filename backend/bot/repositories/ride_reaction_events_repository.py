@@ -3,7 +3,7 @@
 import datetime
 import logging
 
-from sqlalchemy import select
+from sqlalchemy import Row, and_, insert, or_, select, tuple_
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from bot.core.models import RideReactionEvent
@@ -15,58 +15,107 @@ class RideReactionEventsRepository:
     """Handles database operations for ride reaction events."""
 
     @staticmethod
-    async def record_event(
-        session: AsyncSession,
-        message_id: str,
-        discord_username: str,
-        display_name: str | None,
-        emoji: str,
-        action: str,
-        occurred_at: datetime.datetime,
-        ride_date: datetime.date | None,
-        ride_type: str | None,
-    ) -> RideReactionEvent:
-        """Insert a new ride reaction event row and return it with its generated id."""
+    async def record_events(session: AsyncSession, rows: list[dict]) -> int:
+        """
+        Insert many ride reaction events in a single transaction.
+
+        Args:
+            session: An active async database session.
+            rows: Column-name -> value dicts, one per event.
+
+        Returns:
+            The number of rows inserted.
+        """
+        if not rows:
+            return 0
         try:
-            entry = RideReactionEvent(
-                message_id=message_id,
-                discord_username=discord_username,
-                display_name=display_name,
-                emoji=emoji,
-                action=action,
-                occurred_at=occurred_at,
-                ride_date=ride_date,
-                ride_type=ride_type,
-            )
-            session.add(entry)
+            await session.execute(insert(RideReactionEvent), rows)
             await session.commit()
-            return entry
+            return len(rows)
         except Exception:
             await session.rollback()
             raise
 
     @staticmethod
-    async def get_events(
+    async def get_event_page(
         session: AsyncSession,
         ride_type: str | None = None,
         date_from: datetime.date | None = None,
         date_to: datetime.date | None = None,
         emoji: str | None = None,
-    ) -> list[RideReactionEvent]:
-        """Return ride reaction events filtered by the given criteria."""
+        after: tuple[datetime.date | None, str, datetime.datetime, int] | None = None,
+        limit: int = 500,
+    ) -> list[Row]:
+        """
+        Return one page of ride reaction events as plain rows, newest rides first.
+
+        Rows are ordered by (ride_date, message_id, occurred_at, id), all descending,
+        so each message's events are contiguous and can be grouped in one pass.
+        Events with no ride_date sort last.
+
+        Args:
+            session: An active async database session.
+            ride_type: Optional ride type filter.
+            date_from: Include events on or after this ride_date.
+            date_to: Include events on or before this ride_date.
+            emoji: Filter to a specific emoji string.
+            after: Sort key of the last row of the previous page (keyset cursor).
+            limit: Maximum number of rows to return.
+
+        Returns:
+            Core rows with the event columns (no ORM objects).
+        """
+        e = RideReactionEvent
         try:
-            stmt = select(RideReactionEvent)
+            stmt = select(
+                e.id,
+                e.message_id,
+                e.ride_type,
+                e.ride_date,
+                e.discord_username,
+                e.display_name,
+                e.emoji,
+                e.action,
+                e.occurred_at,
+            )
             if ride_type:
-                stmt = stmt.where(RideReactionEvent.ride_type == ride_type)
+                stmt = stmt.where(e.ride_type == ride_type)
             if date_from:
-                stmt = stmt.where(RideReactionEvent.ride_date >= date_from)
+                stmt = stmt.where(e.ride_date >= date_from)
             if date_to:
-                stmt = stmt.where(RideReactionEvent.ride_date <= date_to)
+                stmt = stmt.where(e.ride_date <= date_to)
             if emoji:
-                stmt = stmt.where(RideReactionEvent.emoji == emoji)
-            stmt = stmt.order_by(RideReactionEvent.occurred_at.desc())
+                stmt = stmt.where(e.emoji == emoji)
+            if after is not None:
+                ride_date, message_id, occurred_at, event_id = after
+                within_date = tuple_(e.message_id, e.occurred_at, e.id) < tuple_(
+                    message_id, occurred_at, event_id
+                )
+                if ride_date is None:
+                    stmt = stmt.where(e.ride_date.is_(None), within_date)
+                else:
+                    stmt = stmt.where(
+                        or_(
+                            e.ride_date < ride_date,
+                            e.ride_date.is_(None),
+                            and_(e.ride_date == ride_date, within_date),
+                        )
+                    )
+            stmt = stmt.order_by(
+                e.ride_date.desc().nulls_last(),
+                e.message_id.desc(),
+                e.occurred_at.desc(),
+                e.id.desc(),
+            ).limit(limit)
             result = await session.execute(stmt)
-            return list(result.scalars().all())
+            return list(result.all())
         except Exception:
             logger.exception("Failed to get ride reaction events")
             return []
+
+    @staticmethod
+    async def get_emojis(session: AsyncSession) -> list[str]:
+        """Return every distinct emoji that appears in the reaction log."""
+        stmt = select(RideReactionEvent.emoji).distinct().order_by(RideReactionEvent.emoji)
+        result = await session.execute(stmt)
+        return list(result.scalars().all())
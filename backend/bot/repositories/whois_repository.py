@@ -16,27 +16,36 @@ class WhoisRepository:
     """Handles database operations for whois lookups."""
 
     @staticmethod
-    async def get_display_name(session: AsyncSession, discord_username: str) -> str | None:
+    async def get_display_names(
+        session: AsyncSession, discord_usernames: set[str]
+    ) -> dict[str, str]:
         """
-        Look up a user's full name from the discord_usernames table.
+        Look up full names for many Discord usernames in one query.
 
         Args:
             session: An active async database session.
-            discord_username: The Discord username to look up.
+            discord_usernames: The Discord usernames to look up.
 
         Returns:
-            "first_name last_name" (stripped) if found, otherwise None.
+            Mapping of discord_username -> "first_name last_name" for the users
+            found. When a username appears more than once, the first row wins.
         """
+        if not discord_usernames:
+            return {}
         try:
-            stmt = select(DiscordUsers).where(DiscordUsers.discord_username == discord_username)
+            stmt = (
+                select(
+                    DiscordUsers.discord_username, DiscordUsers.first_name, DiscordUsers.last_name
+                )
+                .where(DiscordUsers.discord_username.in_(discord_usernames))
+                .order_by(DiscordUsers.id.desc())
+            )
             result = await session.execute(stmt)
-            user = result.scalars().first()
-            if user:
-                return f"{user.first_name} {user.last_name}".strip()
-            return None
+            # Iterating newest-first lets the lowest id overwrite, so the first row wins.
+            return {username: f"{first} {last}".strip() for username, first, last in result.all()}
         except Exception:
-            logger.exception("Failed to get display name for %s", discord_username)
-            return None
+            logger.exception("Failed to get display names for %d users", len(discord_usernames))
+            return {}
 
     @staticmethod
     async def fetch_data_by_name(session: AsyncSession, name: str) -> list[Row]:
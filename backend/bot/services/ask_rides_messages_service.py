@@ -13,8 +13,8 @@ from dataclasses import dataclass
 
 from sqlalchemy.exc import OperationalError
 
-from bot.core.database import AsyncSessionLocal
-from bot.core.enums import AskRidesMessageType, EmbedColorChoice
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
+from bot.core.enums import AskRidesMessageType, CacheNamespace, EmbedColorChoice
 from bot.core.messages_broadcaster import publish
 from bot.repositories.ask_rides_messages_repository import AskRidesMessagesRepository
 from bot.utils.ask_rides_defaults import (
@@ -23,6 +23,7 @@ from bot.utils.ask_rides_defaults import (
     MAX_REACTIONS,
     MessageTemplate,
 )
+from bot.utils.cache import Stamped, alru_cache, invalidate_namespace
 
 logger = logging.getLogger(__name__)
 
@@ -92,20 +93,43 @@ class AskRidesMessagesService:
 
     @staticmethod
     async def get_effective_templates() -> dict[AskRidesMessageType, EffectiveTemplate]:
-        """Return the effective (DB-customized or default) template for every message type."""
-        defaults = {
-            message_type: _to_effective(template, is_customized=False)
-            for message_type, template in DEFAULT_TEMPLATES.items()
-        }
+        """
+        Return the effective (DB-customized or default) template for every message type.
+
+        The merged snapshot is cached until a template is saved or reset.
+        """
+        return (await AskRidesMessagesService.get_effective_templates_stamped()).value
+
+    @staticmethod
+    async def get_effective_templates_stamped() -> Stamped[
+        dict[AskRidesMessageType, EffectiveTemplate]
+    ]:
+        """
+        Return the effective templates with a token that changes on every reload.
 
+        Lets readers detect a new snapshot without comparing the templates.
+        """
         try:
-            async with AsyncSessionLocal() as session:
-                rows = await AskRidesMessagesRepository.get_all(session)
+            return await AskRidesMessagesService._load_stamped_templates()
         except Exception:
             logger.exception("Failed to load ask-rides message templates; using defaults")
-            return defaults
+            return Stamped(
+                {
+                    message_type: _to_effective(template, is_customized=False)
+                    for message_type, template in DEFAULT_TEMPLATES.items()
+                }
+            )
+
+    @staticmethod
+    @alru_cache(namespace=CacheNamespace.ASK_RIDES_TEMPLATES)
+    async def _load_stamped_templates() -> Stamped[dict[AskRidesMessageType, EffectiveTemplate]]:
+        async with AsyncReadSessionLocal() as session:
+            rows = await AskRidesMessagesRepository.get_all(session)
 
-        effective = dict(defaults)
+        effective = {
+            message_type: _to_effective(template, is_customized=False)
+            for message_type, template in DEFAULT_TEMPLATES.items()
+        }
         for row in rows:
             try:
                 message_type = AskRidesMessageType(row.message_type)
@@ -119,7 +143,7 @@ class AskRidesMessagesService:
                 is_customized=True,
                 reactions=_row_reactions(row.reactions, message_type),
             )
-        return effective
+        return Stamped(effective)
 
     @staticmethod
     async def get_effective_template(message_type: AskRidesMessageType) -> EffectiveTemplate:
@@ -132,7 +156,7 @@ class AskRidesMessagesService:
         """
         default = _to_effective(DEFAULT_TEMPLATES[message_type], is_customized=False)
         try:
-            async with AsyncSessionLocal() as session:
+            async with AsyncReadSessionLocal() as session:
                 row = await AskRidesMessagesRepository.get(session, message_type)
         except OperationalError:
             logger.exception(
@@ -246,6 +270,7 @@ class AskRidesMessagesService:
                 session, message_type, title, body, color, reactions_json, updated_by
             )
 
+        await invalidate_namespace(CacheNamespace.ASK_RIDES_TEMPLATES)
         await publish({"type": "templates_updated", "message_type": message_type.value})
 
         return EffectiveTemplate(
@@ -262,6 +287,7 @@ class AskRidesMessagesService:
         async with AsyncSessionLocal() as session:
             await AskRidesMessagesRepository.delete(session, message_type)
 
+        await invalidate_namespace(CacheNamespace.ASK_RIDES_TEMPLATES)
         await publish({"type": "templates_updated", "message_type": message_type.value})
 
     @staticmethod
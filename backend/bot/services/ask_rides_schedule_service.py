@@ -12,7 +12,7 @@ from datetime import datetime, timedelta
 
 from sqlalchemy.exc import OperationalError
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import AskRidesScheduleSlot, CacheNamespace, JobName
 from bot.core.messages_broadcaster import publish
 from bot.core.scheduler_control import reschedule_job
@@ -28,7 +28,7 @@ from bot.utils.ask_rides_schedule_defaults import (
     SLOT_TO_JOB_ID,
     ScheduleDefault,
 )
-from bot.utils.cache import invalidate_namespace
+from bot.utils.cache import Stamped, alru_cache, invalidate_namespace
 from bot.utils.constants import DAYS_IN_WEEK
 from bot.utils.time_helpers import LA_TZ
 
@@ -68,7 +68,7 @@ class AskRidesScheduleService:
         """
         default = _to_effective(DEFAULT_SCHEDULE[slot], is_customized=False)
         try:
-            async with AsyncSessionLocal() as session:
+            async with AsyncReadSessionLocal() as session:
                 row = await AskRidesScheduleRepository.get(session, slot)
         except OperationalError:
             logger.exception(
@@ -96,20 +96,43 @@ class AskRidesScheduleService:
 
     @staticmethod
     async def get_effective_schedules() -> dict[AskRidesScheduleSlot, EffectiveSchedule]:
-        """Return the effective schedule for every slot at once."""
-        defaults = {
-            slot: _to_effective(default, is_customized=False)
-            for slot, default in DEFAULT_SCHEDULE.items()
-        }
+        """
+        Return the effective schedule for every slot at once.
+
+        The merged snapshot is cached until a slot is saved or reset.
+        """
+        return (await AskRidesScheduleService.get_effective_schedules_stamped()).value
+
+    @staticmethod
+    async def get_effective_schedules_stamped() -> Stamped[
+        dict[AskRidesScheduleSlot, EffectiveSchedule]
+    ]:
+        """
+        Return the effective schedules with a token that changes on every reload.
 
+        Lets readers detect a new snapshot without comparing the schedules.
+        """
         try:
-            async with AsyncSessionLocal() as session:
-                rows = await AskRidesScheduleRepository.get_all(session)
+            return await AskRidesScheduleService._load_stamped_schedules()
         except Exception:
             logger.exception("Failed to load ask-rides schedules; using defaults")
-            return defaults
+            return Stamped(
+                {
+                    slot: _to_effective(default, is_customized=False)
+                    for slot, default in DEFAULT_SCHEDULE.items()
+                }
+            )
+
+    @staticmethod
+    @alru_cache(namespace=CacheNamespace.ASK_RIDES_SCHEDULES)
+    async def _load_stamped_schedules() -> Stamped[dict[AskRidesScheduleSlot, EffectiveSchedule]]:
+        async with AsyncReadSessionLocal() as session:
+            rows = await AskRidesScheduleRepository.get_all(session)
 
-        effective = dict(defaults)
+        effective = {
+            slot: _to_effective(default, is_customized=False)
+            for slot, default in DEFAULT_SCHEDULE.items()
+        }
         for row in rows:
             try:
                 slot = AskRidesScheduleSlot(row.slot)
@@ -122,7 +145,7 @@ class AskRidesScheduleService:
                 minute=row.minute,
                 is_customized=True,
             )
-        return effective
+        return Stamped(effective)
 
     @staticmethod
     def _validate(slot: AskRidesScheduleSlot, day_of_week: int, hour: int, minute: int) -> None:
@@ -174,6 +197,7 @@ class AskRidesScheduleService:
             SLOT_TO_JOB_ID[slot], day_of_week=day_of_week, hour=hour, minute=minute
         )
 
+        await invalidate_namespace(CacheNamespace.ASK_RIDES_SCHEDULES)
         await invalidate_namespace(CacheNamespace.ASK_RIDES_STATUS)
         await publish({"type": "schedule_updated", "slot": slot.value})
 
@@ -207,6 +231,7 @@ class AskRidesScheduleService:
             minute=default.minute,
         )
 
+        await invalidate_namespace(CacheNamespace.ASK_RIDES_SCHEDULES)
         await invalidate_namespace(CacheNamespace.ASK_RIDES_STATUS)
         await publish({"type": "schedule_updated", "slot": slot.value})
 
@@ -4,6 +4,7 @@ Auth service.
 Business logic for Discord OAuth identity matching and server-side session management.
 """
 
+import asyncio
 import hashlib
 import hmac
 import secrets
@@ -12,11 +13,18 @@ from datetime import UTC, datetime, timedelta
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from bot.core.database import AsyncSessionLocal
 from bot.core.enums import AccountRoles
 from bot.core.models import AuthSession, UserAccount
 from bot.repositories.auth_sessions_repository import AuthSessionsRepository
 from bot.repositories.user_accounts_repository import UserAccountsRepository
-from bot.utils.constants import SESSION_TOUCH_THROTTLE_MINUTES, SESSION_TTL_DAYS
+from bot.services.auth_session_cache import auth_session_cache
+from bot.services.user_accounts_service import UserAccountsService
+from bot.utils.constants import (
+    AUTH_SESSION_SWEEP_BATCH_SIZE,
+    AUTH_SESSION_SWEEP_MAX_BATCHES,
+    SESSION_TTL_DAYS,
+)
 
 
 def _hash_token(token: str) -> str:
@@ -31,6 +39,11 @@ def _as_utc(dt: datetime) -> datetime:
 class AuthService:
     """Service for Discord OAuth matching and session lifecycle."""
 
+    @staticmethod
+    def session_hash(session_id_plain: str) -> str:
+        """Return the hash a plaintext session token is stored (and cached) under."""
+        return _hash_token(session_id_plain)
+
     @staticmethod
     async def match_or_reject(
         session: AsyncSession,
@@ -47,6 +60,19 @@ class AuthService:
         After matching via branch 2 or 3, the account is linked with the Discord identity.
         Returns None if no match is found (user not invited).
         """
+        account = await AuthService._match(session, discord_user_id, discord_username, email)
+        if account:
+            # Linking can set the account's email, so any cached "no account" is stale.
+            await UserAccountsService.forget_role(account.email)
+        return account
+
+    @staticmethod
+    async def _match(
+        session: AsyncSession,
+        discord_user_id: str,
+        discord_username: str,
+        email: str | None,
+    ) -> UserAccount | None:
         # Branch 1: already linked
         account = await UserAccountsRepository.get_by_discord_user_id(session, discord_user_id)
         if account:
@@ -105,36 +131,52 @@ class AuthService:
         Validate a session by plaintext token.
 
         Returns the AuthSession if valid and not expired, None otherwise.
-        Does NOT slide the expiry — call touch_session separately for that.
+        Read-only, so it can run on a read session: it does NOT slide the
+        expiry (auth_session_cache.touch batches that) and leaves expired rows
+        for sweep_expired_sessions.
         """
         session_id_hash = _hash_token(session_id_plain)
         auth_session = await AuthSessionsRepository.get_by_hash(session, session_id_hash)
         if not auth_session:
             return None
         if _as_utc(auth_session.expires_at) < datetime.now(UTC):
-            await AuthSessionsRepository.delete_by_hash(session, session_id_hash)
             return None
         return auth_session
 
-    @staticmethod
-    async def touch_session(
-        session: AsyncSession, session_id_plain: str, auth_session: AuthSession
-    ) -> None:
-        """Slide the session expiry if it hasn't been touched recently."""
-        now = datetime.now(UTC)
-        if (now - _as_utc(auth_session.last_activity_at)) < timedelta(
-            minutes=SESSION_TOUCH_THROTTLE_MINUTES
-        ):
-            return
-        new_expires = now + timedelta(days=SESSION_TTL_DAYS)
-        session_id_hash = _hash_token(session_id_plain)
-        await AuthSessionsRepository.update_activity(session, session_id_hash, now, new_expires)
-
     @staticmethod
     async def revoke_session(session: AsyncSession, session_id_plain: str) -> None:
-        """Revoke a session by deleting it from the database."""
+        """Revoke a session by deleting it from the database and the session cache."""
         session_id_hash = _hash_token(session_id_plain)
         await AuthSessionsRepository.delete_by_hash(session, session_id_hash)
+        auth_session_cache.invalidate(session_id_hash)
+
+    @staticmethod
+    async def sweep_expired_sessions(
+        batch_size: int = AUTH_SESSION_SWEEP_BATCH_SIZE,
+        max_batches: int = AUTH_SESSION_SWEEP_MAX_BATCHES,
+    ) -> int:
+        """
+        Delete expired sessions in bounded batches, one short transaction each.
+
+        Stops when a batch comes back short or after *max_batches*, leaving any
+        remainder for the next run rather than holding the writer for minutes.
+
+        Returns:
+            The number of sessions deleted.
+        """
+        now = datetime.now(UTC)
+        total = 0
+        for _ in range(max_batches):
+            async with AsyncSessionLocal() as session:
+                deleted = await AuthSessionsRepository.delete_expired(
+                    session, limit=batch_size, now=now
+                )
+            total += deleted
+            if deleted < batch_size:
+                break
+            # Let request handlers get at the database between batches.
+            await asyncio.sleep(0)
+        return total
 
     @staticmethod
     async def provision_from_guild_role(
@@ -161,6 +203,7 @@ class AuthService:
             )
             if linked is None:
                 raise RuntimeError("link_discord_identity returned None unexpectedly")
+            await UserAccountsService.forget_role(linked.email)
             return linked
         except IntegrityError:
             await session.rollback()
@@ -169,6 +212,7 @@ class AuthService:
                 raise RuntimeError(  # noqa: B904
                     "get_by_discord_user_id returned None after IntegrityError"
                 )
+            await UserAccountsService.forget_role(fetched.email)
             return fetched
 
     @staticmethod
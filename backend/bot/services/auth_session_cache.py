@@ -0,0 +1,189 @@
+"""
+In-process cache of validated auth sessions with write-behind activity touches.
+
+With ``AUTH_PROVIDER=self`` every ``/api/*`` request validated its cookie against
+the ``auth_sessions`` table, and a dashboard page load fires 10+ of those in
+parallel. Validated sessions are kept here for ``SESSION_CACHE_TTL_SECONDS`` so
+only the first request of a burst reads the database, and sliding-expiry
+touches are collected and written in one batched UPDATE every
+``SESSION_TOUCH_FLUSH_INTERVAL_SECONDS``.
+
+The cache is per process: revocations are visible immediately in the process
+that performed them and within the TTL everywhere else.
+"""
+
+import asyncio
+import contextlib
+import logging
+import time
+from collections import OrderedDict
+from dataclasses import dataclass, replace
+from datetime import UTC, datetime, timedelta
+
+from bot.core.database import AsyncSessionLocal
+from bot.core.models import AuthSession
+from bot.repositories.auth_sessions_repository import AuthSessionsRepository
+from bot.utils.constants import (
+    SESSION_CACHE_MAXSIZE,
+    SESSION_CACHE_TTL_SECONDS,
+    SESSION_TOUCH_FLUSH_INTERVAL_SECONDS,
+    SESSION_TOUCH_THROTTLE_MINUTES,
+    SESSION_TTL_DAYS,
+)
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(dt: datetime) -> datetime:
+    # SQLite returns naive datetimes; treat them as UTC.
+    return dt if dt.tzinfo is not None else dt.replace(tzinfo=UTC)
+
+
+@dataclass(frozen=True)
+class CachedSession:
+    """The parts of an AuthSession the middleware needs, detached from the DB session."""
+
+    email: str
+    csrf_token: str
+    expires_at: datetime
+    last_activity_at: datetime
+
+    @classmethod
+    def from_model(cls, auth_session: AuthSession) -> "CachedSession":
+        """Snapshot a loaded AuthSession row."""
+        return cls(
+            email=auth_session.email,
+            csrf_token=auth_session.csrf_token,
+            expires_at=_as_utc(auth_session.expires_at),
+            last_activity_at=_as_utc(auth_session.last_activity_at),
+        )
+
+
+class AuthSessionCache:
+    """Bounded LRU of validated sessions keyed by session_id_hash, plus pending touches."""
+
+    def __init__(
+        self,
+        *,
+        ttl_seconds: float = SESSION_CACHE_TTL_SECONDS,
+        maxsize: int = SESSION_CACHE_MAXSIZE,
+        flush_interval_seconds: float = SESSION_TOUCH_FLUSH_INTERVAL_SECONDS,
+    ) -> None:
+        self._ttl = ttl_seconds
+        self._maxsize = maxsize
+        self._flush_interval = flush_interval_seconds
+        # session_id_hash -> (monotonic time cached, session)
+        self._entries: OrderedDict[str, tuple[float, CachedSession]] = OrderedDict()
+        # session_id_hash -> (last_activity_at, expires_at) not yet written
+        self._pending: dict[str, tuple[datetime, datetime]] = {}
+        self._task: asyncio.Task | None = None
+
+    def __len__(self) -> int:
+        """Number of cached sessions (possibly including stale ones not yet evicted)."""
+        return len(self._entries)
+
+    @property
+    def pending(self) -> int:
+        """Number of sessions with an activity touch not yet written."""
+        return len(self._pending)
+
+    def get(self, session_id_hash: str) -> CachedSession | None:
+        """Return the cached session, or None if absent, stale or expired."""
+        item = self._entries.get(session_id_hash)
+        if item is None:
+            return None
+        cached_at, entry = item
+        if time.monotonic() - cached_at > self._ttl or entry.expires_at <= datetime.now(UTC):
+            del self._entries[session_id_hash]
+            return None
+        self._entries.move_to_end(session_id_hash)
+        return entry
+
+    def put(self, session_id_hash: str, entry: CachedSession) -> None:
+        """Cache a freshly validated session, evicting the least recently used."""
+        self._entries[session_id_hash] = (time.monotonic(), entry)
+        self._entries.move_to_end(session_id_hash)
+        while len(self._entries) > self._maxsize:
+            self._entries.popitem(last=False)
+
+    def invalidate(self, session_id_hash: str) -> None:
+        """Forget one session (logout / revoke)."""
+        self._entries.pop(session_id_hash, None)
+        self._pending.pop(session_id_hash, None)
+
+    def invalidate_email(self, email: str) -> None:
+        """Forget every cached session belonging to *email*."""
+        for session_id_hash in [
+            h for h, (_, entry) in self._entries.items() if entry.email == email
+        ]:
+            self.invalidate(session_id_hash)
+
+    def clear(self) -> None:
+        """Drop all cached sessions and pending touches."""
+        self._entries.clear()
+        self._pending.clear()
+
+    def touch(self, session_id_hash: str, entry: CachedSession) -> None:
+        """
+        Slide the session expiry if it hasn't been touched recently.
+
+        The new expiry is applied to the cached entry straight away and queued
+        for the next batched write instead of committing per request.
+        """
+        now = datetime.now(UTC)
+        if now - entry.last_activity_at < timedelta(minutes=SESSION_TOUCH_THROTTLE_MINUTES):
+            return
+        expires_at = now + timedelta(days=SESSION_TTL_DAYS)
+        self._pending[session_id_hash] = (now, expires_at)
+        item = self._entries.get(session_id_hash)
+        if item is not None:
+            self._entries[session_id_hash] = (
+                item[0],
+                replace(entry, last_activity_at=now, expires_at=expires_at),
+            )
+        self._ensure_started()
+
+    def _ensure_started(self) -> None:
+        """Start the flush loop lazily so it binds to the running event loop."""
+        loop = asyncio.get_running_loop()
+        if self._task is None or self._task.done() or self._task.get_loop() is not loop:
+            self._task = loop.create_task(self._run(), name="auth-session-touch-flusher")
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self._flush_interval)
+            await self.flush()
+
+    async def flush(self) -> int:
+        """
+        Write all pending touches in one UPDATE. Failures are logged, never raised.
+
+        Returns:
+            The number of sessions written.
+        """
+        if not self._pending:
+            return 0
+        batch, self._pending = self._pending, {}
+        try:
+            async with AsyncSessionLocal() as session:
+                await AuthSessionsRepository.update_activity_many(session, batch)
+        except Exception:
+            logger.exception("Failed to write %d session activity touches", len(batch))
+            # Retry on the next tick unless a newer touch superseded them.
+            for session_id_hash, touch in batch.items():
+                self._pending.setdefault(session_id_hash, touch)
+            return 0
+        logger.debug("Wrote %d session activity touches", len(batch))
+        return len(batch)
+
+    async def stop(self) -> None:
+        """Stop the flush loop and write whatever is still pending."""
+        task, self._task = self._task, None
+        if task is not None and not task.done():
+            task.cancel()
+            with contextlib.suppress(asyncio.CancelledError):
+                await task
+        await self.flush()
+
+
+auth_session_cache = AuthSessionCache()
@@ -10,9 +10,10 @@ import httpx
 from dotenv import load_dotenv
 
 from bot.core.database import AsyncSessionLocal
-from bot.core.enums import CanBeDriver, ClassYear
+from bot.core.enums import CacheNamespace, CanBeDriver, ClassYear
 from bot.core.models import Locations as LocationsModel
 from bot.repositories.locations_repository import LocationsRepository
+from bot.utils.cache import invalidate_namespace
 
 logger = logging.getLogger(__name__)
 
@@ -75,6 +76,7 @@ class CsvSyncService:
 
         async with AsyncSessionLocal() as session:
             await LocationsRepository.sync_locations(session, locations_to_add)
+        await invalidate_namespace(CacheNamespace.DISCORD_USERNAMES)
 
         logger.info("Finished syncing locations csv with table.")
 
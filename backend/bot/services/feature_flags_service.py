@@ -1,13 +1,16 @@
 """Service layer for feature flag logic and validation."""
 
+import asyncio
 import logging
 
 import discord
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import Emoji, FeatureFlagNames
 from bot.repositories.feature_flags_repository import FeatureFlagsRepository
+from bot.utils.constants import SHARED_VERSION_POLL_SECONDS
+from bot.utils.shared_version import SharedVersion
 
 logger = logging.getLogger(__name__)
 
@@ -15,6 +18,9 @@ logger = logging.getLogger(__name__)
 class FeatureFlagsService:
     """Handles feature flag business logic between the Cog and Repository."""
 
+    # Tells other processes that their flag cache is out of date
+    _cache_version = SharedVersion("feature_flags")
+
     async def validate_feature_name(self, feature_name: str) -> FeatureFlagNames | None:
         """
         Validate and convert a feature name to an enum member.
@@ -67,6 +73,7 @@ class FeatureFlagsService:
             return False, f"ℹ️ Feature flag `{feature_name}` is already **{state}**."
 
         await FeatureFlagsRepository.update_feature_flag(session, feature_name, enabled)
+        await FeatureFlagsService._cache_version.bump()
 
         new_state = "enabled" if enabled else "disabled"
         logger.info(f"modify_feature_flag: {feature_name} set to {new_state}")
@@ -75,21 +82,55 @@ class FeatureFlagsService:
     @staticmethod
     async def list_flags():
         """Return all feature flag rows."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             return await FeatureFlagsRepository.get_all_feature_flags(session)
 
     @staticmethod
     async def get_flag(feature_name: str):
         """Return a single feature flag row, or None if not found."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             return await FeatureFlagsRepository.get_feature_flag(session, feature_name)
 
     @staticmethod
     async def reinitialize_cache() -> None:
         """Re-populate the in-memory feature flag cache from the database."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             await FeatureFlagsRepository.initialize_cache(session)
 
+    @staticmethod
+    async def refresh_cache_if_changed() -> bool:
+        """
+        Reload the flag cache if another process has toggled a flag since the last check.
+
+        Returns:
+            Whether the cache was reloaded.
+        """
+        version = FeatureFlagsService._cache_version
+        if not await version.changed():
+            return False
+        try:
+            await FeatureFlagsService.reinitialize_cache()
+        except Exception:
+            version.forget()
+            raise
+        return True
+
+    @staticmethod
+    async def watch_cache(interval: float = SHARED_VERSION_POLL_SECONDS) -> None:
+        """
+        Load the flag cache, then keep it in step with other processes until cancelled.
+
+        Run as a background task by every process of a split deployment, since a
+        toggle only updates the cache of the process that handled it.
+        """
+        FeatureFlagsService._cache_version.forget()
+        while True:
+            try:
+                await FeatureFlagsService.refresh_cache_if_changed()
+            except Exception:
+                logger.exception("Failed to refresh the feature flag cache")
+            await asyncio.sleep(interval)
+
     async def list_feature_flags_embed(self, session: AsyncSession | None = None) -> discord.Embed:
         """
         Return a Discord embed listing all feature flags and their current states.
@@ -103,7 +144,7 @@ class FeatureFlagsService:
         if session is not None:
             all_flags = await FeatureFlagsRepository.get_all_feature_flags(session)
         else:
-            async with AsyncSessionLocal() as session:
+            async with AsyncReadSessionLocal() as session:
                 all_flags = await FeatureFlagsRepository.get_all_feature_flags(session)
 
         embed = discord.Embed(
@@ -2,7 +2,7 @@
 
 import logging
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import CacheNamespace, FeatureFlagNames, FellowshipSeason
 from bot.repositories.global_settings_repository import GlobalSettingsRepository
 from bot.services.feature_flags_service import FeatureFlagsService
@@ -19,7 +19,7 @@ class FellowshipSeasonService:
     @staticmethod
     async def get_season() -> FellowshipSeason:
         """Return the active fellowship season (defaults to Friday)."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             value = await GlobalSettingsRepository.get(session, FELLOWSHIP_SEASON_KEY)
         if not value:
             return FellowshipSeason.FRIDAY
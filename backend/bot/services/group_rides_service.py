@@ -9,8 +9,10 @@ import discord
 from bot.core.enums import (
     DAY_TO_ASK_RIDES_MESSAGE,
     AskRidesMessage,
+    CacheNamespace,
     CampusLivingLocations,
     ChannelIds,
+    GroupingSolver,
     JobName,
 )
 from bot.core.error_reporter import send_error_to_discord
@@ -24,12 +26,17 @@ from bot.services.ride_grouping import (
     PassengersByLocation,
     count_tuples,
     create_output,
+    grouping_cache_key,
     is_enough_capacity,
     llm_input_drivers,
+    llm_input_matrix,
     llm_input_pickups,
     parse_numbers,
 )
+from bot.services.ride_solver import solve_ride_groups
 from bot.services.route_service import RouteService
+from bot.utils.cache_backends import get_backend
+from bot.utils.constants import RIDE_GROUPING_CACHE_TTL_SECONDS
 from bot.utils.parsing import get_message_and_embed_content
 
 logger = logging.getLogger(__name__)
@@ -154,10 +161,17 @@ class GroupRidesService:
         channel_id: int,
         legacy_prompt: bool = False,
         custom_prompt: str | None = None,
+        solver: GroupingSolver = GroupingSolver.LLM,
+        optimize_order: bool = False,
+        regenerate: bool = False,
     ) -> list[str]:
         """
         Core ride grouping logic shared by both Discord and API methods.
 
+        The LLM path falls back to the local solver when Gemini fails after retries.
+        With ``optimize_order`` each driver's stops are reordered for the shortest drive.
+        LLM groupings are cached by content; ``regenerate`` asks the LLM again.
+
         Raises:
             ValueError: If invalid parameters or insufficient capacity
         """
@@ -194,36 +208,100 @@ class GroupRidesService:
         passengers_by_location, off_campus = self._split_on_off_campus(locations_people, routing)
         driver_capacity_list = self._validate_capacity(driver_capacity, passengers_by_location)
 
+        if solver == GroupingSolver.LOCAL:
+            logger.info("_process_ride_grouping: grouping with the local solver")
+            # Up to about a second at 500 riders; keep it off the gateway's event loop
+            groups = await asyncio.to_thread(
+                solve_ride_groups, passengers_by_location, driver_capacity_list, routing
+            )
+        else:
+            groups = await self._llm_ride_groups(
+                passengers_by_location,
+                driver_capacity_list,
+                routing,
+                legacy_prompt,
+                custom_prompt,
+                regenerate,
+            )
+
+        output = create_output(
+            groups, passengers_by_location, end_leave_time, off_campus, routing, optimize_order
+        )
+        logger.info(f"_process_ride_grouping: completed - generated {len(output)} output blocks")
+        return output
+
+    async def _llm_ride_groups(
+        self,
+        passengers_by_location: PassengersByLocation,
+        driver_capacity_list: list[int],
+        routing: RoutingContext,
+        legacy_prompt: bool,
+        custom_prompt: str | None,
+        regenerate: bool,
+    ) -> dict[str, list[dict[str, str]]]:
+        """
+        Ask the LLM for ride groups, using the local solver if the call fails or times out.
+
+        A grouping for the same riders, capacities, graph and prompt is served
+        from the cache unless ``regenerate`` is set. Only LLM answers are cached,
+        so a fallback grouping is retried with the LLM next time. If the cache
+        cannot be reached the grouping goes ahead uncached.
+
+        Raises:
+            ValueError: If the LLM answers with an error object
+        """
+        cache_key = grouping_cache_key(
+            passengers_by_location,
+            driver_capacity_list,
+            routing.graph_digest,
+            legacy_prompt,
+            custom_prompt,
+        )
+        if not regenerate:
+            try:
+                hit, cached = await get_backend().get(CacheNamespace.RIDE_GROUPINGS, cache_key)
+            except Exception:
+                logger.exception("Failed to read the ride grouping cache, calling the LLM")
+            else:
+                if hit:
+                    logger.info("_process_ride_grouping: reusing cached ride grouping")
+                    return cached
+
         drivers = llm_input_drivers(driver_capacity_list)
         pickups = llm_input_pickups(passengers_by_location)
+        matrix = llm_input_matrix(passengers_by_location, routing)
 
         try:
             logger.info("_process_ride_grouping: calling LLM for ride grouping")
-            llm_result = await asyncio.to_thread(
-                self.llm_service.generate_ride_groups,
+            llm_result = await self.llm_service.generate_ride_groups(
                 pickups,
                 drivers,
-                routing.graph,
+                matrix,
                 legacy_prompt,
                 custom_prompt,
             )
         except Exception:
             logger.exception("Failed to get a successful LLM response after retries")
             await send_error_to_discord(
-                "**Unexpected Error** in `_process_ride_grouping`: LLM failed after retries"
+                "**Unexpected Error** in `_process_ride_grouping`: LLM failed after retries, "
+                "fell back to the local solver"
+            )
+            return await asyncio.to_thread(
+                solve_ride_groups, passengers_by_location, driver_capacity_list, routing
             )
-            raise ValueError(
-                "Could not process ride grouping request. Please try again later."
-            ) from None
 
         if "error" in {key.lower() for key in llm_result}:
             raise ValueError(f"LLM returned with error: {llm_result}")
-
-        output = create_output(
-            llm_result, passengers_by_location, end_leave_time, off_campus, routing
-        )
-        logger.info(f"_process_ride_grouping: completed - generated {len(output)} output blocks")
-        return output
+        try:
+            await get_backend().set(
+                CacheNamespace.RIDE_GROUPINGS,
+                cache_key,
+                llm_result,
+                RIDE_GROUPING_CACHE_TTL_SECONDS,
+            )
+        except Exception:
+            logger.exception("Failed to cache the ride grouping, returning it uncached")
+        return llm_result
 
     async def group_rides(
         self,
@@ -233,6 +311,9 @@ class GroupRidesService:
         day: str | None = None,
         legacy_prompt: bool = False,
         custom_prompt: str | None = None,
+        solver: GroupingSolver = GroupingSolver.LLM,
+        optimize_order: bool = False,
+        regenerate: bool = False,
     ):
         """
         Orchestrates the group rides process.
@@ -244,6 +325,11 @@ class GroupRidesService:
             day (str | None, optional): Optional day to fetch pickups for.
             legacy_prompt (bool, optional): Whether to use the legacy prompt. Defaults to False.
             custom_prompt (str | None, optional): Optional custom prompt to use. Defaults to None.
+            solver (GroupingSolver, optional): Which engine groups the riders. Defaults to LLM.
+            optimize_order (bool, optional): Reorder each driver's stops for the shortest
+                drive. Defaults to False.
+            regenerate (bool, optional): Ignore a cached grouping and ask the LLM again.
+                Defaults to False.
         """
         await interaction.response.defer()
 
@@ -273,7 +359,14 @@ class GroupRidesService:
 
         try:
             output = await self._process_ride_grouping(
-                message_id, driver_capacity, channel_id, legacy_prompt, custom_prompt
+                message_id,
+                driver_capacity,
+                channel_id,
+                legacy_prompt,
+                custom_prompt,
+                solver,
+                optimize_order,
+                regenerate,
             )
         except ValueError as e:
             await interaction.followup.send(f"Error: {e!s}")
@@ -303,6 +396,9 @@ class GroupRidesService:
         channel_id: int | None = None,
         legacy_prompt: bool = False,
         custom_prompt: str | None = None,
+        solver: GroupingSolver = GroupingSolver.LLM,
+        optimize_order: bool = False,
+        regenerate: bool = False,
     ) -> dict[str, str | list[str]]:
         """
         Group rides and return structured data (for API use).
@@ -317,6 +413,9 @@ class GroupRidesService:
             channel_id: Optional channel ID, defaults to rides announcements
             legacy_prompt: Whether to use the legacy prompt
             custom_prompt: Optional custom prompt to use
+            solver: Which engine groups the riders
+            optimize_order: Reorder each driver's stops for the shortest drive
+            regenerate: Ignore a cached grouping and ask the LLM again
 
         Returns:
             Dictionary with 'summary' and 'groupings' keys
@@ -346,7 +445,14 @@ class GroupRidesService:
             raise ValueError("Either message_id or day must be provided")
 
         output = await self._process_ride_grouping(
-            message_id, driver_capacity, channel_id, legacy_prompt, custom_prompt
+            message_id,
+            driver_capacity,
+            channel_id,
+            legacy_prompt,
+            custom_prompt,
+            solver,
+            optimize_order,
+            regenerate,
         )
 
         summary = output[0] if output else ""
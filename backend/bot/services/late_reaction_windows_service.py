@@ -5,7 +5,7 @@ import logging
 import re
 import time
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import DaysOfWeek
 from bot.repositories.global_settings_repository import GlobalSettingsRepository
 from bot.utils.time_helpers import TimeWindow
@@ -121,7 +121,7 @@ class LateReactionWindowsService:
 
     @classmethod
     async def _load_windows(cls) -> dict[DaysOfWeek, TimeWindow]:
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             raw_value = await GlobalSettingsRepository.get(session, LATE_REACTION_WINDOWS_KEY)
 
         if not raw_value:
@@ -1,19 +1,30 @@
 """Service for LLM interactions."""
 
+import asyncio
 import json
 import logging
 import os
 import re
+import statistics
+import time
+from collections import deque
+from functools import cached_property
+from typing import TYPE_CHECKING, ClassVar
 
 import httpx
 import tenacity
-from langchain_google_genai import ChatGoogleGenerativeAI
 
 from bot.core.schemas import LLMOutputError, LLMOutputNominal
 from bot.utils.constants import (
     GEMINI_MODEL,
+    LLM_BACKOFF_INITIAL_SECONDS,
+    LLM_BACKOFF_MAX_SECONDS,
+    LLM_DEADLINE_SECONDS,
+    LLM_HEDGE_DEFAULT_DELAY_SECONDS,
+    LLM_HEDGE_MIN_SAMPLES,
+    LLM_HEDGE_PERCENTILE,
+    LLM_LATENCY_WINDOW,
     LLM_RETRY_ATTEMPTS,
-    LLM_RETRY_WAIT_SECONDS,
 )
 from bot.utils.genai.prompt import (
     CUSTOM_INSTRUCTIONS,
@@ -22,8 +33,13 @@ from bot.utils.genai.prompt import (
     PROMPT_EPILOGUE,
 )
 
+if TYPE_CHECKING:
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
 logger = logging.getLogger(__name__)
 
+LLM_HEDGE_ENABLED = os.getenv("LLM_HEDGE_ENABLED", "false").lower() == "true"
+
 
 def _is_transient_llm_error(exc: BaseException) -> bool:
     if isinstance(exc, (httpx.TransportError, httpx.TimeoutException)):
@@ -32,58 +48,108 @@ def _is_transient_llm_error(exc: BaseException) -> bool:
     return any(kw in msg for kw in ("rate limit", "quota", "503", "429", "timeout", "connection"))
 
 
-def log_retry_attempt(retry_state):
+def log_retry_attempt(retry_state: tenacity.RetryCallState) -> None:
     """
     Logs a warning when a retry attempt is made.
 
     Args:
         retry_state (tenacity.RetryCallState): The current state of the retry call.
     """
-    prev_response = None
-    if retry_state.args:
-        llm_self = retry_state.args[0]
-        prev_response = getattr(llm_self, "_last_response", None)
+    outcome = retry_state.outcome
     logger.warning(
         f"Failed to process request, attempting retry {retry_state.attempt_number}..."
-        f"Exception was: {retry_state.outcome.exception()}..."
-        f"Prev response: {prev_response}"
+        f"Exception was: {outcome.exception() if outcome else None}..."
+        f"Retrying in {retry_state.upcoming_sleep:.1f}s"
     )
 
 
 class LLMService:
     """Service for handling Google Gemini interactions."""
 
-    def __init__(self):
-        """Initialize the LLMService."""
-        self.llm = ChatGoogleGenerativeAI(model=GEMINI_MODEL, temperature=0)
+    # Latencies (seconds) of recent successful calls, shared by every instance so
+    # the hedge delay tracks the provider rather than one request
+    _latencies: ClassVar[deque[float]] = deque(maxlen=LLM_LATENCY_WINDOW)
 
-    @tenacity.retry(
-        stop=tenacity.stop_after_attempt(LLM_RETRY_ATTEMPTS),
-        wait=tenacity.wait_fixed(LLM_RETRY_WAIT_SECONDS),
-        retry=tenacity.retry_if_exception(_is_transient_llm_error),
-        before_sleep=log_retry_attempt,
-    )
-    def generate_ride_groups(
+    def __init__(self, hedge: bool = LLM_HEDGE_ENABLED) -> None:
+        """
+        Initialize the service.
+
+        Args:
+            hedge (bool, optional): Send a second request when the first one is slow.
+                Defaults to the ``LLM_HEDGE_ENABLED`` environment setting.
+        """
+        self.hedge = hedge
+        self._last_response = None
+
+    @cached_property
+    def llm(self) -> "ChatGoogleGenerativeAI":
+        """
+        The Gemini chat client, built on first use.
+
+        ``langchain_google_genai`` pulls in the whole ``google.genai`` SDK (about a
+        second of import time), so it is imported here rather than at module load
+        to keep API and bot cold starts off that cost.
+        """
+        from langchain_google_genai import ChatGoogleGenerativeAI
+
+        return ChatGoogleGenerativeAI(model=GEMINI_MODEL, temperature=0)
+
+    async def generate_ride_groups(
         self,
         pickups_str: str,
         drivers_str: str,
-        locations_matrix: dict,
+        locations_matrix: str,
         legacy_prompt: bool = False,
         custom_prompt: str | None = None,
     ) -> dict:
         """
         Invokes the LLM to group rides.
 
+        Transient provider errors are retried with jittered exponential backoff,
+        and the whole call, retries included, is bounded by ``LLM_DEADLINE_SECONDS``.
+        Cancelling the awaiting task cancels the in-flight request.
+
         Args:
             pickups_str (str): Formatted string of pickups.
             drivers_str (str): Formatted string of drivers.
-            locations_matrix (dict): The locations distance matrix.
+            locations_matrix (str): Drive times between the requested locations.
             legacy_prompt (bool, optional): Whether to use the legacy prompt. Defaults to False.
             custom_prompt (str | None, optional): Optional custom prompt to use. Defaults to None.
 
         Returns:
             dict: The parsed LLM result.
+
+        Raises:
+            TimeoutError: If no valid answer arrived before the deadline.
         """
+        prompt = self._build_prompt(
+            pickups_str, drivers_str, locations_matrix, legacy_prompt, custom_prompt
+        )
+        retrying = tenacity.AsyncRetrying(
+            stop=tenacity.stop_after_attempt(LLM_RETRY_ATTEMPTS),
+            wait=tenacity.wait_random_exponential(
+                multiplier=LLM_BACKOFF_INITIAL_SECONDS, max=LLM_BACKOFF_MAX_SECONDS
+            ),
+            retry=tenacity.retry_if_exception(_is_transient_llm_error),
+            before_sleep=log_retry_attempt,
+            reraise=True,
+        )
+        async with asyncio.timeout(LLM_DEADLINE_SECONDS):
+            async for attempt in retrying:
+                with attempt:
+                    ai_response = await (
+                        self._hedged_invoke(prompt) if self.hedge else self._invoke(prompt)
+                    )
+        return self._parse_result(ai_response)
+
+    def _build_prompt(
+        self,
+        pickups_str: str,
+        drivers_str: str,
+        locations_matrix: str,
+        legacy_prompt: bool,
+        custom_prompt: str | None,
+    ) -> str:
         if legacy_prompt:
             prompt = GROUP_RIDES_PROMPT_LEGACY
         else:
@@ -92,32 +158,61 @@ class LLMService:
                 prompt += CUSTOM_INSTRUCTIONS.format(custom_instructions=custom_prompt)
             prompt += PROMPT_EPILOGUE
 
+        prompt = prompt.format(
+            pickups_str=pickups_str, drivers_str=drivers_str, locations_matrix=locations_matrix
+        )
         if os.getenv("APP_ENV", "local") == "local":
-            logger.debug(
-                f"prompt={
-                    prompt.format(
-                        pickups_str=pickups_str,
-                        drivers_str=drivers_str,
-                        locations_matrix=locations_matrix,
-                    )
-                }"
-            )
+            logger.debug(f"{prompt=}")
         else:
             logger.info(f"{pickups_str=}")
             logger.info(f"{drivers_str=}")
-            logger.info(f"{locations_matrix=}")
-
-        ai_response = self.llm.invoke(
-            prompt.format(
-                pickups_str=pickups_str, drivers_str=drivers_str, locations_matrix=locations_matrix
-            )
-        )
-
-        # Store response for retry logging via tenacity's retry_state
+            logger.info(f"Prompt is {len(prompt)} characters")
+        return prompt
+
+    async def _invoke(self, prompt: str):
+        """One request to the model, recording its latency on success."""
+        started = time.perf_counter()
+        ai_response = await self.llm.ainvoke(prompt)
+        self._latencies.append(time.perf_counter() - started)
+        # Kept for debugging a failed parse
         self._last_response = ai_response
-
         logger.debug(f"Raw LLM output={ai_response}")
+        return ai_response
 
+    def _hedge_delay(self) -> float:
+        """Seconds to wait on the first request before sending a second one."""
+        if len(self._latencies) < LLM_HEDGE_MIN_SAMPLES:
+            return LLM_HEDGE_DEFAULT_DELAY_SECONDS
+        return statistics.quantiles(self._latencies, n=100)[LLM_HEDGE_PERCENTILE - 1]
+
+    async def _hedged_invoke(self, prompt: str):
+        """
+        Invoke the model, racing a second request if the first is slower than usual.
+
+        The first successful answer wins and the other request is cancelled. If
+        both fail, the last error is raised.
+        """
+        tasks = [asyncio.create_task(self._invoke(prompt))]
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=self._hedge_delay())
+            if not done:
+                logger.info("LLM request is slower than usual, sending a hedged request")
+                tasks.append(asyncio.create_task(self._invoke(prompt)))
+
+            pending = set(tasks)
+            while True:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                succeeded = [task for task in done if task.exception() is None]
+                if succeeded:
+                    return succeeded[0].result()
+                if not pending:
+                    return next(iter(done)).result()  # raises the last error
+        finally:
+            for task in tasks:
+                task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    def _parse_result(self, ai_response) -> dict:
         def preprocess_llm_result(ai_response):
             content = ai_response.content
             # Try to extract from ```json ... ``` or ``` ... ``` code block
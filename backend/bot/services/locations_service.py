@@ -12,10 +12,11 @@ from collections import defaultdict
 
 import discord
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal
 from bot.core.enums import (
     DAY_TO_ASK_RIDES_MESSAGE,
     AskRidesMessage,
+    CacheNamespace,
     ChannelIds,
     JobName,
     RideOption,
@@ -25,6 +26,7 @@ from bot.repositories.locations_repository import LocationsRepository
 from bot.services.csv_sync_service import CsvSyncService
 from bot.services.housing_group_service import HousingGroupService
 from bot.services.reaction_service import ReactionService
+from bot.utils.cache import Stamped, alru_cache
 from bot.utils.custom_exceptions import NoMatchingMessageFoundError, NotAllowedInChannelError
 from bot.utils.parsing import get_message_and_embed_content
 
@@ -47,10 +49,16 @@ class LocationsService:
     # Static helpers (no bot required)
     # ------------------------------------------------------------------
     @staticmethod
-    async def get_all_discord_usernames() -> list[tuple[str, str]]:
-        """Return (discord_username, name) pairs for all rows with a non-null username."""
-        async with AsyncSessionLocal() as session:
-            return await LocationsRepository.get_all_discord_usernames(session)
+    @alru_cache(namespace=CacheNamespace.DISCORD_USERNAMES)
+    async def get_all_discord_usernames_stamped() -> Stamped[list[tuple[str, str]]]:
+        """
+        Return (discord_username, name) pairs for all rows with a non-null username.
+
+        Cached until the next CSV sync rewrites the ``locations`` table. The token
+        changes on every reload, so readers can detect new pairs cheaply.
+        """
+        async with AsyncReadSessionLocal() as session:
+            return Stamped(await LocationsRepository.get_all_discord_usernames(session))
 
     # ------------------------------------------------------------------
     # CSV sync (delegates to CsvSyncService)
@@ -75,7 +83,7 @@ class LocationsService:
         Returns:
             A list of tuples containing (name, location) if found, otherwise None.
         """
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             possible_people = (
                 await LocationsRepository.get_location_check_discord(session, name)
                 if discord_only
@@ -87,7 +95,7 @@ class LocationsService:
         logger.info("Cache miss in get_location. Triggering sync and retrying.")
         await self.sync_locations()
 
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             possible_people = (
                 await LocationsRepository.get_location_check_discord(session, name)
                 if discord_only
@@ -105,7 +113,7 @@ class LocationsService:
         Returns:
             A tuple containing (name, location) if found, otherwise None.
         """
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             person = await LocationsRepository.get_name_location(session, discord_username)
         return person
 
@@ -153,7 +161,7 @@ class LocationsService:
             args = await self.list_locations(day, message_id, channel_id, option)
             embed = self._housing.build_embed(*args, option=option)
             if day and option and "dropoff" in option.lower():
-                async with AsyncSessionLocal() as session:
+                async with AsyncReadSessionLocal() as session:
                     non_discord = await LocationsRepository.get_non_discord_pickups(session, day)
                 if non_discord:
                     non_discord_locations_people = defaultdict(list)
@@ -238,7 +246,7 @@ class LocationsService:
         locations_people, location_found = await self._sort_locations(usernames_reacted)
 
         if day and (option is None or "dropoff" not in option.lower()):
-            async with AsyncSessionLocal() as session:
+            async with AsyncReadSessionLocal() as session:
                 pickups = await LocationsRepository.get_non_discord_pickups(session, day)
             for pickup in pickups:
                 locations_people[pickup.location].append((pickup.name, None))
@@ -3,7 +3,7 @@
 import logging
 from datetime import date
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.models import MessageSchedulePause
 from bot.repositories.message_schedule_repository import MessageScheduleRepository
 
@@ -16,7 +16,7 @@ class MessageScheduleService:
     @staticmethod
     async def get_all_pauses() -> list[MessageSchedulePause]:
         """Return pause status for all jobs."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             return await MessageScheduleRepository.get_all_pause_statuses(session)
 
     @staticmethod
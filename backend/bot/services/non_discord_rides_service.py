@@ -6,7 +6,7 @@ from datetime import date
 from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import DaysOfWeek
 from bot.core.models import NonDiscordRides
 from bot.repositories.non_discord_rides_repository import NonDiscordRidesRepository
@@ -112,7 +112,7 @@ class NonDiscordRidesService:
         if session is not None:
             return await NonDiscordRidesRepository.get_rides_by_date(session, ride_date)
 
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             return await NonDiscordRidesRepository.get_rides_by_date(session, ride_date)
 
     async def delete_past_pickups(self, session: AsyncSession | None = None) -> int:
@@ -3,21 +3,32 @@ Service for user-managed pickup locations, travel-time edges, and living mapping
 
 Owns the unit-of-work for the pickup-locations tables and holds an in-memory
 snapshot cache of the full routing graph (locations, edges, mappings, pickup
-adjustment). Every mutation invalidates the cache so the next read re-fetches.
+adjustment). Every mutation derives the next snapshot from the cached one
+(``RoutingContext.evolve``) instead of re-fetching it, and bumps a shared
+version so other processes drop their copy and reload on their next read.
 """
 
 import asyncio
+import hashlib
 import heapq
+import itertools
+import json
 import logging
-from dataclasses import dataclass, field
+from array import array
+from collections.abc import Callable, Iterable
+from dataclasses import InitVar, dataclass, field, replace
+from typing import cast
 
 from rapidfuzz import fuzz, process, utils
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import CampusLivingLocations
 from bot.core.models import PickupLocation, PickupLocationEdge
 from bot.repositories.global_settings_repository import GlobalSettingsRepository
 from bot.repositories.pickup_locations_repository import PickupLocationsRepository
+from bot.utils.cache import Stamped
+from bot.utils.constants import SHARED_VERSION_POLL_SECONDS
+from bot.utils.shared_version import SharedVersion
 
 logger = logging.getLogger(__name__)
 
@@ -30,6 +41,18 @@ END_NODE = "END"
 
 FUZZY_TOKEN_SORT_CUTOFF = 65
 FUZZY_PARTIAL_CUTOFF = 60
+# Fuzzy results remembered per snapshot before the memo starts over
+FUZZY_MEMO_MAX_ENTRIES = 1024
+# Memo lookup default; None is a real result ("no match").
+_MISSING = object()
+
+# Sentinel in the shortest-path arrays for "no path" / "no predecessor".
+UNREACHABLE = -1
+# Past this many changed edges a derived snapshot recomputes all shortest paths.
+MAX_INCREMENTAL_EDGE_CHANGES = 4
+
+# Process-wide snapshot versions: every RoutingContext gets a fresh one.
+_snapshot_versions = itertools.count(1)
 
 
 @dataclass(frozen=True)
@@ -56,6 +79,45 @@ class EdgeInfo:
     minutes: int
 
 
+@dataclass(frozen=True)
+class ShortestPaths:
+    """
+    All-pairs shortest travel times over the routing graph.
+
+    Nodes are numbered in ``names`` order. ``minutes`` and ``predecessors`` are
+    flat row-major ``n * n`` integer arrays: ``minutes[i * n + j]`` is the
+    shortest time from node i to node j and ``predecessors[i * n + j]`` is the
+    node just before j on that path, both ``UNREACHABLE`` when there is none.
+    """
+
+    names: tuple[str, ...]
+    index: dict[str, int]
+    minutes: array
+    predecessors: array
+
+    def time(self, start: str, end: str) -> int | None:
+        """Shortest time in minutes from *start* to *end*, or None if there is no path."""
+        i = self.index.get(start)
+        j = self.index.get(end)
+        if i is None or j is None:
+            return None
+        minutes = self.minutes[i * len(self.names) + j]
+        return None if minutes == UNREACHABLE else minutes
+
+    def path(self, start: str, end: str) -> list[str] | None:
+        """Node names along the shortest path, both ends included, or None if there is none."""
+        if self.time(start, end) is None:
+            return None
+        n = len(self.names)
+        i = self.index[start]
+        j = self.index[end]
+        nodes = [j]
+        while j != i:
+            j = self.predecessors[i * n + j]
+            nodes.append(j)
+        return [self.names[node] for node in reversed(nodes)]
+
+
 @dataclass(frozen=True)
 class RoutingContext:
     """
@@ -63,6 +125,17 @@ class RoutingContext:
 
     ``graph`` maps node name (location name or START/END) to a list of
     ``(neighbor_name, minutes)`` tuples, covering active locations only.
+    ``paths`` holds the all-pairs shortest paths over ``graph``; it is computed
+    on construction unless passed in as ``shortest_paths``, so lookups never
+    search the graph.
+    Name indexes, the active-name and map-link views and the preprocessed
+    fuzzy-match choices are likewise built once per snapshot; callers must not
+    mutate what they return. Fuzzy-match results are memoized per snapshot.
+    ``version`` is unique per snapshot within the process, so anything derived
+    from a snapshot (e.g. serialized API bodies) can be cached against it.
+    ``graph_digest`` is a content hash of ``graph`` that is stable across
+    processes, for keys in shared caches. ``evolve`` derives the next snapshot
+    after an edit without going back to the database.
     """
 
     locations: tuple[LocationInfo, ...]
@@ -70,66 +143,203 @@ class RoutingContext:
     living_to_pickup: dict[str, str]
     pickup_adjustment: int
     graph: dict[str, list[tuple[str, int]]] = field(default_factory=dict)
+    shortest_paths: InitVar[ShortestPaths | None] = None
+    paths: ShortestPaths = field(init=False, compare=False, repr=False)
+    version: int = field(
+        init=False, default_factory=lambda: next(_snapshot_versions), compare=False
+    )
+    _by_name: dict[str, LocationInfo] = field(init=False, compare=False, repr=False)
+    _active_by_lower: dict[str, str] = field(init=False, compare=False, repr=False)
+    _active_names: tuple[str, ...] = field(init=False, compare=False, repr=False)
+    _map_links: dict[str, str] = field(init=False, compare=False, repr=False)
+    _fuzzy_choices: tuple[str, ...] = field(init=False, compare=False, repr=False)
+    _fuzzy_memo: dict[str, str | None] = field(init=False, compare=False, repr=False)
+    graph_digest: str = field(init=False, compare=False, repr=False)
+
+    def __post_init__(self, shortest_paths: ShortestPaths | None) -> None:
+        """Build the lookup indexes, and the shortest-path matrix if not supplied."""
+        if shortest_paths is None:
+            shortest_paths = all_pairs_shortest_paths(self.graph)
+        object.__setattr__(self, "paths", shortest_paths)
+        by_name = {loc.name: loc for loc in self.locations}
+        active_names = tuple(loc.name for loc in self.locations if loc.is_active)
+        active_by_lower: dict[str, str] = {}
+        for name in active_names:
+            active_by_lower.setdefault(name.lower(), name)
+        object.__setattr__(self, "_by_name", by_name)
+        object.__setattr__(self, "_active_by_lower", active_by_lower)
+        object.__setattr__(self, "_active_names", active_names)
+        object.__setattr__(
+            self,
+            "_map_links",
+            {name: _map_url(by_name[name]) for name in active_names},
+        )
+        object.__setattr__(
+            self, "_fuzzy_choices", tuple(utils.default_process(name) for name in active_names)
+        )
+        object.__setattr__(self, "_fuzzy_memo", {})
+        object.__setattr__(self, "graph_digest", _graph_digest(self.graph))
+
+    def evolve(
+        self,
+        *,
+        locations: tuple[LocationInfo, ...] | None = None,
+        edges: tuple[EdgeInfo, ...] | None = None,
+        living_to_pickup: dict[str, str] | None = None,
+        pickup_adjustment: int | None = None,
+    ) -> "RoutingContext":
+        """
+        A new snapshot with some parts replaced, sharing the rest with this one.
+
+        The graph is rebuilt from the new locations and edges. If its nodes are
+        unchanged and only a few edges differ, the shortest paths are updated
+        from this snapshot's instead of being recomputed; if no edge differs
+        they are reused as is. The result gets a new ``version``.
+        """
+        locations = self.locations if locations is None else locations
+        edges = self.edges if edges is None else edges
+        graph = self.graph
+        paths: ShortestPaths | None = self.paths
+        if locations is not self.locations or edges is not self.edges:
+            graph = build_graph(locations, edges)
+            changes = _edge_changes(self.graph, graph)
+            if graph.keys() != self.graph.keys() or len(changes) > MAX_INCREMENTAL_EDGE_CHANGES:
+                paths = None
+            elif changes:
+                paths = update_shortest_paths(self.paths, self.graph, changes)
+        return replace(
+            self,
+            locations=locations,
+            edges=edges,
+            living_to_pickup=(
+                self.living_to_pickup if living_to_pickup is None else living_to_pickup
+            ),
+            pickup_adjustment=(
+                self.pickup_adjustment if pickup_adjustment is None else pickup_adjustment
+            ),
+            graph=graph,
+            shortest_paths=paths,
+        )
 
     @property
-    def active_names(self) -> list[str]:
+    def active_names(self) -> tuple[str, ...]:
         """Names of active pickup locations."""
-        return [loc.name for loc in self.locations if loc.is_active]
+        return self._active_names
+
+    def location(self, name: str) -> LocationInfo | None:
+        """Return the location with this exact name (active or not), or None."""
+        return self._by_name.get(name)
+
+    def exact_match(self, token: str) -> str | None:
+        """Return the active location name equal to *token* ignoring case and padding."""
+        return self._active_by_lower.get(token.strip().lower())
 
     def coordinates(self, name: str) -> tuple[float, float] | None:
         """Return (lat, lng) for a location name, or None if unknown."""
-        for loc in self.locations:
-            if loc.name == name:
-                return (loc.latitude, loc.longitude)
-        return None
+        loc = self._by_name.get(name)
+        if loc is None:
+            return None
+        return (loc.latitude, loc.longitude)
 
     def map_url(self, name: str) -> str | None:
         """Generate a Google Maps URL for a pickup location name."""
-        coords = self.coordinates(name)
-        if coords is None:
+        loc = self._by_name.get(name)
+        if loc is None:
             return None
-        lat, lng = coords
-        return f"https://www.google.com/maps?q={lat},{lng}"
+        return _map_url(loc)
 
     def map_links(self) -> dict[str, str]:
         """Return a dict of active location names to Google Maps URLs."""
-        return {name: url for name in self.active_names if (url := self.map_url(name)) is not None}
+        return self._map_links
 
     def lookup_time(self, start_name: str, end_name: str) -> int:
         """
-        Shortest travel time in minutes between two locations (Dijkstra).
+        Shortest travel time in minutes between two locations (precomputed).
 
         Raises:
             ValueError: If no path exists between the two locations.
         """
-        return dijkstra(self.graph, start_name, end_name)
+        if start_name == end_name:
+            return 0
+        minutes = self.paths.time(start_name, end_name)
+        if minutes is None:
+            raise ValueError(f"No path found from {start_name} to {end_name}")
+        return minutes
+
+    def leg_time(self, start_name: str, end_name: str) -> int:
+        """
+        Minutes a route spends between two consecutive nodes.
+
+        The travel time, plus the pickup adjustment when both ends are distinct
+        pickup stops (not START/END).
+
+        Raises:
+            ValueError: If no path exists between the two nodes.
+        """
+        if start_name == end_name:
+            return 0
+        minutes = self.lookup_time(start_name, end_name)
+        if start_name in (START_NODE, END_NODE) or end_name in (START_NODE, END_NODE):
+            return minutes
+        return minutes + self.pickup_adjustment
 
     def fuzzy_match(self, input_loc: str) -> str | None:
         """Fuzzy-match an input string to an active pickup location name."""
-        names = self.active_names
+        return self.fuzzy_match_many([input_loc])[0]
+
+    def fuzzy_match_many(self, inputs: Iterable[str]) -> list[str | None]:
+        """
+        Fuzzy-match several input strings to active pickup location names, in order.
+
+        Each distinct input is scored once against the choices preprocessed for
+        this snapshot, and results are memoized so repeated inputs are free.
+        """
+        queries = [utils.default_process(input_loc) for input_loc in inputs]
+        # Agent tool threads share this memo and may clear it, so read each
+        # entry once instead of checking membership first.
+        memo = self._fuzzy_memo
+        found: dict[str, str | None] = {}
+        misses: list[str] = []
+        for query in dict.fromkeys(queries):
+            result = memo.get(query, _MISSING)
+            if result is _MISSING:
+                misses.append(query)
+            else:
+                found[query] = cast(str | None, result)
+        if misses:
+            for query in misses:
+                found[query] = self._fuzzy_score(query)
+            if len(memo) + len(misses) > FUZZY_MEMO_MAX_ENTRIES:
+                memo.clear()
+            memo.update((query, found[query]) for query in misses)
+        return [found[query] for query in queries]
+
+    def _fuzzy_score(self, query: str) -> str | None:
+        """Best active name for an already-processed query: token sort, then partial."""
+        names = self._active_names
         if not names:
             return None
 
         result = process.extractOne(
-            input_loc,
-            names,
+            query,
+            self._fuzzy_choices,
             scorer=fuzz.token_sort_ratio,
             score_cutoff=FUZZY_TOKEN_SORT_CUTOFF,
-            processor=utils.default_process,
+            processor=None,
         )
         if result:
-            return str(result[0])
+            return names[result[2]]
 
         result = process.extractOne(
-            input_loc,
-            names,
+            query,
+            self._fuzzy_choices,
             scorer=fuzz.partial_ratio,
             score_cutoff=FUZZY_PARTIAL_CUTOFF,
-            processor=utils.default_process,
+            processor=None,
         )
         if result:
-            logger.debug(f"Fallback match: '{input_loc}' -> '{result[0]}' (Score: {result[1]})")
-            return str(result[0])
+            logger.debug(f"Fallback match: '{query}' -> '{names[result[2]]}' (Score: {result[1]})")
+            return names[result[2]]
 
         return None
 
@@ -150,49 +360,152 @@ class RoutingContext:
         return [
             name
             for name in self.active_names
-            if not _connected(self.graph, name, START_NODE)
-            or not _connected(self.graph, name, END_NODE)
+            if self.paths.time(name, START_NODE) is None or self.paths.time(name, END_NODE) is None
         ]
 
 
-def dijkstra(graph: dict[str, list[tuple[str, int]]], start: str, end: str) -> int:
-    """
-    Shortest-path travel time between two nodes of the routing graph.
+def _graph_digest(graph: dict[str, list[tuple[str, int]]]) -> str:
+    canonical = json.dumps(sorted((node, sorted(adj)) for node, adj in graph.items()))
+    return hashlib.sha256(canonical.encode()).hexdigest()
 
-    Raises:
-        ValueError: If no path exists.
-    """
-    if start == end:
-        return 0
-    distances: dict[str, float] = {node: float("inf") for node in graph}
-    distances[start] = 0
-    priority_queue: list[tuple[float, str]] = [(0, start)]
 
-    while priority_queue:
-        current_distance, current_node = heapq.heappop(priority_queue)
+def _map_url(loc: LocationInfo) -> str:
+    return f"https://www.google.com/maps?q={loc.latitude},{loc.longitude}"
 
-        if current_distance > distances.get(current_node, float("inf")):
-            continue
 
-        if current_node == end:
-            return int(current_distance)
-
-        for neighbor, minutes in graph.get(current_node, []):
-            distance = current_distance + minutes
-            if distance < distances.get(neighbor, float("inf")):
-                distances[neighbor] = distance
-                heapq.heappush(priority_queue, (distance, neighbor))
-
-    raise ValueError(f"No path found from {start} to {end}")
+def all_pairs_shortest_paths(graph: dict[str, list[tuple[str, int]]]) -> ShortestPaths:
+    """
+    Shortest paths between every pair of routing-graph nodes.
 
+    Runs Dijkstra once from each node over an integer-indexed adjacency list.
+    The graph is small and sparse, so this beats Floyd-Warshall and is done
+    once per snapshot rather than per lookup.
+    """
+    names = tuple(
+        dict.fromkeys([*graph, *(neighbor for adj in graph.values() for neighbor, _ in adj)])
+    )
+    index = {name: i for i, name in enumerate(names)}
+    n = len(names)
+    adjacency = [
+        [(index[neighbor], minutes) for neighbor, minutes in graph.get(name, ())] for name in names
+    ]
+    minutes = array("i", [UNREACHABLE]) * (n * n)
+    predecessors = array("i", [UNREACHABLE]) * (n * n)
+
+    for source in range(n):
+        _dijkstra_row(adjacency, source, minutes, predecessors)
+
+    return ShortestPaths(names=names, index=index, minutes=minutes, predecessors=predecessors)
+
+
+def update_shortest_paths(
+    paths: ShortestPaths,
+    graph: dict[str, list[tuple[str, int]]],
+    changes: Iterable[tuple[str, str, int | None]],
+) -> ShortestPaths:
+    """
+    Shortest paths after editing a few edges of *graph*, derived from *paths*.
 
-def _connected(graph: dict[str, list[tuple[str, int]]], start: str, end: str) -> bool:
-    """Whether a path exists between two nodes."""
-    try:
-        dijkstra(graph, start, end)
-    except ValueError:
-        return False
-    return True
+    Each change is ``(a, b, minutes)`` for the undirected edge between two
+    nodes already in *paths*, with None removing the edge. A new or shorter
+    edge relaxes every pair through it; a longer or removed one re-runs
+    Dijkstra only from the sources whose shortest-path tree used it. *paths*
+    and *graph* are left untouched.
+    """
+    n = len(paths.names)
+    index = paths.index
+    weights: list[dict[int, int]] = [{} for _ in range(n)]
+    for name, adj in graph.items():
+        for neighbor, edge_minutes in adj:
+            weights[index[name]][index[neighbor]] = edge_minutes
+    minutes = array("i", paths.minutes)
+    predecessors = array("i", paths.predecessors)
+
+    for a_name, b_name, new in changes:
+        a, b = index[a_name], index[b_name]
+        old = weights[a].get(b)
+        if new == old:
+            continue
+        if new is None:
+            del weights[a][b], weights[b][a]
+        else:
+            weights[a][b] = weights[b][a] = new
+
+        if new is not None and (old is None or new < old):
+            _relax_edge(minutes, predecessors, n, a, b, new)
+        else:
+            adjacency = [list(adj.items()) for adj in weights]
+            for source in range(n):
+                row = source * n
+                if predecessors[row + b] == a or predecessors[row + a] == b:
+                    _dijkstra_row(adjacency, source, minutes, predecessors)
+
+    return ShortestPaths(names=paths.names, index=index, minutes=minutes, predecessors=predecessors)
+
+
+def _dijkstra_row(
+    adjacency: list[list[tuple[int, int]]], source: int, minutes: array, predecessors: array
+) -> None:
+    """Fill row *source* of the flat matrices with Dijkstra from *source*."""
+    n = len(adjacency)
+    row = source * n
+    minutes[row : row + n] = array("i", [UNREACHABLE]) * n
+    predecessors[row : row + n] = array("i", [UNREACHABLE]) * n
+    minutes[row + source] = 0
+    predecessors[row + source] = source
+    priority_queue = [(0, source)]
+    while priority_queue:
+        distance, node = heapq.heappop(priority_queue)
+        if distance > minutes[row + node]:
+            continue
+        for neighbor, edge_minutes in adjacency[node]:
+            candidate = distance + edge_minutes
+            best = minutes[row + neighbor]
+            if best == UNREACHABLE or candidate < best:
+                minutes[row + neighbor] = candidate
+                predecessors[row + neighbor] = node
+                heapq.heappush(priority_queue, (candidate, neighbor))
+
+
+def _relax_edge(
+    minutes: array, predecessors: array, n: int, a: int, b: int, edge_minutes: int
+) -> None:
+    """Shorten every pair whose path improves through the new or shorter edge a-b."""
+    # Rows a and b as they were before this edge changed
+    from_a = (minutes[a * n : (a + 1) * n], predecessors[a * n : (a + 1) * n])
+    from_b = (minutes[b * n : (b + 1) * n], predecessors[b * n : (b + 1) * n])
+    for i in range(n):
+        row = i * n
+        to_a = minutes[row + a]
+        to_b = minutes[row + b]
+        for u, v, to_u, (rest_minutes, rest_predecessors) in (
+            (a, b, to_a, from_b),
+            (b, a, to_b, from_a),
+        ):
+            if to_u == UNREACHABLE:
+                continue
+            via = to_u + edge_minutes
+            for j in range(n):
+                rest = rest_minutes[j]
+                if rest == UNREACHABLE:
+                    continue
+                current = minutes[row + j]
+                if current == UNREACHABLE or via + rest < current:
+                    minutes[row + j] = via + rest
+                    predecessors[row + j] = u if j == v else rest_predecessors[j]
+
+
+def _edge_changes(
+    old: dict[str, list[tuple[str, int]]], new: dict[str, list[tuple[str, int]]]
+) -> list[tuple[str, str, int | None]]:
+    """Undirected edges whose minutes differ between two graphs (None = removed)."""
+    before = {(u, v): m for u, adj in old.items() for v, m in adj if u < v}
+    after = {(u, v): m for u, adj in new.items() for v, m in adj if u < v}
+    return [
+        (u, v, after.get((u, v)))
+        for u, v in sorted(before.keys() | after.keys())
+        if before.get((u, v)) != after.get((u, v))
+    ]
 
 
 def build_graph(
@@ -227,18 +540,66 @@ class PickupLocationsService:
     """Business logic for pickup locations. Cache is shared across instances."""
 
     _snapshot: RoutingContext | None = None
+    _payload: Stamped[dict] | None = None
     _lock = asyncio.Lock()
+    _version = SharedVersion("pickup_locations", min_interval=SHARED_VERSION_POLL_SECONDS)
 
     # --- Snapshot / reads ------------------------------------------------
 
     @classmethod
     def invalidate_cache(cls) -> None:
-        """Drop the cached routing snapshot so the next read re-fetches."""
+        """
+        Drop this process's routing snapshot so its next read re-fetches.
+
+        Mutations do not need this (they derive the next snapshot themselves);
+        it is for tests and for edits made outside this service.
+        """
         cls._snapshot = None
 
+    @classmethod
+    async def _update_snapshot(cls, change: Callable[[RoutingContext], RoutingContext]) -> None:
+        """
+        Apply a committed edit to the cached snapshot and publish it to other processes.
+
+        Mutations call this with ``_lock`` held, so a load cannot race the edit.
+        With nothing cached the next read loads from the DB as usual; if the
+        edit cannot be applied the snapshot is dropped so that it does.
+        """
+        if cls._snapshot is not None:
+            try:
+                cls._snapshot = change(cls._snapshot)
+            except Exception:
+                logger.exception("Failed to update the routing snapshot in place, reloading it")
+                cls._snapshot = None
+        await cls._version.bump()
+
     @classmethod
     async def get_routing_context(cls) -> RoutingContext:
-        """Return the cached routing snapshot, loading it from the DB if needed."""
+        """
+        Return the cached routing snapshot, loading it from the DB if needed.
+
+        The snapshot is dropped first if another process has edited pickup
+        locations since it was loaded (split deployments). That check reads
+        the shared version at most once per ``SHARED_VERSION_POLL_SECONDS``.
+        """
+        if await cls._version.changed():
+            cls._snapshot = None
+        return await cls._cached_snapshot()
+
+    @classmethod
+    def get_routing_context_sync(cls) -> RoutingContext:
+        """
+        Synchronous snapshot access for non-async callers (e.g. agent tools).
+
+        Must not be called from within a running event loop. Skips the shared
+        version check: it runs on a throwaway event loop, which must not drive
+        the main loop's Redis client. The async readers on this process keep
+        the snapshot in step with other processes.
+        """
+        return asyncio.run(cls._cached_snapshot())
+
+    @classmethod
+    async def _cached_snapshot(cls) -> RoutingContext:
         if cls._snapshot is not None:
             return cls._snapshot
         async with cls._lock:
@@ -248,18 +609,9 @@ class PickupLocationsService:
             cls._snapshot = snapshot
             return snapshot
 
-    @classmethod
-    def get_routing_context_sync(cls) -> RoutingContext:
-        """
-        Synchronous snapshot access for non-async callers (e.g. agent tools).
-
-        Must not be called from within a running event loop.
-        """
-        return asyncio.run(cls.get_routing_context())
-
     @classmethod
     async def _load_snapshot(cls) -> RoutingContext:
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             locations = await PickupLocationsRepository.get_all_locations(session)
             edges = await PickupLocationsRepository.get_all_edges(session)
             mappings = await PickupLocationsRepository.get_all_mappings(session)
@@ -286,12 +638,14 @@ class PickupLocationsService:
                 f"Loaded pickup locations snapshot: {len(location_infos)} locations, "
                 f"{len(edge_infos)} edges, {len(living_to_pickup)} mappings"
             )
+            graph = build_graph(location_infos, edge_infos)
             return RoutingContext(
                 locations=location_infos,
                 edges=edge_infos,
                 living_to_pickup=living_to_pickup,
                 pickup_adjustment=adjustment,
-                graph=build_graph(location_infos, edge_infos),
+                graph=graph,
+                shortest_paths=all_pairs_shortest_paths(graph),
             )
 
     @staticmethod
@@ -318,20 +672,34 @@ class PickupLocationsService:
 
     @classmethod
     async def get_all(cls) -> dict:
-        """Full management payload for the API: locations, edges, mappings, settings."""
+        """
+        Full management payload for the API: locations, edges, mappings, settings.
+
+        Built once per snapshot version; callers must not mutate the result.
+        """
+        return (await cls.get_all_stamped()).value
+
+    @classmethod
+    async def get_all_stamped(cls) -> Stamped[dict]:
+        """Management payload tagged with the version of the snapshot it was built from."""
         ctx = await cls.get_routing_context()
+        if cls._payload is None or cls._payload.token != ctx.version:
+            cls._payload = Stamped(cls._build_payload(ctx), token=ctx.version)
+        return cls._payload
+
+    @staticmethod
+    def _build_payload(ctx: RoutingContext) -> dict:
+        living_mappings = []
+        for living, pickup in ctx.living_to_pickup.items():
+            location = ctx.location(pickup)
+            if location is None:
+                logger.warning(f"Living location '{living}' maps to unknown pickup '{pickup}'")
+                continue
+            living_mappings.append({"living_location": living, "pickup_location_id": location.id})
         return {
             "locations": [vars(loc) | {} for loc in ctx.locations],
             "edges": [vars(edge) | {} for edge in ctx.edges],
-            "living_mappings": [
-                {
-                    "living_location": living,
-                    "pickup_location_id": next(
-                        loc.id for loc in ctx.locations if loc.name == pickup
-                    ),
-                }
-                for living, pickup in ctx.living_to_pickup.items()
-            ],
+            "living_mappings": living_mappings,
             "pickup_adjustment": ctx.pickup_adjustment,
             "unreachable": ctx.unreachable_names(),
         }
@@ -354,26 +722,23 @@ class PickupLocationsService:
         Raises:
             ValueError: If a location with the same name already exists.
         """
-        cls.invalidate_cache()
-        try:
-            async with AsyncSessionLocal() as session:
-                existing = await PickupLocationsRepository.get_location_by_name(session, name)
-                if existing is not None:
-                    raise ValueError(f"A pickup location named '{name}' already exists")
-                location = await PickupLocationsRepository.create_location(
-                    session,
-                    name=name,
-                    latitude=latitude,
-                    longitude=longitude,
-                    minutes_from_start=minutes_from_start,
-                    minutes_to_end=minutes_to_end,
-                )
-                info = cls._to_location_info(location)
-                await session.commit()
-                logger.info(f"Created pickup location '{name}' (id={info.id})")
-                return info
-        finally:
-            cls.invalidate_cache()
+        async with cls._lock, AsyncSessionLocal() as session:
+            existing = await PickupLocationsRepository.get_location_by_name(session, name)
+            if existing is not None:
+                raise ValueError(f"A pickup location named '{name}' already exists")
+            location = await PickupLocationsRepository.create_location(
+                session,
+                name=name,
+                latitude=latitude,
+                longitude=longitude,
+                minutes_from_start=minutes_from_start,
+                minutes_to_end=minutes_to_end,
+            )
+            info = cls._to_location_info(location)
+            await session.commit()
+            logger.info(f"Created pickup location '{name}' (id={info.id})")
+            await cls._update_snapshot(lambda ctx: ctx.evolve(locations=_with_location(ctx, info)))
+            return info
 
     @classmethod
     async def update_location(cls, location_id: int, **fields) -> LocationInfo | None:
@@ -383,27 +748,31 @@ class PickupLocationsService:
         Raises:
             ValueError: If renaming to a name that already exists.
         """
-        cls.invalidate_cache()
-        try:
-            async with AsyncSessionLocal() as session:
-                location = await PickupLocationsRepository.get_location(session, location_id)
-                if location is None:
-                    return None
-                new_name = fields.get("name")
-                if new_name is not None and new_name != location.name:
-                    existing = await PickupLocationsRepository.get_location_by_name(
-                        session, new_name
-                    )
-                    if existing is not None:
-                        raise ValueError(f"A pickup location named '{new_name}' already exists")
-                for key, value in fields.items():
-                    setattr(location, key, value)
-                info = cls._to_location_info(location)
-                await session.commit()
-                logger.info(f"Updated pickup location id={location_id}: {sorted(fields)}")
-                return info
-        finally:
-            cls.invalidate_cache()
+        async with cls._lock, AsyncSessionLocal() as session:
+            location = await PickupLocationsRepository.get_location(session, location_id)
+            if location is None:
+                return None
+            old_name = location.name
+            new_name = fields.get("name")
+            if new_name is not None and new_name != old_name:
+                existing = await PickupLocationsRepository.get_location_by_name(session, new_name)
+                if existing is not None:
+                    raise ValueError(f"A pickup location named '{new_name}' already exists")
+            for key, value in fields.items():
+                setattr(location, key, value)
+            info = cls._to_location_info(location)
+            await session.commit()
+            logger.info(f"Updated pickup location id={location_id}: {sorted(fields)}")
+            await cls._update_snapshot(
+                lambda ctx: ctx.evolve(
+                    locations=_with_location(ctx, info),
+                    living_to_pickup={
+                        living: info.name if pickup == old_name else pickup
+                        for living, pickup in ctx.living_to_pickup.items()
+                    },
+                )
+            )
+            return info
 
     @classmethod
     async def soft_delete_location(cls, location_id: int) -> bool:
@@ -413,27 +782,25 @@ class PickupLocationsService:
         Raises:
             ValueError: If living-location mappings still point at the location.
         """
-        cls.invalidate_cache()
-        try:
-            async with AsyncSessionLocal() as session:
-                location = await PickupLocationsRepository.get_location(session, location_id)
-                if location is None:
-                    return False
-                mappings = await PickupLocationsRepository.get_mappings_for_location(
-                    session, location_id
+        async with cls._lock, AsyncSessionLocal() as session:
+            location = await PickupLocationsRepository.get_location(session, location_id)
+            if location is None:
+                return False
+            mappings = await PickupLocationsRepository.get_mappings_for_location(
+                session, location_id
+            )
+            if mappings:
+                living = ", ".join(sorted(m.living_location for m in mappings))
+                raise ValueError(
+                    f"Cannot delete '{location.name}': living location(s) still "
+                    f"mapped to it: {living}. Remap them first."
                 )
-                if mappings:
-                    living = ", ".join(sorted(m.living_location for m in mappings))
-                    raise ValueError(
-                        f"Cannot delete '{location.name}': living location(s) still "
-                        f"mapped to it: {living}. Remap them first."
-                    )
-                location.is_active = False
-                await session.commit()
-                logger.info(f"Deactivated pickup location '{location.name}' (id={location_id})")
-                return True
-        finally:
-            cls.invalidate_cache()
+            location.is_active = False
+            info = cls._to_location_info(location)
+            await session.commit()
+            logger.info(f"Deactivated pickup location '{location.name}' (id={location_id})")
+            await cls._update_snapshot(lambda ctx: ctx.evolve(locations=_with_location(ctx, info)))
+            return True
 
     @classmethod
     async def upsert_edge(cls, location_a_id: int, location_b_id: int, minutes: int) -> EdgeInfo:
@@ -446,38 +813,34 @@ class PickupLocationsService:
         if location_a_id == location_b_id:
             raise ValueError("An edge must connect two different locations")
         a_id, b_id = sorted((location_a_id, location_b_id))
-        cls.invalidate_cache()
-        try:
-            async with AsyncSessionLocal() as session:
-                for loc_id in (a_id, b_id):
-                    location = await PickupLocationsRepository.get_location(session, loc_id)
-                    if location is None or not location.is_active:
-                        raise ValueError(f"Unknown or inactive pickup location id {loc_id}")
-                edge = await PickupLocationsRepository.get_edge_by_pair(session, a_id, b_id)
-                if edge is None:
-                    edge = await PickupLocationsRepository.create_edge(session, a_id, b_id, minutes)
-                else:
-                    edge.minutes = minutes
-                info = cls._to_edge_info(edge)
-                await session.commit()
-                logger.info(f"Upserted edge {a_id}<->{b_id} = {minutes} min")
-                return info
-        finally:
-            cls.invalidate_cache()
+        async with cls._lock, AsyncSessionLocal() as session:
+            for loc_id in (a_id, b_id):
+                location = await PickupLocationsRepository.get_location(session, loc_id)
+                if location is None or not location.is_active:
+                    raise ValueError(f"Unknown or inactive pickup location id {loc_id}")
+            edge = await PickupLocationsRepository.get_edge_by_pair(session, a_id, b_id)
+            if edge is None:
+                edge = await PickupLocationsRepository.create_edge(session, a_id, b_id, minutes)
+            else:
+                edge.minutes = minutes
+            info = cls._to_edge_info(edge)
+            await session.commit()
+            logger.info(f"Upserted edge {a_id}<->{b_id} = {minutes} min")
+            await cls._update_snapshot(lambda ctx: ctx.evolve(edges=_with_edge(ctx, info)))
+            return info
 
     @classmethod
     async def delete_edge(cls, edge_id: int) -> bool:
         """Delete an edge. Returns False if the id is unknown."""
-        cls.invalidate_cache()
-        try:
-            async with AsyncSessionLocal() as session:
-                deleted = await PickupLocationsRepository.delete_edge(session, edge_id)
-                await session.commit()
-                if deleted:
-                    logger.info(f"Deleted edge id={edge_id}")
-                return deleted
-        finally:
-            cls.invalidate_cache()
+        async with cls._lock, AsyncSessionLocal() as session:
+            deleted = await PickupLocationsRepository.delete_edge(session, edge_id)
+            await session.commit()
+            if deleted:
+                logger.info(f"Deleted edge id={edge_id}")
+                await cls._update_snapshot(
+                    lambda ctx: ctx.evolve(edges=tuple(e for e in ctx.edges if e.id != edge_id))
+                )
+            return deleted
 
     @classmethod
     async def set_living_mapping(cls, living_location: str, pickup_location_id: int) -> dict:
@@ -490,24 +853,26 @@ class PickupLocationsService:
         valid_living = {loc.value for loc in CampusLivingLocations}
         if living_location not in valid_living:
             raise ValueError(f"Unknown living location '{living_location}'")
-        cls.invalidate_cache()
-        try:
-            async with AsyncSessionLocal() as session:
-                location = await PickupLocationsRepository.get_location(session, pickup_location_id)
-                if location is None or not location.is_active:
-                    raise ValueError(f"Unknown or inactive pickup location id {pickup_location_id}")
-                mapping = await PickupLocationsRepository.upsert_mapping(
-                    session, living_location, pickup_location_id
+        async with cls._lock, AsyncSessionLocal() as session:
+            location = await PickupLocationsRepository.get_location(session, pickup_location_id)
+            if location is None or not location.is_active:
+                raise ValueError(f"Unknown or inactive pickup location id {pickup_location_id}")
+            mapping = await PickupLocationsRepository.upsert_mapping(
+                session, living_location, pickup_location_id
+            )
+            result = {
+                "living_location": mapping.living_location,
+                "pickup_location_id": mapping.pickup_location_id,
+            }
+            pickup_name = location.name
+            await session.commit()
+            logger.info(f"Mapped living '{living_location}' -> pickup id={pickup_location_id}")
+            await cls._update_snapshot(
+                lambda ctx: ctx.evolve(
+                    living_to_pickup={**ctx.living_to_pickup, living_location: pickup_name}
                 )
-                result = {
-                    "living_location": mapping.living_location,
-                    "pickup_location_id": mapping.pickup_location_id,
-                }
-                await session.commit()
-                logger.info(f"Mapped living '{living_location}' -> pickup id={pickup_location_id}")
-                return result
-        finally:
-            cls.invalidate_cache()
+            )
+            return result
 
     @classmethod
     async def set_pickup_adjustment(cls, value: int) -> int:
@@ -519,12 +884,25 @@ class PickupLocationsService:
         """
         if value < 0:
             raise ValueError("Pickup adjustment must be >= 0")
-        cls.invalidate_cache()
-        try:
-            async with AsyncSessionLocal() as session:
-                await GlobalSettingsRepository.set(session, PICKUP_ADJUSTMENT_KEY, str(value))
-                await session.commit()
-                logger.info(f"Set pickup adjustment to {value}")
-                return value
-        finally:
-            cls.invalidate_cache()
+        async with cls._lock, AsyncSessionLocal() as session:
+            await GlobalSettingsRepository.set(session, PICKUP_ADJUSTMENT_KEY, str(value))
+            await session.commit()
+            logger.info(f"Set pickup adjustment to {value}")
+            await cls._update_snapshot(lambda ctx: ctx.evolve(pickup_adjustment=value))
+            return value
+
+
+def _with_location(ctx: RoutingContext, info: LocationInfo) -> tuple[LocationInfo, ...]:
+    """*ctx*'s locations with *info* added or replacing the one with its id, in name order."""
+    return tuple(
+        sorted(
+            (*(loc for loc in ctx.locations if loc.id != info.id), info), key=lambda loc: loc.name
+        )
+    )
+
+
+def _with_edge(ctx: RoutingContext, info: EdgeInfo) -> tuple[EdgeInfo, ...]:
+    """*ctx*'s edges with *info* replacing the one with its id, or appended."""
+    if any(edge.id == info.id for edge in ctx.edges):
+        return tuple(info if edge.id == info.id else edge for edge in ctx.edges)
+    return (*ctx.edges, info)
@@ -5,7 +5,7 @@ from collections import defaultdict
 
 import discord
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal
 from bot.core.enums import (
     AskRidesMessage,
     CacheNamespace,
@@ -105,7 +105,7 @@ class ReactionService:
                     reactions_by_emoji[str(reaction.emoji)].append(username)
                     all_usernames.add(username)
 
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             username_to_name = await LocationsRepository.get_names_for_usernames(
                 session, all_usernames
             )
@@ -163,7 +163,7 @@ class ReactionService:
                     reactions_by_emoji[str(reaction.emoji)].append(username)
                     all_usernames.add(username)
 
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             username_to_name = await LocationsRepository.get_names_for_usernames(
                 session, all_usernames
             )
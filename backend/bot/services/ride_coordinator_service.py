@@ -13,7 +13,7 @@ from enum import Enum
 import discord
 from discord.ext.commands import Bot
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.repositories.global_settings_repository import GlobalSettingsRepository
 from bot.utils.format_message import ping_user
 
@@ -50,7 +50,7 @@ class RideCoordinatorService:
         table) is logged and treated as "not configured".
         """
         try:
-            async with AsyncSessionLocal() as session:
+            async with AsyncReadSessionLocal() as session:
                 return await GlobalSettingsRepository.get(
                     session, RideCoordinatorService.COORDINATOR_KEY
                 )
@@ -4,7 +4,7 @@ import logging
 
 import discord
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
 from bot.core.enums import AskRidesMessage, ChannelIds, JobName
 from bot.core.error_reporter import send_error_to_discord
 from bot.repositories.ride_coverage_repository import RideCoverageRepository
@@ -215,7 +215,7 @@ class RideCoverageService:
 
         coverage_since = get_coverage_message_lookup_start(ride_type) or get_last_sunday()
         usernames_list = [str(u) for u in usernames_reacted]
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             covered_usernames = await RideCoverageRepository.get_bulk_coverage_status(
                 session, usernames_list, since=coverage_since
             )
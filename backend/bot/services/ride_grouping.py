@@ -1,16 +1,27 @@
 """Pure domain functions for ride grouping, capacity checks, and output formatting."""
 
+import hashlib
+import json
 import logging
 from datetime import datetime, time, timedelta
 
 from bot.core.schemas import Passenger
-from bot.services.pickup_locations_service import RoutingContext
+from bot.services.pickup_locations_service import END_NODE, START_NODE, RoutingContext
+from bot.services.route_service import RouteService
 
 logger = logging.getLogger(__name__)
 
 LocationsPeopleType = dict[str, list[tuple[str, str]]]
 PassengersByLocation = dict[str, list[Passenger]]
 
+# Locations GROUP_RIDES_PROMPT may route a driver through without riders there,
+# keyed to the requested pickup that triggers the rule (3f: Marshall riders go to
+# Geisel Loop), so the matrix gives the model their drive times.
+PROMPT_RULE_LOCATIONS = {"Geisel Loop": "Marshall uppers"}
+# Part of every grouping cache key; bump it when the prompt or the way its
+# inputs are formatted changes, so groupings made from the old one are not reused.
+GROUPING_PROMPT_VERSION = 2
+
 
 def parse_numbers(s: str) -> list[int]:
     """
@@ -144,12 +155,153 @@ def llm_input_pickups(locations_people: PassengersByLocation) -> str:
     ) + ("\n" if locations_people else "")
 
 
+def _short_id(index: int) -> str:
+    """Spreadsheet-style column id: A, B, ..., Z, AA, AB, ..."""
+    letters = ""
+    index += 1
+    while index:
+        index, rem = divmod(index - 1, 26)
+        letters = chr(ord("A") + rem) + letters
+    return letters
+
+
+def llm_input_matrix(locations_people: PassengersByLocation, routing: RoutingContext) -> str:
+    """
+    Formats drive times between the requested pickup locations for LLM input.
+
+    Only the locations in this request appear, plus any active
+    ``PROMPT_RULE_LOCATIONS`` whose rule applies to them, each under a short
+    id, with the shortest drive time between every pair taken from the
+    precomputed matrix. START is a row only and END a column only, since
+    drivers never return to START or leave END.
+
+    Args:
+        locations_people (PassengersByLocation): Dictionary of passengers grouped by location.
+        routing (RoutingContext): Snapshot of the routing graph and settings.
+
+    Returns:
+        str: A legend mapping ids to location names, then a table of minutes.
+    """
+    requested = sorted(location for location, people in locations_people.items() if people)
+    rule_only = [
+        name
+        for name, trigger in PROMPT_RULE_LOCATIONS.items()
+        if trigger in requested and name not in requested and routing.exact_match(name) == name
+    ]
+    names = [*requested, *rule_only]
+    ids = {name: _short_id(i) for i, name in enumerate(names)}
+
+    def minutes(start: str, end: str) -> str:
+        if start == end:
+            return "0"
+        travel = routing.paths.time(start, end)
+        return "-" if travel is None else str(travel)
+
+    header = ["", *(ids[name] for name in names), END_NODE]
+    rows = [
+        [row_id, *(minutes(start, end) for end in [*names, END_NODE])]
+        for row_id, start in [(START_NODE, START_NODE), *((ids[name], name) for name in names)]
+    ]
+    legend = [
+        "Ids (answer with the full location name): "
+        + "; ".join(f"{ids[name]}={name}" for name in names)
+    ]
+    if rule_only:
+        legend.append(
+            "No riders at (listed for the routing rules): "
+            + ", ".join(ids[name] for name in rule_only)
+        )
+    return "\n".join(
+        [
+            *legend,
+            'Drive minutes from row to column ("-" = no route):',
+            *(" ".join(line) for line in [header, *rows]),
+        ]
+    )
+
+
+def grouping_cache_key(
+    locations_people: PassengersByLocation,
+    driver_capacity: list[int],
+    graph_digest: str,
+    legacy_prompt: bool,
+    custom_prompt: str | None,
+) -> str:
+    """
+    Content hash of everything that determines an LLM ride grouping.
+
+    Riders are sorted so the same people reacting in a different order map to
+    the same key. ``GROUPING_PROMPT_VERSION`` is included, so a new prompt
+    format starts from an empty cache.
+
+    Args:
+        locations_people (PassengersByLocation): Dictionary of passengers grouped by location.
+        driver_capacity (list[int]): List of driver capacities.
+        graph_digest (str): Content hash of the routing graph.
+        legacy_prompt (bool): Whether the legacy prompt is used.
+        custom_prompt (str | None): Custom prompt instructions, if any.
+
+    Returns:
+        str: A hex SHA-256 digest.
+    """
+    pickups = sorted(
+        (location, sorted(person.identity.name for person in people))
+        for location, people in locations_people.items()
+        if people
+    )
+    canonical = json.dumps(
+        {
+            "pickups": pickups,
+            "drivers": driver_capacity,
+            "graph": graph_digest,
+            "legacy_prompt": legacy_prompt,
+            "custom_prompt": (custom_prompt or "").strip(),
+            "prompt_version": GROUPING_PROMPT_VERSION,
+        },
+        sort_keys=True,
+    )
+    return hashlib.sha256(canonical.encode()).hexdigest()
+
+
+def reorder_stops(
+    stops: list[dict[str, str]],
+    passenger_lookup: dict[str, Passenger],
+    routing: RoutingContext,
+) -> tuple[list[dict[str, str]], int]:
+    """
+    Reorders one driver's pickups for the shortest drive to the destination.
+
+    Args:
+        stops (list[dict[str, str]]): The driver's ``{name, location}`` entries.
+        passenger_lookup (dict[str, Passenger]): Passengers by name.
+        routing (RoutingContext): Snapshot of the routing graph and settings.
+
+    Returns:
+        tuple[list[dict[str, str]], int]: The entries grouped by stop in the
+        optimal order (unknown names last), and the minutes saved.
+    """
+    locations = [
+        passenger.pickup_location
+        for obj in stops
+        if (passenger := passenger_lookup.get(obj["name"])) is not None
+    ]
+    order, saved = RouteService.optimize_order(routing, locations)
+    rank = {location: idx for idx, location in enumerate(dict.fromkeys(order))}
+
+    def position(obj: dict[str, str]) -> int:
+        passenger = passenger_lookup.get(obj["name"])
+        return rank[passenger.pickup_location] if passenger is not None else len(rank)
+
+    return sorted(stops, key=position), saved
+
+
 def create_output(
     llm_result: dict[str, list[dict[str, str]]],
     locations_people: PassengersByLocation,
     end_leave_time: time,
     off_campus: LocationsPeopleType,
     routing: RoutingContext,
+    optimize_order: bool = False,
 ) -> list[str]:
     """
     Creates the final output messages based on the LLM result.
@@ -160,6 +312,8 @@ def create_output(
         end_leave_time (time): The target arrival time.
         off_campus (LocationsPeopleType): Dictionary of off-campus passengers.
         routing (RoutingContext): Snapshot of the routing graph and settings.
+        optimize_order (bool): Reorder each driver's stops for the shortest drive
+            and report the minutes saved in the summary.
 
     Returns:
         list[str]: A list of formatted output strings.
@@ -172,13 +326,19 @@ def create_output(
         for passenger in passengers
     }
     output_list = []
+    minutes_saved = 0
 
     for driver_id in llm_result:
         curr_leave_time = end_leave_time
         grouped_by_location: list[list[Passenger]] = []
         curr_location: list[Passenger] = []
 
-        for obj in llm_result[driver_id]:
+        stops = llm_result[driver_id]
+        if optimize_order:
+            stops, saved = reorder_stops(stops, passenger_lookup, routing)
+            minutes_saved += saved
+
+        for obj in stops:
             person_name = obj["name"]
             location = obj["location"]
 
@@ -238,6 +398,9 @@ def create_output(
         output_list.append(copy_str)
         output_list.append(f"```\n{copy_str}\n```")
 
+    if optimize_order:
+        overall_summary += f"- optimized pickup order saved {minutes_saved} min\n"
+
     if len(off_campus) != 0:
         overall_summary += "- TODO: off campus\n"
         for key in off_campus:
@@ -0,0 +1,210 @@
+"""
+Group-commit writer for ride reaction events.
+
+Reaction handlers enqueue events instead of committing one row per click. A
+background task drains the bounded queue and writes each batch in a single
+transaction, either when ``REACTION_EVENT_BATCH_SIZE`` rows are pending or
+``REACTION_EVENT_FLUSH_INTERVAL_MS`` after the first row of a batch arrived.
+Display names are resolved for the whole batch with one query. Events are
+published to SSE subscribers only once their batch has committed, so a
+dashboard refetch triggered by an event finds its row; a failed batch is
+retried before it is given up.
+"""
+
+import asyncio
+import contextlib
+import datetime
+import logging
+from dataclasses import asdict, dataclass
+
+from bot.core import reaction_broadcaster
+from bot.core.database import AsyncSessionLocal
+from bot.repositories.ride_reaction_events_repository import RideReactionEventsRepository
+from bot.repositories.whois_repository import WhoisRepository
+from bot.utils.constants import (
+    REACTION_EVENT_BATCH_SIZE,
+    REACTION_EVENT_FLUSH_ATTEMPTS,
+    REACTION_EVENT_FLUSH_INTERVAL_MS,
+    REACTION_EVENT_QUEUE_MAXSIZE,
+    REACTION_EVENT_RETRY_DELAY_SECONDS,
+    REACTION_EVENT_SHUTDOWN_TIMEOUT,
+)
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass(frozen=True)
+class PendingReactionEvent:
+    """A ride reaction event waiting to be written; display_name is resolved at flush."""
+
+    message_id: str
+    discord_username: str
+    emoji: str
+    action: str
+    occurred_at: datetime.datetime
+    ride_date: datetime.date | None
+    ride_type: str | None
+
+    def broadcast_payload(self) -> dict:
+        """The SSE event announcing this reaction to live listeners."""
+        return {
+            "source": "rides_announcements",
+            "message_id": self.message_id,
+            "discord_username": self.discord_username,
+            "emoji": self.emoji,
+            "action": self.action,
+            "occurred_at": self.occurred_at.isoformat(),
+            "ride_date": self.ride_date.isoformat() if self.ride_date else None,
+            "ride_type": self.ride_type,
+        }
+
+
+class RideReactionEventWriter:
+    """Bounded queue plus background task that flushes reaction events in batches."""
+
+    def __init__(
+        self,
+        *,
+        batch_size: int = REACTION_EVENT_BATCH_SIZE,
+        flush_interval_ms: int = REACTION_EVENT_FLUSH_INTERVAL_MS,
+        maxsize: int = REACTION_EVENT_QUEUE_MAXSIZE,
+        attempts: int = REACTION_EVENT_FLUSH_ATTEMPTS,
+        retry_delay: float = REACTION_EVENT_RETRY_DELAY_SECONDS,
+    ) -> None:
+        self._batch_size = batch_size
+        self._flush_interval = flush_interval_ms / 1000
+        self._maxsize = maxsize
+        self._attempts = attempts
+        self._retry_delay = retry_delay
+        # ``None`` on the queue is the shutdown sentinel.
+        self._queue: asyncio.Queue[PendingReactionEvent | None] | None = None
+        self._task: asyncio.Task | None = None
+
+    def _ensure_started(self) -> asyncio.Queue[PendingReactionEvent | None]:
+        """Create the queue and worker lazily so they bind to the running loop."""
+        if self._queue is None:
+            self._queue = asyncio.Queue(maxsize=self._maxsize)
+        if self._task is None or self._task.done():
+            self._task = asyncio.create_task(self._run(), name="ride-reaction-event-writer")
+        return self._queue
+
+    @property
+    def pending(self) -> int:
+        """Number of events queued but not yet picked up by the worker."""
+        return self._queue.qsize() if self._queue is not None else 0
+
+    async def enqueue(self, event: PendingReactionEvent) -> None:
+        """
+        Queue an event for the next batch.
+
+        Waits when the queue is full, so a stalled database applies
+        backpressure to the reaction handler instead of growing memory.
+        """
+        queue = self._ensure_started()
+        await queue.put(event)
+
+    async def _run(self) -> None:
+        assert self._queue is not None
+        loop = asyncio.get_running_loop()
+        stopping = False
+        while not stopping:
+            first = await self._queue.get()
+            if first is None:
+                return
+            batch = [first]
+            deadline = loop.time() + self._flush_interval
+            while len(batch) < self._batch_size:
+                timeout = deadline - loop.time()
+                if timeout <= 0:
+                    break
+                try:
+                    event = await asyncio.wait_for(self._queue.get(), timeout)
+                except TimeoutError:
+                    break
+                if event is None:
+                    stopping = True
+                    break
+                batch.append(event)
+            await self._flush(batch)
+
+    async def _flush(self, batch: list[PendingReactionEvent]) -> None:
+        """
+        Write one batch, retrying with backoff, then publish its events.
+
+        Failures are logged, never raised; a batch that fails every attempt is
+        dropped and its events are not published.
+        """
+        delay = self._retry_delay
+        for attempt in range(1, self._attempts + 1):
+            try:
+                await self._write(batch)
+                break
+            except Exception:
+                logger.exception(
+                    "Failed to flush %d ride reaction events (attempt %d of %d)",
+                    len(batch),
+                    attempt,
+                    self._attempts,
+                )
+            if attempt == self._attempts:
+                logger.error("Dropped %d ride reaction events", len(batch))
+                return
+            await asyncio.sleep(delay)
+            delay *= 2
+        logger.debug("Flushed %d ride reaction events", len(batch))
+
+        for event in batch:
+            try:
+                await reaction_broadcaster.publish(event.broadcast_payload())
+            except Exception:
+                logger.exception("Failed to broadcast ride reaction event")
+
+    async def _write(self, batch: list[PendingReactionEvent]) -> None:
+        """Write one batch in a single transaction."""
+        async with AsyncSessionLocal() as session:
+            display_names = await WhoisRepository.get_display_names(
+                session, {event.discord_username for event in batch}
+            )
+            rows = [
+                asdict(event) | {"display_name": display_names.get(event.discord_username)}
+                for event in batch
+            ]
+            await RideReactionEventsRepository.record_events(session, rows)
+
+    async def stop(self, timeout: float = REACTION_EVENT_SHUTDOWN_TIMEOUT) -> None:
+        """Flush everything still queued, then stop the background task."""
+        queue, task = self._queue, self._task
+        if queue is None:
+            return
+        if task is not None and not task.done():
+            # The sentinel makes the worker flush its in-hand batch and exit.
+            await queue.put(None)
+            try:
+                await asyncio.wait_for(task, timeout=timeout)
+            except TimeoutError:
+                logger.warning(
+                    "Reaction event writer did not drain within %.0fs; flushing inline", timeout
+                )
+                task.cancel()
+                with contextlib.suppress(asyncio.CancelledError):
+                    await task
+
+        leftover = [event for event in _drain(queue) if event is not None]
+        for start in range(0, len(leftover), self._batch_size):
+            await self._flush(leftover[start : start + self._batch_size])
+        if leftover:
+            logger.info("Flushed %d pending ride reaction events on shutdown", len(leftover))
+
+        self._queue = None
+        self._task = None
+
+
+def _drain(queue: asyncio.Queue) -> list:
+    """Remove and return everything currently in *queue* without waiting."""
+    items = []
+    while not queue.empty():
+        items.append(queue.get_nowait())
+    return items
+
+
+reaction_event_writer = RideReactionEventWriter()
@@ -1,17 +1,22 @@
 """Service for recording ride reaction log events to the database."""
 
+import base64
 import datetime
+import json
 import logging
-from collections import defaultdict
+from dataclasses import dataclass
+from itertools import groupby
+from operator import attrgetter
 from zoneinfo import ZoneInfo
 
 import discord
+from sqlalchemy import Row
 
 from bot.core import reaction_broadcaster
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal
 from bot.core.enums import ReactionAction
 from bot.repositories.ride_reaction_events_repository import RideReactionEventsRepository
-from bot.repositories.whois_repository import WhoisRepository
+from bot.services.ride_reaction_event_writer import PendingReactionEvent, reaction_event_writer
 from bot.utils.parsing import get_message_and_embed_content
 
 logger = logging.getLogger(__name__)
@@ -19,6 +24,14 @@ logger = logging.getLogger(__name__)
 LA_TZ = ZoneInfo("America/Los_Angeles")
 
 
+@dataclass(frozen=True)
+class ReactionLogPage:
+    """One page of the reaction log."""
+
+    groups: list[dict]
+    next_cursor: str | None
+
+
 class RideReactionLogService:
     """Business logic for persisting ride reaction events."""
 
@@ -64,9 +77,10 @@ class RideReactionLogService:
         """
         Record a reaction event on an ask-rides announcement message.
 
-        Detects the ride type from message content, resolves the user's display
-        name from the database, and persists the event. Exceptions are logged
-        but never re-raised so this never blocks the reaction handler.
+        Detects the ride type from message content and queues the event on the
+        group-commit writer, which persists it (with the user's display name) in
+        the next batch and then broadcasts it to SSE subscribers. Exceptions are
+        logged but never re-raised so this never blocks the reaction handler.
 
         Args:
             user: The Discord member who reacted.
@@ -95,94 +109,115 @@ class RideReactionLogService:
             ride_date = created_at.astimezone(LA_TZ).date()
             logger.debug("record_ask_rides_reaction: ride_date=%s", ride_date)
 
-            discord_username = user.name
-
-            occurred_at = datetime.datetime.now(datetime.UTC)
-            async with AsyncSessionLocal() as session:
-                display_name = await WhoisRepository.get_display_name(session, discord_username)
-                logger.debug(
-                    "record_ask_rides_reaction: display_name=%s, writing to DB", display_name
-                )
-                event_row = await RideReactionEventsRepository.record_event(
-                    session=session,
-                    message_id=str(payload.message_id),
-                    discord_username=discord_username,
-                    display_name=display_name,
-                    emoji=str(payload.emoji),
-                    action=action.value,
-                    occurred_at=occurred_at,
-                    ride_date=ride_date,
-                    ride_type=ride_type,
-                )
+            event = PendingReactionEvent(
+                message_id=str(payload.message_id),
+                discord_username=user.name,
+                emoji=str(payload.emoji),
+                action=action.value,
+                occurred_at=datetime.datetime.now(datetime.UTC),
+                ride_date=ride_date,
+                ride_type=ride_type,
+            )
+            await reaction_event_writer.enqueue(event)
             logger.info(
-                "record_ask_rides_reaction: saved event user=%s emoji=%s action=%s ride_type=%s ride_date=%s",
-                discord_username,
+                "record_ask_rides_reaction: queued event user=%s emoji=%s action=%s ride_type=%s ride_date=%s",
+                event.discord_username,
                 payload.emoji,
                 action,
                 ride_type,
                 ride_date,
             )
-            await reaction_broadcaster.publish(
-                {
-                    "source": "rides_announcements",
-                    "id": event_row.id,
-                    "message_id": event_row.message_id,
-                    "discord_username": event_row.discord_username,
-                    "display_name": event_row.display_name,
-                    "emoji": event_row.emoji,
-                    "action": event_row.action,
-                    "occurred_at": event_row.occurred_at.isoformat(),
-                    "ride_date": event_row.ride_date.isoformat() if event_row.ride_date else None,
-                    "ride_type": event_row.ride_type,
-                }
-            )
         except Exception:
             logger.exception("Failed to record ask-rides reaction event")
 
     @staticmethod
     async def get_grouped_events(
+        limit: int,
         ride_type: str | None = None,
         date_from: datetime.date | None = None,
         date_to: datetime.date | None = None,
         emoji: str | None = None,
-    ) -> list[tuple[str, dict]]:
+        cursor: str | None = None,
+    ) -> ReactionLogPage:
         """
-        Fetch reaction events and return them grouped by message, newest rides first.
+        Fetch one page of reaction events grouped by message, newest rides first.
+
+        Pages hold at most *limit* events; a message whose events straddle a page
+        boundary continues at the top of the next page.
 
         Args:
+            limit: Maximum number of events in the page.
             ride_type: Optional filter (friday | sunday | sunday_class | wednesday).
             date_from: Include events on or after this ride_date.
             date_to: Include events on or before this ride_date.
             emoji: Filter to a specific emoji string.
+            cursor: ``next_cursor`` from the previous page, or None for the first.
 
         Returns:
-            Sorted list of (message_id, {"ride_type", "ride_date", "events": [row, ...]}).
+            The page's groups and the cursor for the next page.
+
+        Raises:
+            ValueError: If *cursor* is malformed.
         """
-        async with AsyncSessionLocal() as session:
-            events = await RideReactionEventsRepository.get_events(
+        after = _decode_cursor(cursor) if cursor else None
+        async with AsyncReadSessionLocal() as session:
+            rows = await RideReactionEventsRepository.get_event_page(
                 session,
                 ride_type=ride_type,
                 date_from=date_from,
                 date_to=date_to,
                 emoji=emoji,
+                after=after,
+                limit=limit + 1,
+            )
+
+        next_cursor = _encode_cursor(rows[limit - 1]) if len(rows) > limit else None
+        # Rows arrive ordered by message within ride_date, so groups are contiguous.
+        groups = []
+        for message_id, group in groupby(rows[:limit], key=attrgetter("message_id")):
+            events = list(group)
+            groups.append(
+                {
+                    "message_id": message_id,
+                    "ride_type": events[0].ride_type,
+                    "ride_date": events[0].ride_date,
+                    "events": [event._asdict() for event in events],
+                }
             )
+        return ReactionLogPage(groups=groups, next_cursor=next_cursor)
 
-        groups: dict[str, dict] = defaultdict(
-            lambda: {"ride_type": None, "ride_date": None, "events": []}
+    @staticmethod
+    async def get_emojis() -> list[str]:
+        """Return every distinct emoji in the reaction log, for the filter dropdown."""
+        async with AsyncReadSessionLocal() as session:
+            return await RideReactionEventsRepository.get_emojis(session)
+
+
+def _encode_cursor(row: Row) -> str:
+    """Encode a row's sort key as an opaque, URL-safe cursor."""
+    key = [
+        row.ride_date.isoformat() if row.ride_date else None,
+        row.message_id,
+        row.occurred_at.isoformat(),
+        row.id,
+    ]
+    return base64.urlsafe_b64encode(json.dumps(key).encode()).decode()
+
+
+def _decode_cursor(cursor: str) -> tuple[datetime.date | None, str, datetime.datetime, int]:
+    """Decode a cursor from _encode_cursor, raising ValueError if it is malformed."""
+    try:
+        ride_date, message_id, occurred_at, event_id = json.loads(
+            base64.urlsafe_b64decode(cursor.encode())
+        )
+        return (
+            datetime.date.fromisoformat(ride_date) if ride_date else None,
+            str(message_id),
+            datetime.datetime.fromisoformat(occurred_at),
+            int(event_id),
         )
-        for event in events:
-            mid = event.message_id
-            groups[mid]["ride_type"] = event.ride_type
-            groups[mid]["ride_date"] = event.ride_date
-            groups[mid]["events"].append(event)
-
-        def _sort_key(item: tuple) -> tuple:
-            mid, data = item
-            rd = data["ride_date"]
-            date_key = rd if rd is not None else datetime.date.min
-            return (date_key, mid)
-
-        return sorted(groups.items(), key=_sort_key, reverse=True)
+    except (ValueError, TypeError) as e:
+        raise ValueError(f"Invalid reaction log cursor: {cursor!r}") from e
 
 
 def _detect_ride_type(content: str) -> str | None:
@@ -0,0 +1,343 @@
+"""
+Deterministic local solver for ride grouping.
+
+A capacitated vehicle-routing heuristic over the routing snapshot: every
+driver leaves START, picks up a set of stops and continues to END. Routes are
+built by cheapest insertion and then improved by local search (relocate, swap
+and 2-opt) until no move lowers the total drive time. There is no randomness,
+so the same input always produces the same grouping.
+
+The result has the same ``{driver: [{name, location}]}`` shape as the LLM
+output, so ``create_output`` formats either one.
+"""
+
+import logging
+from collections import deque
+from dataclasses import dataclass
+from itertools import pairwise
+
+from bot.services.pickup_locations_service import END_NODE, START_NODE, RoutingContext
+from bot.services.ride_grouping import PassengersByLocation
+
+logger = logging.getLogger(__name__)
+
+# Minutes charged for a leg with no path in the graph, so the solver avoids it
+UNREACHABLE_PENALTY = 10_000
+# Safety net against cycling; real inputs converge within a few passes
+MAX_IMPROVEMENT_PASSES = 200
+
+RideGroups = dict[str, list[dict[str, str]]]
+
+
+@dataclass(frozen=True)
+class _Stop:
+    """Riders picked up together at one location by one driver."""
+
+    location: str
+    names: tuple[str, ...]
+
+    @property
+    def demand(self) -> int:
+        return len(self.names)
+
+
+class _Legs(dict[tuple[str, str], int]):
+    """Memoized leg costs in minutes, including the per-stop pickup adjustment."""
+
+    def __init__(self, routing: RoutingContext) -> None:
+        super().__init__()
+        self._routing = routing
+
+    def __missing__(self, key: tuple[str, str]) -> int:
+        try:
+            minutes = self._routing.leg_time(*key)
+        except ValueError:
+            minutes = UNREACHABLE_PENALTY
+        self[key] = minutes
+        return minutes
+
+
+class _Solution:
+    """
+    Per-driver stop sequences with their loads and costs.
+
+    ``loads`` and ``costs`` are kept in step with ``routes`` by the moves, so a
+    candidate move is priced from the legs it changes instead of re-walking
+    the routes.
+    """
+
+    def __init__(self, stops: list[_Stop], capacities: list[int], legs: _Legs) -> None:
+        self.stops = stops
+        self.capacities = capacities
+        self.legs = legs
+        self.routes: list[list[int]] = [[] for _ in capacities]
+        self.loads = [0] * len(capacities)
+        self.costs = [0] * len(capacities)
+
+    def cost(self, route: list[int]) -> int:
+        """Drive minutes from START through *route* to END (0 for an unused driver)."""
+        if not route:
+            return 0
+        legs = self.legs
+        total = legs[START_NODE, self.stops[route[0]].location]
+        for prev, nxt in pairwise(route):
+            total += legs[self.stops[prev].location, self.stops[nxt].location]
+        return total + legs[self.stops[route[-1]].location, END_NODE]
+
+    def total_cost(self) -> int:
+        """Drive minutes summed over all drivers."""
+        return sum(self.costs)
+
+    def insertion_delta(self, route: list[int], position: int, stop: int) -> int:
+        """Extra minutes for inserting *stop* into *route* before *position*."""
+        prev, nxt = self._neighbours(route, position - 1, position)
+        location = self.stops[stop].location
+        return self.legs[prev, location] + self.legs[location, nxt] - self._gap(prev, nxt)
+
+    def removal_saving(self, route: list[int], position: int) -> int:
+        """Minutes saved by dropping the stop at *position* from *route*."""
+        prev, nxt = self._neighbours(route, position - 1, position + 1)
+        location = self.stops[route[position]].location
+        return self.legs[prev, location] + self.legs[location, nxt] - self._gap(prev, nxt)
+
+    def slots(self, route: list[int]) -> list[tuple[str, str, str, int, int]]:
+        """
+        Per position of *route*: (previous location, location, next location,
+        minutes of the two legs through the stop, riders picked up).
+        """
+        legs = self.legs
+        slots = []
+        for position, stop in enumerate(route):
+            prev, nxt = self._neighbours(route, position - 1, position + 1)
+            location = self.stops[stop].location
+            out = legs[prev, location] + legs[location, nxt]
+            slots.append((prev, location, nxt, out, self.stops[stop].demand))
+        return slots
+
+    def _neighbours(self, route: list[int], before: int, after: int) -> tuple[str, str]:
+        prev = self.stops[route[before]].location if before >= 0 else START_NODE
+        nxt = self.stops[route[after]].location if after < len(route) else END_NODE
+        return prev, nxt
+
+    def _gap(self, prev: str, nxt: str) -> int:
+        # An empty route costs nothing rather than a START -> END drive
+        return 0 if prev == START_NODE and nxt == END_NODE else self.legs[prev, nxt]
+
+
+def solve_ride_groups(
+    passengers_by_location: PassengersByLocation,
+    driver_capacities: list[int],
+    routing: RoutingContext,
+) -> RideGroups:
+    """
+    Assign riders to drivers and order each driver's pickups.
+
+    Args:
+        passengers_by_location: On-campus passengers grouped by pickup location.
+        driver_capacities: Seats per driver; driver i is reported as ``Driver{i}``.
+        routing: Snapshot of the routing graph and settings.
+
+    Returns:
+        ``{driver: [{"name": ..., "location": ...}]}`` in pickup order, with
+        unused drivers left out.
+
+    Raises:
+        ValueError: If the drivers cannot seat every passenger.
+    """
+    riders = sum(len(people) for people in passengers_by_location.values())
+    if riders > sum(driver_capacities):
+        raise ValueError(
+            f"Insufficient driver capacity. Riders: {riders}, Capacity: {sum(driver_capacities)}"
+        )
+
+    legs = _Legs(routing)
+    solution = _Solution(
+        _initial_stops(passengers_by_location, driver_capacities), driver_capacities, legs
+    )
+    _construct(solution)
+    constructed = solution.total_cost()
+    passes = _improve(solution)
+    logger.debug(
+        f"Local ride grouping: {riders} riders, {len(solution.stops)} stops, "
+        f"{constructed} -> {solution.total_cost()} min after {passes} passes"
+    )
+
+    return {
+        f"Driver{driver}": [
+            {"name": name, "location": solution.stops[s].location}
+            for s in route
+            for name in solution.stops[s].names
+        ]
+        for driver, route in enumerate(solution.routes)
+        if route
+    }
+
+
+def _initial_stops(
+    passengers_by_location: PassengersByLocation, driver_capacities: list[int]
+) -> list[_Stop]:
+    """One stop per location, split into car-sized chunks where one car cannot hold it."""
+    largest_car = max(driver_capacities, default=0) or 1
+    stops = []
+    for location, passengers in passengers_by_location.items():
+        names = [p.identity.name for p in passengers]
+        stops.extend(
+            _Stop(location, tuple(names[i : i + largest_car]))
+            for i in range(0, len(names), largest_car)
+        )
+    return stops
+
+
+def _construct(solution: _Solution) -> None:
+    """
+    Cheapest insertion, largest and most remote stops first.
+
+    A stop that no driver has room for is split into single riders, which
+    always fit because total capacity covers total demand.
+    """
+    legs = solution.legs
+    pending = deque(
+        sorted(
+            range(len(solution.stops)),
+            key=lambda s: (
+                -solution.stops[s].demand,
+                -(
+                    legs[START_NODE, solution.stops[s].location]
+                    + legs[solution.stops[s].location, END_NODE]
+                ),
+                solution.stops[s].location,
+                s,
+            ),
+        )
+    )
+
+    while pending:
+        stop = pending.popleft()
+        demand = solution.stops[stop].demand
+        best: tuple[int, int, int] | None = None
+        for driver, route in enumerate(solution.routes):
+            if solution.loads[driver] + demand > solution.capacities[driver]:
+                continue
+            for position in range(len(route) + 1):
+                delta = solution.insertion_delta(route, position, stop)
+                if best is None or delta < best[0]:
+                    best = (delta, driver, position)
+
+        if best is None:
+            pending.extendleft(reversed(_split(solution, stop)))
+            continue
+
+        delta, driver, position = best
+        solution.routes[driver].insert(position, stop)
+        solution.loads[driver] += demand
+        solution.costs[driver] += delta
+
+
+def _split(solution: _Solution, stop: int) -> list[int]:
+    """Replace *stop* with one stop per rider; returns the new stop indexes."""
+    original = solution.stops[stop]
+    solution.stops[stop] = _Stop(original.location, original.names[:1])
+    singles = [stop]
+    for name in original.names[1:]:
+        solution.stops.append(_Stop(original.location, (name,)))
+        singles.append(len(solution.stops) - 1)
+    return singles
+
+
+def _improve(solution: _Solution) -> int:
+    """Apply improving moves until none is left; returns the number of passes."""
+    for passes in range(1, MAX_IMPROVEMENT_PASSES + 1):
+        improved = _relocate(solution) | _swap(solution) | _two_opt(solution)
+        if not improved:
+            return passes
+    logger.warning(f"Local ride grouping stopped after {MAX_IMPROVEMENT_PASSES} passes")
+    return MAX_IMPROVEMENT_PASSES
+
+
+def _relocate(solution: _Solution) -> bool:
+    """Move single stops to the cheapest position on any driver with room."""
+    improved = False
+    routes, loads, costs = solution.routes, solution.loads, solution.costs
+    for a in range(len(routes)):
+        i = 0
+        while i < len(routes[a]):
+            stop = routes[a][i]
+            demand = solution.stops[stop].demand
+            without = routes[a][:i] + routes[a][i + 1 :]
+            saving = solution.removal_saving(routes[a], i)
+            best: tuple[int, int, int] | None = None
+            for b, target in enumerate(routes):
+                if b != a and loads[b] + demand > solution.capacities[b]:
+                    continue
+                base = without if b == a else target
+                for position in range(len(base) + 1):
+                    if b == a and position == i:
+                        continue
+                    delta = solution.insertion_delta(base, position, stop)
+                    if delta < saving and (best is None or delta < best[0]):
+                        best = (delta, b, position)
+            if best is None:
+                i += 1
+                continue
+            delta, b, position = best
+            routes[a] = without
+            routes[b].insert(position, stop)
+            loads[a] -= demand
+            loads[b] += demand
+            costs[a] -= saving
+            costs[b] += delta
+            improved = True
+    return improved
+
+
+def _swap(solution: _Solution) -> bool:
+    """Exchange two stops between drivers when it shortens the total drive."""
+    improved = False
+    routes, loads, costs = solution.routes, solution.loads, solution.costs
+    legs = solution.legs
+    slots = [solution.slots(route) for route in routes]
+    for a in range(len(routes)):
+        for b in range(a + 1, len(routes)):
+            if not routes[a] or not routes[b]:
+                continue
+            for i in range(len(routes[a])):
+                prev_a, loc_s, next_a, out_a, demand_s = slots[a][i]
+                for j in range(len(routes[b])):
+                    prev_b, loc_t, next_b, out_b, demand_t = slots[b][j]
+                    if loc_s == loc_t:
+                        continue  # same legs either way
+                    shift = demand_t - demand_s
+                    if (
+                        loads[a] + shift > solution.capacities[a]
+                        or loads[b] - shift > solution.capacities[b]
+                    ):
+                        continue
+                    delta_a = legs[prev_a, loc_t] + legs[loc_t, next_a] - out_a
+                    delta_b = legs[prev_b, loc_s] + legs[loc_s, next_b] - out_b
+                    if delta_a + delta_b < 0:
+                        routes[a][i], routes[b][j] = routes[b][j], routes[a][i]
+                        loads[a] += shift
+                        loads[b] -= shift
+                        costs[a] += delta_a
+                        costs[b] += delta_b
+                        slots[a], slots[b] = solution.slots(routes[a]), solution.slots(routes[b])
+                        prev_a, loc_s, next_a, out_a, demand_s = slots[a][i]
+                        improved = True
+    return improved
+
+
+def _two_opt(solution: _Solution) -> bool:
+    """Reverse segments within each driver's route when it shortens the drive."""
+    improved = False
+    for driver, route in enumerate(solution.routes):
+        current = solution.costs[driver]
+        for i in range(len(route) - 1):
+            for j in range(i + 1, len(route)):
+                candidate = route[:i] + route[i : j + 1][::-1] + route[j + 1 :]
+                cost = solution.cost(candidate)
+                if cost < current:
+                    route, current = candidate, cost
+                    improved = True
+        solution.routes[driver] = route
+        solution.costs[driver] = current
+    return improved
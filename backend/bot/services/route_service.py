@@ -1,17 +1,44 @@
 """Service for route building and location matching."""
 
 import logging
+import math
+from collections import Counter
+from dataclasses import dataclass
 from datetime import datetime, timedelta
+from itertools import pairwise
+from typing import ClassVar
 
-from bot.services.pickup_locations_service import RoutingContext
+from bot.services.pickup_locations_service import END_NODE, RoutingContext
 from bot.utils.parsing import parse_time
 
 logger = logging.getLogger(__name__)
 
+# Held-Karp is O(2^n * n^2); routes longer than this keep their given order.
+MAX_OPTIMIZED_STOPS = 10
+# Bound on memoized (stop set, last stop) entries kept for one snapshot
+MAX_ORDER_TABLE_ENTRIES = 200_000
+
+
+@dataclass(frozen=True)
+class RoutePlan:
+    """A formatted route with the stop order it was timed in."""
+
+    route: str
+    order: list[str]
+    minutes_saved: int
+
+
+_OrderTables = dict[tuple[frozenset[str], str], tuple[float, str | None]]
+
 
 class RouteService:
     """Handles route building and fuzzy location matching."""
 
+    # Held-Karp subproblems for the current snapshot, as (snapshot version, tables):
+    # (stops visited, last stop) -> (minutes, previous stop). One attribute, so
+    # a caller never pairs one snapshot's version with another's tables.
+    _order_tables: ClassVar[tuple[int | None, _OrderTables]] = (None, {})
+
     @staticmethod
     def get_pickup_location_fuzzy(routing: RoutingContext, input_loc: str) -> str | None:
         """
@@ -41,18 +68,46 @@ class RouteService:
         Raises:
             ValueError: If no location matches.
         """
-        lowered = token.strip().lower()
-        for name in routing.active_names:
-            if name.lower() == lowered:
-                return name
-        match = routing.fuzzy_match(token)
-        if match is None:
-            raise ValueError(f"Invalid location: {token}")
-        return match
+        return RouteService.resolve_locations(routing, [token])[0]
+
+    @staticmethod
+    def resolve_locations(routing: RoutingContext, tokens: list[str]) -> list[str]:
+        """
+        Resolve input strings to pickup location names in one pass.
+
+        Exact matches are looked up first; the rest are fuzzy-matched together,
+        so repeated tokens are scored once.
+
+        Args:
+            routing (RoutingContext): Snapshot of the routing graph and settings.
+            tokens: The input location strings.
+
+        Returns:
+            The matched pickup location names, in input order.
+
+        Raises:
+            ValueError: If a location does not match.
+        """
+        exact = [routing.exact_match(token) for token in tokens]
+        fuzzy = iter(
+            routing.fuzzy_match_many(
+                token for token, match in zip(tokens, exact, strict=True) if match is None
+            )
+        )
+        resolved = []
+        for token, match in zip(tokens, exact, strict=True):
+            match = match or next(fuzzy)
+            if match is None:
+                raise ValueError(f"Invalid location: {token}")
+            resolved.append(match)
+        return resolved
 
     @staticmethod
     def make_route_from_names(
-        routing: RoutingContext, locations: list[str], leave_time: str
+        routing: RoutingContext,
+        locations: list[str],
+        leave_time: str,
+        optimize_order: bool = False,
     ) -> str:
         """
         Makes a route from a list of location input strings.
@@ -61,15 +116,44 @@ class RouteService:
             routing (RoutingContext): Snapshot of the routing graph and settings.
             locations: Location input strings in pickup order.
             leave_time: The leave time for the route.
+            optimize_order: Reorder the stops to minimize total drive time.
 
         Returns:
             The route as a string.
 
+        Raises:
+            ValueError: If a location cannot be resolved.
+        """
+        return RouteService.plan_route(routing, locations, leave_time, optimize_order).route
+
+    @staticmethod
+    def plan_route(
+        routing: RoutingContext,
+        locations: list[str],
+        leave_time: str,
+        optimize_order: bool = False,
+    ) -> RoutePlan:
+        """
+        Resolve, optionally reorder, and time a route.
+
+        Args:
+            routing (RoutingContext): Snapshot of the routing graph and settings.
+            locations: Location input strings in pickup order.
+            leave_time: The leave time for the route.
+            optimize_order: Reorder the stops to minimize total drive time.
+
+        Returns:
+            The formatted route, the stop order used and the minutes saved by
+            reordering (0 when the order was kept).
+
         Raises:
             ValueError: If a location cannot be resolved.
         """
         curr_leave_time = parse_time(leave_time)
-        resolved = [RouteService.resolve_location(routing, token) for token in locations]
+        resolved = RouteService.resolve_locations(routing, locations)
+        minutes_saved = 0
+        if optimize_order:
+            resolved, minutes_saved = RouteService.optimize_order(routing, resolved)
 
         drive_formatted: list[str] = []
         logger.debug(f"{resolved=}")
@@ -99,7 +183,11 @@ class RouteService:
 
         logger.debug(f"{drive_formatted=}")
 
-        return ", ".join(reversed(drive_formatted))
+        return RoutePlan(
+            route=", ".join(reversed(drive_formatted)),
+            order=resolved,
+            minutes_saved=minutes_saved,
+        )
 
     @staticmethod
     def make_route(routing: RoutingContext, locations: str, leave_time: str) -> str:
@@ -115,3 +203,113 @@ class RouteService:
             The route as a string.
         """
         return RouteService.make_route_from_names(routing, locations.split(), leave_time)
+
+    @staticmethod
+    def drive_minutes(routing: RoutingContext, stops: list[str]) -> float:
+        """
+        Drive time through *stops* in the given order and on to END.
+
+        Includes the pickup adjustment between distinct stops. Returns
+        ``math.inf`` if some leg has no path.
+        """
+        try:
+            return sum(routing.leg_time(a, b) for a, b in pairwise([*stops, END_NODE]))
+        except ValueError:
+            return math.inf
+
+    @classmethod
+    def optimize_order(cls, routing: RoutingContext, stops: list[str]) -> tuple[list[str], int]:
+        """
+        Order pickup stops to minimize drive time to END (Held-Karp).
+
+        Repeated stops are visited once, with their riders kept together.
+        Subproblem tables are shared across calls for the same snapshot.
+
+        Args:
+            routing (RoutingContext): Snapshot of the routing graph and settings.
+            stops: Exact pickup location names in their current order.
+
+        Returns:
+            The reordered stops and the minutes saved compared to *stops*. The
+            input order comes back unchanged, with 0 saved, when the route is
+            too long to solve exactly or has no complete path.
+        """
+        distinct = list(dict.fromkeys(stops))
+        if len(distinct) < 2 or len(distinct) > MAX_OPTIMIZED_STOPS:
+            return list(stops), 0
+
+        tables = cls._use_snapshot(routing)
+        visited = frozenset(distinct)
+        best_minutes, last = min(
+            (
+                cls._best_path_to(routing, tables, visited, stop)[0] + cls._end_leg(routing, stop),
+                stop,
+            )
+            for stop in sorted(distinct)
+        )
+        if math.isinf(best_minutes):
+            return list(stops), 0
+
+        order: list[str] = []
+        stop: str | None = last
+        while stop is not None:
+            order.append(stop)
+            previous = tables[(visited, stop)][1]
+            visited = visited - {stop}
+            stop = previous
+        order.reverse()
+
+        counts = Counter(stops)
+        reordered = [stop for stop in order for _ in range(counts[stop])]
+        before = cls.drive_minutes(routing, stops)
+        saved = 0 if math.isinf(before) else max(0, int(before - best_minutes))
+        return reordered, saved
+
+    @classmethod
+    def _use_snapshot(cls, routing: RoutingContext) -> _OrderTables:
+        """
+        Return the memoized tables for *routing*, starting new ones when needed.
+
+        Tables are replaced when the snapshot changes or they grow too large.
+        Callers keep the returned dict for the whole solve, so a concurrent
+        call for another snapshot (agent tool threads, API routes) cannot swap
+        it out from under them.
+        """
+        version, tables = cls._order_tables
+        if version != routing.version or len(tables) > MAX_ORDER_TABLE_ENTRIES:
+            tables = {}
+            cls._order_tables = (routing.version, tables)
+        return tables
+
+    @classmethod
+    def _best_path_to(
+        cls, routing: RoutingContext, tables: _OrderTables, visited: frozenset[str], last: str
+    ) -> tuple[float, str | None]:
+        """Shortest path that visits every stop in *visited* and ends at *last*."""
+        key = (visited, last)
+        known = tables.get(key)
+        if known is not None:
+            return known
+
+        rest = visited - {last}
+        result: tuple[float, str | None] = (0, None) if not rest else (math.inf, None)
+        for previous in sorted(rest):
+            minutes = cls._best_path_to(routing, tables, rest, previous)[0] + cls._leg(
+                routing, previous, last
+            )
+            if minutes < result[0]:
+                result = (minutes, previous)
+
+        tables[key] = result
+        return result
+
+    @staticmethod
+    def _leg(routing: RoutingContext, a: str, b: str) -> float:
+        try:
+            return routing.leg_time(a, b)
+        except ValueError:
+            return math.inf
+
+    @staticmethod
+    def _end_leg(routing: RoutingContext, stop: str) -> float:
+        return RouteService._leg(routing, stop, END_NODE)
@@ -6,11 +6,14 @@ Business logic for user account management and role-based access control.
 
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.core.database import AsyncSessionLocal
-from bot.core.enums import AccountRoles
+from bot.core.database import AsyncReadSessionLocal, AsyncSessionLocal
+from bot.core.enums import AccountRoles, CacheNamespace
 from bot.core.models import UserAccount
 from bot.repositories.auth_sessions_repository import AuthSessionsRepository
 from bot.repositories.user_accounts_repository import UserAccountsRepository
+from bot.services.auth_session_cache import auth_session_cache
+from bot.utils.cache import alru_cache
+from bot.utils.constants import ROLE_CACHE_TTL_SECONDS
 
 ROLE_LEVELS: dict[str, int] = {
     AccountRoles.VIEWER: 1,
@@ -35,16 +38,21 @@ class UserAccountsService:
             The existing or newly created UserAccount.
         """
         if session is not None:
-            return await UserAccountsRepository.get_or_create(session, email)
-
-        async with AsyncSessionLocal() as session:
-            return await UserAccountsRepository.get_or_create(session, email)
+            account = await UserAccountsRepository.get_or_create(session, email)
+        else:
+            async with AsyncSessionLocal() as session:
+                account = await UserAccountsRepository.get_or_create(session, email)
+        # The row was just read (or created), so it is the freshest role there is.
+        await UserAccountsService.remember_role(email, account.role)
+        return account
 
     @staticmethod
     async def get_account(email: str) -> UserAccount | None:
         """Get an existing account by email without creating one."""
-        async with AsyncSessionLocal() as session:
-            return await UserAccountsRepository.get_by_email(session, email)
+        async with AsyncReadSessionLocal() as session:
+            account = await UserAccountsRepository.get_by_email(session, email)
+        await UserAccountsService.remember_role(email, account.role if account else None)
+        return account
 
     @staticmethod
     async def invite(
@@ -77,13 +85,15 @@ class UserAccountsService:
         if email:
             async with AsyncSessionLocal() as session:
                 await AuthSessionsRepository.delete_by_email(session, email)
+            auth_session_cache.invalidate_email(email)
+            await UserAccountsService.forget_role(email)
 
         return True
 
     @staticmethod
     async def list_accounts() -> list[UserAccount]:
         """Return all user accounts ordered by email."""
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             return await UserAccountsRepository.get_all_accounts(session)
 
     @staticmethod
@@ -92,9 +102,44 @@ class UserAccountsService:
     ) -> UserAccount | None:
         """Update a user's role. Returns the updated account, or None if not found."""
         async with AsyncSessionLocal() as session:
-            return await UserAccountsRepository.update_role(
+            account = await UserAccountsRepository.update_role(
                 session, email, role, role_edited_by=role_edited_by
             )
+        await UserAccountsService.forget_role(email)
+        return account
+
+    @staticmethod
+    @alru_cache(ttl=ROLE_CACHE_TTL_SECONDS, namespace=CacheNamespace.ACCOUNT_ROLES)
+    async def get_role(email: str) -> AccountRoles | None:
+        """
+        Return the role for *email*, or None if there is no account.
+
+        Cached for ROLE_CACHE_TTL_SECONDS because every protected request checks
+        it. Account writes in this service (and AuthService linking/provisioning)
+        refresh or drop the entry, so the TTL only bounds changes made elsewhere.
+        """
+        async with AsyncReadSessionLocal() as session:
+            account = await UserAccountsRepository.get_by_email(session, email)
+        return account.role if account else None
+
+    @staticmethod
+    async def remember_role(email: str | None, role: AccountRoles | None) -> None:
+        """Store a freshly read role in the role cache."""
+        if email:
+            await UserAccountsService.get_role.cache_set(email, result=role)
+
+    @staticmethod
+    async def forget_role(email: str | None) -> None:
+        """Drop the cached role for *email* after its account changed."""
+        if email:
+            await UserAccountsService.get_role.cache_invalidate(email)
+
+    @staticmethod
+    def role_meets(role: AccountRoles | None, minimum_role: AccountRoles) -> bool:
+        """Whether *role* is at or above *minimum_role* in the role hierarchy."""
+        if role is None:
+            return False
+        return ROLE_LEVELS.get(role, 0) >= ROLE_LEVELS.get(minimum_role, 0)
 
     @staticmethod
     async def has_minimum_role(
@@ -106,20 +151,16 @@ class UserAccountsService:
         Args:
             email: The email address to check.
             minimum_role: The minimum required role.
-            session: Optional database session. If None, one is created internally.
+            session: Optional database session. If None, the cached role is used.
 
         Returns:
             True if the user's role meets or exceeds the minimum.
         """
-        if session is not None:
-            account = await UserAccountsRepository.get_by_email(session, email)
-        else:
-            async with AsyncSessionLocal() as session:
-                account = await UserAccountsRepository.get_by_email(session, email)
-
-        if not account:
-            return False
+        if session is None:
+            return UserAccountsService.role_meets(
+                await UserAccountsService.get_role(email), minimum_role
+            )
 
-        user_level = ROLE_LEVELS.get(account.role, 0)
-        required_level = ROLE_LEVELS.get(minimum_role, 0)
-        return user_level >= required_level
+        # An explicit session means the caller wants a read inside its own transaction.
+        account = await UserAccountsRepository.get_by_email(session, email)
+        return UserAccountsService.role_meets(account.role if account else None, minimum_role)
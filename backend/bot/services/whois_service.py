@@ -3,7 +3,7 @@
 from sqlalchemy.engine import Row
 from sqlalchemy.ext.asyncio import AsyncSession
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal
 from bot.repositories.whois_repository import WhoisRepository
 
 
@@ -26,7 +26,7 @@ class WhoisService:
         if session is not None:
             return await WhoisService._get_whois_data(session, name)
 
-        async with AsyncSessionLocal() as session:
+        async with AsyncReadSessionLocal() as session:
             return await WhoisService._get_whois_data(session, name)
 
     @staticmethod
@@ -11,7 +11,9 @@ import functools
 import hashlib
 import logging
 import pickle
+import uuid
 from collections.abc import Callable
+from dataclasses import dataclass, field
 from typing import Any, TypeVar, cast
 
 from bot.core.enums import CacheNamespace, FeatureFlagNames
@@ -33,6 +35,19 @@ _namespace_registry: dict[str, list[Callable]] = {}
 _func_registry: dict[str, list[tuple[str, Callable]]] = {}
 
 
+@dataclass(frozen=True)
+class Stamped[T]:
+    """
+    A cached value plus a token that identifies this particular load.
+
+    The token survives pickling, so callers can tell whether a value changed by
+    comparing tokens instead of comparing the values themselves.
+    """
+
+    value: T
+    token: int = field(default_factory=lambda: uuid.uuid4().int)
+
+
 def _get_reaction_cache_ttl() -> int:
     """
     Return dynamic TTL for reaction caches based on time of day.
@@ -86,6 +101,11 @@ def alru_cache(
     def decorator(func: Callable[..., Any]) -> Callable[..., Any]:
         locks: dict[str, asyncio.Lock] = {}
         stats = {"hits": 0, "misses": 0}
+        # Keys with a computation in flight, and how often each was invalidated
+        # or overwritten meanwhile. A result computed before such a write is
+        # stale and must not be stored over it.
+        pending: dict[str, int] = {}
+        generations: dict[str, int] = {}
         ns_key = str(namespace)
         func_prefix = cast(Any, func).__qualname__
 
@@ -115,11 +135,23 @@ def alru_cache(
 
                 # Compute result
                 stats["misses"] += 1
-                result = await func(*args, **kwargs)
+                pending[key] = pending.get(key, 0) + 1
+                generation = generations.get(key, 0)
+                try:
+                    result = await func(*args, **kwargs)
+                finally:
+                    superseded = generations.get(key, 0) != generation
+                    pending[key] -= 1
+                    if not pending[key]:
+                        del pending[key]
+                        generations.pop(key, None)
 
             # Clean up lock to prevent unbounded growth
             locks.pop(key, None)
 
+            if superseded:
+                return result
+
             # Calculate TTL (support dynamic TTL via callable)
             current_ttl = cast(Callable[[], int | float], ttl)() if callable(ttl) else ttl
 
@@ -128,6 +160,11 @@ def alru_cache(
 
             return result
 
+        def _supersede(key: str) -> None:
+            """Stop any in-flight computation for ``key`` from storing its result."""
+            if key in pending:
+                generations[key] = generations.get(key, 0) + 1
+
         def cache_clear():
             """Clear all cached entries for this function's namespace."""
             locks.clear()
@@ -144,6 +181,7 @@ def alru_cache(
             """
             backend = get_backend()
             key = _make_cache_key(func_prefix, *args)
+            _supersede(key)
             current_ttl = cast(Callable[[], int | float], ttl)() if callable(ttl) else ttl
             await backend.set(ns_key, key, result, current_ttl)
 
@@ -155,6 +193,7 @@ def alru_cache(
             """
             backend = get_backend()
             key = _make_cache_key(func_prefix, *args)
+            _supersede(key)
             await backend.delete(ns_key, key)
             logger.info(f"Cache explicitly invalidated for {cast(Any, func).__name__}")
 
@@ -8,7 +8,7 @@ from typing import Any
 import discord
 from discord import app_commands
 
-from bot.core.database import AsyncSessionLocal
+from bot.core.database import AsyncReadSessionLocal
 from bot.core.enums import FeatureFlagNames
 from bot.core.error_reporter import send_error_to_discord
 from bot.repositories.feature_flags_repository import FeatureFlagsRepository
@@ -76,7 +76,7 @@ def feature_flag_enabled(feature: FeatureFlagNames, enable_logs: bool = True):
                 if feature in FeatureFlagsRepository._cache:
                     feature_is_enabled = FeatureFlagsRepository._cache[feature]
                 else:
-                    async with AsyncSessionLocal() as session:
+                    async with AsyncReadSessionLocal() as session:
                         feature_flag = await FeatureFlagsRepository.get_feature_flag_status(
                             session, feature
                         )
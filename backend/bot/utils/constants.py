@@ -58,11 +58,47 @@ RITA_LOCATIONS = ["rita"]
 # Session / auth (bot side)
 SESSION_TTL_DAYS = 30
 SESSION_TOUCH_THROTTLE_MINUTES = 5
+# Validated-session cache in front of auth_sessions (per process)
+SESSION_CACHE_TTL_SECONDS = 30
+SESSION_CACHE_MAXSIZE = 1024
+SESSION_TOUCH_FLUSH_INTERVAL_SECONDS = 30
+# Nightly expired-session sweep: short DELETE batches so the SQLite writer is never held long
+AUTH_SESSION_SWEEP_BATCH_SIZE = 500
+AUTH_SESSION_SWEEP_MAX_BATCHES = 200
+AUTH_SESSION_SWEEP_HOUR = 4
+AUTH_SESSION_SWEEP_MINUTE = 15
+# Role lookups for require_role; writes through UserAccountsService refresh it
+ROLE_CACHE_TTL_SECONDS = 60
+
+# SSE fan-out: frames buffered per subscriber, and recent frames kept for Last-Event-ID replay
+SSE_SUBSCRIBER_BUFFER_SIZE = 256
+SSE_REPLAY_BUFFER_SIZE = 256
+# Redis event bus behind the SSE broadcasters (used whenever Redis is reachable)
+SSE_BUS_BLOCK_MS = 5000
+SSE_BUS_RETRY_SECONDS = 1.0
 
 # LLM
 GEMINI_MODEL = "gemini-2.5-flash"
 LLM_RETRY_ATTEMPTS = 4
-LLM_RETRY_WAIT_SECONDS = 5
+# Exponential backoff with full jitter between attempts
+LLM_BACKOFF_INITIAL_SECONDS = 1.0
+LLM_BACKOFF_MAX_SECONDS = 8.0
+# End-to-end budget for one grouping call, retries and hedges included
+LLM_DEADLINE_SECONDS = 60.0
+# Hedging (opt-in via LLM_HEDGE_ENABLED): send a second request once the first
+# is slower than this percentile of recent latencies
+LLM_HEDGE_PERCENTILE = 90
+LLM_HEDGE_MIN_SAMPLES = 20
+LLM_HEDGE_DEFAULT_DELAY_SECONDS = 15.0
+LLM_LATENCY_WINDOW = 100
+
+# Ride reaction event writer (group commit)
+REACTION_EVENT_FLUSH_INTERVAL_MS = 200
+REACTION_EVENT_BATCH_SIZE = 100
+REACTION_EVENT_QUEUE_MAXSIZE = 1000
+REACTION_EVENT_SHUTDOWN_TIMEOUT = 10.0  # seconds
+REACTION_EVENT_FLUSH_ATTEMPTS = 3  # writes of one batch before it is dropped
+REACTION_EVENT_RETRY_DELAY_SECONDS = 0.5  # doubled after each failed attempt
 
 # Ride coverage
 COVERAGE_STATUS_DEFAULT_HOURS = 24
@@ -77,6 +113,9 @@ ASK_RIDES_MESSAGE_HISTORY_LIMIT = 20
 CACHE_DEFAULT_MAX_SIZE = 128
 REACTION_CACHE_ACTIVE_TTL = 65 * 60  # 65 minutes
 REACTION_CACHE_OFF_HOURS_TTL = 7 * 60 * 60  # 7 hours
+# Per-process caches shared across split-mode processes through a version key
+SHARED_VERSION_POLL_SECONDS = 1.0  # feature flag refresh; least gap between routing checks
+SHARED_VERSION_MAX_AGE_SECONDS = 60  # reload anyway when the version key is unreadable
 
 # Time helpers
 DAYS_IN_WEEK = 7
@@ -85,6 +124,17 @@ ACTIVE_HOURS_END = 1  # 1 AM next day
 
 # Lifecycle
 REDIS_CONNECTION_TIMEOUT = 5.0
+STARTUP_TIME_BUDGET_SECONDS = 3.0  # startup() phases; bot_lifespan blocks the API on this
+
+# SQLite performance profile (overridable via SQLITE_* env vars)
+SQLITE_BUSY_TIMEOUT_MS = 5000
+SQLITE_MMAP_SIZE_BYTES = 256 * 1024 * 1024  # 256 MB
+SQLITE_CACHE_SIZE_KIB = 16 * 1024  # 16 MB page cache per connection
+SQLITE_READ_POOL_SIZE = 4
+SQLITE_WRITE_POOL_OVERFLOW = 2  # extra writer connections for overlapping sessions
+SQLITE_POOL_TIMEOUT_SECONDS = 30
 
 # Default group rides capacity
 GROUP_RIDES_DEFAULT_CAPACITY = "44444"
+# How long an LLM ride grouping is reused for identical riders and settings
+RIDE_GROUPING_CACHE_TTL_SECONDS = 24 * 60 * 60
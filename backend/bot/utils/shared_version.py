@@ -0,0 +1,106 @@
+"""
+Cross-process change tracking for per-process caches.
+
+Some state is cached in class attributes (the routing snapshot, the feature
+flag cache), so each process holds its own copy. A ``SharedVersion`` keeps
+those copies in step: the process that commits a change calls ``bump``, which
+writes a fresh token to the shared cache backend (Redis in production), and
+every process calls ``changed`` before trusting its copy. With the in-memory
+backend (a single process) the token never moves behind a reader's back.
+Hot read paths pass ``min_interval`` so they do not pay a backend round trip
+on every read.
+"""
+
+import logging
+import time
+import uuid
+
+from bot.core.enums import CacheNamespace
+from bot.utils.cache_backends import get_backend
+from bot.utils.constants import SHARED_VERSION_MAX_AGE_SECONDS
+
+logger = logging.getLogger(__name__)
+
+# Never a real token, so the next ``changed`` reports a change
+_UNSYNCED = ""
+
+
+class SharedVersion:
+    """Version token for one cached piece of state, shared through the cache backend."""
+
+    def __init__(
+        self,
+        name: str,
+        max_age: float = SHARED_VERSION_MAX_AGE_SECONDS,
+        min_interval: float = 0.0,
+    ) -> None:
+        """
+        Args:
+            name: Key of the token in the ``shared_versions`` namespace.
+            max_age: Seconds after which a copy counts as stale while the
+                token cannot be read (e.g. Redis is down).
+            min_interval: Seconds during which ``changed`` trusts the last
+                check instead of reading the token again.
+        """
+        self.name = name
+        self.max_age = max_age
+        self.min_interval = min_interval
+        self._seen: str | None = None
+        self._synced_at = time.monotonic()
+        self._checked_at = float("-inf")
+
+    async def bump(self) -> None:
+        """
+        Publish a change this process has committed and already applied locally.
+
+        If another process moved the token since this one last synced, its
+        change is not in the local copy yet, so the next ``changed`` reports it.
+        """
+        backend = get_backend()
+        token = uuid.uuid4().hex
+        try:
+            _, previous = await backend.get(CacheNamespace.SHARED_VERSIONS, self.name)
+            await backend.set(CacheNamespace.SHARED_VERSIONS, self.name, token, None)
+        except Exception:
+            logger.exception(f"Failed to publish a change to '{self.name}'")
+            return
+        if previous == self._seen:
+            self._mark(token)
+        else:
+            self.forget()
+
+    async def changed(self) -> bool:
+        """
+        Return True when the local copy must be reloaded.
+
+        The token read here is recorded as seen, so callers reload straight
+        away: an edit committed during the reload moves the token again and
+        is picked up by the next call. Within ``min_interval`` of the last
+        check this returns False without touching the backend, unless
+        ``forget`` was called.
+        """
+        now = time.monotonic()
+        if self._seen != _UNSYNCED and now - self._checked_at < self.min_interval:
+            return False
+        self._checked_at = now
+        try:
+            _, token = await get_backend().get(CacheNamespace.SHARED_VERSIONS, self.name)
+        except Exception:
+            logger.warning(f"Could not read the shared version of '{self.name}'", exc_info=True)
+            if time.monotonic() - self._synced_at < self.max_age:
+                return False
+            self._synced_at = time.monotonic()
+            return True
+        if token == self._seen:
+            self._synced_at = time.monotonic()
+            return False
+        self._mark(token)
+        return True
+
+    def forget(self) -> None:
+        """Make the next ``changed`` return True, e.g. after a failed reload."""
+        self._seen = _UNSYNCED
+
+    def _mark(self, token: str | None) -> None:
+        self._seen = token
+        self._synced_at = time.monotonic()
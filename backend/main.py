@@ -7,9 +7,19 @@ import sys
 
 from dotenv import load_dotenv
 
+from api.constants import DEPLOYMENT_MODE
 from bot.core.bot_instance import set_bot_instance
+from bot.core.enums import DeploymentMode
 from bot.core.error_reporter import send_error_to_discord
-from bot.core.lifecycle import attach_event_handlers, build_bot, load_extensions, startup
+from bot.core.lifecycle import (
+    attach_event_handlers,
+    build_bot,
+    load_extensions,
+    shutdown,
+    startup,
+)
+from bot.services.auth_session_cache import auth_session_cache
+from bot.services.feature_flags_service import FeatureFlagsService
 
 logger = logging.getLogger(__name__)
 
@@ -21,7 +31,12 @@ if not TOKEN:
 
 
 async def main() -> None:
-    """Build and run the bot."""
+    """
+    Build and run the bot.
+
+    With ``DEPLOYMENT_MODE=split`` this process also serves bot-bound API
+    requests forwarded by the API workers over a Unix socket.
+    """
     bot = build_bot()
     attach_event_handlers(bot, send_error_to_discord)
     set_bot_instance(bot)
@@ -37,8 +52,29 @@ async def main() -> None:
         except Exception:
             logger.exception("Failed to load extensions")
             sys.exit(1)
+        rpc_server = None
+        rpc_task = None
+        flags_task = None
+        if DEPLOYMENT_MODE == DeploymentMode.SPLIT:
+            # Imported here so the combined deployment never loads the web app
+            from api.app import app
+            from api.bot_proxy import bot_rpc_server
+
+            rpc_server = bot_rpc_server(app)
+            rpc_task = asyncio.create_task(rpc_server.serve())
+            # Flag toggles can also be made by API workers (e.g. the fellowship season)
+            flags_task = asyncio.create_task(FeatureFlagsService.watch_cache())
         assert TOKEN is not None
-        await bot.start(TOKEN)
+        try:
+            await bot.start(TOKEN)
+        finally:
+            if flags_task is not None:
+                flags_task.cancel()
+            if rpc_server is not None and rpc_task is not None:
+                rpc_server.should_exit = True
+                await rpc_task
+                await auth_session_cache.stop()
+            await shutdown()
 
 
 if __name__ == "__main__":
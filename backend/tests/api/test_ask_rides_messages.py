@@ -11,6 +11,7 @@ from api.auth import require_ride_coordinator
 from api.routes.ask_rides import router as ask_rides_router
 from bot.core.enums import AskRidesMessageType
 from bot.services.ask_rides_messages_service import EffectiveTemplate
+from bot.utils.cache import Stamped
 
 
 def _build_client() -> TestClient:
@@ -39,8 +40,8 @@ class TestGetMessageTemplates:
         client = _build_client()
 
         with patch(
-            "api.routes.ask_rides.AskRidesMessagesService.get_effective_templates",
-            new=AsyncMock(return_value=_all_defaults()),
+            "api.routes.ask_rides.AskRidesMessagesService.get_effective_templates_stamped",
+            new=AsyncMock(return_value=Stamped(_all_defaults())),
         ):
             resp = client.get("/api/ask-rides/messages")
 
@@ -11,6 +11,7 @@ from api.auth import require_ride_coordinator
 from api.routes.ask_rides import router as ask_rides_router
 from bot.core.enums import AskRidesScheduleSlot
 from bot.services.ask_rides_schedule_service import EffectiveSchedule
+from bot.utils.cache import Stamped
 
 
 def _build_client(*, forbidden: bool = False) -> TestClient:
@@ -45,8 +46,8 @@ class TestGetSchedule:
         client = _build_client()
 
         with patch(
-            "api.routes.ask_rides.AskRidesScheduleService.get_effective_schedules",
-            new=AsyncMock(return_value=_default_schedules()),
+            "api.routes.ask_rides.AskRidesScheduleService.get_effective_schedules_stamped",
+            new=AsyncMock(return_value=Stamped(_default_schedules())),
         ):
             resp = client.get("/api/ask-rides/schedule")
 
@@ -0,0 +1,173 @@
+"""Tests for forwarding bot-bound routes from API workers to the bot process."""
+
+from __future__ import annotations
+
+import asyncio
+
+import httpx
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI, HTTPException, Request, Response
+
+import api.bot_proxy as bot_proxy
+import api.disconnect as disconnect
+from api.bot_proxy import (
+    BotProxyResponse,
+    bot_proxy_response_handler,
+    bot_rpc_server,
+    forward_to_bot,
+)
+from api.dependencies import run_on_bot_process
+from api.disconnect import cancel_on_disconnect
+
+
+def _app(where: str) -> FastAPI:
+    app = FastAPI()
+    app.add_exception_handler(BotProxyResponse, bot_proxy_response_handler)
+    # Both roles share this interpreter, so only the worker's copy may forward.
+    dependencies = [Depends(run_on_bot_process)] if where == "worker" else []
+
+    @app.post("/api/thing/{thing_id}", dependencies=dependencies)
+    async def thing(thing_id: str, body: dict, request: Request, response: Response):
+        response.set_cookie("seen_by", where)
+        return {
+            "where": where,
+            "thing_id": thing_id,
+            "body": body,
+            "q": request.query_params.getlist("q"),
+            "cookie": request.cookies.get("rides_session"),
+            "forwarded_for": request.headers.get("x-forwarded-for"),
+        }
+
+    @app.post("/api/slow", dependencies=dependencies)
+    async def slow(request: Request):
+        return await cancel_on_disconnect(request, _slow_work())
+
+    return app
+
+
+_slow_started = asyncio.Event()
+_slow_cancelled = asyncio.Event()
+
+
+async def _slow_work() -> None:
+    _slow_started.set()
+    try:
+        await asyncio.sleep(30)
+    except asyncio.CancelledError:
+        _slow_cancelled.set()
+        raise
+
+
+@pytest_asyncio.fixture
+async def split(monkeypatch, tmp_path):
+    """A bot process serving its app on a Unix socket, seen from an API worker."""
+    socket_path = str(tmp_path / "bot.sock")
+    monkeypatch.setattr(bot_proxy, "DEPLOYMENT_MODE", "split")
+    monkeypatch.setattr(bot_proxy, "BOT_RPC_SOCKET", socket_path)
+    monkeypatch.setattr(bot_proxy, "_client", None)
+    monkeypatch.setattr(bot_proxy, "_is_bot_process", False)
+
+    server = bot_rpc_server(_app("bot"), socket_path)
+    task = asyncio.create_task(server.serve())
+    while not server.started:
+        await asyncio.sleep(0.01)
+    # Act as the worker from here on.
+    monkeypatch.setattr(bot_proxy, "_is_bot_process", False)
+
+    yield socket_path
+
+    server.should_exit = True
+    await task
+    await bot_proxy.close_bot_proxy()
+
+
+def _worker_client() -> httpx.AsyncClient:
+    transport = httpx.ASGITransport(app=_app("worker"), client=("203.0.113.7", 1234))
+    return httpx.AsyncClient(transport=transport, base_url="http://worker")
+
+
+@pytest.mark.asyncio
+async def test_worker_forwards_request_and_returns_bot_response(split):
+    async with _worker_client() as client:
+        response = await client.post(
+            "/api/thing/42?q=a&q=b",
+            json={"x": 1},
+            headers={"Cookie": "rides_session=s3cret"},
+        )
+
+    assert response.status_code == 200
+    assert response.json() == {
+        "where": "bot",
+        "thing_id": "42",
+        "body": {"x": 1},
+        "q": ["a", "b"],
+        "cookie": "s3cret",
+        "forwarded_for": "203.0.113.7",
+    }
+    assert response.cookies["seen_by"] == "bot"
+
+
+@pytest.mark.asyncio
+async def test_bot_error_status_is_passed_through(split):
+    async with _worker_client() as client:
+        response = await client.post("/api/thing/42", content=b"not json")
+
+    assert response.status_code == 422
+
+
+@pytest.mark.asyncio
+async def test_client_disconnect_cancels_the_call_on_the_bot_process(split, monkeypatch):
+    monkeypatch.setattr(disconnect, "DISCONNECT_POLL_INTERVAL_SECONDS", 0.01)
+    _slow_started.clear()
+    _slow_cancelled.clear()
+    client_gone = asyncio.Event()
+    messages = [{"type": "http.request", "body": b"", "more_body": False}]
+
+    async def receive():
+        if messages:
+            return messages.pop()
+        await client_gone.wait()
+        return {"type": "http.disconnect"}
+
+    scope = {
+        "type": "http",
+        "method": "POST",
+        "path": "/api/slow",
+        "query_string": b"",
+        "headers": [(b"host", b"worker")],
+        "client": ("203.0.113.7", 1234),
+    }
+    forwarded = asyncio.create_task(forward_to_bot(Request(scope, receive)))
+    await asyncio.wait_for(_slow_started.wait(), timeout=5)
+
+    client_gone.set()
+
+    with pytest.raises(HTTPException) as exc_info:
+        await asyncio.wait_for(forwarded, timeout=5)
+    assert exc_info.value.status_code == 499
+    await asyncio.wait_for(_slow_cancelled.wait(), timeout=5)
+
+
+@pytest.mark.asyncio
+async def test_unreachable_bot_process_is_503(monkeypatch, tmp_path):
+    monkeypatch.setattr(bot_proxy, "DEPLOYMENT_MODE", "split")
+    monkeypatch.setattr(bot_proxy, "BOT_RPC_SOCKET", str(tmp_path / "missing.sock"))
+    monkeypatch.setattr(bot_proxy, "_client", None)
+
+    async with _worker_client() as client:
+        response = await client.post("/api/thing/42", json={})
+    await bot_proxy.close_bot_proxy()
+
+    assert response.status_code == 503
+    assert response.headers["Retry-After"]
+
+
+@pytest.mark.asyncio
+async def test_combined_deployment_runs_route_locally(monkeypatch):
+    monkeypatch.setattr(bot_proxy, "DEPLOYMENT_MODE", "combined")
+
+    async with _worker_client() as client:
+        response = await client.post("/api/thing/42", json={})
+
+    assert response.json()["where"] == "worker"
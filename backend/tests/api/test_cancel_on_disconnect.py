@@ -0,0 +1,60 @@
+"""Tests for cancelling route work when the client disconnects."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
+from fastapi import HTTPException
+
+import api.disconnect as disconnect
+from api.disconnect import cancel_on_disconnect
+
+
+def _request(*disconnected: bool) -> MagicMock:
+    request = MagicMock()
+    request.is_disconnected = AsyncMock(side_effect=[*disconnected, *[True] * 100])
+    return request
+
+
+@pytest.fixture(autouse=True)
+def fast_poll(monkeypatch):
+    monkeypatch.setattr(disconnect, "DISCONNECT_POLL_INTERVAL_SECONDS", 0.01)
+
+
+@pytest.mark.asyncio
+async def test_returns_result_while_client_is_connected():
+    async def work():
+        await asyncio.sleep(0.03)
+        return "done"
+
+    assert await cancel_on_disconnect(_request(False, False, False, False), work()) == "done"
+
+
+@pytest.mark.asyncio
+async def test_cancels_work_when_client_disconnects():
+    cancelled = asyncio.Event()
+
+    async def work():
+        try:
+            await asyncio.sleep(10)
+        except asyncio.CancelledError:
+            cancelled.set()
+            raise
+
+    with pytest.raises(HTTPException) as exc_info:
+        await cancel_on_disconnect(_request(False), work())
+    await asyncio.sleep(0)
+
+    assert exc_info.value.status_code == 499
+    assert cancelled.is_set()
+
+
+@pytest.mark.asyncio
+async def test_work_errors_propagate():
+    async def work():
+        raise ValueError("bad input")
+
+    with pytest.raises(ValueError, match="bad input"):
+        await cancel_on_disconnect(_request(), work())
@@ -0,0 +1,63 @@
+"""Unit tests for ETag rendering and If-None-Match handling on snapshot endpoints."""
+
+from __future__ import annotations
+
+import json
+
+from fastapi import FastAPI, Request
+from fastapi.testclient import TestClient
+
+from api.conditional import RenderCache, conditional_json, render_json
+
+
+def test_render_json_matches_json_response_and_tags_content():
+    rendered = render_json({"name": "Café", "n": [1, 2]})
+
+    assert json.loads(rendered.body) == {"name": "Café", "n": [1, 2]}
+    assert rendered.body == '{"name":"Café","n":[1,2]}'.encode()
+    assert rendered.etag == render_json({"name": "Café", "n": [1, 2]}).etag
+    assert rendered.etag != render_json({"name": "Cafe", "n": [1, 2]}).etag
+    assert rendered.etag.startswith('"') and rendered.etag.endswith('"')
+
+
+def test_render_cache_serializes_once_per_version():
+    cache = RenderCache()
+    builds = []
+
+    def build(value):
+        builds.append(value)
+        return {"v": value}
+
+    first = cache.get(1, lambda: build("a"))
+    again = cache.get(1, lambda: build("b"))
+    bumped = cache.get(2, lambda: build("c"))
+
+    assert builds == ["a", "c"]
+    assert again is first
+    assert bumped.etag != first.etag
+
+
+def _client(rendered) -> TestClient:
+    app = FastAPI()
+
+    @app.get("/snapshot")
+    async def snapshot(request: Request):
+        return conditional_json(request, rendered)
+
+    return TestClient(app)
+
+
+def test_if_none_match_variants():
+    rendered = render_json({"ok": True})
+    client = _client(rendered)
+
+    def status(header: str | None) -> int:
+        headers = {"If-None-Match": header} if header is not None else {}
+        return client.get("/snapshot", headers=headers).status_code
+
+    assert status(None) == 200
+    assert status(rendered.etag) == 304
+    assert status(f'"other", {rendered.etag}') == 304
+    assert status(f"W/{rendered.etag}") == 304
+    assert status("*") == 304
+    assert status('"stale"') == 200
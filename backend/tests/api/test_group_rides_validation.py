@@ -110,6 +110,27 @@ def test_group_rides_success_with_explicit_message_id():
     assert call_kwargs.get("message_id") == 123456789
 
 
+def test_group_rides_passes_solver_choice():
+    """The solver field should reach the service; it defaults to the LLM."""
+    client = _build_client()
+    fake_service = MagicMock()
+    fake_service.group_rides_api = AsyncMock(return_value={"summary": "summary", "groupings": []})
+
+    with (
+        patch("api.routes.group_rides.require_bot", return_value=MagicMock()),
+        patch("api.routes.group_rides.GroupRidesService", return_value=fake_service),
+    ):
+        default = client.post("/api/group-rides", json={"ride_type": "friday"})
+        local = client.post("/api/group-rides", json={"ride_type": "friday", "solver": "local"})
+        bogus = client.post("/api/group-rides", json={"ride_type": "friday", "solver": "magic"})
+
+    assert default.status_code == 200
+    assert local.status_code == 200
+    assert bogus.status_code == 422
+    calls = fake_service.group_rides_api.call_args_list
+    assert [call.kwargs["solver"] for call in calls] == ["llm", "local"]
+
+
 def test_group_rides_service_value_error_returns_400():
     """When the service raises ValueError the endpoint should return 400."""
     client = _build_client()
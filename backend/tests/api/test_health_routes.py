@@ -2,12 +2,26 @@
 
 from __future__ import annotations
 
-from unittest.mock import MagicMock, patch
+from unittest.mock import patch
 
-from fastapi import FastAPI
+import pytest
+from fastapi import FastAPI, HTTPException
 from fastapi.testclient import TestClient
 
+from api.dependencies import require_bot
 from api.routes.health import router as health_router
+from bot.core.enums import BotStatus
+
+
+class _FakeSession:
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc, tb):
+        return False
+
+    async def execute(self, _stmt):
+        return None
 
 
 def _build_client() -> TestClient:
@@ -21,8 +35,8 @@ def test_health_returns_degraded_when_bot_missing():
     client = _build_client()
 
     with (
-        patch("api.routes.health.get_bot", return_value=None),
-        patch("api.routes.health.AsyncSessionLocal") as session_factory,
+        patch("api.routes.health.get_bot_status", return_value=BotStatus.UNAVAILABLE),
+        patch("api.routes.health.AsyncReadSessionLocal") as session_factory,
     ):
         # Make the DB context manager raise so we exercise the failure path.
         session_factory.side_effect = RuntimeError("db unavailable")
@@ -38,28 +52,51 @@ def test_health_returns_degraded_when_bot_missing():
 def test_health_returns_ok_when_bot_and_db_ready():
     """Healthy bot + DB should produce status=ok."""
     client = _build_client()
-    fake_bot = MagicMock()
-    fake_bot.is_ready.return_value = True
 
-    class _FakeSession:
-        async def __aenter__(self):
-            return self
+    with (
+        patch("api.routes.health.get_bot_status", return_value=BotStatus.CONNECTED),
+        patch("api.routes.health.AsyncReadSessionLocal", return_value=_FakeSession()),
+    ):
+        resp = client.get("/health")
+
+    assert resp.status_code == 200
+    body = resp.json()
+    assert body == {
+        "status": "ok",
+        "bot": "connected",
+        "bot_ready": True,
+        "database": "connected",
+    }
 
-        async def __aexit__(self, exc_type, exc, tb):
-            return False
 
-        async def execute(self, _stmt):
-            return None
+def test_health_reports_starting_while_bot_connects():
+    """The API serves before the gateway is ready; health says so without degrading."""
+    client = _build_client()
 
     with (
-        patch("api.routes.health.get_bot", return_value=fake_bot),
-        patch("api.routes.health.AsyncSessionLocal", return_value=_FakeSession()),
+        patch("api.routes.health.get_bot_status", return_value=BotStatus.STARTING),
+        patch("api.routes.health.AsyncReadSessionLocal", return_value=_FakeSession()),
     ):
         resp = client.get("/health")
 
-    assert resp.status_code == 200
     body = resp.json()
-    assert body == {"status": "ok", "bot": "connected", "database": "connected"}
+    assert resp.status_code == 200
+    assert body["status"] == "starting"
+    assert body["bot"] == "starting"
+    assert body["bot_ready"] is False
+    assert body["database"] == "connected"
+
+
+def test_require_bot_returns_retry_after_while_starting():
+    with (
+        patch("api.dependencies.get_bot", return_value=None),
+        patch("api.dependencies.get_bot_status", return_value=BotStatus.STARTING),
+        pytest.raises(HTTPException) as exc_info,
+    ):
+        require_bot()
+
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers == {"Retry-After": "5"}
 
 
 def test_environment_endpoint_reports_app_env(monkeypatch):
@@ -1,7 +1,8 @@
-"""Integration tests for the ungated GET /api/map-locations route."""
+"""Integration tests for the ungated route-builder routes (map locations, make route)."""
 
 from __future__ import annotations
 
+from dataclasses import replace
 from unittest.mock import AsyncMock, patch
 
 from fastapi import FastAPI
@@ -9,6 +10,7 @@ from fastapi.testclient import TestClient
 
 from api.routes.route_builder import router
 from bot.services.pickup_locations_service import EdgeInfo, LocationInfo, RoutingContext
+from tests.unit.routing_fixtures import make_seed_context
 
 SERVICE = "api.routes.route_builder.PickupLocationsService"
 
@@ -73,9 +75,76 @@ class TestGetMapLocations:
             ]
         }
 
+    def test_etag_revalidation_until_snapshot_changes(self):
+        client = _build_client()
+        first_ctx = _routing_context()
+        with patch(f"{SERVICE}.get_routing_context", new=AsyncMock(return_value=first_ctx)):
+            first = client.get("/api/map-locations")
+            etag = first.headers["ETag"]
+            cached = client.get("/api/map-locations", headers={"If-None-Match": etag})
+
+        assert first.headers["Cache-Control"] == "private, no-cache"
+        assert cached.status_code == 304
+        assert cached.content == b""
+        assert cached.headers["ETag"] == etag
+
+        moved = RoutingContext(
+            locations=tuple(
+                replace(loc, latitude=1.0) if loc.name == "Alpha" else loc
+                for loc in first_ctx.locations
+            ),
+            edges=(),
+            living_to_pickup={},
+            pickup_adjustment=1,
+        )
+        with patch(f"{SERVICE}.get_routing_context", new=AsyncMock(return_value=moved)):
+            fresh = client.get("/api/map-locations", headers={"If-None-Match": etag})
+
+        assert fresh.status_code == 200
+        assert fresh.headers["ETag"] != etag
+        assert fresh.json()["locations"][0]["latitude"] == 1.0
+
     def test_no_role_dependency(self):
         """The route must not require the ride coordinator role."""
         routes = {route.path: route for route in router.routes}
         route = routes["/api/map-locations"]
         dependency_names = [dep.call.__name__ for dep in route.dependant.dependencies]
         assert "require_ride_coordinator" not in dependency_names
+
+
+class TestMakeRoute:
+    def _post(self, body: dict):
+        client = _build_client()
+        with patch(
+            f"{SERVICE}.get_routing_context", new=AsyncMock(return_value=make_seed_context())
+        ):
+            return client.post("/api/make-route", json=body)
+
+    def test_keeps_given_order_by_default(self):
+        response = self._post({"locations": ["rita", "sixth"], "leave_time": "7:00pm"})
+
+        assert response.status_code == 200
+        body = response.json()
+        assert body["order"] == ["Rita", "Sixth loop"]
+        assert body["minutes_saved"] is None
+
+    def test_optimize_order_reorders_and_reports_savings(self):
+        response = self._post(
+            {
+                "locations": ["rita", "sixth", "innovation", "seventh"],
+                "leave_time": "7:00pm",
+                "optimize_order": True,
+            }
+        )
+
+        assert response.status_code == 200
+        body = response.json()
+        assert sorted(body["order"]) == sorted(
+            ["Rita", "Sixth loop", "Innovation", "Seventh mail room"]
+        )
+        assert body["minutes_saved"] > 0
+        assert body["route"].endswith(f"{body['order'][-1]} ([Google Maps](<{_maps_url(body)}>))")
+
+
+def _maps_url(body: dict) -> str:
+    return make_seed_context().map_url(body["order"][-1])
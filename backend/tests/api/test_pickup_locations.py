@@ -9,6 +9,7 @@ from fastapi.testclient import TestClient
 
 from api.auth import require_ride_coordinator
 from api.routes.pickup_locations import router
+from bot.utils.cache import Stamped
 
 SERVICE = "api.routes.pickup_locations.PickupLocationsService"
 
@@ -66,7 +67,7 @@ class TestAuth:
 class TestGetPayload:
     def test_returns_full_payload(self):
         client = _build_client()
-        with patch(f"{SERVICE}.get_all", new=AsyncMock(return_value=_payload())):
+        with patch(f"{SERVICE}.get_all_stamped", new=AsyncMock(return_value=Stamped(_payload()))):
             resp = client.get("/api/pickup-locations")
 
         assert resp.status_code == 200
@@ -76,6 +77,28 @@ class TestGetPayload:
         assert body["pickup_adjustment"] == 1
         assert body["unreachable"] == ["Alpha"]
 
+    def test_matching_etag_returns_304(self):
+        client = _build_client()
+        with patch(f"{SERVICE}.get_all_stamped", new=AsyncMock(return_value=Stamped(_payload()))):
+            etag = client.get("/api/pickup-locations").headers["ETag"]
+            resp = client.get("/api/pickup-locations", headers={"If-None-Match": f"W/{etag}"})
+
+        assert resp.status_code == 304
+
+    def test_body_is_rebuilt_only_when_the_snapshot_version_moves(self):
+        client = _build_client()
+        renamed = _payload() | {"locations": [_location(name="Beta")]}
+        get_all = AsyncMock(return_value=Stamped(_payload(), token=-1))
+        with patch(f"{SERVICE}.get_all_stamped", new=get_all):
+            first = client.get("/api/pickup-locations").json()
+            get_all.return_value = Stamped(renamed, token=-1)
+            same_version = client.get("/api/pickup-locations").json()
+            get_all.return_value = Stamped(renamed, token=-2)
+            new_version = client.get("/api/pickup-locations").json()
+
+        assert first["locations"][0]["name"] == same_version["locations"][0]["name"] == "Alpha"
+        assert new_version["locations"][0]["name"] == "Beta"
+
 
 class TestCreateLocation:
     def test_create_success(self):
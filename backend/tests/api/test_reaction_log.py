@@ -0,0 +1,145 @@
+"""Integration tests for /api/reaction-log pagination against an in-memory database."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+from unittest.mock import patch
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from api.auth import require_ride_coordinator
+from api.routes.reaction_log import router
+from bot.core.base import Base
+from bot.core.models import RideReactionEvent
+
+BASE_TIME = datetime.datetime(2026, 5, 1, 12, 0)
+
+
+def _events() -> list[RideReactionEvent]:
+    """Three rides on two dates, plus one legacy event with no ride_date."""
+    rows = []
+    rides = [
+        ("m1", datetime.date(2026, 5, 1), "friday", 4),
+        ("m2", datetime.date(2026, 5, 3), "sunday", 3),
+        ("m3", datetime.date(2026, 5, 3), "sunday_class", 2),
+        ("m0", None, None, 1),
+    ]
+    for message_id, ride_date, ride_type, count in rides:
+        for i in range(count):
+            rows.append(
+                RideReactionEvent(
+                    message_id=message_id,
+                    discord_username=f"user{i}",
+                    display_name=None,
+                    emoji="🍔" if i % 2 else "🚗",
+                    action="add",
+                    occurred_at=BASE_TIME + datetime.timedelta(minutes=i),
+                    ride_date=ride_date,
+                    ride_type=ride_type,
+                )
+            )
+    return rows
+
+
+@pytest.fixture
+def db():
+    """In-memory SQLite seeded with reaction events, patched into the service."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+
+    async def seed():
+        async with engine.begin() as conn:
+            await conn.run_sync(Base.metadata.create_all)
+        async with factory() as session:
+            session.add_all(_events())
+            await session.commit()
+
+    asyncio.run(seed())
+    with patch("bot.services.ride_reaction_log_service.AsyncReadSessionLocal", factory):
+        yield engine
+    asyncio.run(engine.dispose())
+
+
+@pytest.fixture
+def client(db):
+    app = FastAPI()
+    app.include_router(router)
+    app.dependency_overrides[require_ride_coordinator] = lambda: "coordinator@example.com"
+    return TestClient(app)
+
+
+def _all_pages(client: TestClient, **params) -> list[dict]:
+    pages = []
+    cursor = None
+    while True:
+        query = params | ({"cursor": cursor} if cursor else {})
+        response = client.get("/api/reaction-log", params=query)
+        assert response.status_code == 200
+        pages.append(response.json())
+        cursor = pages[-1]["next_cursor"]
+        if cursor is None:
+            return pages
+
+
+def test_single_page_groups_newest_rides_first(client):
+    body = client.get("/api/reaction-log").json()
+
+    assert body["next_cursor"] is None
+    assert [ride["message_id"] for ride in body["rides"]] == ["m3", "m2", "m1", "m0"]
+    m3 = body["rides"][0]
+    assert m3["label"] == "Sunday Class · May 3, 2026"
+    assert [e["discord_username"] for e in m3["events"]] == ["user1", "user0"]
+    assert body["rides"][-1]["label"] == "Unknown"
+
+
+def test_pages_cover_every_event_once_and_split_rides_continue(client):
+    pages = _all_pages(client, limit=3)
+
+    assert len(pages) == 4
+    assert all(sum(len(r["events"]) for r in page["rides"]) <= 3 for page in pages)
+    ids = [e["id"] for page in pages for ride in page["rides"] for e in ride["events"]]
+    assert len(ids) == len(set(ids)) == 10
+    # m2 has 3 events: one ends page 1 after m3's two, the rest open page 2.
+    assert pages[0]["rides"][-1]["message_id"] == "m2"
+    assert pages[1]["rides"][0]["message_id"] == "m2"
+    # The event without a ride_date is last.
+    assert pages[-1]["rides"][-1]["message_id"] == "m0"
+
+
+def test_filters_apply_across_pages(client):
+    pages = _all_pages(client, ride_type="sunday", limit=2)
+
+    events = [e for page in pages for ride in page["rides"] for e in ride["events"]]
+    assert len(events) == 3
+    assert {ride["message_id"] for page in pages for ride in page["rides"]} == {"m2"}
+
+
+def test_invalid_cursor_is_rejected(client):
+    response = client.get("/api/reaction-log", params={"cursor": "not-a-cursor"})
+    assert response.status_code == 400
+
+
+def test_limit_is_bounded(client):
+    assert client.get("/api/reaction-log", params={"limit": 0}).status_code == 422
+    assert client.get("/api/reaction-log", params={"limit": 100_000}).status_code == 422
+
+
+def test_emojis_lists_distinct_emojis(client):
+    assert client.get("/api/reaction-log/emojis").json() == {"emojis": ["🍔", "🚗"]}
+
+
+def test_ride_type_page_query_uses_composite_index(db):
+    async def plan() -> str:
+        async with db.connect() as conn:
+            rows = await conn.exec_driver_sql(
+                "EXPLAIN QUERY PLAN SELECT id FROM ride_reaction_events "
+                "WHERE ride_type = 'friday' "
+                "ORDER BY ride_date DESC, message_id DESC, occurred_at DESC, id DESC LIMIT 501"
+            )
+            return " ".join(row[-1] for row in rows)
+
+    assert "ix_ride_reaction_events_type_date_occurred" in asyncio.run(plan())
@@ -1,4 +1,7 @@
+import logging
 import sys
+import threading
+import time
 from pathlib import Path
 from unittest.mock import patch
 
@@ -6,10 +9,12 @@ from unittest.mock import patch
 # valid for running pytest from backend root
 sys.path.append(str(Path(__file__).resolve().parent.parent.parent))
 
-from fastapi import FastAPI, Response
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
 from fastapi.testclient import TestClient
 
 from api.middleware.access_logger import AccessLogMiddleware
+from bot.core.logger import TransactionIdFilter, queue_handler_for, txn_id_var
 
 
 @patch("api.middleware.access_logger.access_logger")
@@ -70,3 +75,93 @@ def test_other_endpoints_logged(mock_logger):
 
     # Verify info log was called
     mock_logger.info.assert_called_once()
+
+
+@patch("api.middleware.access_logger.access_logger")
+def test_streaming_response_passes_through_and_is_logged_once(mock_logger):
+    """Streaming bodies are forwarded chunk by chunk and logged after they finish."""
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware)
+
+    @app.get("/stream")
+    def stream():
+        return StreamingResponse(
+            iter([b"data: 1\n\n", b"data: 2\n\n"]), media_type="text/event-stream"
+        )
+
+    client = TestClient(app)
+
+    with client.stream("GET", "/stream") as response:
+        chunks = list(response.iter_bytes())
+
+    assert b"".join(chunks) == b"data: 1\n\ndata: 2\n\n"
+    mock_logger.info.assert_called_once()
+    assert '"GET /stream" 200' in mock_logger.info.call_args.args[0]
+
+
+@patch("api.middleware.access_logger.access_logger")
+def test_user_from_request_state_is_logged(mock_logger):
+    """The email an inner auth middleware puts on request.state appears in the log line."""
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def fake_auth(request: Request, call_next):
+        request.state.user = {"email": "rider@example.com"}
+        return await call_next(request)
+
+    app.add_middleware(AccessLogMiddleware)
+
+    @app.get("/me")
+    def me():
+        return {}
+
+    TestClient(app).get("/me")
+
+    assert "rider@example.com" in mock_logger.info.call_args.args[0]
+
+
+@patch("api.middleware.access_logger.access_logger")
+def test_unhandled_exception_logged_as_500(mock_logger):
+    """A route that raises is still logged, as a 500."""
+    app = FastAPI()
+    app.add_middleware(AccessLogMiddleware)
+
+    @app.get("/boom")
+    def boom():
+        raise RuntimeError("boom")
+
+    client = TestClient(app, raise_server_exceptions=False)
+
+    assert client.get("/boom").status_code == 500
+    mock_logger.error.assert_called_once()
+    assert '"GET /boom" 500' in mock_logger.error.call_args.args[0]
+
+
+def test_queue_handler_writes_on_listener_thread():
+    """Records reach the wrapped handler on the listener thread, with context filters applied."""
+    seen: list[tuple[str, str]] = []
+
+    class Recorder(logging.Handler):
+        def emit(self, record):
+            seen.append((threading.current_thread().name, self.format(record)))
+
+    recorder = Recorder()
+    recorder.setFormatter(logging.Formatter("[txn:%(txn_id)s] %(message)s"))
+    handler = queue_handler_for(recorder)
+    handler.addFilter(TransactionIdFilter())
+    test_logger = logging.getLogger("tests.queue_handler")
+    test_logger.propagate = False
+    test_logger.addHandler(handler)
+    token = txn_id_var.set("abc12345")
+    try:
+        test_logger.warning("hello %s", "world")
+    finally:
+        txn_id_var.reset(token)
+        test_logger.removeHandler(handler)
+
+    deadline = time.monotonic() + 2
+    while not seen and time.monotonic() < deadline:
+        time.sleep(0.01)
+    [(thread_name, line)] = seen
+    assert thread_name != threading.current_thread().name
+    assert line == "[txn:abc12345] hello world"
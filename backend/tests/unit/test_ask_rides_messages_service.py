@@ -3,11 +3,21 @@
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.exc import OperationalError
 
-from bot.core.enums import AskRidesMessageType
+from bot.core.enums import AskRidesMessageType, CacheNamespace
 from bot.services.ask_rides_messages_service import AskRidesMessagesService, EffectiveTemplate
 from bot.utils.ask_rides_defaults import DEFAULT_TEMPLATES
+from bot.utils.cache import invalidate_namespace
+
+
+@pytest_asyncio.fixture(autouse=True)
+async def fresh_cache():
+    """The merged templates are cached; every test starts from the (mocked) database."""
+    await invalidate_namespace(CacheNamespace.ASK_RIDES_TEMPLATES)
+    yield
+    await invalidate_namespace(CacheNamespace.ASK_RIDES_TEMPLATES)
 
 
 def _mock_session_local(mock_session_local):
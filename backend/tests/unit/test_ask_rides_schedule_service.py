@@ -4,9 +4,10 @@ from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 from sqlalchemy.exc import OperationalError
 
-from bot.core.enums import AskRidesScheduleSlot, JobName
+from bot.core.enums import AskRidesScheduleSlot, CacheNamespace, JobName
 from bot.services.ask_rides_schedule_service import (
     AskRidesScheduleService,
     EffectiveSchedule,
@@ -14,9 +15,18 @@ from bot.services.ask_rides_schedule_service import (
     has_send_time_passed,
 )
 from bot.utils.ask_rides_schedule_defaults import DEFAULT_SCHEDULE
+from bot.utils.cache import invalidate_namespace
 from bot.utils.time_helpers import LA_TZ
 
 
+@pytest_asyncio.fixture(autouse=True)
+async def fresh_cache():
+    """The merged schedules are cached; every test starts from the (mocked) database."""
+    await invalidate_namespace(CacheNamespace.ASK_RIDES_SCHEDULES)
+    yield
+    await invalidate_namespace(CacheNamespace.ASK_RIDES_SCHEDULES)
+
+
 def _la(year, month, day, hour=0, minute=0):
     """Helper to build a timezone-aware LA datetime."""
     return LA_TZ.localize(datetime(year, month, day, hour, minute))
@@ -206,7 +216,10 @@ class TestUpdateSchedule:
         mock_reschedule.assert_called_once_with(
             "run_ask_rides_wed", day_of_week=1, hour=10, minute=0
         )
-        mock_invalidate.assert_awaited_once()
+        assert {c.args[0] for c in mock_invalidate.await_args_list} == {
+            CacheNamespace.ASK_RIDES_SCHEDULES,
+            CacheNamespace.ASK_RIDES_STATUS,
+        }
         mock_publish.assert_awaited_once_with(
             {"type": "schedule_updated", "slot": "wednesday_reminder"}
         )
@@ -10,7 +10,6 @@ from sqlalchemy.exc import IntegrityError
 from bot.core.enums import AccountRoles
 from bot.core.models import AuthSession, UserAccount
 from bot.services.auth_service import AuthService, _hash_token
-from bot.utils.constants import SESSION_TOUCH_THROTTLE_MINUTES
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -329,7 +328,7 @@ async def test_get_session_not_found_returns_none():
 
 
 @pytest.mark.asyncio
-async def test_get_session_expired_deletes_and_returns_none():
+async def test_get_session_expired_returns_none_and_leaves_row_for_sweep():
     expired = _make_session(expires_at=datetime.now(UTC) - timedelta(seconds=1))
     session = AsyncMock()
 
@@ -346,42 +345,7 @@ async def test_get_session_expired_deletes_and_returns_none():
         result = await AuthService.get_session(session, "plain-token")
 
     assert result is None
-    mock_delete.assert_awaited_once()
-
-
-# ---------------------------------------------------------------------------
-# touch_session
-# ---------------------------------------------------------------------------
-
-
-@pytest.mark.asyncio
-async def test_touch_session_slides_expiry_when_stale():
-    old_activity = datetime.now(UTC) - timedelta(minutes=SESSION_TOUCH_THROTTLE_MINUTES + 1)
-    auth_session = _make_session(last_activity_at=old_activity)
-    session = AsyncMock()
-
-    with patch(
-        "bot.services.auth_service.AuthSessionsRepository.update_activity",
-        new=AsyncMock(),
-    ) as mock_update:
-        await AuthService.touch_session(session, "plain-token", auth_session)
-
-    mock_update.assert_awaited_once()
-
-
-@pytest.mark.asyncio
-async def test_touch_session_skips_when_recent():
-    recent_activity = datetime.now(UTC) - timedelta(seconds=30)
-    auth_session = _make_session(last_activity_at=recent_activity)
-    session = AsyncMock()
-
-    with patch(
-        "bot.services.auth_service.AuthSessionsRepository.update_activity",
-        new=AsyncMock(),
-    ) as mock_update:
-        await AuthService.touch_session(session, "plain-token", auth_session)
-
-    mock_update.assert_not_called()
+    mock_delete.assert_not_awaited()
 
 
 # ---------------------------------------------------------------------------
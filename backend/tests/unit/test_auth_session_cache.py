@@ -0,0 +1,165 @@
+"""Unit tests for the validated-session cache and its write-behind activity touches."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bot.core.base import Base
+from bot.core.models import AuthSession
+from bot.services.auth_service import AuthService
+from bot.services.auth_session_cache import AuthSessionCache, CachedSession, auth_session_cache
+from bot.utils.constants import SESSION_TOUCH_THROTTLE_MINUTES
+
+
+def _entry(
+    email: str = "user@example.com",
+    last_activity_at: datetime | None = None,
+    expires_in: timedelta = timedelta(days=30),
+) -> CachedSession:
+    now = datetime.now(UTC)
+    return CachedSession(
+        email=email,
+        csrf_token="csrf",
+        expires_at=now + expires_in,
+        last_activity_at=last_activity_at or now,
+    )
+
+
+def _stale() -> datetime:
+    return datetime.now(UTC) - timedelta(minutes=SESSION_TOUCH_THROTTLE_MINUTES + 1)
+
+
+@pytest_asyncio.fixture
+async def session_local():
+    """In-memory SQLite with two auth sessions, patched into the cache module."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    old = datetime.now(UTC) - timedelta(days=1)
+    async with factory() as session:
+        for h in ("h1", "h2"):
+            session.add(
+                AuthSession(
+                    session_id_hash=h,
+                    email="user@example.com",
+                    csrf_token="csrf",
+                    last_activity_at=old,
+                    expires_at=old + timedelta(days=30),
+                )
+            )
+        await session.commit()
+    with patch("bot.services.auth_session_cache.AsyncSessionLocal", factory):
+        yield factory
+    await engine.dispose()
+
+
+def test_get_returns_cached_entry_until_ttl():
+    cache = AuthSessionCache(ttl_seconds=30)
+    entry = _entry()
+    cache.put("h", entry)
+    assert cache.get("h") == entry
+
+    with patch("bot.services.auth_session_cache.time.monotonic", return_value=1e12):
+        assert cache.get("h") is None
+    assert len(cache) == 0
+
+
+def test_get_drops_expired_session():
+    cache = AuthSessionCache()
+    cache.put("h", _entry(expires_in=timedelta(seconds=-1)))
+    assert cache.get("h") is None
+
+
+def test_put_evicts_least_recently_used():
+    cache = AuthSessionCache(maxsize=2)
+    cache.put("a", _entry())
+    cache.put("b", _entry())
+    cache.get("a")
+    cache.put("c", _entry())
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.get("c") is not None
+
+
+def test_invalidate_email_drops_all_sessions_for_user():
+    cache = AuthSessionCache()
+    cache.put("a", _entry(email="x@example.com"))
+    cache.put("b", _entry(email="x@example.com"))
+    cache.put("c", _entry(email="y@example.com"))
+    cache.invalidate_email("x@example.com")
+    assert cache.get("a") is None
+    assert cache.get("b") is None
+    assert cache.get("c") is not None
+
+
+@pytest.mark.asyncio
+async def test_touch_is_throttled():
+    cache = AuthSessionCache()
+    cache.touch("h", _entry(last_activity_at=datetime.now(UTC) - timedelta(seconds=30)))
+    assert cache.pending == 0
+    cache.touch("h", _entry(last_activity_at=_stale()))
+    assert cache.pending == 1
+    await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_touch_updates_cached_entry_so_burst_queues_one_write():
+    cache = AuthSessionCache()
+    cache.put("h", _entry(last_activity_at=_stale()))
+    for _ in range(10):
+        entry = cache.get("h")
+        assert entry is not None
+        cache.touch("h", entry)
+    assert cache.pending == 1
+    entry = cache.get("h")
+    assert entry is not None
+    assert entry.expires_at > datetime.now(UTC) + timedelta(days=29)
+    await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_flush_writes_all_touches_in_one_update(session_local):
+    cache = AuthSessionCache(flush_interval_seconds=3600)
+    cache.touch("h1", _entry(last_activity_at=_stale()))
+    cache.touch("h2", _entry(last_activity_at=_stale()))
+
+    await cache.stop()
+
+    async with session_local() as session:
+        rows = (await session.execute(select(AuthSession))).scalars().all()
+    cutoff = datetime.now(UTC) - timedelta(minutes=1)
+    assert all(row.last_activity_at.replace(tzinfo=UTC) > cutoff for row in rows)
+    assert cache.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_flush_keeps_touches_for_retry():
+    cache = AuthSessionCache(flush_interval_seconds=3600)
+    cache.touch("h", _entry(last_activity_at=_stale()))
+    with patch(
+        "bot.services.auth_session_cache.AuthSessionsRepository.update_activity_many",
+        new=AsyncMock(side_effect=RuntimeError("locked")),
+    ):
+        assert await cache.flush() == 0
+    assert cache.pending == 1
+    cache.clear()
+    await cache.stop()
+
+
+@pytest.mark.asyncio
+async def test_revoke_session_invalidates_cache():
+    session_id_hash = AuthService.session_hash("plain-token")
+    auth_session_cache.put(session_id_hash, _entry())
+    with patch(
+        "bot.services.auth_service.AuthSessionsRepository.delete_by_hash",
+        new=AsyncMock(),
+    ):
+        await AuthService.revoke_session(AsyncMock(), "plain-token")
+    assert auth_session_cache.get(session_id_hash) is None
@@ -0,0 +1,113 @@
+"""Unit tests for the batched expired-session sweep and its scheduled job."""
+
+from __future__ import annotations
+
+from datetime import UTC, datetime, timedelta
+from unittest.mock import patch
+
+import pytest
+import pytest_asyncio
+from prometheus_client import REGISTRY
+from sqlalchemy import event, func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bot.core.base import Base
+from bot.core.models import AuthSession
+from bot.jobs.sweep_auth_sessions import sweep_expired_auth_sessions
+from bot.repositories.auth_sessions_repository import AuthSessionsRepository
+from bot.services.auth_service import AuthService
+
+
+def _session(h: str, expires_at: datetime) -> AuthSession:
+    return AuthSession(
+        session_id_hash=h,
+        email="user@example.com",
+        csrf_token="csrf",
+        last_activity_at=expires_at - timedelta(days=30),
+        expires_at=expires_at,
+    )
+
+
+@pytest_asyncio.fixture
+async def session_local():
+    """In-memory SQLite with 7 expired and 2 live sessions, patched into AuthService."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    now = datetime.now(UTC)
+    async with factory() as session:
+        session.add_all(_session(f"old{i}", now - timedelta(days=i + 1)) for i in range(7))
+        session.add_all(_session(f"live{i}", now + timedelta(days=i + 1)) for i in range(2))
+        await session.commit()
+    with patch("bot.services.auth_service.AsyncSessionLocal", factory):
+        yield factory
+    await engine.dispose()
+
+
+async def _remaining(factory) -> set[str]:
+    async with factory() as session:
+        return set((await session.execute(select(AuthSession.session_id_hash))).scalars())
+
+
+@pytest.mark.asyncio
+async def test_sweep_deletes_expired_sessions_in_batches(session_local):
+    with patch(
+        "bot.services.auth_service.AuthSessionsRepository.delete_expired",
+        wraps=AuthSessionsRepository.delete_expired,
+    ) as delete_expired:
+        deleted = await AuthService.sweep_expired_sessions(batch_size=3)
+
+    assert deleted == 7
+    assert delete_expired.await_count == 3  # 3 + 3 + 1
+    assert await _remaining(session_local) == {"live0", "live1"}
+
+
+@pytest.mark.asyncio
+async def test_sweep_stops_after_max_batches(session_local):
+    deleted = await AuthService.sweep_expired_sessions(batch_size=2, max_batches=2)
+
+    assert deleted == 4
+    remaining = await _remaining(session_local)
+    assert len(remaining) == 5
+    # Oldest expiries go first; the most recently expired are left for the next run.
+    assert {"old0", "old1", "old2"} <= remaining
+
+
+@pytest.mark.asyncio
+async def test_batched_delete_uses_expires_at_index(session_local):
+    engine = session_local.kw["bind"]
+    captured: list[tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("DELETE"):
+            captured.append((statement, parameters))
+
+    event.listen(engine.sync_engine, "before_cursor_execute", capture)
+    try:
+        async with session_local() as session:
+            await AuthSessionsRepository.delete_expired(session, limit=500)
+    finally:
+        event.remove(engine.sync_engine, "before_cursor_execute", capture)
+
+    [(statement, parameters)] = captured
+    async with engine.connect() as conn:
+        plan = (await conn.exec_driver_sql(f"EXPLAIN QUERY PLAN {statement}", parameters)).all()
+    assert "ix_auth_sessions_expires_at" in " ".join(row[-1] for row in plan)
+
+
+@pytest.mark.asyncio
+async def test_job_records_metrics(session_local):
+    def sample(name: str) -> float:
+        return REGISTRY.get_sample_value(name) or 0.0
+
+    swept_before = sample("auth_sessions_swept_total")
+    runs_before = sample("auth_session_sweep_duration_seconds_count")
+
+    await sweep_expired_auth_sessions()
+
+    assert sample("auth_sessions_swept_total") - swept_before == 7
+    assert sample("auth_sessions_last_sweep_rows") == 7
+    assert sample("auth_session_sweep_duration_seconds_count") - runs_before == 1
+    async with session_local() as session:
+        assert (await session.scalar(select(func.count()).select_from(AuthSession))) == 2
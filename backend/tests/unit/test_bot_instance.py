@@ -0,0 +1,57 @@
+"""Tests for bot readiness reporting."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, MagicMock
+
+import discord
+import pytest
+from fastapi import HTTPException
+
+from api.dependencies import require_bot
+from bot.core.bot_instance import get_bot_status, set_bot_instance, set_bot_task
+from bot.core.enums import BotStatus
+
+
+@pytest.fixture
+def bot():
+    bot = MagicMock()
+    bot.is_ready.return_value = False
+    bot.is_closed.return_value = False
+    set_bot_instance(bot)
+    yield bot
+    set_bot_instance(None)
+
+
+@pytest.mark.asyncio
+async def test_status_is_starting_while_logging_in(bot):
+    task = asyncio.create_task(asyncio.sleep(10))
+    set_bot_task(task)
+
+    assert get_bot_status() == BotStatus.STARTING
+    task.cancel()
+    await asyncio.gather(task, return_exceptions=True)
+
+
+@pytest.mark.asyncio
+async def test_failed_login_reports_unavailable(bot):
+    bot.start = AsyncMock(side_effect=discord.LoginFailure("Improper token has been passed."))
+    task = asyncio.create_task(bot.start("token"))
+    set_bot_task(task)
+    await asyncio.gather(task, return_exceptions=True)
+
+    assert not bot.is_closed()
+    assert get_bot_status() == BotStatus.UNAVAILABLE
+    with pytest.raises(HTTPException) as exc_info:
+        require_bot()
+    assert exc_info.value.status_code == 503
+    assert exc_info.value.headers is None
+
+
+def test_clearing_the_instance_forgets_the_task(bot):
+    set_bot_task(MagicMock(done=MagicMock(return_value=True)))
+    set_bot_instance(None)
+    set_bot_instance(bot)
+
+    assert get_bot_status() == BotStatus.STARTING
@@ -0,0 +1,238 @@
+"""Unit tests for the bounded SSE broadcaster and its Last-Event-ID replay."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from bot.core import broadcaster as broadcaster_module
+from bot.core.broadcaster import (
+    HEARTBEAT_FRAME,
+    RESYNC_FRAME,
+    Broadcaster,
+    InMemoryBroadcastBackend,
+    RedisBroadcastBackend,
+)
+from bot.core.enums import SubscriberOverflowPolicy
+
+
+@pytest.fixture(autouse=True)
+def backend(monkeypatch):
+    """A fresh in-memory backend per test."""
+    fresh = InMemoryBroadcastBackend()
+    monkeypatch.setattr(broadcaster_module, "_backend", fresh)
+    return fresh
+
+
+def _event_id(frame: str) -> str:
+    return frame.split("\n", 1)[0].removeprefix("id: ")
+
+
+def _data(frame: str) -> dict:
+    return json.loads(frame.split("data: ", 1)[1])
+
+
+@pytest.mark.asyncio
+async def test_event_is_serialized_once_for_all_subscribers():
+    broadcaster = Broadcaster("test")
+    subscribers = [broadcaster.subscribe() for _ in range(5)]
+
+    with patch("bot.core.broadcaster.json.dumps", wraps=json.dumps) as dumps:
+        await broadcaster.publish({"n": 1})
+
+    assert dumps.call_count == 1
+    frames = [await s.next_frame(timeout=0) for s in subscribers]
+    assert len(set(frames)) == 1
+    assert _data(frames[0]) == {"n": 1}
+
+
+@pytest.mark.asyncio
+async def test_stalled_subscriber_buffer_drops_oldest():
+    broadcaster = Broadcaster("test", subscriber_buffer_size=3)
+    stalled = broadcaster.subscribe()
+
+    for n in range(10):
+        await broadcaster.publish({"n": n})
+
+    assert len(stalled) == 3
+    assert stalled.dropped == 7
+    assert [_data(await stalled.next_frame(timeout=0))["n"] for _ in range(3)] == [7, 8, 9]
+
+
+@pytest.mark.asyncio
+async def test_disconnect_policy_drops_subscriber_that_falls_behind():
+    broadcaster = Broadcaster(
+        "test", subscriber_buffer_size=2, overflow=SubscriberOverflowPolicy.DISCONNECT
+    )
+    subscriber = broadcaster.subscribe()
+
+    for n in range(3):
+        await broadcaster.publish({"n": n})
+
+    assert subscriber.closed
+    assert len(broadcaster) == 0
+    # Buffered frames are still delivered, then the stream ends.
+    assert _data(await subscriber.next_frame(timeout=0))["n"] == 0
+    assert _data(await subscriber.next_frame(timeout=0))["n"] == 1
+    with pytest.raises(EOFError):
+        await subscriber.next_frame(timeout=0)
+
+
+@pytest.mark.asyncio
+async def test_reconnect_replays_missed_events():
+    broadcaster = Broadcaster("test")
+    for n in range(5):
+        await broadcaster.publish({"n": n})
+    seen = broadcaster.subscribe()
+    await broadcaster.publish({"n": 5})
+    last_seen = _event_id(await seen.next_frame(timeout=0))
+    broadcaster.unsubscribe(seen)
+
+    await broadcaster.publish({"n": 6})
+    await broadcaster.publish({"n": 7})
+    resumed = broadcaster.subscribe()
+    await broadcaster.resume(resumed, last_seen)
+
+    assert [_data(await resumed.next_frame(timeout=0))["n"] for _ in range(2)] == [6, 7]
+    assert await resumed.next_frame(timeout=0) is None
+
+
+@pytest.mark.asyncio
+async def test_up_to_date_reconnect_replays_nothing():
+    broadcaster = Broadcaster("test")
+    sub = broadcaster.subscribe()
+    await broadcaster.publish({"n": 0})
+    last_seen = _event_id(await sub.next_frame(timeout=0))
+
+    resumed = broadcaster.subscribe()
+    await broadcaster.resume(resumed, last_seen)
+    assert await resumed.next_frame(timeout=0) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize("last_event_id", ["stale-epoch-3", "garbage", None])
+async def test_unknown_last_event_id_gets_resync(backend, last_event_id):
+    broadcaster = Broadcaster("test")
+    await broadcaster.publish({"n": 0})
+    if last_event_id is None:
+        last_event_id = f"{backend._epoch}-99"  # ahead of anything published
+    resumed = broadcaster.subscribe()
+
+    await broadcaster.resume(resumed, last_event_id)
+    frame = await resumed.next_frame(timeout=0)
+
+    assert frame == RESYNC_FRAME
+
+
+@pytest.mark.asyncio
+async def test_last_event_id_older_than_replay_buffer_gets_resync(monkeypatch):
+    monkeypatch.setattr(broadcaster_module, "_backend", InMemoryBroadcastBackend(2))
+    broadcaster = Broadcaster("test")
+    sub = broadcaster.subscribe()
+    await broadcaster.publish({"n": 0})
+    last_seen = _event_id(await sub.next_frame(timeout=0))
+    for n in range(1, 5):
+        await broadcaster.publish({"n": n})
+
+    resumed = broadcaster.subscribe()
+    await broadcaster.resume(resumed, last_seen)
+
+    assert await resumed.next_frame(timeout=0) == RESYNC_FRAME
+
+
+@pytest.mark.asyncio
+async def test_stream_yields_heartbeat_then_events_and_unsubscribes_on_close():
+    broadcaster = Broadcaster("test")
+    stream = broadcaster.stream(heartbeat_interval=0.01)
+
+    assert await anext(stream) == HEARTBEAT_FRAME
+    assert len(broadcaster) == 1
+    await broadcaster.publish({"n": 1})
+    assert _data(await anext(stream)) == {"n": 1}
+
+    await stream.aclose()
+    assert len(broadcaster) == 0
+
+
+@pytest.mark.asyncio
+async def test_replay_goes_ahead_of_live_frames_without_duplicates():
+    broadcaster = Broadcaster("test")
+    seen = broadcaster.subscribe()
+    await broadcaster.publish({"n": 0})
+    last_seen = _event_id(await seen.next_frame(timeout=0))
+    await broadcaster.publish({"n": 1})
+
+    resumed = broadcaster.subscribe()
+    await broadcaster.publish({"n": 2})  # live, and also in the replay below
+    await broadcaster.resume(resumed, last_seen)
+
+    assert [_data(await resumed.next_frame(timeout=0))["n"] for _ in range(2)] == [1, 2]
+    assert await resumed.next_frame(timeout=0) is None
+
+
+@pytest.mark.asyncio
+async def test_publish_failure_is_logged_not_raised(monkeypatch):
+    failing = MagicMock(publish=AsyncMock(side_effect=ConnectionError("redis down")))
+    monkeypatch.setattr(broadcaster_module, "_backend", failing)
+
+    await Broadcaster("test").publish({"n": 1})
+
+
+def _redis_backend() -> RedisBroadcastBackend:
+    backend = RedisBroadcastBackend("redis://localhost:6379", replay_buffer_size=100)
+    backend._redis = MagicMock(
+        xadd=AsyncMock(), xrange=AsyncMock(), xread=AsyncMock(), aclose=AsyncMock()
+    )
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_redis_publish_appends_to_trimmed_stream():
+    backend = _redis_backend()
+
+    await backend.publish("reactions", '{"n": 1}')
+
+    backend._redis.xadd.assert_awaited_once_with(
+        "sse:reactions", {"data": '{"n": 1}'}, maxlen=100, approximate=True
+    )
+
+
+@pytest.mark.asyncio
+async def test_redis_replay_reads_entries_after_last_event_id():
+    backend = _redis_backend()
+    backend._redis.xrange.side_effect = [
+        [("5-0", {"data": "{}"})],  # last_event_id is still in the stream
+        [("6-0", {"data": '{"n": 6}'}), ("7-0", {"data": '{"n": 7}'})],
+    ]
+
+    events = await backend.replay("reactions", "5-0")
+
+    assert events == [("6-0", '{"n": 6}'), ("7-0", '{"n": 7}')]
+    assert backend._redis.xrange.await_args.kwargs == {"min": "(5-0", "max": "+"}
+
+
+@pytest.mark.asyncio
+async def test_redis_replay_of_trimmed_id_is_unknown():
+    backend = _redis_backend()
+    backend._redis.xrange.return_value = []
+
+    assert await backend.replay("reactions", "1-0") is None
+
+
+@pytest.mark.asyncio
+async def test_redis_reader_delivers_entries_to_local_listeners():
+    backend = _redis_backend()
+    entries = [("sse:reactions", [("9-0", {"data": '{"n": 9}'})])]
+    backend._redis.xread.side_effect = [entries, asyncio.CancelledError()]
+    delivered: list[tuple[str, str]] = []
+
+    backend.listen("reactions", lambda event_id, data: delivered.append((event_id, data)))
+    with pytest.raises(asyncio.CancelledError):
+        await backend._readers["reactions"]
+
+    assert delivered == [("9-0", '{"n": 9}')]
+    assert backend._redis.xread.await_args_list[1].args[0] == {"sse:reactions": "9-0"}
+    await backend.close()
@@ -161,7 +161,7 @@ async def test_feature_flag_fetched_from_db_when_not_in_cache():
 
     with (
         patch("bot.utils.checks.FeatureFlagsRepository") as mock_repo,
-        patch("bot.utils.checks.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.utils.checks.AsyncReadSessionLocal", return_value=mock_session_cm),
     ):
         mock_repo._cache = {}
         mock_repo.get_feature_flag_status = AsyncMock(return_value=True)
@@ -182,7 +182,7 @@ async def test_feature_flag_db_returns_none_blocks_execution():
 
     with (
         patch("bot.utils.checks.FeatureFlagsRepository") as mock_repo,
-        patch("bot.utils.checks.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.utils.checks.AsyncReadSessionLocal", return_value=mock_session_cm),
     ):
         mock_repo._cache = {}
         mock_repo.get_feature_flag_status = AsyncMock(return_value=None)
@@ -200,7 +200,7 @@ async def test_feature_flag_db_exception_with_interaction_sends_error():
 
     with (
         patch("bot.utils.checks.FeatureFlagsRepository") as mock_repo,
-        patch("bot.utils.checks.AsyncSessionLocal", side_effect=RuntimeError("db gone")),
+        patch("bot.utils.checks.AsyncReadSessionLocal", side_effect=RuntimeError("db gone")),
     ):
         mock_repo._cache = {}
 
@@ -216,7 +216,7 @@ async def test_feature_flag_db_exception_no_interaction_returns_none():
     """DB exception without an interaction just returns None silently."""
     with (
         patch("bot.utils.checks.FeatureFlagsRepository") as mock_repo,
-        patch("bot.utils.checks.AsyncSessionLocal", side_effect=RuntimeError("db gone")),
+        patch("bot.utils.checks.AsyncReadSessionLocal", side_effect=RuntimeError("db gone")),
     ):
         mock_repo._cache = {}
 
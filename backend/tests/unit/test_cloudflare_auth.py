@@ -0,0 +1,152 @@
+"""Unit tests for Cloudflare Access JWT verification, key caching and refresh."""
+
+from __future__ import annotations
+
+import asyncio
+import time
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+from cryptography.hazmat.primitives import serialization
+from cryptography.hazmat.primitives.asymmetric import rsa
+from jose import jwk, jwt
+
+import api.auth as auth
+
+TEAM_DOMAIN = "team.cloudflareaccess.com"
+AUD = "test-aud"
+
+
+def _keypair(kid: str) -> tuple[bytes, dict]:
+    private_key = rsa.generate_private_key(public_exponent=65537, key_size=2048)
+    private_pem = private_key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    )
+    public_pem = private_key.public_key().public_bytes(
+        serialization.Encoding.PEM, serialization.PublicFormat.SubjectPublicKeyInfo
+    )
+    public_jwk = jwk.construct(public_pem, algorithm="RS256").to_dict()
+    return private_pem, public_jwk | {"kid": kid}
+
+
+PRIVATE_1, JWK_1 = _keypair("k1")
+PRIVATE_2, JWK_2 = _keypair("k2")
+
+
+def _token(private_pem: bytes, kid: str, email: str = "user@example.com", ttl: int = 600) -> str:
+    claims = {
+        "email": email,
+        "sub": "sub-1",
+        "aud": AUD,
+        "iss": f"https://{TEAM_DOMAIN}",
+        "exp": int(time.time()) + ttl,
+    }
+    return jwt.encode(claims, private_pem, algorithm="RS256", headers={"kid": kid})
+
+
+def _request(token: str) -> MagicMock:
+    request = MagicMock()
+    request.url.path = "/api/data"
+    request.headers = {"Cf-Access-Jwt-Assertion": token}
+    return request
+
+
+@pytest.fixture(autouse=True)
+def cloudflare_env(monkeypatch):
+    """Production Cloudflare config and fresh key / token caches for each test."""
+    monkeypatch.setattr(auth, "APP_ENV", "production")
+    monkeypatch.setattr(auth, "CLOUDFLARE_TEAM_DOMAIN", TEAM_DOMAIN)
+    monkeypatch.setattr(auth, "CLOUDFLARE_AUD", AUD)
+    monkeypatch.setattr(auth, "_cloudflare_keys", {})
+    monkeypatch.setattr(auth, "_cloudflare_keys_fetched_at", 0.0)
+    monkeypatch.setattr(auth, "_cloudflare_keys_attempted_at", 0.0)
+    monkeypatch.setattr(auth, "_cloudflare_keys_refresh", None)
+    monkeypatch.setattr(auth, "_verified_tokens", auth.OrderedDict())
+
+
+@pytest.mark.asyncio
+async def test_valid_token_is_verified_once_then_served_from_cache():
+    token = _token(PRIVATE_1, "k1")
+    with (
+        patch.object(auth, "_download_jwks", new=AsyncMock(return_value=[JWK_1])) as download,
+        patch.object(auth.jwt, "decode", wraps=jwt.decode) as decode,
+    ):
+        first = await auth.verify_cloudflare_token(_request(token))
+        second = await auth.verify_cloudflare_token(_request(token))
+
+    assert first == second == {"email": "user@example.com", "sub": "sub-1", "name": None}
+    assert decode.call_count == 1
+    assert download.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_cached_token_is_not_served_after_exp():
+    token = _token(PRIVATE_1, "k1")
+    with patch.object(auth, "_download_jwks", new=AsyncMock(return_value=[JWK_1])):
+        assert await auth.verify_cloudflare_token(_request(token)) is not None
+        token_hash = next(iter(auth._verified_tokens))
+        auth._verified_tokens[token_hash] = (time.time() - 1, {"email": "stale"})
+        with patch.object(auth.jwt, "decode", wraps=jwt.decode) as decode:
+            result = await auth.verify_cloudflare_token(_request(token))
+
+    assert result is not None
+    assert result["email"] == "user@example.com"
+    assert decode.call_count == 1
+
+
+@pytest.mark.asyncio
+async def test_bad_signature_is_rejected():
+    forged = _token(PRIVATE_2, "k1")
+    with patch.object(auth, "_download_jwks", new=AsyncMock(return_value=[JWK_1])):
+        assert await auth.verify_cloudflare_token(_request(forged)) is None
+    assert not auth._verified_tokens
+
+
+@pytest.mark.asyncio
+async def test_unknown_kid_forces_one_refresh_for_key_rotation():
+    download = AsyncMock(side_effect=[[JWK_1], [JWK_1, JWK_2]])
+    with patch.object(auth, "_download_jwks", new=download):
+        assert await auth.verify_cloudflare_token(_request(_token(PRIVATE_1, "k1")))
+        auth._cloudflare_keys_attempted_at = 0.0  # past the minimum refresh interval
+        result = await auth.verify_cloudflare_token(_request(_token(PRIVATE_2, "k2")))
+
+    assert result is not None
+    assert download.await_count == 2
+
+
+@pytest.mark.asyncio
+async def test_failed_refresh_keeps_serving_stale_keys():
+    download = AsyncMock(side_effect=[[JWK_1], RuntimeError("cloudflare down")])
+    with patch.object(auth, "_download_jwks", new=download):
+        await auth.get_cloudflare_keys()
+        # Age the keys past the refresh-ahead threshold: the refresh runs in the
+        # background and requests keep using the keys already loaded.
+        auth._cloudflare_keys_fetched_at = time.time() - auth.CF_KEYS_CACHE_TTL_SECONDS
+        auth._cloudflare_keys_attempted_at = 0.0
+        result = await auth.verify_cloudflare_token(_request(_token(PRIVATE_1, "k1")))
+        await asyncio.sleep(0)
+        refresh = auth._cloudflare_keys_refresh
+        assert refresh is not None
+        await refresh
+
+    assert result is not None
+    assert download.await_count == 2
+    assert set(auth._cloudflare_keys) == {"k1"}
+
+
+@pytest.mark.asyncio
+async def test_concurrent_first_requests_share_one_fetch():
+    async def slow_download():
+        await asyncio.sleep(0.01)
+        return [JWK_1]
+
+    download = AsyncMock(side_effect=slow_download)
+    with patch.object(auth, "_download_jwks", new=download):
+        results = await asyncio.gather(
+            *(auth.verify_cloudflare_token(_request(_token(PRIVATE_1, "k1"))) for _ in range(5))
+        )
+
+    assert all(results)
+    assert download.await_count == 1
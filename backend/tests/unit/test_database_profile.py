@@ -0,0 +1,85 @@
+"""Unit tests for the SQLite performance profile and reader/writer engine split."""
+
+import asyncio
+
+import pytest
+from sqlalchemy import text
+
+from bot.core.database import SqliteProfile, create_engines
+
+
+@pytest.mark.asyncio
+async def test_file_database_gets_separate_reader_and_writer(tmp_path):
+    writer, reader = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'bot.db'}")
+    try:
+        assert writer is not reader
+        assert writer.pool.size() == 1
+
+        async with writer.connect() as conn:
+            journal_mode = (await conn.execute(text("PRAGMA journal_mode"))).scalar()
+            synchronous = (await conn.execute(text("PRAGMA synchronous"))).scalar()
+            busy_timeout = (await conn.execute(text("PRAGMA busy_timeout"))).scalar()
+            query_only = (await conn.execute(text("PRAGMA query_only"))).scalar()
+        assert journal_mode == "wal"
+        assert synchronous == 1  # NORMAL
+        assert busy_timeout == SqliteProfile().busy_timeout_ms
+        assert query_only == 0
+
+        async with reader.connect() as conn:
+            assert (await conn.execute(text("PRAGMA query_only"))).scalar() == 1
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_overlapping_writer_sessions_do_not_wait_for_the_pool(tmp_path):
+    writer, reader = create_engines(
+        f"sqlite+aiosqlite:///{tmp_path / 'bot.db'}", SqliteProfile(write_pool_overflow=1)
+    )
+    try:
+        async with writer.begin() as outer:
+            await outer.execute(text("CREATE TABLE t (x INTEGER)"))
+            async with asyncio.timeout(1), writer.connect() as inner:
+                assert (await inner.execute(text("SELECT 1"))).scalar() == 1
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+@pytest.mark.asyncio
+async def test_reader_rejects_writes(tmp_path):
+    writer, reader = create_engines(f"sqlite+aiosqlite:///{tmp_path / 'bot.db'}")
+    try:
+        async with writer.begin() as conn:
+            await conn.execute(text("CREATE TABLE t (x INTEGER)"))
+        async with reader.connect() as conn:
+            with pytest.raises(Exception, match="readonly"):
+                await conn.execute(text("INSERT INTO t VALUES (1)"))
+    finally:
+        await writer.dispose()
+        await reader.dispose()
+
+
+def test_disabled_profile_and_memory_db_share_one_engine(tmp_path):
+    writer, reader = create_engines(
+        f"sqlite+aiosqlite:///{tmp_path / 'bot.db'}", SqliteProfile(enabled=False)
+    )
+    assert writer is reader
+
+    writer, reader = create_engines("sqlite+aiosqlite:///:memory:")
+    assert writer is reader
+
+
+def test_profile_from_env(monkeypatch):
+    monkeypatch.setenv("SQLITE_SYNCHRONOUS", "FULL")
+    monkeypatch.setenv("SQLITE_READ_POOL_SIZE", "2")
+    monkeypatch.setenv("SQLITE_WRITE_POOL_OVERFLOW", "0")
+    monkeypatch.setenv("SQLITE_PERFORMANCE_PROFILE", "false")
+    profile = SqliteProfile.from_env()
+    assert profile.synchronous == "FULL"
+    assert profile.read_pool_size == 2
+    assert profile.write_pool_overflow == 0
+    assert profile.enabled is False
+    assert "PRAGMA query_only=ON" in profile.pragmas(read_only=True)
+    assert "PRAGMA query_only=ON" not in profile.pragmas()
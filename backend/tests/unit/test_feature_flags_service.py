@@ -1,11 +1,19 @@
 """Unit tests for FeatureFlagsService (business logic layer)."""
 
+from contextlib import contextmanager
 from unittest.mock import AsyncMock, patch
 
 import pytest
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
+from bot.core.base import Base
 from bot.core.enums import FeatureFlagNames
+from bot.core.models import FeatureFlags
+from bot.repositories.feature_flags_repository import FeatureFlagsRepository
 from bot.services.feature_flags_service import FeatureFlagsService
+from bot.utils import cache_backends
+from bot.utils.cache_backends import InMemoryBackend
+from bot.utils.shared_version import SharedVersion
 
 
 @pytest.mark.asyncio
@@ -224,3 +232,46 @@ async def test_modify_feature_flag_disable_existing(mock_update, mock_get):
     assert success is True
     assert "disabled" in msg
     mock_update.assert_awaited_once()
+
+
+class _Process:
+    """The per-process flag cache of a split deployment."""
+
+    def __init__(self) -> None:
+        self.cache: dict[str, bool] = {}
+        self.version = SharedVersion("feature_flags")
+
+    @contextmanager
+    def running(self, monkeypatch):
+        with monkeypatch.context() as m:
+            m.setattr(FeatureFlagsRepository, "_cache", self.cache)
+            m.setattr(FeatureFlagsService, "_cache_version", self.version)
+            yield
+            self.cache = FeatureFlagsRepository._cache
+
+
+@pytest.mark.asyncio
+async def test_split_mode_toggle_on_one_process_reaches_another(monkeypatch):
+    monkeypatch.setattr(cache_backends, "_backend", InMemoryBackend())
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(FeatureFlags(feature=FeatureFlagNames.USE_CACHE.value, enabled=True))
+        await session.commit()
+    monkeypatch.setattr("bot.services.feature_flags_service.AsyncSessionLocal", factory)
+    monkeypatch.setattr("bot.services.feature_flags_service.AsyncReadSessionLocal", factory)
+    worker, bot_process = _Process(), _Process()
+
+    with worker.running(monkeypatch):
+        FeatureFlagsService._cache_version.forget()
+        assert await FeatureFlagsService.refresh_cache_if_changed() is True
+    with bot_process.running(monkeypatch):
+        await FeatureFlagsService().modify_feature_flag(FeatureFlagNames.USE_CACHE.value, False)
+    with worker.running(monkeypatch):
+        assert FeatureFlagsRepository._cache[FeatureFlagNames.USE_CACHE.value] is True
+        assert await FeatureFlagsService.refresh_cache_if_changed() is True
+        assert FeatureFlagsRepository._cache[FeatureFlagNames.USE_CACHE.value] is False
+        assert await FeatureFlagsService.refresh_cache_if_changed() is False
+    await engine.dispose()
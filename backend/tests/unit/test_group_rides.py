@@ -6,17 +6,21 @@ import pytest
 
 from bot.core.enums import CampusLivingLocations
 from bot.core.schemas import Identity, Passenger
+from bot.services import ride_grouping
 from bot.services.ride_grouping import (
     PassengersByLocation,
     calculate_pickup_time,
     count_tuples,
     create_output,
     find_passenger,
+    grouping_cache_key,
     is_enough_capacity,
     llm_input_drivers,
+    llm_input_matrix,
     llm_input_pickups,
     parse_numbers,
 )
+from bot.services.route_service import RouteService
 from tests.unit.routing_fixtures import make_seed_context
 
 SEED_CTX = make_seed_context()
@@ -279,6 +283,57 @@ class TestLlmInputPickups:
         assert llm_input_pickups({}) == ""
 
 
+class TestLlmInputMatrix:
+    """Tests for the `llm_input_matrix` function."""
+
+    def test_only_requested_locations_with_shortest_times(
+        self, sample_locations_people: PassengersByLocation
+    ):
+        """Should list only non-empty requested locations, keyed by short ids."""
+        assert llm_input_matrix(sample_locations_people, SEED_CTX).splitlines() == [
+            "Ids (answer with the full location name): A=ERC across from bamboo; B=Sixth loop",
+            'Drive minutes from row to column ("-" = no route):',
+            " A B END",
+            "START 15 13 30",
+            "A 0 2 21",
+            "B 2 0 23",
+        ]
+
+    def test_unreachable_pairs_are_marked(self, sample_passengers: dict[str, Passenger]):
+        """Should print '-' where the graph has no path."""
+        isolated = sample_passengers["alice"].model_copy(
+            update={"pickup_location": "Warren Justice Ln"}
+        )
+        matrix = llm_input_matrix(
+            {"Rita": [sample_passengers["bob"]], "Warren Justice Ln": [isolated]}, SEED_CTX
+        )
+        assert matrix.splitlines()[-2:] == ["A 0 - 27", "B - 0 -"]
+
+    def test_rule_location_listed_when_its_rule_applies(
+        self, sample_passengers: dict[str, Passenger]
+    ):
+        """Should add Geisel Loop, without riders, when Marshall riders are requested."""
+        marshall = sample_passengers["alice"].model_copy(
+            update={"pickup_location": "Marshall uppers"}
+        )
+        lines = llm_input_matrix(
+            {"Marshall uppers": [marshall], "Innovation": [sample_passengers["bob"]]}, SEED_CTX
+        ).splitlines()
+
+        assert lines[0] == (
+            "Ids (answer with the full location name): "
+            "A=Innovation; B=Marshall uppers; C=Geisel Loop"
+        )
+        assert lines[1] == "No riders at (listed for the routing rules): C"
+        assert lines[-1].startswith("C 4 7 0 ")
+
+    def test_smaller_than_full_graph(self, sample_locations_people: PassengersByLocation):
+        """Should be far shorter than the full adjacency it replaces."""
+        assert (
+            len(llm_input_matrix(sample_locations_people, SEED_CTX)) < len(repr(SEED_CTX.graph)) / 4
+        )
+
+
 # ---------------------------------------------------------------------------
 # Fixtures shared by create_output tests
 # ---------------------------------------------------------------------------
@@ -314,6 +369,33 @@ def charlie():
 class TestCreateOutput:
     """Tests for the `create_output` function (lines 165-246)."""
 
+    def test_optimize_order_reorders_stops_and_reports_savings(self, alice, bob, charlie):
+        locations_people: PassengersByLocation = {
+            "Sixth loop": [alice],
+            "ERC across from bamboo": [bob],
+            "Muir tennis courts": [charlie],
+        }
+        llm_result = {
+            "Driver0": [
+                {"name": "Charlie", "location": "Muir tennis courts"},
+                {"name": "Bob", "location": "ERC across from bamboo"},
+                {"name": "Alice", "location": "Sixth loop"},
+            ],
+        }
+        plain = create_output(llm_result, locations_people, time(17, 0), {}, SEED_CTX)
+        optimized = create_output(
+            llm_result, locations_people, time(17, 0), {}, SEED_CTX, optimize_order=True
+        )
+
+        assert "optimized pickup order saved" not in plain[0]
+        assert "optimized pickup order saved" in optimized[0]
+        order = [obj["location"] for obj in llm_result["Driver0"]]
+        best, saved = RouteService.optimize_order(SEED_CTX, order)
+        assert f"saved {saved} min" in optimized[0]
+        drive = optimized[1]
+        positions = [drive.index(location) for location in best]
+        assert positions == sorted(positions)
+
     @patch("bot.services.ride_grouping.calculate_pickup_time")
     def test_single_driver_single_location(self, mock_pickup_time, alice):
         """Single driver, single pickup location: no intermediate time calculation."""
@@ -445,3 +527,39 @@ class TestCreateOutput:
         mock_pickup_time.assert_not_called()
         assert "@alice" in result[1]
         assert "@charlie" in result[1]
+
+
+class TestGroupingCacheKey:
+    def _key(self, people, **overrides):
+        args = {
+            "driver_capacity": [4, 4],
+            "graph_digest": SEED_CTX.graph_digest,
+            "legacy_prompt": False,
+            "custom_prompt": None,
+        } | overrides
+        return grouping_cache_key(people, **args)
+
+    def test_rider_order_does_not_matter(self, alice, bob, charlie):
+        forward = {"Sixth loop": [alice], "ERC across from bamboo": [bob, charlie]}
+        backward = {"ERC across from bamboo": [charlie, bob], "Sixth loop": [alice]}
+
+        assert self._key(forward) == self._key(backward)
+
+    def test_every_input_changes_the_key(self, alice, bob):
+        people = {"Sixth loop": [alice, bob]}
+        base = self._key(people)
+
+        assert self._key({"Sixth loop": [alice]}) != base
+        assert self._key(people, driver_capacity=[4, 3]) != base
+        assert self._key(people, graph_digest="other") != base
+        assert self._key(people, legacy_prompt=True) != base
+        assert self._key(people, custom_prompt="Rita first") != base
+        assert self._key(people, custom_prompt="  ") == base
+
+    def test_prompt_version_changes_the_key(self, alice, bob, monkeypatch):
+        people = {"Sixth loop": [alice, bob]}
+        base = self._key(people)
+
+        monkeypatch.setattr(ride_grouping, "GROUPING_PROMPT_VERSION", 0)
+
+        assert self._key(people) != base
@@ -2,12 +2,16 @@
 
 from __future__ import annotations
 
+import threading
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
+import pytest_asyncio
 
 from bot.core.enums import (
+    CacheNamespace,
     CampusLivingLocations,
+    GroupingSolver,
     JobName,
 )
 from bot.core.schemas import Identity, Passenger
@@ -15,10 +19,21 @@ from bot.services.group_rides_service import (
     EVENT_END_LEAVE_TIMES,
     GroupRidesService,
 )
+from bot.services.ride_solver import solve_ride_groups
+from bot.utils.cache import invalidate_namespace
 from tests.unit.routing_fixtures import SEED_LIVING_TO_PICKUP, make_seed_context
 
 SEED_CTX = make_seed_context()
 
+
+@pytest_asyncio.fixture(autouse=True)
+async def fresh_grouping_cache():
+    """LLM groupings are cached; every test starts with an empty cache."""
+    await invalidate_namespace(CacheNamespace.RIDE_GROUPINGS)
+    yield
+    await invalidate_namespace(CacheNamespace.RIDE_GROUPINGS)
+
+
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
@@ -400,24 +415,74 @@ async def test_process_ride_grouping_raises_on_llm_error_key():
     fake_msg.content = "friday fellowship"
     fake_msg.embeds = []
     svc.repo.fetch_message = AsyncMock(return_value=fake_msg)
-    svc.llm_service.generate_ride_groups = MagicMock(return_value={"error": "bad input"})
+    svc.llm_service.generate_ride_groups = AsyncMock(return_value={"error": "bad input"})
 
     with (
         patch(
             "bot.services.group_rides_service.PickupLocationsService.get_routing_context",
             new=AsyncMock(return_value=SEED_CTX),
         ),
-        patch(
-            "bot.services.group_rides_service.asyncio.to_thread",
-            new=AsyncMock(return_value={"error": "bad input"}),
-        ),
         pytest.raises(ValueError, match="LLM returned with error"),
     ):
         await svc._process_ride_grouping(1234, "44444", 9999)
 
 
 @pytest.mark.asyncio
-async def test_process_ride_grouping_raises_on_llm_exception():
+async def test_process_ride_grouping_falls_back_to_local_solver_on_llm_exception():
+    svc = _make_service()
+    svc.locations_service.list_locations = AsyncMock(
+        return_value=({"Seventh": [("Alice", "alice")]}, {"alice"}, {"alice"})
+    )
+    fake_msg = MagicMock()
+    fake_msg.content = "friday fellowship"
+    fake_msg.embeds = []
+    svc.repo.fetch_message = AsyncMock(return_value=fake_msg)
+    svc.llm_service.generate_ride_groups = AsyncMock(side_effect=TimeoutError)
+    report = AsyncMock()
+
+    with (
+        patch(
+            "bot.services.group_rides_service.PickupLocationsService.get_routing_context",
+            new=AsyncMock(return_value=SEED_CTX),
+        ),
+        patch("bot.services.group_rides_service.send_error_to_discord", new=report),
+    ):
+        output = await svc._process_ride_grouping(1234, "44444", 9999)
+
+    report.assert_awaited_once()
+    assert "alice" in output[1]
+    assert "Seventh mail room" in output[1]
+
+
+@pytest.mark.asyncio
+async def test_process_ride_grouping_local_solver_skips_llm():
+    svc = _make_service()
+    svc.locations_service.list_locations = AsyncMock(
+        return_value=(
+            {"Seventh": [("Alice", "alice")], "Muir": [("Bob", "bob"), ("Cy", "cy")]},
+            {"alice", "bob", "cy"},
+            {"alice", "bob", "cy"},
+        )
+    )
+    fake_msg = MagicMock()
+    fake_msg.content = "friday fellowship"
+    fake_msg.embeds = []
+    svc.repo.fetch_message = AsyncMock(return_value=fake_msg)
+    svc.llm_service.generate_ride_groups = AsyncMock()
+
+    with patch(
+        "bot.services.group_rides_service.PickupLocationsService.get_routing_context",
+        new=AsyncMock(return_value=SEED_CTX),
+    ):
+        output = await svc._process_ride_grouping(1234, "44444", 9999, solver=GroupingSolver.LOCAL)
+
+    svc.llm_service.generate_ride_groups.assert_not_awaited()
+    drives = "".join(output[1:])
+    assert all(name in drives for name in ("alice", "bob", "cy"))
+
+
+@pytest.mark.asyncio
+async def test_process_ride_grouping_local_solver_runs_off_the_event_loop():
     svc = _make_service()
     svc.locations_service.list_locations = AsyncMock(
         return_value=({"Seventh": [("Alice", "alice")]}, {"alice"}, {"alice"})
@@ -426,20 +491,108 @@ async def test_process_ride_grouping_raises_on_llm_exception():
     fake_msg.content = "friday fellowship"
     fake_msg.embeds = []
     svc.repo.fetch_message = AsyncMock(return_value=fake_msg)
+    solver_threads = []
+
+    def solver(*args):
+        solver_threads.append(threading.get_ident())
+        return solve_ride_groups(*args)
+
+    with (
+        patch(
+            "bot.services.group_rides_service.PickupLocationsService.get_routing_context",
+            new=AsyncMock(return_value=SEED_CTX),
+        ),
+        patch("bot.services.group_rides_service.solve_ride_groups", new=solver),
+    ):
+        await svc._process_ride_grouping(1234, "44444", 9999, solver=GroupingSolver.LOCAL)
+
+    assert solver_threads
+    assert threading.get_ident() not in solver_threads
+
+
+def _friday_service(people: dict, llm: AsyncMock) -> GroupRidesService:
+    svc = _make_service()
+    svc.llm_service.generate_ride_groups = llm
+    usernames = {username for riders in people.values() for _, username in riders}
+    svc.locations_service.list_locations = AsyncMock(return_value=(people, usernames, usernames))
+    fake_msg = MagicMock()
+    fake_msg.content = "friday fellowship"
+    fake_msg.embeds = []
+    svc.repo.fetch_message = AsyncMock(return_value=fake_msg)
+    return svc
+
+
+@pytest.mark.asyncio
+async def test_process_ride_grouping_reuses_cached_llm_grouping():
+    llm_groups = {"Driver0": [{"name": "Alice", "location": "Seventh mail room"}]}
+    llm = AsyncMock(return_value=llm_groups)
+
+    with patch(
+        "bot.services.group_rides_service.PickupLocationsService.get_routing_context",
+        new=AsyncMock(return_value=SEED_CTX),
+    ):
+        first = await _friday_service(
+            {"Seventh": [("Alice", "alice")]}, llm
+        )._process_ride_grouping(1234, "44444", 9999)
+        second = await _friday_service(
+            {"Seventh": [("Alice", "alice")]}, llm
+        )._process_ride_grouping(1234, "44444", 9999)
+        assert llm.await_count == 1
+
+        regenerated = await _friday_service(
+            {"Seventh": [("Alice", "alice")]}, llm
+        )._process_ride_grouping(1234, "44444", 9999, regenerate=True)
+        assert llm.await_count == 2
+
+        await _friday_service({"Seventh": [("Alice", "alice")]}, llm)._process_ride_grouping(
+            1234, "44444", 9999, custom_prompt="put Alice first"
+        )
+        assert llm.await_count == 3
+
+    assert first == second == regenerated
+
+
+@pytest.mark.asyncio
+async def test_process_ride_grouping_survives_cache_outage():
+    llm_groups = {"Driver0": [{"name": "Alice", "location": "Seventh mail room"}]}
+    llm = AsyncMock(return_value=llm_groups)
+    backend = MagicMock()
+    backend.get = AsyncMock(side_effect=ConnectionError("redis down"))
+    backend.set = AsyncMock(side_effect=ConnectionError("redis down"))
 
     with (
         patch(
             "bot.services.group_rides_service.PickupLocationsService.get_routing_context",
             new=AsyncMock(return_value=SEED_CTX),
         ),
+        patch("bot.services.group_rides_service.get_backend", return_value=backend),
+    ):
+        result = await _friday_service(
+            {"Seventh": [("Alice", "alice")]}, llm
+        )._process_ride_grouping(1234, "44444", 9999)
+
+    assert "@alice" in "".join(result)
+    llm.assert_awaited_once()
+    backend.set.assert_awaited_once()
+
+
+@pytest.mark.asyncio
+async def test_process_ride_grouping_does_not_cache_fallback_grouping():
+    llm = AsyncMock(side_effect=RuntimeError("LLM down"))
+
+    with (
         patch(
-            "bot.services.group_rides_service.asyncio.to_thread",
-            new=AsyncMock(side_effect=RuntimeError("LLM down")),
+            "bot.services.group_rides_service.PickupLocationsService.get_routing_context",
+            new=AsyncMock(return_value=SEED_CTX),
         ),
         patch("bot.services.group_rides_service.send_error_to_discord", new=AsyncMock()),
-        pytest.raises(ValueError, match="Could not process"),
     ):
-        await svc._process_ride_grouping(1234, "44444", 9999)
+        for _ in range(2):
+            await _friday_service({"Seventh": [("Alice", "alice")]}, llm)._process_ride_grouping(
+                1234, "44444", 9999
+            )
+
+    assert llm.await_count == 2
 
 
 # ---------------------------------------------------------------------------
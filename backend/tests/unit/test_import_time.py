@@ -0,0 +1,59 @@
+"""
+Cold-start imports of the two entry points must not pull in the LLM stack.
+
+Each check runs a fresh interpreter and inspects its ``sys.modules``, so the
+result reflects a real cold import rather than this (already warm) process.
+Wall-clock import time is measured by ``benchmarks/import_time.py`` instead,
+since a timing budget here would flake on loaded CI runners.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+# Heavy LLM stacks that must only load on the first LLM call.
+LAZY_PREFIXES = ("langchain", "langchain_core", "langchain_openai", "langchain_google_genai")
+
+_COGS = sorted(
+    f"bot.cogs.{path.stem}"
+    for path in (BACKEND_DIR / "bot" / "cogs").glob("*.py")
+    if not path.name.startswith("_")
+)
+
+# `run_api.py` serves `api.app:app`; `main.py` imports its lifecycle and then
+# loads every cog at startup.
+ENTRY_POINTS = {
+    "run_api": "import api.app",
+    "main": "import main\n" + "\n".join(f"import {cog}" for cog in _COGS),
+}
+
+
+def _loaded_modules(code: str) -> set[str]:
+    """Run *code* in a fresh interpreter and return the modules it left loaded."""
+    env = os.environ | {"TOKEN": os.environ.get("TOKEN", "test-token")}
+    report = "import json, sys\nprint(json.dumps(sorted(sys.modules)))"
+    proc = subprocess.run(
+        [sys.executable, "-c", f"{code}\n{report}"],
+        cwd=BACKEND_DIR,
+        env=env,
+        capture_output=True,
+        text=True,
+        check=True,
+    )
+    return set(json.loads(proc.stdout.splitlines()[-1]))
+
+
+@pytest.mark.parametrize("entry_point", sorted(ENTRY_POINTS))
+def test_cold_import_skips_llm_stack(entry_point):
+    modules = _loaded_modules(ENTRY_POINTS[entry_point])
+
+    eager = sorted(name for name in modules if name.split(".")[0] in LAZY_PREFIXES)
+    assert not eager, f"{entry_point} imports LLM modules eagerly: {eager[:5]}"
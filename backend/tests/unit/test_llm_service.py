@@ -0,0 +1,120 @@
+"""Unit tests for the async LLM call path: retries, deadline and hedging."""
+
+from __future__ import annotations
+
+import asyncio
+import json
+from types import SimpleNamespace
+
+import httpx
+import pytest
+
+import bot.services.llm_service as llm_module
+from bot.services.llm_service import LLMService
+
+GROUPS = {"Driver0": [{"name": "Alice", "location": "Rita"}]}
+
+
+class FakeModel:
+    """Stands in for the chat client: answers from a script of delays and errors."""
+
+    def __init__(self, *script: float | BaseException) -> None:
+        self.script = list(script)
+        self.calls = 0
+        self.cancelled = 0
+
+    async def ainvoke(self, prompt: str):
+        step = self.script[min(self.calls, len(self.script) - 1)]
+        self.calls += 1
+        if isinstance(step, BaseException):
+            raise step
+        try:
+            await asyncio.sleep(step)
+        except asyncio.CancelledError:
+            self.cancelled += 1
+            raise
+        return SimpleNamespace(content=json.dumps(GROUPS))
+
+
+@pytest.fixture(autouse=True)
+def fast_timings(monkeypatch):
+    monkeypatch.setattr(llm_module, "LLM_BACKOFF_INITIAL_SECONDS", 0.001)
+    monkeypatch.setattr(llm_module, "LLM_BACKOFF_MAX_SECONDS", 0.001)
+    monkeypatch.setattr(llm_module, "LLM_HEDGE_DEFAULT_DELAY_SECONDS", 0.05)
+    monkeypatch.setattr(LLMService, "_latencies", LLMService._latencies.__class__(maxlen=100))
+
+
+def _service(model: FakeModel, hedge: bool = False) -> LLMService:
+    svc = LLMService(hedge=hedge)
+    svc.llm = model
+    return svc
+
+
+async def _generate(svc: LLMService) -> dict:
+    return await svc.generate_ride_groups("pickups", "drivers", {})
+
+
+@pytest.mark.asyncio
+async def test_transient_errors_are_retried():
+    model = FakeModel(httpx.ConnectError("refused"), RuntimeError("429 rate limit"), 0)
+
+    assert await _generate(_service(model)) == GROUPS
+    assert model.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_permanent_errors_are_not_retried():
+    model = FakeModel(RuntimeError("invalid api key"))
+
+    with pytest.raises(RuntimeError, match="invalid api key"):
+        await _generate(_service(model))
+    assert model.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_the_whole_call(monkeypatch):
+    monkeypatch.setattr(llm_module, "LLM_DEADLINE_SECONDS", 0.05)
+    model = FakeModel(10)
+
+    with pytest.raises(TimeoutError):
+        await _generate(_service(model))
+    assert model.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_cancellation_reaches_the_request():
+    model = FakeModel(10)
+    task = asyncio.create_task(_generate(_service(model)))
+    await asyncio.sleep(0.01)
+
+    task.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await task
+    assert model.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_request_is_hedged_and_loser_cancelled():
+    model = FakeModel(10, 0)
+
+    assert await _generate(_service(model, hedge=True)) == GROUPS
+    assert model.calls == 2
+    assert model.cancelled == 1
+
+
+@pytest.mark.asyncio
+async def test_fast_request_is_not_hedged():
+    model = FakeModel(0)
+
+    await _generate(_service(model, hedge=True))
+    assert model.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_delay_follows_recent_latencies(monkeypatch):
+    monkeypatch.setattr(llm_module, "LLM_HEDGE_MIN_SAMPLES", 10)
+    svc = _service(FakeModel(0), hedge=True)
+    assert svc._hedge_delay() == 0.05
+
+    LLMService._latencies.extend([1.0] * 9 + [3.0])
+    assert 1.0 < svc._hedge_delay() <= 3.0
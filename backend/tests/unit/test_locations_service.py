@@ -156,7 +156,7 @@ async def test_get_location_returns_cached_results():
     mock_session_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("bot.services.locations_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.locations_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.locations_service.LocationsRepository.get_location_check_name_and_discord",
             new_callable=AsyncMock,
@@ -190,7 +190,7 @@ async def test_get_location_triggers_sync_on_cache_miss():
     svc.sync_locations = AsyncMock()
 
     with (
-        patch("bot.services.locations_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.locations_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.locations_service.LocationsRepository.get_location_check_name_and_discord",
             side_effect=fake_lookup,
@@ -215,7 +215,7 @@ async def test_get_location_returns_none_after_sync_miss():
     svc.sync_locations = AsyncMock()
 
     with (
-        patch("bot.services.locations_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.locations_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.locations_service.LocationsRepository.get_location_check_name_and_discord",
             new_callable=AsyncMock,
@@ -237,7 +237,7 @@ async def test_get_location_discord_only_uses_discord_check():
     mock_session_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("bot.services.locations_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.locations_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.locations_service.LocationsRepository.get_location_check_discord",
             new_callable=AsyncMock,
@@ -262,7 +262,7 @@ async def test_get_name_location_no_sync_delegates_to_repo():
     mock_session_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("bot.services.locations_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.locations_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.locations_service.LocationsRepository.get_name_location",
             new_callable=AsyncMock,
@@ -347,7 +347,7 @@ async def test_list_locations_no_day_uses_message_id():
     mock_session_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("bot.services.locations_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.locations_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.locations_service.LocationsRepository.get_non_discord_pickups",
             new_callable=AsyncMock,
@@ -2,7 +2,8 @@
 
 from __future__ import annotations
 
-from unittest.mock import patch
+from contextlib import contextmanager
+from unittest.mock import AsyncMock, patch
 
 import pytest
 import pytest_asyncio
@@ -10,7 +11,10 @@ from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
 
 from bot.core.base import Base
 from bot.core.models import GlobalSetting, LivingLocationPickup, PickupLocation
-from bot.services.pickup_locations_service import PickupLocationsService
+from bot.services.pickup_locations_service import END_NODE, START_NODE, PickupLocationsService
+from bot.utils import cache_backends
+from bot.utils.cache_backends import InMemoryBackend
+from bot.utils.shared_version import SharedVersion
 
 
 @pytest_asyncio.fixture
@@ -21,7 +25,10 @@ async def session_local():
         await conn.run_sync(Base.metadata.create_all)
     factory = async_sessionmaker(engine, expire_on_commit=False)
     PickupLocationsService.invalidate_cache()
-    with patch("bot.services.pickup_locations_service.AsyncSessionLocal", factory):
+    with (
+        patch("bot.services.pickup_locations_service.AsyncSessionLocal", factory),
+        patch("bot.services.pickup_locations_service.AsyncReadSessionLocal", factory),
+    ):
         yield factory
     PickupLocationsService.invalidate_cache()
     await engine.dispose()
@@ -54,6 +61,18 @@ async def test_get_all_returns_full_payload(session_local):
     assert set(payload["unreachable"]) == {"Alpha", "Beta"}
 
 
+@pytest.mark.asyncio
+async def test_get_all_skips_mapping_to_unknown_pickup(session_local):
+    await _seed_minimal(session_local)
+    ctx = await PickupLocationsService.get_routing_context()
+
+    payload = PickupLocationsService._build_payload(
+        ctx.evolve(living_to_pickup={"Muir": "Alpha", "Sixth": "Gone"})
+    )
+
+    assert payload["living_mappings"] == [{"living_location": "Muir", "pickup_location_id": 1}]
+
+
 @pytest.mark.asyncio
 async def test_create_location_and_duplicate_rejected(session_local):
     created = await PickupLocationsService.create_location(
@@ -178,6 +197,54 @@ async def test_cache_invalidated_on_mutation(session_local):
     assert "Gamma" in [loc.name for loc in second.locations]
 
 
+@pytest.mark.asyncio
+async def test_mutations_update_cached_snapshot_without_reload(session_local):
+    await _seed_minimal(session_local)
+    await PickupLocationsService.get_routing_context()
+
+    with patch.object(
+        PickupLocationsService, "_load_snapshot", wraps=PickupLocationsService._load_snapshot
+    ) as load:
+        gamma = await PickupLocationsService.create_location(
+            name="Gamma", latitude=1.0, longitude=2.0, minutes_from_start=5
+        )
+        edge = await PickupLocationsService.upsert_edge(1, 2, minutes=4)
+        await PickupLocationsService.upsert_edge(2, gamma.id, minutes=2)
+        await PickupLocationsService.upsert_edge(1, 2, minutes=9)
+        await PickupLocationsService.update_location(1, name="Alpha 2", minutes_to_end=3)
+        await PickupLocationsService.set_living_mapping("Warren", gamma.id)
+        await PickupLocationsService.set_pickup_adjustment(2)
+        await PickupLocationsService.delete_edge(edge.id)
+        await PickupLocationsService.upsert_edge(1, gamma.id, minutes=1)
+        await PickupLocationsService.soft_delete_location(2)
+        versions = set()
+        for _ in range(2):
+            ctx = await PickupLocationsService.get_routing_context()
+            versions.add(ctx.version)
+        load.assert_not_called()
+
+    assert len(versions) == 1
+    PickupLocationsService.invalidate_cache()
+    fresh = await PickupLocationsService.get_routing_context()
+    assert ctx.locations == fresh.locations
+    assert sorted(ctx.edges, key=lambda e: e.id) == sorted(fresh.edges, key=lambda e: e.id)
+    assert ctx.living_to_pickup == fresh.living_to_pickup == {"Muir": "Alpha 2", "Warren": "Gamma"}
+    assert ctx.pickup_adjustment == fresh.pickup_adjustment == 2
+    assert ctx.graph_digest == fresh.graph_digest
+    assert ctx.lookup_time(START_NODE, END_NODE) == fresh.lookup_time(START_NODE, END_NODE) == 9
+
+
+@pytest.mark.asyncio
+async def test_failed_mutation_keeps_cached_snapshot(session_local):
+    await _seed_minimal(session_local)
+    first = await PickupLocationsService.get_routing_context()
+
+    with pytest.raises(ValueError, match="Unknown or inactive"):
+        await PickupLocationsService.upsert_edge(1, 999, minutes=2)
+
+    assert await PickupLocationsService.get_routing_context() is first
+
+
 @pytest.mark.asyncio
 async def test_inactive_location_excluded_from_graph_and_fuzzy(session_local):
     await _seed_minimal(session_local)
@@ -190,3 +257,63 @@ async def test_inactive_location_excluded_from_graph_and_fuzzy(session_local):
     assert ctx.fuzzy_match("Alpha") is None
     with pytest.raises(ValueError, match="No path found"):
         ctx.lookup_time("Beta", "Alpha")
+
+
+class _Process:
+    """The per-process cache state of PickupLocationsService in a split deployment."""
+
+    def __init__(self) -> None:
+        self.snapshot = None
+        self.payload = None
+        # No min_interval: the test switches processes faster than the poll gap
+        self.version = SharedVersion("pickup_locations")
+
+    @contextmanager
+    def running(self):
+        svc = PickupLocationsService
+        saved = svc._snapshot, svc._payload, svc._version
+        svc._snapshot, svc._payload, svc._version = self.snapshot, self.payload, self.version
+        try:
+            yield
+        finally:
+            self.snapshot, self.payload = svc._snapshot, svc._payload
+            svc._snapshot, svc._payload, svc._version = saved
+
+
+@pytest.mark.asyncio
+async def test_split_mode_edit_on_one_process_is_read_on_another(session_local, monkeypatch):
+    monkeypatch.setattr(cache_backends, "_backend", InMemoryBackend())
+    await _seed_minimal(session_local)
+    worker, bot_process = _Process(), _Process()
+
+    with bot_process.running():
+        before = await PickupLocationsService.get_routing_context()
+        assert {loc["name"] for loc in (await PickupLocationsService.get_all())["locations"]} == {
+            "Alpha",
+            "Beta",
+        }
+    with worker.running():
+        await PickupLocationsService.get_routing_context()
+        await PickupLocationsService.update_location(2, name="Beta 2")
+        edited = await PickupLocationsService.get_routing_context()
+    with bot_process.running():
+        after = await PickupLocationsService.get_routing_context()
+        payload = await PickupLocationsService.get_all()
+        assert await PickupLocationsService.get_routing_context() is after
+
+    assert "Beta" in before.active_names
+    assert after is not before
+    assert after.active_names == edited.active_names == ("Alpha", "Beta 2")
+    assert {loc["name"] for loc in payload["locations"]} == {"Alpha", "Beta 2"}
+
+
+def test_sync_snapshot_read_skips_the_shared_version():
+    """Agent tool threads run their own event loop and must not touch the shared backend."""
+    process = _Process()
+    process.snapshot = object()
+    process.version.changed = AsyncMock(return_value=True)
+
+    with process.running():
+        assert PickupLocationsService.get_routing_context_sync() is process.snapshot
+
+    process.version.changed.assert_not_awaited()
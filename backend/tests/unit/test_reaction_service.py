@@ -187,7 +187,7 @@ async def test_get_ask_rides_reactions_aggregates_users():
     mock_session_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("bot.services.reaction_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.reaction_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.reaction_service.LocationsRepository.get_names_for_usernames",
             new_callable=AsyncMock,
@@ -348,7 +348,7 @@ async def test_get_driver_reactions_aggregates_reactions():
     mock_session_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("bot.services.reaction_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.reaction_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.reaction_service.LocationsRepository.get_names_for_usernames",
             new_callable=AsyncMock,
@@ -386,7 +386,7 @@ async def test_get_driver_reactions_filters_bot_users():
     mock_session_cm.__aexit__ = AsyncMock(return_value=False)
 
     with (
-        patch("bot.services.reaction_service.AsyncSessionLocal", return_value=mock_session_cm),
+        patch("bot.services.reaction_service.AsyncReadSessionLocal", return_value=mock_session_cm),
         patch(
             "bot.services.reaction_service.LocationsRepository.get_names_for_usernames",
             new_callable=AsyncMock,
@@ -0,0 +1,150 @@
+"""Unit tests for the group-commit RideReactionEventWriter against an in-memory DB."""
+
+from __future__ import annotations
+
+import asyncio
+import datetime
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import func, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bot.core.base import Base
+from bot.core.models import DiscordUsers, RideReactionEvent
+from bot.repositories.ride_reaction_events_repository import RideReactionEventsRepository
+from bot.services.ride_reaction_event_writer import PendingReactionEvent, RideReactionEventWriter
+
+
+@pytest_asyncio.fixture
+async def session_local():
+    """In-memory SQLite session factory with all tables created."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(DiscordUsers(discord_username="alice", first_name="Alice", last_name="A"))
+        await session.commit()
+    with patch("bot.services.ride_reaction_event_writer.AsyncSessionLocal", factory):
+        yield factory
+    await engine.dispose()
+
+
+def _event(username: str = "alice") -> PendingReactionEvent:
+    return PendingReactionEvent(
+        message_id="123",
+        discord_username=username,
+        emoji="🍔",
+        action="add",
+        occurred_at=datetime.datetime.now(datetime.UTC),
+        ride_date=datetime.date(2026, 5, 1),
+        ride_type="friday",
+    )
+
+
+async def _rows(factory) -> list[RideReactionEvent]:
+    async with factory() as session:
+        result = await session.execute(select(RideReactionEvent).order_by(RideReactionEvent.id))
+        return list(result.scalars().all())
+
+
+@pytest.mark.asyncio
+async def test_batch_flushes_after_interval_with_display_names(session_local):
+    writer = RideReactionEventWriter(batch_size=50, flush_interval_ms=20)
+    await writer.enqueue(_event("alice"))
+    await writer.enqueue(_event("bob"))
+    await asyncio.sleep(0.1)
+
+    rows = await _rows(session_local)
+    assert [(r.discord_username, r.display_name) for r in rows] == [
+        ("alice", "Alice A"),
+        ("bob", None),
+    ]
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_one_transaction(session_local):
+    writer = RideReactionEventWriter(batch_size=3, flush_interval_ms=10_000)
+    with patch(
+        "bot.services.ride_reaction_event_writer.RideReactionEventsRepository.record_events",
+        wraps=RideReactionEventsRepository.record_events,
+    ) as record_events:
+        for _ in range(3):
+            await writer.enqueue(_event())
+        await asyncio.sleep(0.05)
+        assert record_events.await_count == 1
+        assert len(record_events.await_args.args[1]) == 3
+        await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_stop_flushes_pending_rows(session_local):
+    writer = RideReactionEventWriter(batch_size=100, flush_interval_ms=60_000)
+    for _ in range(5):
+        await writer.enqueue(_event())
+
+    await writer.stop()
+
+    async with session_local() as session:
+        count = await session.scalar(select(func.count()).select_from(RideReactionEvent))
+    assert count == 5
+    assert writer.pending == 0
+
+
+@pytest.mark.asyncio
+async def test_failed_batch_is_retried(session_local):
+    writer = RideReactionEventWriter(batch_size=1, flush_interval_ms=10, retry_delay=0.001)
+    with patch(
+        "bot.services.ride_reaction_event_writer.RideReactionEventsRepository.record_events",
+        side_effect=[RuntimeError("boom"), 1],
+    ) as record_events:
+        await writer.enqueue(_event())
+        await asyncio.sleep(0.05)
+        assert record_events.await_count == 2
+    await writer.stop()
+
+
+@pytest.mark.asyncio
+async def test_batch_failing_every_attempt_is_dropped_and_writer_keeps_running(session_local):
+    writer = RideReactionEventWriter(
+        batch_size=1, flush_interval_ms=10, attempts=2, retry_delay=0.001
+    )
+    with (
+        patch(
+            "bot.services.ride_reaction_event_writer.RideReactionEventsRepository.record_events",
+            side_effect=[RuntimeError("boom"), RuntimeError("boom"), 1],
+        ) as record_events,
+        patch("bot.services.ride_reaction_event_writer.reaction_broadcaster") as broadcaster,
+    ):
+        broadcaster.publish = AsyncMock()
+        await writer.enqueue(_event("alice"))
+        await writer.enqueue(_event("bob"))
+        await asyncio.sleep(0.05)
+        assert record_events.await_count == 3
+    await writer.stop()
+
+    published = [call.args[0]["discord_username"] for call in broadcaster.publish.await_args_list]
+    assert published == ["bob"]
+
+
+@pytest.mark.asyncio
+async def test_events_are_published_after_their_rows_commit(session_local):
+    writer = RideReactionEventWriter(batch_size=50, flush_interval_ms=20)
+    rows_at_publish = []
+
+    async def publish(event):
+        rows_at_publish.append(
+            (event["discord_username"], [r.discord_username for r in await _rows(session_local)])
+        )
+
+    with patch("bot.services.ride_reaction_event_writer.reaction_broadcaster") as broadcaster:
+        broadcaster.publish = AsyncMock(side_effect=publish)
+        await writer.enqueue(_event("alice"))
+        await writer.enqueue(_event("bob"))
+        await writer.stop()
+
+    assert rows_at_publish == [("alice", ["alice", "bob"]), ("bob", ["alice", "bob"])]
+    assert broadcaster.publish.await_args_list[0].args[0]["source"] == "rides_announcements"
@@ -0,0 +1,138 @@
+"""Unit tests for the local ride-grouping solver."""
+
+from __future__ import annotations
+
+from itertools import pairwise
+
+import pytest
+
+from bot.core.enums import CampusLivingLocations
+from bot.core.schemas import Identity, Passenger
+from bot.services.pickup_locations_service import END_NODE, START_NODE
+from bot.services.ride_grouping import PassengersByLocation
+from bot.services.ride_solver import (
+    _construct,
+    _improve,
+    _initial_stops,
+    _Legs,
+    _Solution,
+    solve_ride_groups,
+)
+from tests.unit.routing_fixtures import make_seed_context
+
+CTX = make_seed_context()
+
+
+def _riders(counts: dict[str, int]) -> PassengersByLocation:
+    return {
+        location: [
+            Passenger(
+                identity=Identity(name=f"{location.split()[0]}{i}", username=None),
+                living_location=CampusLivingLocations.SIXTH,
+                pickup_location=location,
+            )
+            for i in range(count)
+        ]
+        for location, count in counts.items()
+    }
+
+
+def _drive_minutes(groups) -> int:
+    total = 0
+    for stops in groups.values():
+        path = [START_NODE, *(stop["location"] for stop in stops), END_NODE]
+        for a, b in pairwise(path):
+            if a != b:
+                total += CTX.lookup_time(a, b)
+                if START_NODE not in (a, b) and END_NODE not in (a, b):
+                    total += CTX.pickup_adjustment
+    return total
+
+
+def test_every_rider_assigned_once_within_capacity():
+    riders = _riders({"Sixth loop": 3, "Rita": 2, "Innovation": 4, "Muir tennis courts": 1})
+    capacities = [4, 4, 3, 2]
+
+    groups = solve_ride_groups(riders, capacities, CTX)
+
+    names = sorted(stop["name"] for stops in groups.values() for stop in stops)
+    assert names == sorted(p.identity.name for people in riders.values() for p in people)
+    for driver, stops in groups.items():
+        assert len(stops) <= capacities[int(driver.removeprefix("Driver"))]
+
+
+def test_output_matches_llm_shape():
+    groups = solve_ride_groups(_riders({"Rita": 1}), [4], CTX)
+
+    assert groups == {"Driver0": [{"name": "Rita0", "location": "Rita"}]}
+
+
+def test_same_location_riders_share_a_car_when_they_fit():
+    groups = solve_ride_groups(_riders({"Sixth loop": 3, "Marshall uppers": 1}), [4, 4], CTX)
+
+    assert len(groups) == 1
+    locations = [stop["location"] for stop in next(iter(groups.values()))]
+    # Riders at one stop are listed together
+    assert locations == sorted(locations, key=locations.index)
+
+
+def test_location_larger_than_any_car_is_split():
+    groups = solve_ride_groups(_riders({"Geisel Loop": 6}), [4, 2], CTX)
+
+    assert sorted(len(stops) for stops in groups.values()) == [2, 4]
+
+
+def test_tight_capacity_splits_stops_to_fit():
+    # Three pairs into two 3-seat cars only works by splitting one pair.
+    riders = _riders({"Sixth loop": 2, "Rita": 2, "Innovation": 2})
+
+    groups = solve_ride_groups(riders, [3, 3], CTX)
+
+    assert sorted(len(stops) for stops in groups.values()) == [3, 3]
+
+
+def test_deterministic():
+    riders = _riders({"Sixth loop": 2, "Rita": 3, "Innovation": 1, "Eighth basketball courts": 2})
+
+    first = solve_ride_groups(riders, [4, 4, 4], CTX)
+    second = solve_ride_groups(riders, [4, 4, 4], CTX)
+
+    assert first == second
+
+
+def test_not_worse_than_one_car_per_location():
+    riders = _riders(
+        {"Sixth loop": 1, "Marshall uppers": 1, "ERC across from bamboo": 1, "Seventh mail room": 1}
+    )
+    naive = {
+        f"Driver{i}": [{"name": f"n{i}", "location": location}] for i, location in enumerate(riders)
+    }
+
+    groups = solve_ride_groups(riders, [4, 4, 4, 4], CTX)
+
+    assert _drive_minutes(groups) <= _drive_minutes(naive)
+    assert len(groups) < len(naive)
+
+
+def test_tracked_loads_and_costs_match_the_routes():
+    riders = _riders(
+        {location: 2 + i % 5 for i, location in enumerate(sorted(CTX.active_names)[:12])}
+    )
+    capacities = [5, 4, 3, 2] * 8
+    solution = _Solution(_initial_stops(riders, capacities), capacities, _Legs(CTX))
+
+    _construct(solution)
+    _improve(solution)
+
+    for driver, route in enumerate(solution.routes):
+        assert solution.loads[driver] == sum(solution.stops[s].demand for s in route)
+        assert solution.costs[driver] == solution.cost(route)
+
+
+def test_empty_input():
+    assert solve_ride_groups({}, [4, 4], CTX) == {}
+
+
+def test_insufficient_capacity_raises():
+    with pytest.raises(ValueError, match="Insufficient driver capacity"):
+        solve_ride_groups(_riders({"Rita": 5}), [2, 2], CTX)
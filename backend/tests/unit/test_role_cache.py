@@ -0,0 +1,130 @@
+"""Unit tests for cached role resolution (UserAccountsService.get_role / require_role)."""
+
+from __future__ import annotations
+
+import asyncio
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from fastapi import Depends, FastAPI
+from fastapi.testclient import TestClient
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from api.auth import require_admin, require_ride_coordinator, require_role
+from bot.core.base import Base
+from bot.core.enums import AccountRoles, CacheNamespace
+from bot.core.models import UserAccount
+from bot.repositories.user_accounts_repository import UserAccountsRepository
+from bot.services.user_accounts_service import UserAccountsService
+from bot.utils.cache import invalidate_namespace
+
+
+@pytest_asyncio.fixture
+async def accounts():
+    """In-memory DB with one coordinator account and a clean role cache."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as session:
+        session.add(UserAccount(email="c@example.com", role=AccountRoles.RIDE_COORDINATOR))
+        await session.commit()
+    await invalidate_namespace(CacheNamespace.ACCOUNT_ROLES)
+    with (
+        patch("bot.services.user_accounts_service.AsyncSessionLocal", factory),
+        patch("bot.services.user_accounts_service.AsyncReadSessionLocal", factory),
+    ):
+        yield factory
+    await invalidate_namespace(CacheNamespace.ACCOUNT_ROLES)
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_get_role_is_cached(accounts):
+    with patch(
+        "bot.services.user_accounts_service.UserAccountsRepository.get_by_email",
+        wraps=UserAccountsRepository.get_by_email,
+    ) as get_by_email:
+        for _ in range(3):
+            assert await UserAccountsService.get_role("c@example.com") == (
+                AccountRoles.RIDE_COORDINATOR
+            )
+    assert get_by_email.await_count == 1
+
+
+@pytest.mark.asyncio
+async def test_update_role_invalidates_cached_role(accounts):
+    assert await UserAccountsService.has_minimum_role("c@example.com", AccountRoles.ADMIN) is False
+
+    await UserAccountsService.update_role("c@example.com", AccountRoles.ADMIN)
+
+    assert await UserAccountsService.has_minimum_role("c@example.com", AccountRoles.ADMIN) is True
+
+
+@pytest.mark.asyncio
+async def test_revoke_invalidates_cached_role(accounts):
+    assert await UserAccountsService.get_role("c@example.com") == AccountRoles.RIDE_COORDINATOR
+    async with accounts() as session:
+        account_id = (await session.execute(UserAccount.__table__.select())).first().id
+
+    await UserAccountsService.revoke(account_id)
+
+    assert await UserAccountsService.get_role("c@example.com") is None
+
+
+@pytest.mark.asyncio
+async def test_lookup_in_flight_during_demotion_is_not_cached(accounts):
+    read_started, release_read = asyncio.Event(), asyncio.Event()
+    get_by_email = UserAccountsRepository.get_by_email
+
+    async def slow_get_by_email(session, email):
+        account = await get_by_email(session, email)
+        read_started.set()
+        await release_read.wait()
+        return account
+
+    with patch(
+        "bot.services.user_accounts_service.UserAccountsRepository.get_by_email",
+        side_effect=slow_get_by_email,
+    ):
+        lookup = asyncio.create_task(UserAccountsService.get_role("c@example.com"))
+        await read_started.wait()
+    await UserAccountsService.update_role("c@example.com", AccountRoles.VIEWER)
+    release_read.set()
+    assert await lookup == AccountRoles.RIDE_COORDINATOR
+
+    assert await UserAccountsService.get_role("c@example.com") == AccountRoles.VIEWER
+
+
+@pytest.mark.asyncio
+async def test_unknown_email_has_no_role(accounts):
+    assert await UserAccountsService.get_role("nobody@example.com") is None
+    assert UserAccountsService.role_meets(None, AccountRoles.VIEWER) is False
+
+
+def test_chained_role_dependencies_resolve_role_once():
+    app = FastAPI()
+
+    @app.middleware("http")
+    async def _user(request, call_next):
+        request.state.user = {"email": "a@example.com"}
+        return await call_next(request)
+
+    @app.get("/admin", dependencies=[Depends(require_ride_coordinator)])
+    async def admin(email: str = Depends(require_admin)):
+        return {"email": email}
+
+    @app.get("/viewer")
+    async def viewer(email: str = Depends(require_role(AccountRoles.VIEWER))):
+        return {"email": email}
+
+    get_role = AsyncMock(return_value=AccountRoles.ADMIN)
+    with patch("api.auth.UserAccountsService.get_role", new=get_role):
+        client = TestClient(app)
+        assert client.get("/admin").json() == {"email": "a@example.com"}
+        assert get_role.await_count == 1
+
+        get_role.return_value = AccountRoles.VIEWER
+        assert client.get("/admin").status_code == 403
+        assert client.get("/viewer").status_code == 200
@@ -2,8 +2,13 @@
 
 from __future__ import annotations
 
+from dataclasses import replace
+from itertools import permutations
+from unittest.mock import patch
+
 import pytest
 
+import bot.services.pickup_locations_service as pickup_module
 from bot.services.route_service import RouteService
 from tests.unit.routing_fixtures import make_seed_context
 
@@ -47,6 +52,84 @@ def test_fuzzy_innovation():
     assert result == "Innovation"
 
 
+# ---------------------------------------------------------------------------
+# resolve_location
+# ---------------------------------------------------------------------------
+
+
+def test_resolve_location_exact_ignores_case_and_padding():
+    assert RouteService.resolve_location(CTX, "  MUIR TENNIS COURTS ") == "Muir tennis courts"
+
+
+def test_resolve_location_falls_back_to_fuzzy():
+    assert RouteService.resolve_location(CTX, "seventh") == "Seventh mail room"
+
+
+def test_resolve_location_unknown_raises():
+    with pytest.raises(ValueError, match="Invalid location"):
+        RouteService.resolve_location(CTX, "zzzzzzzzz_no_match_here")
+
+
+def test_resolve_locations_matches_one_at_a_time():
+    tokens = ["seventh", "Rita", "ERC across", "seventh", "  innovation "]
+    assert RouteService.resolve_locations(CTX, tokens) == [
+        RouteService.resolve_location(CTX, token) for token in tokens
+    ]
+
+
+def test_resolve_locations_reports_first_unknown_token():
+    with pytest.raises(ValueError, match="Invalid location: qqqq"):
+        RouteService.resolve_locations(CTX, ["Rita", "qqqq", "zzzzzzzzz_no_match_here"])
+
+
+def test_fuzzy_match_many_scores_each_distinct_input_once(monkeypatch):
+    routing = make_seed_context()
+    calls = []
+    extract_one = pickup_module.process.extractOne
+
+    def counting(query, *args, **kwargs):
+        calls.append(query)
+        return extract_one(query, *args, **kwargs)
+
+    monkeypatch.setattr(pickup_module.process, "extractOne", counting)
+    first = routing.fuzzy_match_many(["seventh", "SEVENTH", "rita", "seventh"])
+    assert first == ["Seventh mail room", "Seventh mail room", "Rita", "Seventh mail room"]
+    assert sorted(set(calls)) == ["rita", "seventh"]
+
+    calls.clear()
+    assert routing.fuzzy_match_many(["Seventh", "rita"]) == first[1:3]
+    assert calls == []
+
+
+def test_fuzzy_match_many_survives_a_concurrent_memo_clear():
+    class ClearedAfterMembershipCheck(dict):
+        """Another thread clears the memo between ``in`` and the lookup."""
+
+        def __contains__(self, key):
+            found = super().__contains__(key)
+            self.clear()
+            return found
+
+    routing = make_seed_context()
+    routing.fuzzy_match_many(["seventh"])
+    object.__setattr__(routing, "_fuzzy_memo", ClearedAfterMembershipCheck(routing._fuzzy_memo))
+
+    assert routing.fuzzy_match_many(["seventh", "rita"]) == ["Seventh mail room", "Rita"]
+
+
+def test_fuzzy_memo_resets_for_new_snapshot():
+    routing = make_seed_context()
+    assert routing.fuzzy_match("seventh") == "Seventh mail room"
+
+    renamed = routing.evolve(
+        locations=[
+            replace(loc, name="Eighth mail room") if loc.name == "Seventh mail room" else loc
+            for loc in routing.locations
+        ]
+    )
+    assert renamed.fuzzy_match("seventh") != "Seventh mail room"
+
+
 # ---------------------------------------------------------------------------
 # make_route — basic functionality
 # ---------------------------------------------------------------------------
@@ -119,3 +202,97 @@ def test_make_route_pm_time_format():
 def test_make_route_am_time_format():
     result = RouteService.make_route(CTX, "seventh", "10:30am")
     assert "10:30am" in result
+
+
+# ---------------------------------------------------------------------------
+# optimize_order (Held-Karp)
+# ---------------------------------------------------------------------------
+
+SIX_STOPS = [
+    "Seventh mail room",
+    "Muir tennis courts",
+    "Eighth basketball courts",
+    "Marshall uppers",
+    "Sixth loop",
+    "ERC across from bamboo",
+]
+
+
+def test_optimize_order_matches_brute_force():
+    order, saved = RouteService.optimize_order(CTX, SIX_STOPS)
+
+    best = min(RouteService.drive_minutes(CTX, list(p)) for p in permutations(SIX_STOPS))
+    assert sorted(order) == sorted(SIX_STOPS)
+    assert RouteService.drive_minutes(CTX, order) == best
+    assert saved == RouteService.drive_minutes(CTX, SIX_STOPS) - best
+
+
+def test_optimize_order_keeps_optimal_input():
+    order, _ = RouteService.optimize_order(CTX, SIX_STOPS)
+
+    again, saved = RouteService.optimize_order(CTX, order)
+
+    assert again == order
+    assert saved == 0
+
+
+def test_optimize_order_keeps_repeated_stops_together():
+    order, _ = RouteService.optimize_order(CTX, ["Rita", "Sixth loop", "Rita"])
+
+    assert order.count("Rita") == 2
+    assert abs(order.index("Rita") - (len(order) - 1 - order[::-1].index("Rita"))) == 1
+
+
+def test_optimize_order_without_complete_path_keeps_input():
+    stops = ["Warren Justice Ln", "Rita"]
+
+    assert RouteService.optimize_order(CTX, stops) == (stops, 0)
+
+
+def test_optimize_order_tables_reset_for_new_snapshot():
+    RouteService.optimize_order(CTX, SIX_STOPS)
+    assert RouteService._order_tables[0] == CTX.version
+
+    newer = replace(CTX, pickup_adjustment=CTX.pickup_adjustment)
+    RouteService.optimize_order(newer, SIX_STOPS[:3])
+
+    version, tables = RouteService._order_tables
+    assert version == newer.version
+    assert all(len(visited) <= 3 for visited, _ in tables)
+
+
+def test_optimize_order_survives_snapshot_switch_mid_solve():
+    expected = RouteService.optimize_order(CTX, SIX_STOPS)
+    newer = replace(CTX, pickup_adjustment=CTX.pickup_adjustment)
+    end_leg = RouteService._end_leg
+    switched = False
+
+    def end_leg_then_switch(routing, stop):
+        # Another caller solving for a newer snapshot replaces the shared tables
+        nonlocal switched
+        if not switched:
+            switched = True
+            RouteService.optimize_order(newer, SIX_STOPS[:2])
+        return end_leg(routing, stop)
+
+    RouteService._order_tables = (None, {})
+    with patch.object(RouteService, "_end_leg", side_effect=end_leg_then_switch):
+        assert RouteService.optimize_order(CTX, SIX_STOPS) == expected
+    assert RouteService._order_tables[0] == newer.version
+
+
+def test_plan_route_reports_order_and_savings():
+    plan = RouteService.plan_route(
+        CTX, ["rita", "sixth", "innovation", "seventh"], "7:00pm", optimize_order=True
+    )
+
+    assert plan.minutes_saved > 0
+    assert plan.order[-1] in plan.route.split(", ")[-1]
+    assert plan.route.split(", ")[-1].startswith("7:00pm")
+
+
+def test_plan_route_without_optimization_keeps_order():
+    plan = RouteService.plan_route(CTX, ["rita", "sixth"], "7:00pm")
+
+    assert plan.order == ["Rita", "Sixth loop"]
+    assert plan.minutes_saved == 0
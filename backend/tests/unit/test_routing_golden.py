@@ -2,12 +2,22 @@
 
 The expected values below were computed with the pre-refactor hardcoded
 implementation (bot/utils/locations.py lookup_time over LOCATIONS_MATRIX)
-and frozen here. The DB-backed Dijkstra must reproduce them exactly.
+and frozen here. The DB-backed shortest-path matrix must reproduce them exactly.
 """
 
+import random
+from dataclasses import replace
+from itertools import pairwise
+
 import pytest
 
-from bot.services.pickup_locations_service import END_NODE, START_NODE
+from bot.services.pickup_locations_service import (
+    END_NODE,
+    START_NODE,
+    EdgeInfo,
+    RoutingContext,
+    all_pairs_shortest_paths,
+)
 from tests.unit.routing_fixtures import make_seed_context
 
 # All-pairs travel times from the old hardcoded LOCATIONS_MATRIX.
@@ -163,3 +173,134 @@ class TestGoldenParity:
     def test_unreachable_reports_isolated_location(self):
         ctx = make_seed_context()
         assert ctx.unreachable_names() == ["Warren Justice Ln"]
+
+
+class TestShortestPathMatrix:
+    def test_paths_follow_graph_edges_and_sum_to_lookup_time(self):
+        ctx = make_seed_context()
+        weights = {(a, b): minutes for a, adj in ctx.graph.items() for b, minutes in adj}
+        for start, end in GOLDEN_PAIRS:
+            path = ctx.paths.path(start, end)
+            assert path[0] == start and path[-1] == end
+            assert sum(weights[hop] for hop in pairwise(path)) == ctx.lookup_time(start, end)
+
+    def test_no_path_to_isolated_location(self):
+        ctx = make_seed_context()
+        assert ctx.paths.path("Warren Justice Ln", "Muir tennis courts") is None
+        assert ctx.paths.time("Warren Justice Ln", "Muir tennis courts") is None
+
+    def test_unknown_name_raises(self):
+        ctx = make_seed_context()
+        with pytest.raises(ValueError, match="No path found"):
+            ctx.lookup_time("Nowhere", "Muir tennis courts")
+
+    def test_empty_graph(self):
+        ctx = RoutingContext(locations=(), edges=(), living_to_pickup={}, pickup_adjustment=1)
+        assert ctx.unreachable_names() == []
+        assert ctx.paths.time(START_NODE, END_NODE) is None
+
+
+def _all_times(ctx: RoutingContext) -> dict[tuple[str, str], int | None]:
+    return {(a, b): ctx.paths.time(a, b) for a in ctx.graph for b in ctx.graph}
+
+
+class TestEvolve:
+    def test_edge_edits_match_full_recompute(self):
+        rng = random.Random(49)
+        ctx = make_seed_context()
+        next_id = 100
+        for _ in range(60):
+            edges = list(ctx.edges)
+            roll = rng.random()
+            if roll < 0.3 and edges:
+                edges.pop(rng.randrange(len(edges)))
+            elif roll < 0.6 and edges:
+                i = rng.randrange(len(edges))
+                edges[i] = replace(edges[i], minutes=rng.randint(1, 12))
+            else:
+                a, b = sorted(rng.sample(range(1, 13), 2))
+                if all((e.location_a_id, e.location_b_id) != (a, b) for e in edges):
+                    edges.append(EdgeInfo(next_id, a, b, rng.randint(1, 12)))
+                    next_id += 1
+            ctx = ctx.evolve(edges=tuple(edges))
+
+            full = all_pairs_shortest_paths(ctx.graph)
+            assert _all_times(ctx) == {
+                (a, b): full.time(a, b) for a in ctx.graph for b in ctx.graph
+            }
+            weights = {(a, b): minutes for a, adj in ctx.graph.items() for b, minutes in adj}
+            for start, end in _all_times(ctx):
+                path = ctx.paths.path(start, end)
+                if path is not None:
+                    assert sum(weights[hop] for hop in pairwise(path)) == ctx.paths.time(start, end)
+
+    def test_start_and_end_minutes_update_incrementally(self):
+        ctx = make_seed_context()
+        isolated = ctx.location("Warren Justice Ln")
+        moved = replace(isolated, minutes_from_start=3, minutes_to_end=4)
+
+        evolved = ctx.evolve(
+            locations=tuple(moved if loc is isolated else loc for loc in ctx.locations)
+        )
+
+        assert evolved.lookup_time(START_NODE, "Warren Justice Ln") == 3
+        assert evolved.lookup_time(START_NODE, END_NODE) == 7
+        assert evolved.unreachable_names() == []
+        assert _all_times(evolved) == _all_times(RoutingContext(**_fields(evolved)))
+
+    def test_non_graph_changes_reuse_paths_with_new_version(self):
+        ctx = make_seed_context()
+        evolved = ctx.evolve(pickup_adjustment=4, living_to_pickup={"Muir": "Rita"})
+
+        assert evolved.paths is ctx.paths
+        assert evolved.version != ctx.version
+        assert evolved.pickup_adjustment == 4
+        assert evolved.pickup_for_living("Muir") == "Rita"
+        assert ctx.pickup_adjustment == 1
+
+    def test_node_changes_recompute(self):
+        ctx = make_seed_context()
+        rita = ctx.location("Rita")
+        evolved = ctx.evolve(
+            locations=tuple(
+                replace(loc, is_active=False) if loc is rita else loc for loc in ctx.locations
+            )
+        )
+
+        assert "Rita" not in evolved.graph
+        assert evolved.paths.time("Innovation", "Rita") is None
+        assert _all_times(evolved) == _all_times(RoutingContext(**_fields(evolved)))
+
+
+def _fields(ctx: RoutingContext) -> dict:
+    return {
+        "locations": ctx.locations,
+        "edges": ctx.edges,
+        "living_to_pickup": ctx.living_to_pickup,
+        "pickup_adjustment": ctx.pickup_adjustment,
+        "graph": ctx.graph,
+    }
+
+
+class TestIndexedViews:
+    def test_location_and_coordinates_by_name(self):
+        ctx = make_seed_context()
+        loc = ctx.location("Rita")
+        assert loc.name == "Rita"
+        assert ctx.coordinates("Rita") == (loc.latitude, loc.longitude)
+        assert ctx.location("Nowhere") is None
+        assert ctx.coordinates("Nowhere") is None
+
+    def test_map_links_cover_active_names_and_match_map_url(self):
+        ctx = make_seed_context()
+        links = ctx.map_links()
+        assert list(links) == list(ctx.active_names)
+        assert all(links[name] == ctx.map_url(name) for name in ctx.active_names)
+        assert ctx.map_links() is links
+
+    def test_graph_digest_tracks_graph_content(self):
+        assert make_seed_context().graph_digest == make_seed_context().graph_digest
+        slower = make_seed_context(pickup_adjustment=5)
+        assert slower.graph_digest == make_seed_context().graph_digest
+        empty = RoutingContext(locations=(), edges=(), living_to_pickup={}, pickup_adjustment=1)
+        assert empty.graph_digest != make_seed_context().graph_digest
@@ -9,6 +9,16 @@ from fastapi.testclient import TestClient
 
 from api.auth_session import SESSION_COOKIE_NAME, session_cookie_middleware
 from bot.core.models import AuthSession
+from bot.services.auth_session_cache import auth_session_cache
+
+
+@pytest.fixture(autouse=True)
+def _clear_session_cache():
+    """Validated sessions are cached per process; keep tests independent."""
+    auth_session_cache.clear()
+    yield
+    auth_session_cache.clear()
+
 
 # ---------------------------------------------------------------------------
 # Helpers
@@ -168,7 +178,7 @@ def test_invalid_session_returns_401():
 
     with (
         patch("api.auth_session.APP_ENV", "production"),
-        patch("api.auth_session.AsyncSessionLocal", return_value=mock_db),
+        patch("api.auth_session.AsyncReadSessionLocal", return_value=mock_db),
         patch("api.auth_session.AuthService.get_session", new=AsyncMock(return_value=None)),
     ):
         client = TestClient(app, raise_server_exceptions=False)
@@ -199,9 +209,8 @@ def test_valid_session_attaches_user_and_proceeds():
 
     with (
         patch("api.auth_session.APP_ENV", "production"),
-        patch("api.auth_session.AsyncSessionLocal", return_value=mock_db),
+        patch("api.auth_session.AsyncReadSessionLocal", return_value=mock_db),
         patch("api.auth_session.AuthService.get_session", new=AsyncMock(return_value=auth_session)),
-        patch("api.auth_session.AuthService.touch_session", new=AsyncMock()),
     ):
         client = TestClient(
             app, raise_server_exceptions=False, cookies={SESSION_COOKIE_NAME: "good-token"}
@@ -232,9 +241,8 @@ def test_post_without_csrf_header_returns_403():
 
     with (
         patch("api.auth_session.APP_ENV", "production"),
-        patch("api.auth_session.AsyncSessionLocal", return_value=mock_db),
+        patch("api.auth_session.AsyncReadSessionLocal", return_value=mock_db),
         patch("api.auth_session.AuthService.get_session", new=AsyncMock(return_value=auth_session)),
-        patch("api.auth_session.AuthService.touch_session", new=AsyncMock()),
         patch(
             "api.auth_session.AuthService.verify_csrf",
             side_effect=lambda expected, provided: provided == expected,
@@ -261,9 +269,8 @@ def test_post_with_correct_csrf_header_succeeds():
 
     with (
         patch("api.auth_session.APP_ENV", "production"),
-        patch("api.auth_session.AsyncSessionLocal", return_value=mock_db),
+        patch("api.auth_session.AsyncReadSessionLocal", return_value=mock_db),
         patch("api.auth_session.AuthService.get_session", new=AsyncMock(return_value=auth_session)),
-        patch("api.auth_session.AuthService.touch_session", new=AsyncMock()),
         patch(
             "api.auth_session.AuthService.verify_csrf",
             side_effect=lambda expected, provided: provided == expected,
@@ -295,11 +302,48 @@ def test_get_request_skips_csrf_check():
 
     with (
         patch("api.auth_session.APP_ENV", "production"),
-        patch("api.auth_session.AsyncSessionLocal", return_value=mock_db),
+        patch("api.auth_session.AsyncReadSessionLocal", return_value=mock_db),
         patch("api.auth_session.AuthService.get_session", new=AsyncMock(return_value=auth_session)),
-        patch("api.auth_session.AuthService.touch_session", new=AsyncMock()),
     ):
         client = TestClient(app, raise_server_exceptions=False)
         resp = client.get("/api/data", cookies={SESSION_COOKIE_NAME: "good-token"})
 
     assert resp.status_code == 200
+
+
+# ---------------------------------------------------------------------------
+# Session cache
+# ---------------------------------------------------------------------------
+
+
+def test_burst_of_requests_validates_session_once():
+    app = FastAPI()
+    app.middleware("http")(session_cookie_middleware)
+
+    @app.get("/api/data")
+    async def data():
+        return {"ok": True}
+
+    get_session = AsyncMock(return_value=_make_auth_session())
+    mock_db = AsyncMock()
+    mock_db.__aenter__ = AsyncMock(return_value=mock_db)
+    mock_db.__aexit__ = AsyncMock(return_value=False)
+
+    with (
+        patch("api.auth_session.APP_ENV", "production"),
+        patch("api.auth_session.AsyncReadSessionLocal", return_value=mock_db),
+        patch("api.auth_session.AuthService.get_session", new=get_session),
+    ):
+        client = TestClient(
+            app, raise_server_exceptions=False, cookies={SESSION_COOKIE_NAME: "good-token"}
+        )
+        statuses = [client.get("/api/data").status_code for _ in range(5)]
+
+        # Revocation (logout or account removal) takes effect immediately.
+        auth_session_cache.invalidate_email("user@example.com")
+        get_session.return_value = None
+        revoked_status = client.get("/api/data").status_code
+
+    assert statuses == [200] * 5
+    assert revoked_status == 401
+    assert get_session.await_count == 2
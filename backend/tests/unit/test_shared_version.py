@@ -0,0 +1,78 @@
+"""Unit tests for SharedVersion (cross-process cache invalidation)."""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from bot.utils import cache_backends
+from bot.utils.cache_backends import InMemoryBackend
+from bot.utils.shared_version import SharedVersion
+
+
+@pytest.fixture(autouse=True)
+def shared_backend(monkeypatch):
+    """A fresh backend standing in for the Redis every process shares."""
+    backend = InMemoryBackend()
+    monkeypatch.setattr(cache_backends, "_backend", backend)
+    return backend
+
+
+@pytest.mark.asyncio
+async def test_unchanged_until_another_process_bumps():
+    mine, theirs = SharedVersion("state"), SharedVersion("state")
+    assert await mine.changed() is False
+
+    await theirs.bump()
+
+    assert await mine.changed() is True
+    assert await mine.changed() is False
+    assert await theirs.changed() is False
+
+
+@pytest.mark.asyncio
+async def test_bump_missing_a_concurrent_change_reports_it():
+    mine, theirs = SharedVersion("state"), SharedVersion("state")
+    await theirs.bump()
+
+    await mine.bump()
+
+    assert await mine.changed() is True
+
+
+@pytest.mark.asyncio
+async def test_forget_forces_a_reload():
+    version = SharedVersion("state")
+    version.forget()
+
+    assert await version.changed() is True
+
+
+@pytest.mark.asyncio
+async def test_unreadable_backend_falls_back_to_max_age(shared_backend):
+    fresh, old = SharedVersion("state", max_age=60), SharedVersion("state", max_age=0)
+    shared_backend.get = AsyncMock(side_effect=ConnectionError("redis down"))
+
+    assert await fresh.changed() is False
+    assert await old.changed() is True
+
+
+@pytest.mark.asyncio
+async def test_min_interval_skips_the_backend_between_checks(shared_backend, monkeypatch):
+    clock = [100.0]
+    monkeypatch.setattr("bot.utils.shared_version.time.monotonic", lambda: clock[0])
+    mine, theirs = SharedVersion("state", min_interval=1.0), SharedVersion("state")
+    assert await mine.changed() is False
+    await theirs.bump()
+
+    assert await mine.changed() is False
+    clock[0] += 1.0
+    assert await mine.changed() is True
+
+
+@pytest.mark.asyncio
+async def test_min_interval_does_not_delay_a_forgotten_copy():
+    version = SharedVersion("state", min_interval=60)
+    assert await version.changed() is False
+    version.forget()
+
+    assert await version.changed() is True
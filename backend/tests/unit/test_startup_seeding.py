@@ -0,0 +1,122 @@
+"""Unit tests for bulk startup seeding and the timed startup() breakdown."""
+
+from __future__ import annotations
+
+from unittest.mock import AsyncMock, patch
+
+import pytest
+import pytest_asyncio
+from sqlalchemy import event, select
+from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+from bot.core import database, lifecycle
+from bot.core.base import Base
+from bot.core.enums import AccountRoles, FeatureFlagNames, JobName
+from bot.core.models import FeatureFlags, MessageSchedulePause, UserAccount
+
+
+@pytest_asyncio.fixture
+async def db():
+    """In-memory engine plus a statement counter."""
+    engine = create_async_engine("sqlite+aiosqlite:///:memory:")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+    statements: list[str] = []
+
+    @event.listens_for(engine.sync_engine, "before_cursor_execute")
+    def _count(conn, cursor, statement, *args):
+        statements.append(statement)
+
+    yield async_sessionmaker(engine, expire_on_commit=False), statements
+    await engine.dispose()
+
+
+@pytest.mark.asyncio
+async def test_seed_feature_flags_is_bulk_and_idempotent(db):
+    factory, statements = db
+    async with factory() as session:
+        session.add(FeatureFlags(feature=FeatureFlagNames.BOT.value, enabled=True))
+        await session.commit()
+    statements.clear()
+
+    async with factory() as session:
+        await database.seed_feature_flags(session)
+    # One existence check + one INSERT, independent of the number of flags.
+    assert len(statements) == 2
+
+    async with factory() as session:
+        await database.seed_feature_flags(session)
+        rows = (await session.execute(select(FeatureFlags))).scalars().all()
+    assert {row.feature for row in rows} == {flag.value for flag in FeatureFlagNames}
+    assert next(row for row in rows if row.feature == FeatureFlagNames.BOT.value).enabled
+
+
+@pytest.mark.asyncio
+async def test_seed_message_schedule_pauses_creates_missing_rows(db):
+    factory, _ = db
+    async with factory() as session:
+        await database.seed_message_schedule_pauses(session)
+        await database.seed_message_schedule_pauses(session)
+        rows = (await session.execute(select(MessageSchedulePause))).scalars().all()
+    assert {row.job_name for row in rows} == set(JobName)
+    assert not any(row.is_paused for row in rows)
+
+
+@pytest.mark.asyncio
+async def test_seed_admin_accounts_upgrades_and_creates(db, monkeypatch):
+    factory, _ = db
+    monkeypatch.setenv("ADMIN_EMAILS", "a@example.com, b@example.com")
+    monkeypatch.setattr(database, "APP_ENV", "prod")
+    async with factory() as session:
+        session.add(UserAccount(email="a@example.com", role=AccountRoles.VIEWER))
+        await session.commit()
+
+    async with factory() as session:
+        await database.seed_admin_accounts(session)
+        rows = (await session.execute(select(UserAccount))).scalars().all()
+    assert {(row.email, row.role) for row in rows} == {
+        ("a@example.com", AccountRoles.ADMIN),
+        ("b@example.com", AccountRoles.ADMIN),
+    }
+
+
+@pytest.mark.asyncio
+async def test_startup_records_phase_timings_and_builds_cache_last():
+    order: list[str] = []
+
+    def _step(name):
+        async def _run(*_args, **_kwargs):
+            order.append(name)
+
+        return _run
+
+    class _Session:
+        async def __aenter__(self):
+            return self
+
+        async def __aexit__(self, *exc):
+            return False
+
+    with (
+        patch.object(lifecycle, "APP_ENV", "local"),
+        patch.object(lifecycle, "AsyncSessionLocal", _Session),
+        patch.object(lifecycle, "init_db", _step("init_db")),
+        patch.object(lifecycle, "seed_feature_flags", _step("seed_feature_flags")),
+        patch.object(lifecycle, "seed_message_schedule_pauses", _step("seed_pauses")),
+        patch.object(lifecycle, "seed_admin_accounts", _step("seed_admin_accounts")),
+        patch.object(lifecycle, "seed_bypass_account", _step("seed_bypass_account")),
+        patch.object(lifecycle, "_disable_features_for_local_env", _step("disable_local")),
+        patch.object(
+            lifecycle.FeatureFlagsRepository,
+            "initialize_cache",
+            AsyncMock(side_effect=_step("cache")),
+        ),
+    ):
+        await lifecycle.startup()
+
+    assert order[0] == "init_db"
+    assert order.index("seed_feature_flags") < order.index("disable_local") < order.index("cache")
+    assert order.index("seed_admin_accounts") < order.index("seed_bypass_account")
+    timings = lifecycle.get_startup_timings()
+    for phase in ("init_db", "seed_feature_flags", "feature_flag_cache", "redis", "total"):
+        assert phase in timings
@@ -17,7 +17,7 @@ def create_mock_row(name, discord_username):
 
 @pytest.mark.asyncio
 @patch("bot.services.whois_service.WhoisRepository")
-@patch("bot.services.whois_service.AsyncSessionLocal")
+@patch("bot.services.whois_service.AsyncReadSessionLocal")
 async def test_get_whois_data_found(mock_async_session_local, mock_whois_repo):
     """Tests the service formats multiple results correctly."""
     # Arrange
@@ -56,7 +56,7 @@ async def test_get_whois_data_found(mock_async_session_local, mock_whois_repo):
 
 @pytest.mark.asyncio
 @patch("bot.services.whois_service.WhoisRepository")
-@patch("bot.services.whois_service.AsyncSessionLocal")
+@patch("bot.services.whois_service.AsyncReadSessionLocal")
 async def test_get_whois_data_not_found(mock_async_session_local, mock_whois_repo):
     """Tests the service returns None when no results are found."""
     # Arrange
@@ -1,5 +1,5 @@
 import { useState } from 'react'
-import { useQuery, useQueryClient } from '@tanstack/react-query'
+import { useInfiniteQuery, useQuery, useQueryClient } from '@tanstack/react-query'
 import { apiFetch } from '../lib/api'
 import { useReactionStream } from '../hooks/useReactionStream'
 import { Button } from '../components/ui/button'
@@ -40,6 +40,11 @@ interface RideReactionLog {
 
 interface ReactionLogResponse {
     rides: RideReactionLog[]
+    next_cursor: string | null
+}
+
+interface ReactionLogEmojisResponse {
+    emojis: string[]
 }
 
 interface Filters {
@@ -107,16 +112,33 @@ function hasActiveFilters(filters: Filters): boolean {
     )
 }
 
-function buildQueryString(filters: Filters): string {
+function buildQueryString(filters: Filters, cursor: string | null): string {
     const params = new URLSearchParams()
     if (filters.ride_type) params.set('ride_type', filters.ride_type)
     if (filters.date_from) params.set('date_from', filters.date_from)
     if (filters.date_to) params.set('date_to', filters.date_to)
     if (filters.emoji) params.set('emoji', filters.emoji)
+    if (cursor) params.set('cursor', cursor)
     const qs = params.toString()
     return qs ? `?${qs}` : ''
 }
 
+// A ride whose events straddle a page boundary ends one page and starts the next.
+function mergePages(pages: ReactionLogResponse[]): RideReactionLog[] {
+    const rides: RideReactionLog[] = []
+    for (const page of pages) {
+        for (const ride of page.rides) {
+            const last = rides[rides.length - 1]
+            if (last && last.message_id === ride.message_id) {
+                rides[rides.length - 1] = { ...last, events: [...last.events, ...ride.events] }
+            } else {
+                rides.push(ride)
+            }
+        }
+    }
+    return rides
+}
+
 // ── Sub-components ─────────────────────────────────────────────────────────
 
 function ActionBadge({ action }: { action: EventAction }) {
@@ -220,27 +242,30 @@ function LoadingSkeleton() {
 function ReactionLog() {
     const [filters, setFilters] = useState<Filters>(EMPTY_FILTERS)
 
-    const { data, isLoading, isError, error } = useQuery<ReactionLogResponse>({
-        queryKey: ['reaction-log', filters],
-        queryFn: async () => {
-            const res = await apiFetch(`/api/reaction-log${buildQueryString(filters)}`)
-            return res.json() as Promise<ReactionLogResponse>
-        },
-    })
-
-    // Fetch unfiltered data to populate emoji dropdown regardless of active filters
-    const { data: allData } = useQuery<ReactionLogResponse>({
+    const { data, isLoading, isError, error, hasNextPage, fetchNextPage, isFetchingNextPage } =
+        useInfiniteQuery({
+            queryKey: ['reaction-log', filters],
+            queryFn: async ({ pageParam }) => {
+                const res = await apiFetch(`/api/reaction-log${buildQueryString(filters, pageParam)}`)
+                return res.json() as Promise<ReactionLogResponse>
+            },
+            initialPageParam: null as string | null,
+            getNextPageParam: (lastPage) => lastPage.next_cursor,
+        })
+
+    const rides = data ? mergePages(data.pages) : []
+
+    // Emoji dropdown lists every emoji in the log regardless of active filters
+    const { data: emojiData } = useQuery<ReactionLogEmojisResponse>({
         queryKey: ['reaction-log-all-emojis'],
         queryFn: async () => {
-            const res = await apiFetch('/api/reaction-log')
-            return res.json() as Promise<ReactionLogResponse>
+            const res = await apiFetch('/api/reaction-log/emojis')
+            return res.json() as Promise<ReactionLogEmojisResponse>
         },
         staleTime: QUERY_STALE_1_MIN,
     })
 
-    const availableEmojis = Array.from(
-        new Set(allData?.rides.flatMap((r) => r.events.map((e) => e.emoji)) ?? [])
-    ).sort()
+    const availableEmojis = emojiData?.emojis ?? []
 
     const queryClient = useQueryClient()
 
@@ -402,7 +427,7 @@ function ReactionLog() {
 
             {!isLoading && !isError && data && (
                 <>
-                    {data.rides.length === 0 ? (
+                    {rides.length === 0 ? (
                         <div className="text-center py-16 text-muted-foreground">
                             <p className="text-lg font-medium mb-1">No reactions found</p>
                             <p className="text-sm">
@@ -413,9 +438,20 @@ function ReactionLog() {
                         </div>
                     ) : (
                         <div className="space-y-4">
-                            {data.rides.map((ride) => (
+                            {rides.map((ride) => (
                                 <RideCard key={ride.message_id} ride={ride} />
                             ))}
+                            {hasNextPage && (
+                                <div className="flex justify-center">
+                                    <Button
+                                        variant="outline"
+                                        onClick={() => void fetchNextPage()}
+                                        disabled={isFetchingNextPage}
+                                    >
+                                        {isFetchingNextPage ? 'Loading…' : 'Load more'}
+                                    </Button>
+                                </div>
+                            )}
                         </div>
                     )}
                 </>